@@ -0,0 +1 @@
+"""Throughput and overhead benchmarks for the off-chain helpers, run against local stand-ins."""
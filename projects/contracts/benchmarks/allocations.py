@@ -0,0 +1,113 @@
+"""
+Measures the memory a typed `BankClient` allocates per call and per state read.
+
+Usage: python -m benchmarks.allocations [--calls N]
+
+Each operation runs against a local algod stand-in in its own process, so only the
+client side is traced. "peak" is the most memory tracemalloc saw in use during one
+call above what was live before it, averaged over the calls; "retained" is what is
+still live per call after all of them, i.e. what the client keeps hold of.
+"""
+
+import argparse
+import multiprocessing
+import time
+import tracemalloc
+import typing
+from collections.abc import Callable
+from multiprocessing.connection import Connection
+
+import algokit_utils
+from algosdk import abi, account, encoding
+from algosdk.v2client.algod import AlgodClient
+
+from smart_contracts.artifacts.bank.bank_client import BankClient
+from tests.algod_stub import AlgodStub
+
+APP_ID = 1234
+DEPOSIT = "deposit(string,pay)uint64"
+
+
+def _serve(sender: str, conn: Connection) -> None:
+    with AlgodStub() as stub:
+        stub.returns[abi.Method.from_signature(DEPOSIT).get_selector()] = (5).to_bytes(
+            8, "big"
+        )
+        stub.global_state[APP_ID] = {b"total_deposit": 5}
+        stub.boxes[APP_ID] = {encoding.decode_address(sender): (5).to_bytes(8, "big")}
+        conn.send(stub.url)
+        conn.recv()
+
+
+def _measure(op: Callable[[], object], calls: int) -> tuple[float, float, float]:
+    op()  # Let caches and lazy imports settle before measuring
+    started = time.perf_counter()
+    for _ in range(calls):
+        op()
+    elapsed = (time.perf_counter() - started) / calls
+    tracemalloc.start()
+    baseline = tracemalloc.get_traced_memory()[0]
+    peaks = 0
+    for _ in range(calls):
+        before = tracemalloc.get_traced_memory()[0]
+        tracemalloc.reset_peak()
+        op()
+        peaks += tracemalloc.get_traced_memory()[1] - before
+    retained = tracemalloc.get_traced_memory()[0] - baseline
+    tracemalloc.stop()
+    return elapsed * 1e6, peaks / calls / 1024, retained / calls
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--calls", type=int, default=200)
+    args = parser.parse_args()
+
+    signer = algokit_utils.SigningAccount(private_key=account.generate_account()[0])
+    sender = signer.address
+    parent, child = multiprocessing.Pipe()
+    server = multiprocessing.Process(target=_serve, args=(sender, child))
+    server.start()
+    try:
+        url = typing.cast(str, parent.recv())
+        algorand = algokit_utils.AlgorandClient.from_clients(AlgodClient("", url))
+        algorand.account.set_signer_from_account(signer)
+        bank = BankClient(algorand=algorand, app_id=APP_ID, default_sender=sender)
+        payment = algorand.create_transaction.payment(
+            algokit_utils.PaymentParams(
+                sender=sender,
+                receiver=bank.app_address,
+                amount=algokit_utils.AlgoAmount.from_micro_algo(5),
+            )
+        )
+        no_populate = algokit_utils.SendParams(populate_app_call_resources=False)
+
+        cases: list[tuple[str, Callable[[], object]]] = [
+            ("state.global_state", lambda: bank.state.global_state),
+            ("state.box.deposits", lambda: bank.state.box.deposits),
+            ("params.withdraw", lambda: bank.params.withdraw((5,))),
+            ("new_group().withdraw", lambda: bank.new_group().withdraw((5,))),
+            (
+                "state...total_deposit",
+                lambda: bank.state.global_state.total_deposit,
+            ),
+            (
+                "state...deposits.get_value",
+                lambda: bank.state.box.deposits.get_value(sender),
+            ),
+            (
+                "send.deposit",
+                lambda: bank.send.deposit(("memo", payment), send_params=no_populate),
+            ),
+        ]
+        print(f"{'operation':<28}{'time':>12}{'peak':>12}{'retained':>12}")
+        for name, op in cases:
+            elapsed, peak, retained = _measure(op, args.calls)
+            print(f"{name:<28}{elapsed:>10.1f}us{peak:>10.1f}KB{retained:>11.0f}B")
+    finally:
+        parent.send(None)
+        server.join()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,80 @@
+"""
+Measures what loading each generated client's app spec costs, eagerly vs lazily.
+
+Usage: python -m benchmarks.app_spec [--runs N]
+
+Each measurement runs in a fresh interpreter with `algokit_utils` already imported,
+so only the client module and its spec are counted. "eager" parses the spec with the
+generator's `Arc56Contract.from_json` as part of the import, "lazy" defers it to the
+first `APP_SPEC` access. Memory is what tracemalloc holds after each step.
+"""
+
+import argparse
+import json
+import statistics
+import subprocess
+import sys
+from pathlib import Path
+
+ARTIFACTS = Path(__file__).parent.parent / "smart_contracts" / "artifacts"
+
+_PROBE = """
+import importlib, json, sys, time, tracemalloc
+import algokit_utils
+
+module_name, mode = sys.argv[1:]
+tracemalloc.start()
+started = time.perf_counter()
+module = importlib.import_module(module_name)
+if mode == "eager":
+    spec = algokit_utils.Arc56Contract.from_json(module._APP_SPEC_JSON)
+imported = time.perf_counter()
+import_kb = tracemalloc.get_traced_memory()[0] / 1024
+if mode == "lazy":
+    spec = module.APP_SPEC
+    spec.methods
+first_use = time.perf_counter()
+print(json.dumps({
+    "import_ms": (imported - started) * 1e3,
+    "import_kb": import_kb,
+    "first_use_ms": (first_use - imported) * 1e3,
+    "resident_kb": tracemalloc.get_traced_memory()[0] / 1024,
+}))
+"""
+
+
+def _probe(module_name: str, mode: str) -> dict[str, float]:
+    output = subprocess.run(
+        [sys.executable, "-c", _PROBE, module_name, mode],
+        check=True,
+        capture_output=True,
+        text=True,
+    ).stdout
+    return json.loads(output.splitlines()[-1])
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--runs", type=int, default=5)
+    args = parser.parse_args()
+
+    print(
+        f"{'contract':<12}{'mode':<8}{'import':>10}{'memory':>10}"
+        f"{'first use':>12}{'memory':>10}"
+    )
+    for client in sorted(ARTIFACTS.glob("*/*_client.py")):
+        module_name = f"smart_contracts.artifacts.{client.parent.name}.{client.stem}"
+        for mode in ("eager", "lazy"):
+            runs = [_probe(module_name, mode) for _ in range(args.runs)]
+            import_ms, import_kb, first_use_ms, resident_kb = (
+                statistics.median(run[key] for run in runs)
+                for key in ("import_ms", "import_kb", "first_use_ms", "resident_kb")
+            )
+            print(
+                f"{client.parent.name:<12}{mode:<8}{import_ms:>8.2f}ms"
+                f"{import_kb:>8.0f}KB{first_use_ms:>10.2f}ms{resident_kb:>8.0f}KB"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,119 @@
+"""
+Compares `StatementIngester.ingest` with `backfill` over a recorded history on a local algod stand-in.
+
+Usage: python -m benchmarks.backfill [--rounds N] [--window N] [--latency SECONDS] [--workers N]
+
+The stand-in serves the indexer searches from its own process. Each round holds one
+deposit, and every search waits `--latency`, about what a remote indexer takes. Each
+worker is a fresh process that imports the SDK, which on few cores costs about a
+second apiece, so the gain shows over long histories rather than short ones.
+"""
+
+import argparse
+import multiprocessing
+import tempfile
+import time
+import typing
+from multiprocessing.connection import Connection
+
+import algokit_utils
+from algosdk import abi, account, logic, transaction
+from algosdk.v2client.algod import AlgodClient
+from algosdk.v2client.indexer import IndexerClient
+
+from smart_contracts.artifacts.bank.bank_client import BankClient
+from smart_contracts.bank.statements import StatementIndex, StatementIngester
+from tests.algod_stub import AlgodStub
+
+APP_ID = 1234
+DEPOSITORS = 100
+
+
+def _serve(rounds: int, latency: float, conn: Connection) -> None:
+    with AlgodStub() as stub:
+        deposit = abi.Method.from_signature("deposit(string,pay)uint64")
+        stub.returns[deposit.get_selector()] = (1).to_bytes(8, "big")
+        memo = abi.StringType().encode("memo")
+        params = transaction.SuggestedParams(0, 1, 1000, bytes(32), "stub-v1")
+        depositors = [
+            typing.cast(str, account.generate_account()[1]) for _ in range(DEPOSITORS)
+        ]
+        address = logic.get_application_address(APP_ID)
+        for i in range(rounds):
+            sender = depositors[i % DEPOSITORS]
+            note = i.to_bytes(8, "big")
+            pay = transaction.PaymentTxn(sender, params, address, 1, note=note)
+            call = transaction.ApplicationCallTxn(
+                sender,
+                params,
+                APP_ID,
+                transaction.OnComplete.NoOpOC,
+                app_args=[deposit.get_selector(), memo],
+                note=note,
+            )
+            stub.record(
+                typing.cast(
+                    list[transaction.Transaction],
+                    transaction.assign_group_id([pay, call]),
+                )
+            )
+        # Only the searches wait, not the recording
+        stub.latency = latency
+        conn.send(stub.url)
+        conn.recv()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--rounds", type=int, default=2_000)
+    parser.add_argument("--window", type=int, default=50)
+    parser.add_argument("--latency", type=float, default=0.2)
+    parser.add_argument("--workers", type=int, default=4)
+    args = parser.parse_args()
+    rounds = typing.cast(int, args.rounds)
+    window = typing.cast(int, args.window)
+
+    parent, child = multiprocessing.Pipe()
+    server = multiprocessing.Process(
+        target=_serve, args=(rounds, typing.cast(float, args.latency), child)
+    )
+    server.start()
+    try:
+        url = typing.cast(str, parent.recv())
+        algorand = algokit_utils.AlgorandClient.from_clients(AlgodClient("", url))
+        bank = BankClient(algorand=algorand, app_id=APP_ID)
+        indexer = IndexerClient("", url)
+        with tempfile.TemporaryDirectory() as directory:
+            with StatementIndex(f"{directory}/ingest.sqlite", APP_ID) as index:
+                started = time.perf_counter()
+                ingested = StatementIngester(bank, index, indexer, window=window)
+                added = ingested.ingest()
+                sequential = time.perf_counter() - started
+            with StatementIndex(f"{directory}/backfill.sqlite", APP_ID) as index:
+                started = time.perf_counter()
+                result = StatementIngester(
+                    bank, index, indexer, window=window
+                ).backfill(
+                    f"{directory}/segments", workers=typing.cast(int, args.workers)
+                )
+                parallel = time.perf_counter() - started
+    finally:
+        parent.send(None)
+        server.join()
+
+    assert added == result.items == rounds
+    print(
+        f"{rounds} rounds in windows of {window}, "
+        f"{typing.cast(float, args.latency) * 1000:.0f} ms simulated indexer latency"
+    )
+    print(
+        f"  ingest():              {sequential:7.2f}s  {rounds / sequential:8.0f} rounds/s"
+    )
+    print(
+        f"  backfill({typing.cast(int, args.workers):>2} workers): {parallel:7.2f}s  "
+        f"{rounds / parallel:8.0f} rounds/s"
+    )
+
+
+if __name__ == "__main__":
+    main()
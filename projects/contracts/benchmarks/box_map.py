@@ -0,0 +1,88 @@
+"""
+Compares `<Client>.state.box.<map>.get_map()` with `BoxMapReader` reads against a local algod stand-in.
+
+Usage: python -m benchmarks.box_map [--boxes N] [--latency SECONDS] [--workers N]
+
+The stand-in runs in its own process so the client side gets the GIL to itself. It is
+pure Python, so at low latency its own CPU caps throughput well below a real node's.
+"""
+
+import argparse
+import multiprocessing
+import time
+import typing
+from multiprocessing.connection import Connection
+
+import algokit_utils
+from algosdk import account, encoding
+from algosdk.v2client.algod import AlgodClient
+
+from smart_contracts._helpers.boxes import AlgodHttp, BoxMapReader
+from smart_contracts.artifacts.bank.bank_client import BankClient
+from tests.algod_stub import AlgodStub
+
+APP_ID = 1234
+
+
+def _serve(boxes: dict[bytes, bytes], latency: float, conn: Connection) -> None:
+    with AlgodStub(latency=latency) as stub:
+        stub.boxes[APP_ID] = boxes
+        conn.send(stub.url)
+        conn.recv()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--boxes", type=int, default=2_000)
+    parser.add_argument("--latency", type=float, default=0.02)
+    parser.add_argument("--workers", type=int, default=32)
+    args = parser.parse_args()
+
+    boxes = {
+        encoding.decode_address(account.generate_account()[1]): i.to_bytes(8, "big")
+        for i in range(args.boxes)
+    }
+    parent, child = multiprocessing.Pipe()
+    server = multiprocessing.Process(target=_serve, args=(boxes, args.latency, child))
+    server.start()
+    try:
+        url = typing.cast(str, parent.recv())
+        algorand = algokit_utils.AlgorandClient.from_clients(AlgodClient("", url))
+        bank = BankClient(algorand=algorand, app_id=APP_ID)
+
+        started = time.perf_counter()
+        expected = bank.state.box.deposits.get_map()
+        sequential = time.perf_counter() - started
+
+        with AlgodHttp(url, max_connections=args.workers) as http:
+            reader = BoxMapReader(
+                bank.app_client, "deposits", http, max_workers=args.workers
+            )
+            started = time.perf_counter()
+            result = reader.get_map()
+            concurrent = time.perf_counter() - started
+            started = time.perf_counter()
+            streamed = sum(1 for _ in reader.iter())
+            streaming = time.perf_counter() - started
+    finally:
+        parent.send(None)
+        server.join()
+
+    assert result == expected
+    assert streamed == len(expected)
+    print(f"{args.boxes} boxes, {args.latency * 1000:.1f} ms simulated algod latency")
+    print(
+        f"  get_map():          {sequential:7.2f}s  {args.boxes / sequential:8.0f} boxes/s"
+    )
+    print(
+        f"  BoxMapReader({args.workers:>2}):   {concurrent:7.2f}s  "
+        f"{args.boxes / concurrent:8.0f} boxes/s"
+    )
+    print(
+        f"  BoxMapReader.iter(): {streaming:7.2f}s  "
+        f"{args.boxes / streaming:8.0f} boxes/s"
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,83 @@
+"""
+Compares the per-call client overhead of the generated `BankClient` with `FastCalls`.
+
+Usage: python -m benchmarks.call_overhead [--calls N] [--entries N]
+
+Only the offline part of a call is timed: turning typed arguments into
+`AppCallMethodCallParams` and decoding an `ABIReturn`. Nothing is sent.
+"""
+
+import argparse
+import time
+from collections.abc import Callable
+
+import algokit_utils
+from algosdk import account, atomic_transaction_composer
+
+from smart_contracts._helpers.fastcall import FastCalls
+from smart_contracts.artifacts.bank.bank_client import BankClient, WithdrawArgs
+
+APP_ID = 1234
+WITHDRAW = "withdraw(uint64)uint64"
+IMPORT = "import_deposits((address,uint64)[])uint64"
+
+
+def _per_call_us(fn: Callable[[], object], calls: int) -> float:
+    started = time.perf_counter()
+    for _ in range(calls):
+        fn()
+    return (time.perf_counter() - started) / calls * 1e6
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--calls", type=int, default=20_000)
+    parser.add_argument("--entries", type=int, default=8)
+    args = parser.parse_args()
+
+    algorand = algokit_utils.AlgorandClient.default_localnet()
+    sender = algorand.account.random().address
+    bank = BankClient(algorand=algorand, app_id=APP_ID, default_sender=sender)
+    fast = FastCalls(bank)
+    entries = [(account.generate_account()[1], 5) for _ in range(args.entries)]
+    method = fast.codec(WITHDRAW).method
+    abi_return = algokit_utils.ABIReturn(
+        atomic_transaction_composer.ABIResult(
+            tx_id="",
+            raw_value=(5).to_bytes(8, "big"),
+            return_value=5,
+            decode_error=None,
+            tx_info={},
+            method=method,
+        )
+    )
+    # Warm both paths so the one-off lookups aren't timed
+    fast.params(WITHDRAW, (1,))
+    fast.params(IMPORT, (entries,))
+
+    cases: list[tuple[str, Callable[[], object], Callable[[], object]]] = [
+        (
+            "withdraw params",
+            lambda: bank.params.withdraw(WithdrawArgs(amount=5)),
+            lambda: fast.params(WITHDRAW, WithdrawArgs(amount=5)),
+        ),
+        (
+            f"import_deposits params ({args.entries} entries)",
+            lambda: bank.params.import_deposits((entries,)),
+            lambda: fast.params(IMPORT, (entries,)),
+        ),
+        (
+            "withdraw return decode",
+            lambda: bank.decode_return_value(WITHDRAW, abi_return),
+            lambda: fast.codec(WITHDRAW).decode(abi_return),
+        ),
+    ]
+    print(f"{'case':<36}{'generated':>12}{'fast':>12}{'speedup':>10}")
+    for name, generated, fast_path in cases:
+        before = _per_call_us(generated, args.calls)
+        after = _per_call_us(fast_path, args.calls)
+        print(f"{name:<36}{before:>10.1f}us{after:>10.1f}us{before / after:>9.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,119 @@
+"""
+Measures what importing many generated clients costs, as generated vs sharing the client runtime.
+
+Usage: python -m benchmarks.client_runtime [--copies N ...] [--runs N]
+
+Each contract's client is generated afresh from its ARC-56 spec, and then both
+variants are made from it. "generated" gets the build's other rewrites but keeps
+its own classes. "shared" also goes through `share_client_runtime`, so its classes
+derive from the bases in `client_runtime`. Each variant is copied once per
+contract in a fleet of `--copies` contracts, and every copy is imported in a fresh
+interpreter that already has `algokit_utils` and the runtime imported. Bytecode is
+cached before measuring, as it is once a deployment has run. Memory is what
+tracemalloc holds after the imports.
+"""
+
+import argparse
+import json
+import shutil
+import statistics
+import subprocess
+import sys
+import tempfile
+import typing
+from pathlib import Path
+
+from smart_contracts._helpers.client_runtime import share_client_runtime, slim_client
+from smart_contracts._helpers.lazy_spec import make_client_lazy
+
+ROOT = Path(__file__).parent.parent
+ARTIFACTS = ROOT / "smart_contracts" / "artifacts"
+
+_PROBE = """
+import importlib, json, pathlib, sys, time, tracemalloc
+import algokit_utils
+import smart_contracts._helpers.client_runtime
+
+directory, copies = sys.argv[1], int(sys.argv[2])
+sys.path.insert(0, directory)
+tracemalloc.start()
+started = time.perf_counter()
+for client in sorted(pathlib.Path(directory).glob("*.py"))[:copies]:
+    importlib.import_module(client.stem)
+print(json.dumps({
+    "import_ms": (time.perf_counter() - started) * 1e3,
+    "memory_kb": tracemalloc.get_traced_memory()[0] / 1024,
+}))
+"""
+
+
+def _generate(spec: Path, directory: Path, *, shared: bool) -> Path:
+    client = directory / f"{spec.parent.name}.py"
+    subprocess.run(
+        [sys.executable, "-m", "algokit_client_generator", "-a", spec, "-o", client],
+        check=True,
+        capture_output=True,
+    )
+    make_client_lazy(client)
+    if shared:
+        share_client_runtime(client)
+    slim_client(client)
+    return client
+
+
+def _probe(directory: Path, copies: int) -> dict[str, float]:
+    output = subprocess.run(
+        [sys.executable, "-c", _PROBE, directory, str(copies)],
+        check=True,
+        capture_output=True,
+        text=True,
+        cwd=ROOT,
+    ).stdout
+    return typing.cast(dict[str, float], json.loads(output.splitlines()[-1]))
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--copies", type=int, nargs="+", default=[1, 10, 50])
+    parser.add_argument("--runs", type=int, default=5)
+    args = parser.parse_args()
+    fleet_sizes = typing.cast(list[int], args.copies)
+    most = max(fleet_sizes)
+
+    print(f"{'contracts':<11}{'variant':<11}{'lines':>8}{'import':>12}{'memory':>11}")
+    with tempfile.TemporaryDirectory() as tmp:
+        for variant in ("generated", "shared"):
+            fleet = Path(tmp) / variant
+            generated = Path(tmp) / f"{variant}-clients"
+            fleet.mkdir()
+            generated.mkdir()
+            clients = [
+                _generate(spec, generated, shared=variant == "shared")
+                for spec in sorted(ARTIFACTS.glob("*/*.arc56.json"))
+            ]
+            for copy in range(most):
+                client = clients[copy % len(clients)]
+                # Numbered first, so the first few copies take turns by contract
+                shutil.copy(client, fleet / f"client_{copy:04d}_{client.stem}.py")
+            # Writes the bytecode caches
+            _probe(fleet, most)
+            for copies in fleet_sizes:
+                lines = sum(
+                    len(clients[i % len(clients)].read_text().splitlines())
+                    for i in range(copies)
+                )
+                runs = [
+                    _probe(fleet, copies) for _ in range(typing.cast(int, args.runs))
+                ]
+                import_ms, memory_kb = (
+                    statistics.median(run[key] for run in runs)
+                    for key in ("import_ms", "memory_kb")
+                )
+                print(
+                    f"{copies:<11}{variant:<11}{lines:>8}{import_ms:>10.1f}ms"
+                    f"{memory_kb:>9.0f}KB"
+                )
+
+
+if __name__ == "__main__":
+    main()
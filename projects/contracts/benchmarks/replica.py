@@ -0,0 +1,73 @@
+"""
+Measures `DepositReplica` loads, round applies, lookups and reopens, in memory and mapped.
+
+Usage: python -m benchmarks.replica [--deposits N] [--lookups N] [--dir PATH]
+
+Deposits are random addresses, so nothing is read from algod. Rounds change 100
+balances each, about as many as a busy Bank sees, and a checkpoint follows the last
+one. Lookups go through `balance_of`, address decoding included, like a caller's.
+"""
+
+import argparse
+import os
+import random
+import tempfile
+import time
+
+from algosdk import encoding
+
+from smart_contracts.bank.replica import DepositReplica
+
+# Balances changed per round applied
+ROUND_CHANGES = 100
+ROUNDS = 100
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--deposits", type=int, default=1_000_000)
+    parser.add_argument("--lookups", type=int, default=200_000)
+    parser.add_argument("--dir")
+    args = parser.parse_args()
+
+    keys = [os.urandom(32) for _ in range(args.deposits)]
+    deposits = [(encoding.encode_address(key), 1_000_000) for key in keys]
+    wanted = [address for address, _ in random.choices(deposits, k=args.lookups)]
+    print(f"{args.deposits} deposits, {args.lookups} lookups")
+    print(
+        f"{'replica':<10}{'load s':>10}{'rounds/s':>10}{'lookups/s':>12}{'reopen s':>10}"
+    )
+    with tempfile.TemporaryDirectory(dir=args.dir) as directory:
+        for mapped in (False, True):
+            path = os.path.join(directory, f"deposits-{mapped}")
+            started = time.perf_counter()
+            with DepositReplica(path, mapped=mapped) as replica:
+                replica.load(deposits, 1)
+                replica.checkpoint()
+                loaded = time.perf_counter() - started
+
+                started = time.perf_counter()
+                for round_ in range(2, ROUNDS + 2):
+                    changed = random.sample(keys, ROUND_CHANGES)
+                    replica.apply(round_, {key: round_ for key in changed})
+                replica.checkpoint()
+                applied = time.perf_counter() - started
+
+                started = time.perf_counter()
+                found = sum(replica.balance_of(address) > 0 for address in wanted)
+                looked_up = time.perf_counter() - started
+
+            started = time.perf_counter()
+            with DepositReplica(path, mapped=mapped) as replica:
+                reopened = time.perf_counter() - started
+                assert replica.round == ROUNDS + 1
+            assert found == args.lookups
+            print(
+                f"{'mapped' if mapped else 'dict':<10}{loaded:>10.2f}"
+                f"{ROUNDS / applied:>10.0f}{args.lookups / looked_up:>12.0f}"
+                f"{reopened:>10.2f}"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,102 @@
+"""
+Measures signatures per second for `Bank.deposit` groups against the number of workers.
+
+Usage: python -m benchmarks.signing [--groups N] [--accounts N] [--workers N ...]
+
+Groups are built offline once, then signed serially the way `TransactionComposer.send`
+does it, and with `SigningPool` using thread and process workers. Each pool signs a
+small batch first so that starting its workers isn't timed. Nothing is sent. Part
+of the speedup comes from `SigningPool` encoding each transaction once, so it shows
+even with a single worker; the rest scales with the cores available.
+"""
+
+import argparse
+import base64
+import copy
+import os
+import time
+
+import algokit_utils
+from algosdk import encoding, transaction
+from algosdk.atomic_transaction_composer import TransactionWithSigner
+from algosdk.v2client.algod import AlgodClient
+
+from smart_contracts._helpers.signing import SigningPool
+from smart_contracts.artifacts.bank.bank_client import BankClient
+
+APP_ID = 1234
+
+
+def _deposits(groups: int, accounts: int) -> list[list[TransactionWithSigner]]:
+    algorand = algokit_utils.AlgorandClient.from_clients(
+        AlgodClient("", "http://localhost:1")
+    )
+    sp = transaction.SuggestedParams(fee=1000, first=1, last=1001, gh=bytes(32))
+    bank = BankClient(algorand=algorand, app_id=APP_ID)
+    depositors = [algorand.account.random().address for _ in range(accounts)]
+    built: list[list[TransactionWithSigner]] = []
+    for index in range(groups):
+        depositor = depositors[index % accounts]
+        pay = transaction.PaymentTxn(depositor, sp, bank.app_address, index + 1)
+        composer = algokit_utils.TransactionComposer(
+            algod=algorand.client.algod,
+            get_signer=algorand.account.get_signer,
+            get_suggested_params=lambda: copy.copy(sp),
+        )
+        composer.add_app_call_method_call(
+            bank.params.deposit(
+                ("memo", pay), algokit_utils.CommonAppCallParams(sender=depositor)
+            )
+        )
+        built.append(composer.build().transactions)
+    return built
+
+
+def _sign_serially(groups: list[list[TransactionWithSigner]]) -> list[bytes]:
+    """What `TransactionComposer.send` does before sending: sign, take IDs, encode."""
+    blobs: list[bytes] = []
+    for group in groups:
+        blob = bytearray()
+        for tws in group:
+            stxn = tws.signer.sign_transactions([tws.txn], [0])[0]
+            tws.txn.get_txid()
+            blob += base64.b64decode(encoding.msgpack_encode(stxn))
+        blobs.append(bytes(blob))
+    return blobs
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--groups", type=int, default=2_000)
+    parser.add_argument("--accounts", type=int, default=64)
+    parser.add_argument("--workers", type=int, nargs="+")
+    args = parser.parse_args()
+
+    cores = os.cpu_count() or 1
+    workers: list[int] = args.workers or sorted(
+        {1, *(2**power for power in range(cores.bit_length())), cores}
+    )
+    groups = _deposits(args.groups, args.accounts)
+    signatures = sum(len(group) for group in groups)
+
+    started = time.perf_counter()
+    expected = _sign_serially(groups)
+    serial = signatures / (time.perf_counter() - started)
+
+    print(f"{args.groups} groups, {signatures} signatures, {cores} cores")
+    print(f"{'signer':<20}{'signatures/s':>14}{'speedup':>10}")
+    print(f"{'serial':<20}{serial:>14.0f}{1:>9.2f}x")
+    for threads in (True, False):
+        for count in workers:
+            with SigningPool(workers=count, threads=threads) as pool:
+                pool.sign(groups[: count * 4])
+                started = time.perf_counter()
+                signed = pool.sign(groups)
+                rate = signatures / (time.perf_counter() - started)
+            name = f"{'threads' if threads else 'processes'} x{count}"
+            print(f"{name:<20}{rate:>14.0f}{rate / serial:>9.2f}x")
+            assert [group.blob for group in signed] == expected
+
+
+if __name__ == "__main__":
+    main()
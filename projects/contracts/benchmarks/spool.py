@@ -0,0 +1,71 @@
+"""
+Measures how fast `TransactionSpool` writes, reopens and replays a large spool.
+
+Usage: python -m benchmarks.spool [--groups N] [--batch N] [--dir PATH]
+
+Groups are synthetic, random bytes the size of a signed payment, so nothing is
+signed or sent. Appends are timed in batches of `--batch` groups, each synced to
+disk once. Reopening reads the whole index and settled log; replaying reads the
+bytes of every unsettled group through the spool's memory map, as `drain` does.
+"""
+
+import argparse
+import base64
+import os
+import tempfile
+import time
+
+from smart_contracts._helpers.signing import SignedGroup
+from smart_contracts._helpers.spool import TransactionSpool
+
+# Bytes of a signed single-transaction payment group, roughly
+GROUP_SIZE = 250
+
+
+def _groups(count: int) -> list[SignedGroup]:
+    return [
+        SignedGroup(
+            [base64.b32encode(os.urandom(32)).decode().rstrip("=")],
+            os.urandom(GROUP_SIZE),
+            1,
+            1001,
+        )
+        for _ in range(count)
+    ]
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--groups", type=int, default=1_000_000)
+    parser.add_argument("--batch", type=int, default=10_000)
+    parser.add_argument("--dir")
+    args = parser.parse_args()
+
+    groups = _groups(args.groups)
+    with tempfile.TemporaryDirectory(dir=args.dir) as directory:
+        path = os.path.join(directory, "spool")
+        started = time.perf_counter()
+        with TransactionSpool(path) as spool:
+            for start in range(0, len(groups), args.batch):
+                spool.append(groups[start : start + args.batch])
+        written = time.perf_counter() - started
+
+        started = time.perf_counter()
+        with TransactionSpool(path) as spool:
+            opened = time.perf_counter() - started
+            replayed = sum(len(spool.blob(record)) for record in spool.pending)
+        replay = time.perf_counter() - started - opened
+        size = os.path.getsize(path) + os.path.getsize(path + ".idx")
+
+    assert replayed == GROUP_SIZE * args.groups
+    print(f"{args.groups} groups, {size / 2**20:.0f} MiB on disk")
+    print(f"{'step':<10}{'seconds':>10}{'groups/s':>14}{'MiB/s':>10}")
+    for step, seconds in (("append", written), ("reopen", opened), ("replay", replay)):
+        print(
+            f"{step:<10}{seconds:>10.2f}{args.groups / seconds:>14.0f}"
+            f"{size / 2**20 / seconds:>10.0f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
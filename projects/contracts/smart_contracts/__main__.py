@@ -10,6 +10,9 @@ from shutil import rmtree
 from algokit_utils.config import config
 from dotenv import load_dotenv
 
+from smart_contracts._helpers.client_runtime import share_client_runtime, slim_client
+from smart_contracts._helpers.lazy_spec import make_client_lazy
+
 # Set trace_all to True to capture all transactions, defaults to capturing traces only on failure
 # Learn more about using AlgoKit AVM Debugger to debug your TEAL source codes and inspect various kinds of
 # Algorand transactions in atomic groups -> https://github.com/algorandfoundation/algokit-avm-vscode-debugger
@@ -152,6 +155,23 @@ def build(output_dir: Path, contract_path: Path) -> Path:
                     raise Exception(
                         f"Could not generate typed client:\n{generate_result.stdout}"
                     )
+            # Defer app spec parsing to first use, share the contract-agnostic helpers
+            # and cut per-call allocations
+            for generated_client in output_dir.glob("*_client.py"):
+                make_client_lazy(generated_client)
+                share_client_runtime(generated_client)
+                slim_client(generated_client)
+                # The rewrites leave code black wouldn't, e.g. blank lines at the end
+                format_result = subprocess.run(
+                    [sys.executable, "-m", "black", "-q", str(generated_client)],
+                    stdout=subprocess.PIPE,
+                    stderr=subprocess.STDOUT,
+                    text=True,
+                )
+                if format_result.returncode:
+                    raise Exception(
+                        f"Could not format typed client:\n{format_result.stdout}"
+                    )
     if client_file:
         return output_dir / client_file
     return output_dir
@@ -0,0 +1 @@
+"""Off-chain runtime helpers shared by the generated typed clients."""
@@ -0,0 +1,195 @@
+import mmap
+import os
+import struct
+import typing
+from collections.abc import Iterable, Iterator
+from types import TracebackType
+
+# Slots in a new table; it doubles whenever it's more than `_MAX_LOAD` full.
+DEFAULT_CAPACITY = 1 << 16
+
+# The file header: the round the table was last flushed at, and its slot count.
+# Padded to the size of a slot, so every slot starts at a multiple of it
+_HEADER = struct.Struct("<QQ32x")
+# A slot: its state, then the public key and the value it maps it to
+_SLOT = struct.Struct("<B7x32sQ")
+_KEY_OFFSET = 8
+_VALUE = struct.Struct("<Q")
+_VALUE_OFFSET = 40
+_EMPTY, _LIVE, _DELETED = 0, 1, 2
+_MAX_LOAD = 0.7
+
+
+class AddressTable:
+    """
+    A hash table from 32-byte public keys to uint64 values, in a memory-mapped file.
+
+    Lookups hash the key's first bytes, which are uniformly distributed for Algorand
+    addresses, and probe linearly from there, so they stay O(1) without the table
+    ever being read into memory: the OS pages in the slots that are used. Deleted
+    slots are marked rather than emptied, so an update or delete rewrites only the
+    key's own slot, each in one assignment, and other threads can read the table
+    while one thread writes it.
+
+    Writes reach the file as the OS flushes them. `flush` syncs them and records the
+    round they bring the table up to, which `round` reads back after reopening.
+    """
+
+    def __init__(self, path: str | os.PathLike[str], capacity: int = DEFAULT_CAPACITY):
+        self.path = os.fspath(path)
+        if not os.path.exists(self.path) or os.path.getsize(self.path) == 0:
+            _create(self.path, 0, max(_power_of_two(capacity), 8), [])
+        self._file = open(self.path, "r+b")
+        self._open()
+
+    @property
+    def round(self) -> int:
+        return typing.cast(tuple[int, int], _HEADER.unpack_from(self._map))[0]
+
+    @property
+    def _map(self) -> mmap.mmap:
+        return self._table[0]
+
+    def __len__(self) -> int:
+        return self._live
+
+    def get(self, key: bytes) -> int | None:
+        map_, mask = self._table
+        found = _find(map_, mask, key)
+        if found < 0:
+            return None
+        return typing.cast(tuple[int], _VALUE.unpack_from(map_, found + _VALUE_OFFSET))[
+            0
+        ]
+
+    def __contains__(self, key: bytes) -> bool:
+        map_, mask = self._table
+        return _find(map_, mask, key) >= 0
+
+    def set(self, key: bytes, value: int) -> None:
+        found = _find(self._map, self._capacity - 1, key)
+        if found < 0:
+            if (self._live + self._deleted + 1) > self._capacity * _MAX_LOAD:
+                self._grow()
+            found = self._free_slot(key)
+            if self._map[found] == _DELETED:
+                self._deleted -= 1
+            self._live += 1
+        self._map[found : found + _SLOT.size] = _SLOT.pack(_LIVE, key, value)
+
+    def delete(self, key: bytes) -> None:
+        found = _find(self._map, self._capacity - 1, key)
+        if found >= 0:
+            self._map[found : found + _SLOT.size] = _SLOT.pack(_DELETED, key, 0)
+            self._live -= 1
+            self._deleted += 1
+
+    def items(self) -> Iterator[tuple[bytes, int]]:
+        slots = typing.cast(
+            Iterator[tuple[int, bytes, int]],
+            _SLOT.iter_unpack(self._map[_HEADER.size :]),
+        )
+        for state, key, value in slots:
+            if state == _LIVE:
+                yield key, value
+
+    def replace(self, entries: Iterable[tuple[bytes, int]], round_: int) -> None:
+        """Swaps the contents for `entries`, as of `round_`, writing them out aside."""
+        entries = list(entries)
+        # Room for as many again before it has to grow
+        self._swap(entries, round_, _power_of_two(2 * len(entries) + 8))
+
+    def flush(self, round_: int) -> None:
+        """Syncs every write to disk, then records that the table is up to `round_`."""
+        self._map.flush()
+        _HEADER.pack_into(self._map, 0, round_, self._capacity)
+        self._map.flush(0, _HEADER.size)
+
+    def close(self) -> None:
+        self._map.close()
+        self._file.close()
+
+    def __enter__(self) -> "AddressTable":
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_value: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        self.close()
+
+    def _open(self) -> None:
+        map_ = mmap.mmap(self._file.fileno(), 0)
+        self._capacity = typing.cast(tuple[int, int], _HEADER.unpack_from(map_))[1]
+        # Swapped in as one, so a reader never probes a map with another's mask
+        self._table = (map_, self._capacity - 1)
+        # The state bytes of every slot, counted without unpacking the slots
+        states = map_[_HEADER.size :: _SLOT.size]
+        self._live = states.count(_LIVE)
+        self._deleted = states.count(_DELETED)
+
+    def _free_slot(self, key: bytes) -> int:
+        map_, mask = self._table
+        slot = int.from_bytes(key[:8], "little") & mask
+        while True:
+            offset = _HEADER.size + slot * _SLOT.size
+            if map_[offset] != _LIVE:
+                return offset
+            slot = (slot + 1) & mask
+
+    def _grow(self) -> None:
+        # Without the deleted slots, it may not need to get any bigger
+        capacity = self._capacity
+        if (self._live + 1) > capacity * _MAX_LOAD / 2:
+            capacity *= 2
+        self._swap(list(self.items()), self.round, capacity)
+
+    def _swap(
+        self, entries: list[tuple[bytes, int]], round_: int, capacity: int
+    ) -> None:
+        """Writes `entries` to a new file and renames it over the table's own."""
+        _create(self.path + ".tmp", round_, capacity, entries)
+        os.replace(self.path + ".tmp", self.path)
+        self._file.close()
+        self._file = open(self.path, "r+b")
+        # The old map is left to close once no reader is still probing it
+        self._open()
+
+
+def _find(map_: mmap.mmap, mask: int, key: bytes) -> int:
+    """The offset of `key`'s live slot, -1 if it has none."""
+    slot = int.from_bytes(key[:8], "little") & mask
+    while True:
+        offset = _HEADER.size + slot * _SLOT.size
+        state = map_[offset]
+        if state == _EMPTY:
+            return -1
+        if (
+            state == _LIVE
+            and map_[offset + _KEY_OFFSET : offset + _VALUE_OFFSET] == key
+        ):
+            return offset
+        slot = (slot + 1) & mask
+
+
+def _power_of_two(n: int) -> int:
+    return 1 << max(n - 1, 0).bit_length()
+
+
+def _create(
+    path: str, round_: int, capacity: int, entries: list[tuple[bytes, int]]
+) -> None:
+    table = bytearray(_HEADER.size + capacity * _SLOT.size)
+    _HEADER.pack_into(table, 0, round_, capacity)
+    mask = capacity - 1
+    for key, value in entries:
+        slot = int.from_bytes(key[:8], "little") & mask
+        while table[_HEADER.size + slot * _SLOT.size] != _EMPTY:
+            slot = (slot + 1) & mask
+        _SLOT.pack_into(table, _HEADER.size + slot * _SLOT.size, _LIVE, key, value)
+    with open(path, "wb") as file:
+        file.write(table)
+        file.flush()
+        os.fsync(file.fileno())
@@ -0,0 +1,662 @@
+import asyncio
+import base64
+import dataclasses
+import inspect
+import typing
+from collections.abc import AsyncIterator, Callable, Coroutine
+
+import algokit_utils
+import httpx
+from algokit_utils.applications.abi import get_abi_decoded_value, get_abi_encoded_value
+from algokit_utils.config import config
+from algokit_utils.transactions.transaction_composer import prepare_group_for_sending
+from algosdk import encoding, error, transaction
+from algosdk.atomic_transaction_composer import (
+    AtomicTransactionComposer,
+    EmptySigner,
+    TransactionSigner,
+)
+from algosdk.v2client.algod import AlgodClient
+from algosdk.v2client.models import SimulateRequest, SimulateRequestTransactionGroup
+
+from smart_contracts._helpers.boxes import (
+    DEFAULT_MAX_WORKERS,
+    DEFAULT_PAGE_SIZE,
+    AsyncAlgodHttp,
+    BoxMapReader,
+)
+from smart_contracts._helpers.budget import DEFAULT_BUDGET, OpcodeBudget
+from smart_contracts._helpers.client_runtime import call_params
+
+_T = typing.TypeVar("_T")
+_K = typing.TypeVar("_K")
+_V = typing.TypeVar("_V")
+_S = typing.TypeVar("_S")
+_A = typing.TypeVar("_A", bound="AsyncComposerBase")
+_P = typing.ParamSpec("_P")
+
+_Json = dict[str, object]
+_AddToComposer = Callable[[algokit_utils.TransactionComposer], object]
+
+# Rounds to wait for confirmation when `SendParams` doesn't say, as `AppClient.send` does.
+DEFAULT_MAX_ROUNDS_TO_WAIT = 5
+
+
+class AsyncAlgod(AsyncAlgodHttp):
+    """
+    The algod endpoints the async clients need, over one pooled `httpx.AsyncClient`.
+
+    Failures surface as `algosdk.error.AlgodHTTPError`, the same as `AlgodClient`.
+    """
+
+    @staticmethod
+    def from_algod(
+        algod: AlgodClient, max_connections: int = DEFAULT_MAX_WORKERS
+    ) -> "AsyncAlgod":
+        return AsyncAlgod(
+            algod.algod_address,
+            algod.algod_token,
+            algod.headers,
+            max_connections=max_connections,
+        )
+
+    async def json(
+        self, path: str, params: dict[str, str | int] | None = None
+    ) -> _Json:
+        return _json_or_raise(await self.get(path, params))
+
+    async def post(self, path: str, content: bytes, content_type: str) -> _Json:
+        return _json_or_raise(
+            await self._client.post(
+                path, content=content, headers={"Content-Type": content_type}
+            )
+        )
+
+    async def status(self) -> _Json:
+        return await self.json("/status")
+
+    async def wait_for_block_after(self, round_: int) -> _Json:
+        return await self.json(f"/status/wait-for-block-after/{round_}")
+
+    async def suggested_params(self) -> transaction.SuggestedParams:
+        res = await self.json("/transactions/params")
+        return transaction.SuggestedParams(
+            typing.cast(int, res["fee"]),
+            typing.cast(int, res["last-round"]),
+            typing.cast(int, res["last-round"]) + 1000,
+            typing.cast(str, res["genesis-hash"]),
+            typing.cast(str, res["genesis-id"]),
+            flat_fee=False,
+            consensus_version=typing.cast(str, res["consensus-version"]),
+            min_fee=typing.cast(int, res["min-fee"]),
+        )
+
+    async def send_transactions(
+        self, signed: list[transaction.GenericSignedTransaction]
+    ) -> str:
+        """Submits a signed group and returns the first transaction's ID."""
+        body = b"".join(
+            base64.b64decode(typing.cast(str, encoding.msgpack_encode(txn)))
+            for txn in signed
+        )
+        return typing.cast(
+            str,
+            (await self.post("/transactions", body, "application/x-binary"))["txId"],
+        )
+
+    async def pending_transaction_info(self, tx_id: str) -> _Json:
+        return await self.json(f"/transactions/pending/{tx_id}")
+
+    async def simulate(self, request: SimulateRequest) -> _Json:
+        body = base64.b64decode(typing.cast(str, encoding.msgpack_encode(request)))
+        return await self.post("/transactions/simulate", body, "application/msgpack")
+
+    async def application_info(self, app_id: int) -> _Json:
+        return await self.json(f"/applications/{app_id}")
+
+    async def wait_for_confirmation(
+        self, tx_id: str, max_rounds: int = DEFAULT_MAX_ROUNDS_TO_WAIT
+    ) -> _Json:
+        """Long-polls `/status/wait-for-block-after` until `tx_id` is confirmed."""
+        round_ = typing.cast(int, (await self.status())["last-round"])
+        for _ in range(max_rounds + 1):
+            info = await self.pending_transaction_info(tx_id)
+            if typing.cast(int, info.get("confirmed-round", 0)) > 0:
+                return info
+            if info.get("pool-error"):
+                raise error.AlgodHTTPError(
+                    f"Transaction {tx_id} was rejected: {info['pool-error']}"
+                )
+            round_ = typing.cast(
+                int, (await self.wait_for_block_after(round_))["last-round"]
+            )
+        raise TimeoutError(
+            f"Transaction {tx_id} not confirmed after {max_rounds} rounds"
+        )
+
+
+def _json_or_raise(response: httpx.Response) -> _Json:
+    if response.is_error:
+        try:
+            message = typing.cast(dict[str, str], response.json())["message"]
+        except (ValueError, KeyError):
+            message = response.text
+        raise error.AlgodHTTPError(message, response.status_code)
+    return typing.cast(_Json, response.json())
+
+
+class _RecordedSimulation:
+    """Hands algokit's resource-population logic a simulate response fetched asynchronously."""
+
+    def __init__(self, response: _Json):
+        self._response = response
+
+    def simulate_transactions(
+        self, request: SimulateRequest, **kwargs: object
+    ) -> _Json:
+        return self._response
+
+
+@dataclasses.dataclass(frozen=True)
+class AsyncSendResult(typing.Generic[_T]):
+    """What `AsyncAppClient` returns from a send or simulate, mirroring `SendAppTransactionResult`."""
+
+    tx_ids: list[str]
+    confirmations: list[_Json]
+    returns: list[algokit_utils.ABIReturn]
+    abi_return: _T | None = None
+    simulate_response: _Json | None = None
+
+    @property
+    def tx_id(self) -> str:
+        return self.tx_ids[-1]
+
+
+class AsyncComposer:
+    """
+    Collects transactions like `TransactionComposer`, then sends or simulates them without blocking.
+
+    Transactions are only built at `send`/`simulate` time, once suggested params have
+    been fetched asynchronously; signing stays synchronous since it is pure CPU work.
+    Before the group is sent, or simulated without `extra_opcode_budget`, `budget` pads
+    it with the `opup` calls it needs, as a typed composer's `send` does. A method the
+    budget has no profile for is measured with a blocking simulate the first time.
+    """
+
+    def __init__(
+        self,
+        client: "AsyncAppClient",
+        *,
+        budget: OpcodeBudget | None = DEFAULT_BUDGET,
+    ):
+        self._client = client
+        self._budget = budget
+        self._steps: list[_AddToComposer] = []
+
+    def add_app_call_method_call(
+        self, params: algokit_utils.AppCallMethodCallParams
+    ) -> "AsyncComposer":
+        self._steps.append(lambda composer: composer.add_app_call_method_call(params))
+        return self
+
+    def add_payment(self, params: algokit_utils.PaymentParams) -> "AsyncComposer":
+        self._steps.append(lambda composer: composer.add_payment(params))
+        return self
+
+    def add_transaction(
+        self, txn: transaction.Transaction, signer: TransactionSigner | None = None
+    ) -> "AsyncComposer":
+        self._steps.append(lambda composer: composer.add_transaction(txn, signer))
+        return self
+
+    async def _build(self, *, padded: bool = True) -> AtomicTransactionComposer:
+        composer = await self._client.new_transaction_composer()
+        for step in self._steps:
+            step(composer)
+        if padded and self._budget is not None:
+            self._budget.ensure(composer, self._client)
+        atc = composer.build().atc
+        atc.build_group()
+        return atc
+
+    async def send(
+        self, send_params: algokit_utils.SendParams | None = None
+    ) -> AsyncSendResult[object]:
+        send_params = send_params or algokit_utils.SendParams()
+        algod = self._client.algod
+        atc = await self._build()
+        populate = send_params.get("populate_app_call_resources")
+        if populate if populate is not None else config.populate_app_call_resource:
+            response = await algod.simulate(
+                _simulate_request(atc, allow_unnamed_resources=True)
+            )
+            atc = prepare_group_for_sending(
+                atc,
+                typing.cast(AlgodClient, _RecordedSimulation(response)),
+                populate_app_call_resources=True,
+            )
+        atc.build_group()
+        signed = atc.gather_signatures()
+        await algod.send_transactions(signed)
+
+        tx_ids = atc.tx_ids
+        max_rounds = send_params.get("max_rounds_to_wait") or DEFAULT_MAX_ROUNDS_TO_WAIT
+        await algod.wait_for_confirmation(tx_ids[-1], max_rounds)
+        confirmations = list(
+            await asyncio.gather(*(algod.pending_transaction_info(t) for t in tx_ids))
+        )
+        return _result(atc, tx_ids, confirmations)
+
+    async def simulate(
+        self,
+        *,
+        allow_more_logs: bool | None = None,
+        allow_unnamed_resources: bool | None = None,
+        extra_opcode_budget: int | None = None,
+        simulation_round: int | None = None,
+    ) -> AsyncSendResult[object]:
+        """Simulates the group without signatures, as `simulate(skip_signatures=True)` does."""
+        # A simulate given extra budget doesn't need padding to succeed
+        atc = await self._build(padded=extra_opcode_budget is None)
+        response = await self._client.algod.simulate(
+            _simulate_request(
+                atc,
+                allow_more_logs=allow_more_logs,
+                allow_unnamed_resources=allow_unnamed_resources,
+                extra_opcode_budget=extra_opcode_budget,
+                simulation_round=simulation_round,
+            )
+        )
+        group = typing.cast(list[_Json], response["txn-groups"])[0]
+        if group.get("failure-message"):
+            raise error.AlgodHTTPError(
+                f"Simulation failed at transaction {group.get('failed-at')}: {group['failure-message']}"
+            )
+        confirmations = [
+            typing.cast(_Json, r["txn-result"])
+            for r in typing.cast(list[_Json], group["txn-results"])
+        ]
+        return dataclasses.replace(
+            _result(atc, atc.tx_ids, confirmations), simulate_response=response
+        )
+
+
+def _simulate_request(
+    atc: AtomicTransactionComposer,
+    *,
+    allow_more_logs: bool | None = None,
+    allow_unnamed_resources: bool | None = None,
+    extra_opcode_budget: int | None = None,
+    simulation_round: int | None = None,
+) -> SimulateRequest:
+    txns = [t.txn for t in atc.clone().build_group()]
+    return SimulateRequest(
+        txn_groups=[
+            SimulateRequestTransactionGroup(
+                txns=EmptySigner().sign_transactions(txns, list(range(len(txns))))
+            )
+        ],
+        allow_empty_signatures=True,
+        allow_more_logs=allow_more_logs or False,
+        allow_unnamed_resources=allow_unnamed_resources or False,
+        extra_opcode_budget=extra_opcode_budget or 0,
+        round=simulation_round,
+    )
+
+
+def _result(
+    atc: AtomicTransactionComposer, tx_ids: list[str], confirmations: list[_Json]
+) -> AsyncSendResult[object]:
+    returns = [
+        algokit_utils.ABIReturn(
+            atc.parse_result(method, tx_ids[index], confirmations[index])
+        )
+        for index, method in sorted(atc.method_dict.items())
+    ]
+    return AsyncSendResult(
+        tx_ids=tx_ids,
+        confirmations=confirmations,
+        returns=returns,
+        abi_return=returns[-1].value if returns else None,
+    )
+
+
+class AsyncAppClient:
+    """
+    Non-blocking counterpart of `AppClient` for one app, used by the `Async*Client` wrappers.
+
+    The wrapped `AppClient` is only used for offline work: the app spec, building call
+    parameters and looking up signers. Every request to algod goes through `algod`.
+    """
+
+    def __init__(
+        self, app_client: algokit_utils.AppClient, algod: AsyncAlgod | None = None
+    ):
+        self.app_client = app_client
+        self.algod = algod or AsyncAlgod.from_algod(app_client.algorand.client.algod)
+        self._box_maps: dict[str, BoxMapReader] = {}
+
+    @property
+    def app_id(self) -> int:
+        return self.app_client.app_id
+
+    @property
+    def app_spec(self) -> algokit_utils.Arc56Contract:
+        return self.app_client.app_spec
+
+    async def new_transaction_composer(self) -> algokit_utils.TransactionComposer:
+        """A `TransactionComposer` whose suggested params were fetched without blocking."""
+        params = await self.algod.suggested_params()
+        algorand = self.app_client.algorand
+        return algokit_utils.TransactionComposer(
+            algod=algorand.client.algod,
+            get_signer=algorand.account.get_signer,
+            get_suggested_params=lambda: params,
+        )
+
+    def new_group(self) -> AsyncComposer:
+        return AsyncComposer(self)
+
+    async def call(
+        self,
+        params: algokit_utils.AppCallMethodCallParams,
+        send_params: algokit_utils.SendParams | None = None,
+    ) -> AsyncSendResult[object]:
+        """
+        Sends a method call, or simulates it if the method is readonly, like `AppClient.send.call`.
+
+        A call that needs more opcodes than one app call has is sent with the `opup`
+        calls its group's budget pads it with, and its result is still that of the call.
+        """
+        if self.app_spec.get_arc56_method(params.method.get_signature()).readonly:
+            # Simulated with unnamed resources allowed, and not sent, so never padded
+            group = AsyncComposer(self, budget=None).add_app_call_method_call(params)
+            result = await group.simulate(allow_unnamed_resources=True)
+        else:
+            result = (
+                await self.new_group()
+                .add_app_call_method_call(params)
+                .send(send_params)
+            )
+        # Its return is the group's first, whatever its transaction's index
+        return dataclasses.replace(
+            result, abi_return=result.returns[0].value if result.returns else None
+        )
+
+    async def global_state(self) -> dict[str, object]:
+        """Decoded values of the app spec's global state keys."""
+        info = await self.algod.application_info(self.app_id)
+        raw = {
+            base64.b64decode(typing.cast(str, entry["key"])): typing.cast(
+                _Json, entry["value"]
+            )
+            for entry in typing.cast(
+                list[_Json], typing.cast(_Json, info["params"]).get("global-state", [])
+            )
+        }
+        result: dict[str, object] = {}
+        for name, key in self.app_spec.state.keys.global_state.items():
+            value = raw.get(base64.b64decode(key.key))
+            if value is not None:
+                stored = (
+                    typing.cast(int, value["uint"])
+                    if value["type"] == 2
+                    else base64.b64decode(typing.cast(str, value["bytes"]))
+                )
+                result[name] = get_abi_decoded_value(
+                    stored, key.value_type, self.app_spec.structs
+                )
+        return result
+
+    async def box_map_value(
+        self, map_name: str, key: object
+    ) -> algokit_utils.ABIValue | None:
+        metadata = self.app_spec.state.maps.box[map_name]
+        name = base64.b64decode(metadata.prefix or "") + get_abi_encoded_value(
+            key, metadata.key_type, self.app_spec.structs
+        )
+        value = await self.algod.box_value(self.app_id, name)
+        if value is None:
+            return None
+        return get_abi_decoded_value(value, metadata.value_type, self.app_spec.structs)
+
+    def box_map(self, map_name: str) -> BoxMapReader:
+        """The map's reader, kept for this client; read it asynchronously through `algod`."""
+        reader = self._box_maps.get(map_name)
+        if reader is None:
+            reader = self._box_maps[map_name] = BoxMapReader(self.app_client, map_name)
+        return reader
+
+    async def aclose(self) -> None:
+        for reader in self._box_maps.values():
+            reader.close()
+        await self.algod.aclose()
+
+
+class AsyncMapState(typing.Generic[_K, _V]):
+    """Async counterpart of a typed client's `_MapState`."""
+
+    def __init__(self, client: AsyncAppClient, map_name: str):
+        self._client = client
+        self._map_name = map_name
+
+    async def get_value(self, key: _K) -> _V | None:
+        return typing.cast(
+            _V | None, await self._client.box_map_value(self._map_name, key)
+        )
+
+    async def get_map(self) -> dict[_K, _V]:
+        return {key: value async for key, value in self.aiter()}
+
+    async def aiter(
+        self, page_size: int = DEFAULT_PAGE_SIZE
+    ) -> AsyncIterator[tuple[_K, _V]]:
+        """Streams the map page by page; see `BoxMapReader.aiter`."""
+        reader = self._client.box_map(self._map_name)
+        async for key, value in reader.aiter(page_size, self._client.algod):
+            yield typing.cast(_K, key), typing.cast(_V, value)
+
+
+def _arguments(
+    signature: inspect.Signature, args: tuple[object, ...], kwargs: dict[str, object]
+) -> dict[str, object]:
+    return typing.cast(dict[str, object], signature.bind(*args, **kwargs).arguments)
+
+
+def _check_mirrors(cls: type, mirrors: type) -> None:
+    """Fails unless `cls` has a counterpart of each method a generated class declares."""
+    declared = typing.cast(dict[str, object], vars(mirrors))
+    missing = sorted(
+        name
+        for name, value in declared.items()
+        if not name.startswith("_") and callable(value) and not hasattr(cls, name)
+    )
+    if missing:
+        raise TypeError(
+            f"{cls.__name__} has no counterpart of {mirrors.__name__}'s "
+            + ", ".join(missing)
+        )
+
+
+def async_send(
+    method: Callable[
+        typing.Concatenate[_S, _P], algokit_utils.SendAppTransactionResult[_T]
+    ],
+) -> Callable[
+    typing.Concatenate["AsyncSendBase", _P],
+    Coroutine[object, object, AsyncSendResult[_T]],
+]:
+    """The async counterpart of a generated `<Contract>Send` method, with its signature."""
+    name = method.__name__
+    signature = inspect.signature(method)
+
+    async def send(
+        self: AsyncSendBase, /, *args: _P.args, **kwargs: _P.kwargs
+    ) -> AsyncSendResult[_T]:
+        call = _arguments(signature, (self, *args), kwargs)
+        result = await self._call(
+            name,
+            call.get("args"),
+            typing.cast(algokit_utils.CommonAppCallParams | None, call.get("params")),
+            typing.cast(algokit_utils.SendParams | None, call.get("send_params")),
+        )
+        return typing.cast(AsyncSendResult[_T], result)
+
+    send.__name__ = send.__qualname__ = name
+    send.__doc__ = method.__doc__
+    return send
+
+
+def async_compose(
+    method: Callable[typing.Concatenate[_S, _P], _S],
+) -> Callable[typing.Concatenate[_A, _P], _A]:
+    """The counterpart of a generated `<Contract>Composer` method, with its signature."""
+    name = method.__name__
+    signature = inspect.signature(method)
+
+    def compose(self: _A, /, *args: _P.args, **kwargs: _P.kwargs) -> _A:
+        call = _arguments(signature, (self, *args), kwargs)
+        return self._call(
+            name,
+            call.get("args"),
+            typing.cast(algokit_utils.CommonAppCallParams | None, call.get("params")),
+        )
+
+    compose.__name__ = compose.__qualname__ = name
+    compose.__doc__ = method.__doc__
+    return compose
+
+
+class AsyncSendBase:
+    """
+    Base of an `Async*Client`'s `send`, with a coroutine for each generated `send` method.
+
+    A subclass names the generated class it stands in for, as in `class AsyncBankSend(
+    AsyncSendBase, mirrors=BankSend)`, and declares its methods with `async_send`, so
+    they keep their generated signatures; leaving one out fails when the subclass is
+    defined. Each is sent as `AsyncAppClient.call` sends it.
+    """
+
+    def __init_subclass__(cls, mirrors: type, **kwargs: object) -> None:
+        super().__init_subclass__(**kwargs)
+        _check_mirrors(cls, mirrors)
+
+    def __init__(self, app: "AsyncAppClient"):
+        self._app = app
+
+    async def _call(
+        self,
+        method: str,
+        args: object | None,
+        params: algokit_utils.CommonAppCallParams | None,
+        send_params: algokit_utils.SendParams | None,
+    ) -> AsyncSendResult[object]:
+        return await self._app.call(
+            call_params(self._app.app_client, method, args, params), send_params
+        )
+
+
+class AsyncComposerBase:
+    """
+    Base of an `Async*Client`'s composer, with a method for each generated composer method.
+
+    Subclasses are declared as `AsyncSendBase`'s are, with `async_compose`. The group
+    is padded and sent by an `AsyncComposer`.
+    """
+
+    def __init_subclass__(cls, mirrors: type, **kwargs: object) -> None:
+        super().__init_subclass__(**kwargs)
+        _check_mirrors(cls, mirrors)
+
+    def __init__(self, app: "AsyncAppClient"):
+        self._app = app
+        self._composer = app.new_group()
+
+    def _call(
+        self: _A,
+        method: str,
+        args: object | None,
+        params: algokit_utils.CommonAppCallParams | None,
+    ) -> _A:
+        self._composer.add_app_call_method_call(
+            call_params(self._app.app_client, method, args, params)
+        )
+        return self
+
+    def composer(self) -> AsyncComposer:
+        return self._composer
+
+    def add_transaction(
+        self: _A, txn: transaction.Transaction, signer: TransactionSigner | None = None
+    ) -> _A:
+        self._composer.add_transaction(txn, signer)
+        return self
+
+    async def send(
+        self, send_params: algokit_utils.SendParams | None = None
+    ) -> AsyncSendResult[object]:
+        return await self._composer.send(send_params)
+
+    async def simulate(
+        self,
+        *,
+        allow_more_logs: bool | None = None,
+        allow_unnamed_resources: bool | None = None,
+        extra_opcode_budget: int | None = None,
+        simulation_round: int | None = None,
+    ) -> AsyncSendResult[object]:
+        return await self._composer.simulate(
+            allow_more_logs=allow_more_logs,
+            allow_unnamed_resources=allow_unnamed_resources,
+            extra_opcode_budget=extra_opcode_budget,
+            simulation_round=simulation_round,
+        )
+
+
+class _GlobalValues:
+    def __init__(self, values: dict[str, object]):
+        self._values = values
+
+    def get_value(self, name: str) -> object:
+        return self._values.get(name)
+
+    def get_all(self) -> dict[str, object]:
+        return self._values
+
+
+@dataclasses.dataclass(frozen=True)
+class _Namespace:
+    global_state: _GlobalValues
+
+
+class _GlobalSnapshot:
+    """Stands in for an `AppClient` whose global state was read asynchronously."""
+
+    def __init__(
+        self, app_spec: algokit_utils.Arc56Contract, values: dict[str, object]
+    ):
+        self.app_spec = app_spec
+        self.state = _Namespace(global_state=_GlobalValues(values))
+
+
+class AsyncGlobalState(typing.Generic[_T]):
+    """
+    Async counterpart of a typed client's `state.global_state`.
+
+    `get` reads every key in one request, and returns the generated accessor `accessor`
+    makes, e.g. `BankState(app_client).global_state`, over what it read, so each key
+    keeps its generated property and type.
+    """
+
+    def __init__(
+        self, app: "AsyncAppClient", accessor: Callable[[algokit_utils.AppClient], _T]
+    ):
+        self._app = app
+        self._accessor = accessor
+
+    async def get(self) -> _T:
+        snapshot = _GlobalSnapshot(self._app.app_spec, await self._app.global_state())
+        return self._accessor(typing.cast(algokit_utils.AppClient, snapshot))
+
+    async def get_all(self) -> dict[str, object]:
+        return await self._app.global_state()
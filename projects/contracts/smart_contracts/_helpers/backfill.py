@@ -0,0 +1,193 @@
+import logging
+import multiprocessing
+import os
+import pickle
+import tempfile
+import typing
+from collections.abc import Callable
+from concurrent.futures import (
+    FIRST_COMPLETED,
+    Executor,
+    Future,
+    ProcessPoolExecutor,
+    ThreadPoolExecutor,
+    wait,
+)
+from dataclasses import dataclass
+from types import TracebackType
+
+logger = logging.getLogger(__name__)
+
+# Rounds per segment: what a worker fetches in one go, and what's checkpointed.
+DEFAULT_SEGMENT_SIZE = 10_000
+
+_R = typing.TypeVar("_R")
+
+
+@dataclass(frozen=True)
+class Segment:
+    start: int
+    # Inclusive, like the indexer's max-round
+    end: int
+
+
+@dataclass(frozen=True)
+class BackfillResult:
+    segments: int
+    # Segments whose items were read back from a checkpoint instead of fetched
+    resumed: int
+    items: int
+
+
+def segments(start: int, end: int, size: int) -> list[Segment]:
+    """
+    The segments covering rounds `start` to `end`, aligned to multiples of `size`.
+
+    Aligned, a range that starts later, e.g. when resuming, is split the same way.
+    """
+    plan = []
+    while start <= end:
+        last = min((start // size + 1) * size - 1, end)
+        plan.append(Segment(start, last))
+        start = last + 1
+    return plan
+
+
+class Backfill(typing.Generic[_R]):
+    """
+    Fetches a range of rounds a segment at a time on a pool, merging in round order.
+
+    `fetch` is called with each segment on a worker and returns the segment's items,
+    e.g. decoded transactions, in round order. Workers are processes unless `threads`,
+    so `fetch` then has to be a module-level function, or a `functools.partial` of
+    one, and its items picklable. `sink` is called on the calling thread with each
+    segment's items once every segment before it has been, so it sees the whole range
+    in round order and needs no locking.
+
+    Segments fetched out of turn are checkpointed to a file in `directory` until
+    they're merged, and at most `ahead` segments beyond the next to merge are in
+    flight or waiting, which bounds memory when one segment is slow. A backfill
+    stopped part way and run again with the same `directory` only fetches the
+    segments it hadn't: where it starts again is the sink's to say, by passing the
+    round after the last it has as `start`.
+    """
+
+    def __init__(
+        self,
+        fetch: Callable[[Segment], list[_R]],
+        sink: Callable[[Segment, list[_R]], None],
+        directory: str | os.PathLike[str],
+        *,
+        segment_size: int = DEFAULT_SEGMENT_SIZE,
+        workers: int | None = None,
+        threads: bool = False,
+        ahead: int | None = None,
+    ):
+        self.fetch = fetch
+        self.sink = sink
+        self.directory = os.fspath(directory)
+        os.makedirs(self.directory, exist_ok=True)
+        self.segment_size = segment_size
+        self.workers = workers or os.cpu_count() or 1
+        self.ahead = ahead or 4 * self.workers
+        self._executor: Executor
+        if threads:
+            self._executor = ThreadPoolExecutor(self.workers)
+        else:
+            # Forking a process that runs threads, e.g. HTTP pools, can deadlock
+            self._executor = ProcessPoolExecutor(
+                self.workers, mp_context=multiprocessing.get_context("spawn")
+            )
+
+    def run(self, start: int, end: int) -> BackfillResult:
+        """Fetches and merges every round from `start` to `end`."""
+        plan = segments(start, end, self.segment_size)
+        self._discard_before(start)
+        fetching: dict[int, Future[list[_R]]] = {}
+        fetched: dict[int, list[_R]] = {}
+        submitted = merged = resumed = items = 0
+        try:
+            while merged < len(plan):
+                while submitted < len(plan) and submitted <= merged + self.ahead:
+                    saved = self._load(plan[submitted])
+                    if saved is None:
+                        fetching[submitted] = self._executor.submit(
+                            self.fetch, plan[submitted]
+                        )
+                    else:
+                        fetched[submitted] = saved
+                        resumed += 1
+                    submitted += 1
+                if merged not in fetched:
+                    done, _ = wait(fetching.values(), return_when=FIRST_COMPLETED)
+                    for i, future in list(fetching.items()):
+                        if future in done:
+                            fetched[i] = future.result()
+                            del fetching[i]
+                            # The next to merge goes straight to the sink instead
+                            if i != merged:
+                                self._save(plan[i], fetched[i])
+                    continue
+                segment = plan[merged]
+                segment_items = fetched.pop(merged)
+                self.sink(segment, segment_items)
+                self._remove(segment)
+                items += len(segment_items)
+                merged += 1
+                logger.debug(
+                    f"Merged rounds {segment.start}-{segment.end}: "
+                    f"{len(segment_items)} items, {merged}/{len(plan)} segments"
+                )
+        finally:
+            for future in fetching.values():
+                future.cancel()
+        return BackfillResult(segments=len(plan), resumed=resumed, items=items)
+
+    def close(self) -> None:
+        self._executor.shutdown(cancel_futures=True)
+
+    def __enter__(self) -> "Backfill[_R]":
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_value: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        self.close()
+
+    def _path(self, segment: Segment) -> str:
+        return os.path.join(self.directory, f"{segment.start}-{segment.end}.pickle")
+
+    def _load(self, segment: Segment) -> list[_R] | None:
+        try:
+            with open(self._path(segment), "rb") as file:
+                return typing.cast(list[_R], pickle.load(file))
+        except FileNotFoundError:
+            return None
+
+    def _save(self, segment: Segment, segment_items: list[_R]) -> None:
+        """Writes beside the checkpoint and renames, so a crash never leaves half of one."""
+        with tempfile.NamedTemporaryFile(
+            "wb", dir=self.directory, delete=False, suffix=".tmp"
+        ) as file:
+            pickle.dump(segment_items, file, protocol=pickle.HIGHEST_PROTOCOL)
+            file.flush()
+            os.fsync(file.fileno())
+        os.replace(file.name, self._path(segment))
+
+    def _remove(self, segment: Segment) -> None:
+        try:
+            os.remove(self._path(segment))
+        except FileNotFoundError:
+            pass
+
+    def _discard_before(self, start: int) -> None:
+        """Removes checkpoints of segments the sink has, left by a crash after merging."""
+        for name in os.listdir(self.directory):
+            last = name.removesuffix(".pickle").rpartition("-")[2]
+            if name.endswith(".tmp") or (
+                name.endswith(".pickle") and last.isdigit() and int(last) < start
+            ):
+                os.remove(os.path.join(self.directory, name))
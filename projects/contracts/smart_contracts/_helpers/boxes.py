@@ -0,0 +1,476 @@
+import asyncio
+import base64
+import logging
+import threading
+import time
+import typing
+from collections.abc import AsyncIterator, Iterable, Iterator
+from concurrent.futures import ThreadPoolExecutor
+from types import TracebackType
+
+import algokit_utils
+import httpx
+from algokit_utils.applications.abi import get_abi_decoded_value
+from algosdk.v2client.algod import AlgodClient
+
+logger = logging.getLogger(__name__)
+
+# Concurrent box reads per map fetch; also the size of the keep-alive connection pool.
+DEFAULT_MAX_WORKERS = 16
+DEFAULT_RETRIES = 3
+RETRY_BACKOFF = 0.2
+DEFAULT_TIMEOUT = 10.0
+
+# Boxes requested (and held in memory) at a time when streaming a map.
+DEFAULT_PAGE_SIZE = 1_000
+
+# Worth retrying: algod is overloaded or restarting, not telling us the request is wrong.
+_RETRY_STATUSES = frozenset({429, 500, 502, 503, 504})
+
+_Entry = tuple[str, algokit_utils.ABIValue]
+_T = typing.TypeVar("_T")
+_P = typing.ParamSpec("_P")
+
+
+class BoxPage(typing.NamedTuple):
+    """
+    One page of `/boxes`; `value` is None where the node did not return values inline.
+
+    `next_token` is None on the last page, and also on nodes that predate box paging,
+    which ignore `max`/`next`/`values` and return every name in one response.
+    """
+
+    boxes: list[tuple[bytes, bytes | None]]
+    next_token: str | None
+
+
+def _b64(data: bytes) -> str:
+    return base64.b64encode(data).decode()
+
+
+def _page_params(
+    prefix: bytes, limit: int, next_token: str | None
+) -> dict[str, str | int]:
+    params: dict[str, str | int] = {"max": limit, "values": "true"}
+    if prefix:
+        params["prefix"] = "b64:" + _b64(prefix)
+    if next_token is not None:
+        params["next"] = next_token
+    return params
+
+
+def _parse_page(response: httpx.Response) -> BoxPage:
+    response.raise_for_status()
+    body = typing.cast(dict[str, list[dict[str, str]]], response.json())
+    boxes = [
+        (
+            base64.b64decode(box["name"]),
+            base64.b64decode(box["value"]) if "value" in box else None,
+        )
+        for box in body["boxes"]
+    ]
+    return BoxPage(boxes, typing.cast(dict[str, str], body).get("next-token"))
+
+
+def _parse_value(response: httpx.Response) -> bytes | None:
+    if response.status_code == httpx.codes.NOT_FOUND:
+        return None
+    response.raise_for_status()
+    return base64.b64decode(typing.cast(dict[str, str], response.json())["value"])
+
+
+def _should_retry(error: httpx.HTTPError, attempt: int, retries: int) -> bool:
+    if attempt == retries:
+        return False
+    if isinstance(error, httpx.HTTPStatusError):
+        return error.response.status_code in _RETRY_STATUSES
+    return isinstance(error, httpx.TransportError)
+
+
+def _backoff(attempt: int) -> float:
+    return RETRY_BACKOFF * (1 << attempt)
+
+
+def _chunks(
+    boxes: list[tuple[bytes, bytes | None]], size: int
+) -> Iterator[list[tuple[bytes, bytes | None]]]:
+    for start in range(0, len(boxes), size):
+        yield boxes[start : start + size]
+
+
+class AlgodHttp:
+    """
+    Keep-alive, pooled HTTP session for the algod box endpoints.
+
+    `AlgodClient` opens a fresh connection for every request, which dominates the cost of
+    reading many small boxes. This keeps up to `max_connections` connections open and is
+    safe to share between threads.
+    """
+
+    def __init__(
+        self,
+        address: str,
+        token: str = "",
+        headers: dict[str, str] | None = None,
+        max_connections: int = DEFAULT_MAX_WORKERS,
+        timeout: float = DEFAULT_TIMEOUT,
+    ):
+        self._client = httpx.Client(
+            **_client_options(address, token, headers, max_connections, timeout)
+        )
+
+    @staticmethod
+    def from_algod(
+        algod: AlgodClient, max_connections: int = DEFAULT_MAX_WORKERS
+    ) -> "AlgodHttp":
+        """Connects to the same node, with the same credentials, as `algod`."""
+        return AlgodHttp(
+            algod.algod_address,
+            algod.algod_token,
+            algod.headers,
+            max_connections=max_connections,
+        )
+
+    def get(
+        self, path: str, params: dict[str, str | int] | None = None
+    ) -> httpx.Response:
+        return self._client.get(path, params=params)
+
+    def box_names(self, app_id: int) -> list[bytes]:
+        response = self.get(f"/applications/{app_id}/boxes")
+        response.raise_for_status()
+        boxes = typing.cast(dict[str, list[dict[str, str]]], response.json())["boxes"]
+        return [base64.b64decode(box["name"]) for box in boxes]
+
+    def box_page(
+        self, app_id: int, prefix: bytes, limit: int, next_token: str | None = None
+    ) -> BoxPage:
+        """Up to `limit` boxes whose names start with `prefix`, with values where supported."""
+        return _parse_page(
+            self.get(
+                f"/applications/{app_id}/boxes", _page_params(prefix, limit, next_token)
+            )
+        )
+
+    def box_value(self, app_id: int, name: bytes) -> bytes | None:
+        """Returns the box's value, or None if it no longer exists."""
+        return _parse_value(
+            self.get(f"/applications/{app_id}/box", {"name": "b64:" + _b64(name)})
+        )
+
+    def close(self) -> None:
+        self._client.close()
+
+    def __enter__(self) -> "AlgodHttp":
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_value: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        self.close()
+
+
+class AsyncAlgodHttp:
+    """Non-blocking counterpart of `AlgodHttp`, for use from a running event loop."""
+
+    def __init__(
+        self,
+        address: str,
+        token: str = "",
+        headers: dict[str, str] | None = None,
+        max_connections: int = DEFAULT_MAX_WORKERS,
+        timeout: float = DEFAULT_TIMEOUT,
+    ):
+        self._client = httpx.AsyncClient(
+            **_client_options(address, token, headers, max_connections, timeout)
+        )
+
+    @staticmethod
+    def from_algod(
+        algod: AlgodClient, max_connections: int = DEFAULT_MAX_WORKERS
+    ) -> "AsyncAlgodHttp":
+        return AsyncAlgodHttp(
+            algod.algod_address,
+            algod.algod_token,
+            algod.headers,
+            max_connections=max_connections,
+        )
+
+    async def get(
+        self, path: str, params: dict[str, str | int] | None = None
+    ) -> httpx.Response:
+        return await self._client.get(path, params=params)
+
+    async def box_page(
+        self, app_id: int, prefix: bytes, limit: int, next_token: str | None = None
+    ) -> BoxPage:
+        return _parse_page(
+            await self.get(
+                f"/applications/{app_id}/boxes", _page_params(prefix, limit, next_token)
+            )
+        )
+
+    async def box_value(self, app_id: int, name: bytes) -> bytes | None:
+        return _parse_value(
+            await self.get(f"/applications/{app_id}/box", {"name": "b64:" + _b64(name)})
+        )
+
+    async def aclose(self) -> None:
+        await self._client.aclose()
+
+    async def __aenter__(self) -> "AsyncAlgodHttp":
+        return self
+
+    async def __aexit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_value: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        await self.aclose()
+
+
+class _ClientOptions(typing.TypedDict):
+    base_url: str
+    headers: dict[str, str]
+    limits: httpx.Limits
+    timeout: float
+
+
+def _client_options(
+    address: str,
+    token: str,
+    headers: dict[str, str] | None,
+    max_connections: int,
+    timeout: float,
+) -> _ClientOptions:
+    return {
+        "base_url": address.rstrip("/") + "/v2",
+        "headers": {
+            **({"X-Algo-API-Token": token} if token else {}),
+            **(headers or {}),
+        },
+        "limits": httpx.Limits(
+            max_connections=max_connections, max_keepalive_connections=max_connections
+        ),
+        "timeout": timeout,
+    }
+
+
+class BoxMapReader:
+    """
+    Reads an ARC-56 box map with concurrent, individually retried box fetches.
+
+    `get_map` lists box names once, then values are fetched by a bounded pool of workers
+    over `AlgodHttp`'s keep-alive connections and decoded straight into the result dict.
+    `iter`/`aiter` instead stream the map a page at a time, so memory stays bounded by
+    `page_size` however large the map is. Keys and values are decoded exactly as
+    `AppClient.state.box.get_map` decodes them, so results are interchangeable with
+    `<Client>.state.box.<map>.get_map()`.
+
+    Without `http`, the reader opens its own connections to the app client's node when
+    first reading through them, and closes them in `close`, or on leaving a `with`
+    block; a given `http` is left open. `aiter` given its own transport opens none.
+    """
+
+    def __init__(
+        self,
+        app_client: algokit_utils.AppClient,
+        map_name: str,
+        http: AlgodHttp | None = None,
+        max_workers: int = DEFAULT_MAX_WORKERS,
+        retries: int = DEFAULT_RETRIES,
+    ):
+        metadata = app_client.app_spec.state.maps.box[map_name]
+        self._algod = app_client.algorand.client.algod
+        self._app_id = app_client.app_id
+        self._prefix = base64.b64decode(metadata.prefix or "")
+        self._key_type = metadata.key_type
+        self._value_type = metadata.value_type
+        self._structs = app_client.app_spec.structs
+        self._given_http = http
+        self._owned_http: AlgodHttp | None = None
+        self._http_lock = threading.Lock()
+        self._max_workers = max_workers
+        self._retries = retries
+
+    @property
+    def _http(self) -> AlgodHttp:
+        if self._given_http is not None:
+            return self._given_http
+        with self._http_lock:
+            if self._owned_http is None:
+                self._owned_http = AlgodHttp.from_algod(self._algod, self._max_workers)
+            return self._owned_http
+
+    def close(self) -> None:
+        """Closes the connections the reader opened; reading again opens new ones."""
+        with self._http_lock:
+            owned, self._owned_http = self._owned_http, None
+        if owned is not None:
+            owned.close()
+
+    def __enter__(self) -> "BoxMapReader":
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_value: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        self.close()
+
+    def get_map(self) -> dict[str, algokit_utils.ABIValue]:
+        """Every key/value pair currently in the map."""
+        names = [
+            name
+            for name in self._http.box_names(self._app_id)
+            if name.startswith(self._prefix)
+        ]
+        started = time.monotonic()
+        result = self._fetch_into({}, names)
+        elapsed = time.monotonic() - started
+        logger.debug(
+            f"Fetched {len(result)} boxes from app {self._app_id} in {elapsed:.2f}s "
+            f"({len(result) / elapsed if elapsed else 0:.0f} boxes/s)"
+        )
+        return result
+
+    def iter(self, page_size: int = DEFAULT_PAGE_SIZE) -> Iterator[_Entry]:
+        """
+        Lazily yields `(key, value)` pairs, requesting the next page only once needed.
+
+        Stopping early (breaking out of the loop) fetches nothing further. The map may
+        change between pages, so this is not a snapshot of a single round.
+        """
+        for page in self.pages(page_size):
+            yield from page
+
+    def pages(self, page_size: int = DEFAULT_PAGE_SIZE) -> Iterator[list[_Entry]]:
+        """Like `iter`, but yields each decoded page as a list."""
+        with ThreadPoolExecutor(
+            max_workers=self._max_workers, thread_name_prefix="box-fetch"
+        ) as executor:
+            next_token: str | None = None
+            while True:
+                page = self._with_retries(
+                    self._http.box_page,
+                    self._app_id,
+                    self._prefix,
+                    page_size,
+                    next_token,
+                )
+                for chunk in _chunks(page.boxes, page_size):
+                    missing = [name for name, value in chunk if value is None]
+                    fetched = dict(executor.map(self._fetch, missing))
+                    yield self._decode_chunk(chunk, fetched)
+                if page.next_token is None:
+                    return
+                next_token = page.next_token
+
+    async def aiter(
+        self, page_size: int = DEFAULT_PAGE_SIZE, http: AsyncAlgodHttp | None = None
+    ) -> AsyncIterator[_Entry]:
+        """Async counterpart of `iter`; values missing from a page are fetched concurrently."""
+        owned = http is None
+        client = http or AsyncAlgodHttp.from_algod(self._algod, self._max_workers)
+        limit = asyncio.Semaphore(self._max_workers)
+        try:
+            next_token: str | None = None
+            while True:
+                page = await self._with_async_retries(
+                    client.box_page, self._app_id, self._prefix, page_size, next_token
+                )
+                for chunk in _chunks(page.boxes, page_size):
+                    missing = [name for name, value in chunk if value is None]
+                    values = await asyncio.gather(
+                        *(self._afetch(client, limit, name) for name in missing)
+                    )
+                    for entry in self._decode_chunk(
+                        chunk, dict(zip(missing, values, strict=True))
+                    ):
+                        yield entry
+                if page.next_token is None:
+                    return
+                next_token = page.next_token
+        finally:
+            if owned:
+                await client.aclose()
+
+    def _decode_chunk(
+        self,
+        chunk: list[tuple[bytes, bytes | None]],
+        fetched: dict[bytes, bytes | None],
+    ) -> list[_Entry]:
+        entries = []
+        for name, inline in chunk:
+            # Older nodes ignore `prefix`, so names are always filtered here too
+            if not name.startswith(self._prefix):
+                continue
+            value = fetched.get(name) if inline is None else inline
+            if value is not None:
+                entries.append(self._decode(name, value))
+        return entries
+
+    def _fetch_into(
+        self, result: dict[str, algokit_utils.ABIValue], names: Iterable[bytes]
+    ) -> dict[str, algokit_utils.ABIValue]:
+        with ThreadPoolExecutor(
+            max_workers=self._max_workers, thread_name_prefix="box-fetch"
+        ) as executor:
+            for name, value in executor.map(self._fetch, names):
+                if value is not None:
+                    key, decoded = self._decode(name, value)
+                    result[key] = decoded
+        return result
+
+    def _decode(self, name: bytes, value: bytes) -> _Entry:
+        try:
+            key = get_abi_decoded_value(
+                name[len(self._prefix) :], self._key_type, self._structs
+            )
+            return str(key), get_abi_decoded_value(
+                value, self._value_type, self._structs
+            )
+        except Exception as e:
+            raise ValueError(f"Failed to decode value for box {name!r}") from e
+
+    def _fetch(self, name: bytes) -> tuple[bytes, bytes | None]:
+        return name, self._with_retries(self._http.box_value, self._app_id, name)
+
+    async def _afetch(
+        self, client: AsyncAlgodHttp, limit: asyncio.Semaphore, name: bytes
+    ) -> bytes | None:
+        async with limit:
+            return await self._with_async_retries(client.box_value, self._app_id, name)
+
+    def _with_retries(
+        self, request: typing.Callable[_P, _T], *args: _P.args, **kwargs: _P.kwargs
+    ) -> _T:
+        for attempt in range(self._retries + 1):
+            try:
+                return request(*args, **kwargs)
+            except httpx.HTTPError as e:
+                if not _should_retry(e, attempt, self._retries):
+                    raise
+            time.sleep(_backoff(attempt))
+        raise AssertionError("unreachable")
+
+    async def _with_async_retries(
+        self,
+        request: typing.Callable[_P, typing.Awaitable[_T]],
+        *args: _P.args,
+        **kwargs: _P.kwargs,
+    ) -> _T:
+        for attempt in range(self._retries + 1):
+            try:
+                return await request(*args, **kwargs)
+            except httpx.HTTPError as e:
+                if not _should_retry(e, attempt, self._retries):
+                    raise
+            await asyncio.sleep(_backoff(attempt))
+        raise AssertionError("unreachable")
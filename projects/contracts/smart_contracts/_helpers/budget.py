@@ -0,0 +1,228 @@
+import logging
+import math
+import threading
+import typing
+from collections.abc import Mapping, Sequence, Sized
+from dataclasses import dataclass
+
+import algokit_utils
+from algosdk import abi, transaction
+from algosdk.constants import APPCALL_TXN
+
+from smart_contracts._helpers.readonly import TypedAppClient
+
+logger = logging.getLogger(__name__)
+
+# Opcode budget each top-level app call contributes to the group's pool.
+APP_CALL_BUDGET = 700
+MAX_GROUP_SIZE = 16
+
+# Padding calls go to the app's own no-op `opup` method, which spends a little of
+# what it adds on ABI routing.
+OPUP_METHOD = "opup()void"
+OPUP_COST = 25
+
+# Extra budget granted to the fallback simulate so heavy calls don't fail while measured.
+SIMULATE_EXTRA_BUDGET = 320_000
+
+# Only the first 15 ABI arguments are passed as separate app args.
+_MAX_APP_ARGS = 15
+
+_Shape = tuple[int, ...]
+
+
+@dataclass(frozen=True)
+class CostProfile:
+    """Opcode cost of a method as `base + per_item * n`, where `n` is the length of its first dynamic argument."""
+
+    base: int
+    per_item: int = 0
+
+    def estimate(self, shape: _Shape) -> int:
+        return self.base + self.per_item * (shape[0] if shape else 0)
+
+
+# Counted from the approval TEAL (ABI routing included) and rounded up with some margin.
+# tests/budget_client_test.py checks them against what simulate measures on LocalNet.
+COST_PROFILES: Mapping[str, CostProfile] = {
+    # Bank
+    "deposit(string,pay)uint64": CostProfile(110),
+    "withdraw(uint64)uint64": CostProfile(90),
+    "balance_of(address)uint64": CostProfile(50),
+    "set_paused(bool)void": CostProfile(50),
+    "approve_successor(byte[])uint64": CostProfile(70),
+    "export_deposits((address,uint64)[],application)uint64": CostProfile(90, 40),
+    "import_deposits((address,uint64)[])uint64": CostProfile(80, 48),
+    # Counter
+    "incr_counter()uint64": CostProfile(50),
+    "get_count()uint64": CostProfile(40),
+    OPUP_METHOD: CostProfile(OPUP_COST),
+}
+
+
+class TypedComposer(typing.Protocol):
+    """Anything wrapping a `TransactionComposer`, i.e. every generated `*Composer`."""
+
+    def composer(self) -> algokit_utils.TransactionComposer: ...
+
+    def send(
+        self, send_params: algokit_utils.SendParams | None = None
+    ) -> algokit_utils.SendAtomicTransactionComposerResults: ...
+
+
+def _shape(method: abi.Method, app_args: list[bytes]) -> _Shape:
+    """Lengths of the dynamic array/string arguments, read from their uint16 prefixes."""
+    shape: list[int] = []
+    index = 1
+    for arg in method.args:
+        if abi.is_abi_transaction_type(arg.type):
+            continue
+        if index <= _MAX_APP_ARGS and isinstance(
+            arg.type, abi.ArrayDynamicType | abi.StringType
+        ):
+            shape.append(int.from_bytes(app_args[index][:2], "big"))
+        index += 1
+    return tuple(shape)
+
+
+def _value_shape(method: abi.Method, args: Sequence[object]) -> _Shape:
+    """The same shape as `_shape`, read from the argument values before they're encoded."""
+    shape: list[int] = []
+    index = 1
+    for arg, value in zip(method.args, args, strict=False):
+        if abi.is_abi_transaction_type(arg.type):
+            continue
+        if index <= _MAX_APP_ARGS and isinstance(
+            arg.type, abi.ArrayDynamicType | abi.StringType
+        ):
+            sized = value.encode() if isinstance(value, str) else value
+            shape.append(len(typing.cast(Sized, sized)))
+        index += 1
+    return tuple(shape)
+
+
+class OpcodeBudget:
+    """
+    Pads a group with `opup` calls so its pooled opcode budget covers every app call in it.
+
+    Costs come from `profiles` where a method is listed there, and otherwise from a single
+    simulate of the group with `app-budget-consumed` read back per transaction. Either way
+    the estimate is cached per `(method, argument shape)`, so a given call shape is only
+    ever simulated once per process.
+    """
+
+    def __init__(self, profiles: Mapping[str, CostProfile] = COST_PROFILES):
+        self._profiles = profiles
+        self._estimates: dict[tuple[str, _Shape], int] = {}
+        self._lock = threading.Lock()
+        self.simulations = 0
+
+    def required(self, composer: algokit_utils.TransactionComposer) -> int:
+        """Total opcode budget the app calls in `composer` need."""
+        built = composer.build_transactions()
+        keys: dict[int, tuple[str, _Shape]] = {}
+        for index, method in built.method_calls.items():
+            txn = typing.cast(transaction.ApplicationCallTxn, built.transactions[index])
+            app_args = typing.cast(list[bytes], txn.app_args)
+            keys[index] = (method.get_signature(), _shape(method, app_args))
+
+        with self._lock:
+            unknown = {
+                index
+                for index, key in keys.items()
+                if key not in self._estimates and key[0] not in self._profiles
+            }
+            for key in keys.values():
+                if key not in self._estimates and key[0] in self._profiles:
+                    self._estimates[key] = self._profiles[key[0]].estimate(key[1])
+
+        if unknown:
+            measured = self._simulate(composer)
+            with self._lock:
+                for index in unknown:
+                    self._estimates[keys[index]] = measured[index]
+                    logger.debug(
+                        f"Measured {keys[index][0]} with shape {keys[index][1]}: "
+                        f"{measured[index]} opcodes"
+                    )
+
+        with self._lock:
+            return sum(self._estimates[key] for key in keys.values())
+
+    def fits(
+        self, signature: str, method: abi.Method, args: Sequence[object] | None
+    ) -> bool:
+        """
+        Whether a lone call to `method` fits a single app call's budget, as far as is known.
+
+        Only profiles and earlier measurements are consulted, so this never simulates: a
+        call it knows nothing about doesn't fit, and is left to `ensure` to measure.
+        """
+        profile = self._profiles.get(signature)
+        if profile is not None and not profile.per_item:
+            return profile.base <= APP_CALL_BUDGET
+        shape = _value_shape(method, args or ())
+        if profile is not None:
+            return profile.estimate(shape) <= APP_CALL_BUDGET
+        with self._lock:
+            estimate = self._estimates.get((signature, shape))
+        return estimate is not None and estimate <= APP_CALL_BUDGET
+
+    def _simulate(self, composer: algokit_utils.TransactionComposer) -> list[int]:
+        self.simulations += 1
+        result = composer.simulate(
+            skip_signatures=True,
+            allow_unnamed_resources=True,
+            extra_opcode_budget=SIMULATE_EXTRA_BUDGET,
+        )
+        response = typing.cast(
+            dict[str, list[dict[str, list[dict[str, int]]]]], result.simulate_response
+        )
+        txn_results = response["txn-groups"][0]["txn-results"]
+        return [txn_result.get("app-budget-consumed", 0) for txn_result in txn_results]
+
+    def ensure(
+        self,
+        composer: algokit_utils.TransactionComposer | TypedComposer,
+        client: TypedAppClient,
+    ) -> int:
+        """
+        Adds just enough `opup` calls to `client`'s app for the group to fit its budget.
+
+        Returns the number of padding calls added.
+        """
+        if not isinstance(composer, algokit_utils.TransactionComposer):
+            composer = composer.composer()
+        required = self.required(composer)
+        built = composer.build_transactions()
+        app_calls = [
+            txn
+            for txn in built.transactions
+            if typing.cast(str, txn.type) == APPCALL_TXN
+        ]
+        shortfall = required - APP_CALL_BUDGET * len(app_calls)
+        if shortfall <= 0:
+            return 0
+
+        padding = math.ceil(shortfall / (APP_CALL_BUDGET - OPUP_COST))
+        if len(built.transactions) + padding > MAX_GROUP_SIZE:
+            raise ValueError(
+                f"Group needs {padding} more app calls for {required} opcodes, "
+                f"which does not fit in {MAX_GROUP_SIZE} transactions"
+            )
+        for index in range(padding):
+            composer.add_app_call_method_call(
+                client.app_client.params.call(
+                    algokit_utils.AppClientMethodCallParams(
+                        method=OPUP_METHOD,
+                        sender=typing.cast(str, app_calls[0].sender),
+                        note=f"opup:{index}".encode(),
+                    )
+                )
+            )
+        logger.debug(f"Padded group with {padding} opup calls for {required} opcodes")
+        return padding
+
+
+# Pads the calls the typed clients send and the groups their composers send or simulate
+DEFAULT_BUDGET = OpcodeBudget()
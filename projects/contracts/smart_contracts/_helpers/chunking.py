@@ -0,0 +1,284 @@
+import dataclasses
+import typing
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+
+import algokit_utils
+from algosdk import transaction
+from algosdk.atomic_transaction_composer import TransactionSigner
+
+from smart_contracts._helpers.resources import (
+    NO_RESOURCES,
+    Resources,
+    TxnReferences,
+    assign_references,
+)
+
+MAX_GROUP_SIZE = 16
+
+_ResultMapper = Callable[[algokit_utils.ABIReturn | None], object]
+_MethodCallParams = (
+    algokit_utils.AppCallMethodCallParams
+    | algokit_utils.AppCreateMethodCallParams
+    | algokit_utils.AppUpdateMethodCallParams
+)
+
+
+@dataclass(frozen=True)
+class _Call:
+    """One queued call and the transactions it brings along, which share its group."""
+
+    add: Callable[[algokit_utils.TransactionComposer, TxnReferences | None], object]
+    size: int
+    # ABI method calls among the transactions; the call's own return is the last one
+    method_calls: int
+    mapper: _ResultMapper | None
+    # Set for app calls whose references are planned offline rather than by simulate
+    app_id: int | None = None
+    resources: Resources | None = None
+
+
+@dataclass(frozen=True)
+class ChunkedSendResult:
+    """Per-call results in the order the calls were queued, plus each group's result."""
+
+    returns: list[object]
+    tx_ids: list[str]
+    groups: list[algokit_utils.SendAtomicTransactionComposerResults]
+
+
+class ChunkedSendError(Exception):
+    """Some groups failed; groups are only atomic on their own, so the rest were sent."""
+
+    def __init__(
+        self,
+        failures: dict[int, Exception],
+        returns: list[object | None],
+        tx_ids: list[str | None],
+    ):
+        super().__init__(
+            f"{len(failures)} group(s) failed to send: "
+            + ", ".join(f"#{index}: {error}" for index, error in failures.items())
+        )
+        self.failures = failures
+        # Per-call results as in `ChunkedSendResult`, None for calls in failed groups
+        self.returns = returns
+        self.tx_ids = tx_ids
+
+
+def _size(params: _MethodCallParams) -> tuple[int, int]:
+    """Transactions and ABI method calls a method call adds to its group."""
+    size, method_calls = 1, 1
+    for arg in typing.cast(list[object] | None, params.args) or []:
+        if not isinstance(arg, algokit_utils.AppMethodCallTransactionArgument):
+            continue
+        if hasattr(arg, "method"):
+            arg_size, arg_calls = _size(typing.cast(_MethodCallParams, arg))
+            size += arg_size
+            method_calls += arg_calls
+        else:
+            size += 1
+    return size, method_calls
+
+
+class ChunkedComposer:
+    """
+    Queues any number of calls and sends them as as many atomic groups as they need.
+
+    Calls are packed in order into groups of at most `max_group_size` transactions, and a
+    call is never split from the transactions passed as its arguments (e.g. a `deposit`
+    and its `pay_txn`). Groups are sent in parallel, so only each group is atomic: calls
+    in different groups can't rely on each other's effects.
+
+    App calls added with their `resources` also have those packed: a group only takes
+    a call if the references of all its planned calls still fit (see
+    `assign_references`), and a group made up of planned calls only is sent with its
+    references filled in and without the simulate that `populate_app_call_resources`
+    would otherwise cost.
+    """
+
+    def __init__(
+        self,
+        algorand: algokit_utils.AlgorandClient,
+        *,
+        max_group_size: int = MAX_GROUP_SIZE,
+        max_workers: int = 4,
+    ):
+        self._algorand = algorand
+        self._max_group_size = max_group_size
+        self._max_workers = max_workers
+        self._calls: list[_Call] = []
+
+    def __len__(self) -> int:
+        return len(self._calls)
+
+    def add_app_call_method_call(
+        self,
+        params: algokit_utils.AppCallMethodCallParams,
+        mapper: _ResultMapper | None = None,
+        resources: Resources | None = None,
+    ) -> "ChunkedComposer":
+        """
+        Queues a method call; pass the `resources` it touches to have them planned.
+
+        Planned calls get their references from the packer, replacing any in `params`.
+        """
+        size, method_calls = _size(params)
+
+        def add(
+            composer: algokit_utils.TransactionComposer,
+            references: TxnReferences | None,
+        ) -> object:
+            if references is None:
+                return composer.add_app_call_method_call(params)
+            return composer.add_app_call_method_call(
+                dataclasses.replace(
+                    params,
+                    box_references=list(references.boxes),
+                    account_references=references.accounts,
+                    app_references=references.apps,
+                )
+            )
+
+        return self._add(
+            _Call(add, size, method_calls, mapper, params.app_id, resources)
+        )
+
+    def add_payment(self, params: algokit_utils.PaymentParams) -> "ChunkedComposer":
+        return self._add(
+            _Call(lambda composer, _: composer.add_payment(params), 1, 0, None)
+        )
+
+    def add_transaction(
+        self, txn: transaction.Transaction, signer: TransactionSigner | None = None
+    ) -> "ChunkedComposer":
+        return self._add(
+            _Call(lambda composer, _: composer.add_transaction(txn, signer), 1, 0, None)
+        )
+
+    def _add(self, call: _Call) -> "ChunkedComposer":
+        if call.size > self._max_group_size:
+            raise ValueError(
+                f"A call needing {call.size} transactions can't fit a group of "
+                f"{self._max_group_size}"
+            )
+        self._calls.append(call)
+        return self
+
+    def groups(self) -> list[list[_Call]]:
+        """
+        The queued calls, packed in order into groups.
+
+        Each group takes calls until the next one would overflow its transactions or
+        its planned references, which gives the fewest groups that keep the order. A
+        call needing more references than it can carry itself is fine as long as the
+        calls around it have room to spare; if its group still can't hold them once
+        full, this raises ValueError.
+        """
+        groups: list[list[_Call]] = []
+        size = self._max_group_size
+        fits = True
+        for call in self._calls:
+            if size + call.size <= self._max_group_size:
+                fits_with = fits
+                if call.resources is not None:
+                    fits_with = _plan([*groups[-1], call]) is not None
+                # Until the group fits it keeps taking calls, which may bring room
+                if fits_with or not fits:
+                    groups[-1].append(call)
+                    size += call.size
+                    fits = fits_with
+                    continue
+            if not fits:
+                raise _unplannable(groups)
+            groups.append([call])
+            size = call.size
+            fits = call.resources is None or _plan([call]) is not None
+        if not fits:
+            raise _unplannable(groups)
+        return groups
+
+    def send(
+        self, send_params: algokit_utils.SendParams | None = None
+    ) -> ChunkedSendResult:
+        groups = self.groups()
+        with ThreadPoolExecutor(max_workers=self._max_workers) as executor:
+            futures = [
+                executor.submit(self._send_group, group, send_params)
+                for group in groups
+            ]
+        returns: list[object | None] = []
+        tx_ids: list[str | None] = []
+        results: list[algokit_utils.SendAtomicTransactionComposerResults] = []
+        failures: dict[int, Exception] = {}
+        for index, (group, future) in enumerate(zip(groups, futures, strict=True)):
+            error = future.exception()
+            if error is not None:
+                failures[index] = typing.cast(Exception, error)
+                returns.extend(None for _ in group)
+                tx_ids.extend(None for _ in group)
+                continue
+            result = future.result()
+            results.append(result)
+            txn, method_call = 0, 0
+            for call in group:
+                txn += call.size
+                method_call += call.method_calls
+                tx_ids.append(result.tx_ids[txn - 1])
+                abi_return = (
+                    result.returns[method_call - 1] if call.method_calls else None
+                )
+                returns.append(call.mapper(abi_return) if call.mapper else abi_return)
+        if failures:
+            raise ChunkedSendError(failures, returns, tx_ids)
+        return ChunkedSendResult(
+            returns=returns,
+            tx_ids=typing.cast(list[str], tx_ids),
+            groups=results,
+        )
+
+    def composers(self) -> list[algokit_utils.TransactionComposer]:
+        """
+        One unsent composer per group, with planned references filled in.
+
+        For building and signing groups elsewhere, e.g. with `SigningPool`; calls added
+        without `resources` only have the references given in their params.
+        """
+        return [self._compose(group) for group in self.groups()]
+
+    def _compose(self, group: list[_Call]) -> algokit_utils.TransactionComposer:
+        composer = self._algorand.new_group()
+        references = _plan(group)
+        assert references is not None, "groups() only packs references that fit"
+        planned = iter(references)
+        for call in group:
+            call.add(composer, next(planned) if call.resources is not None else None)
+        return composer
+
+    def _send_group(
+        self, group: list[_Call], send_params: algokit_utils.SendParams | None
+    ) -> algokit_utils.SendAtomicTransactionComposerResults:
+        composer = self._compose(group)
+        if all(call.resources is not None for call in group if call.app_id is not None):
+            send_params = algokit_utils.SendParams(**(send_params or {}))
+            send_params.setdefault("populate_app_call_resources", False)
+        return composer.send(send_params)
+
+
+def _unplannable(groups: list[list[_Call]]) -> ValueError:
+    return ValueError(
+        f"The references needed by group #{len(groups) - 1} can't fit in its "
+        f"{len(groups[-1])} calls"
+    )
+
+
+def _plan(group: list[_Call]) -> list[TxnReferences] | None:
+    """References for the group's planned calls, in order, or None if they don't fit."""
+    planned = [call for call in group if call.resources is not None]
+    resources = NO_RESOURCES
+    for call in planned:
+        resources |= typing.cast(Resources, call.resources)
+    return assign_references(
+        [typing.cast(int, call.app_id) for call in planned], resources
+    )
@@ -0,0 +1,1559 @@
+"""
+Contract-agnostic code shared by every generated typed client.
+
+The client generator emits its own copy of these helpers into each `*_client.py`,
+along with the parts of every client, factory and composer class that read nothing
+from the app spec. `share_client_runtime` rewrites a generated client to import the
+helpers from here and derive those classes from the bases here instead, so a client
+only keeps one-line shims naming each of its methods and loading more contracts adds
+little more than their method signatures.
+"""
+
+import ast
+import dataclasses
+import functools
+import re
+import sys
+import threading
+import typing
+from collections.abc import AsyncIterator, Callable, Iterator
+from pathlib import Path
+
+import algokit_utils
+from algosdk.atomic_transaction_composer import TransactionSigner
+from algosdk.source_map import SourceMap
+from algosdk.transaction import Transaction
+from algosdk.v2client.models import SimulateTraceConfig
+
+from smart_contracts._helpers.boxes import DEFAULT_PAGE_SIZE, BoxMapReader
+from smart_contracts._helpers.budget import DEFAULT_BUDGET, OpcodeBudget
+from smart_contracts._helpers.fastcall import MethodCodec, method_codec
+from smart_contracts._helpers.readonly import (
+    ReadonlyCallCache,
+    TypedAppClient,
+    installed_cache,
+)
+
+_K = typing.TypeVar("_K")
+_V = typing.TypeVar("_V")
+_T = typing.TypeVar("_T")
+_O = typing.TypeVar("_O")
+_C = typing.TypeVar("_C", bound="AppClientBase")
+_Self = typing.TypeVar("_Self")
+
+_ResultMapper = Callable[[algokit_utils.ABIReturn | None], object]
+
+# Shared stand-ins for the `params or CommonAppCall*Params()` defaults; both are frozen
+NO_PARAMS = algokit_utils.CommonAppCallParams()
+NO_CREATE_PARAMS = algokit_utils.CommonAppCallCreateParams()
+
+# Field names paired with the nested struct class a field holds, if any
+_StructFields = tuple[tuple[str, type | None], ...]
+
+_struct_fields: dict[type, _StructFields] = {}
+_struct_fields_lock = threading.Lock()
+
+
+def _is_struct(value: object) -> bool:
+    return hasattr(value, "__dataclass_fields__")
+
+
+def _fields_of(cls: type) -> _StructFields:
+    fields = _struct_fields.get(cls)
+    if fields is None:
+        hints = typing.cast(dict[str, object], typing.get_type_hints(cls))
+        declared = typing.cast(dict[str, object], vars(cls))["__dataclass_fields__"]
+        fields = tuple(
+            (name, typing.cast(type, hints[name]) if _is_struct(hints[name]) else None)
+            for name in typing.cast(dict[str, object], declared)
+        )
+        with _struct_fields_lock:
+            _struct_fields[cls] = fields
+    return fields
+
+
+def _to_tuple(value: object) -> object:
+    if _is_struct(value):
+        fields = typing.cast(dict[str, object], vars(value))
+        return tuple(_to_tuple(field) for field in fields.values())
+    if isinstance(value, list | tuple):
+        items = typing.cast(list[object] | tuple[object, ...], value)
+        return type(items)(_to_tuple(item) for item in items)
+    return value
+
+
+def _as_dict(value: object) -> dict[str, object]:
+    fields = typing.cast(dict[str, object], vars(value))
+    return {
+        name: _as_dict(field) if _is_struct(field) else field
+        for name, field in fields.items()
+    }
+
+
+def parse_abi_args(args: object | None = None) -> list[object] | None:
+    """Turns a typed args tuple or dataclass into the list the app client expects."""
+    if args is None:
+        return None
+    if isinstance(args, tuple):
+        method_args = list(typing.cast(tuple[object, ...], args))
+    elif _is_struct(args):
+        method_args = list(typing.cast(dict[str, object], vars(args)).values())
+    else:
+        raise ValueError(
+            "Invalid 'args' type. Expected 'tuple' or 'TypedDict' for respective typed arguments."
+        )
+    if not method_args:
+        return None
+    return [
+        (
+            arg
+            if isinstance(arg, algokit_utils.AppMethodCallTransactionArgument)
+            else _to_tuple(arg)
+        )
+        for arg in method_args
+    ]
+
+
+def init_dataclass(cls: type[_T], data: dict[str, object]) -> _T:
+    """Instantiates the struct dataclass `cls` from `data`, recursing into nested structs."""
+    values: dict[str, object] = {}
+    for name, struct in _fields_of(cls):
+        value = data.get(name)
+        if struct is not None and isinstance(value, dict):
+            value = init_dataclass(struct, typing.cast(dict[str, object], value))
+        values[name] = value
+    return cls(**values)
+
+
+class StateMethods(typing.Protocol):
+    def get_map(self, map_name: str) -> dict[str, object]: ...
+
+    def get_map_value(self, map_name: str, key: object) -> object | None: ...
+
+
+class MapState(typing.Generic[_K, _V]):
+    """
+    Reads a state map with strongly typed keys and values
+
+    Given the `app_client`, as the generated box maps are, the whole map is read with
+    a `BoxMapReader`'s concurrent fetches over its keep-alive connections, and can be
+    streamed a page at a time with `iter`/`aiter`. The connections stay open for the
+    next read until `close`.
+    """
+
+    def __init__(
+        self,
+        state_accessor: StateMethods,
+        map_name: str,
+        struct_class: type[_V] | None = None,
+        *,
+        app_client: algokit_utils.AppClient | None = None,
+    ):
+        self._state_accessor = state_accessor
+        self._map_name = map_name
+        self._struct_class = struct_class
+        self._app_client = app_client
+        self._reader: BoxMapReader | None = None
+        self._reader_lock = threading.Lock()
+
+    def get_map(self) -> dict[_K, _V]:
+        """Get all current values in the map"""
+        reader = self._box_map_reader()
+        if reader is not None:
+            result = typing.cast(dict[str, object], reader.get_map())
+        else:
+            result = self._state_accessor.get_map(self._map_name)
+        if not result:
+            return {}
+        if self._struct_class:
+            result = {k: self._value(v) for k, v in result.items()}
+        return typing.cast(dict[_K, _V], result)
+
+    def iter(self, page_size: int = DEFAULT_PAGE_SIZE) -> Iterator[tuple[_K, _V]]:
+        """Lazily yields `(key, value)` pairs a page at a time; see `BoxMapReader.iter`."""
+        reader = self._box_map_reader()
+        if reader is None:
+            yield from self.get_map().items()
+            return
+        for key, value in reader.iter(page_size):
+            yield typing.cast(_K, key), self._value(value)
+
+    async def aiter(
+        self, page_size: int = DEFAULT_PAGE_SIZE
+    ) -> AsyncIterator[tuple[_K, _V]]:
+        """Async counterpart of `iter`; see `BoxMapReader.aiter`."""
+        reader = self._box_map_reader()
+        if reader is None:
+            for entry in self.get_map().items():
+                yield entry
+            return
+        async for key, value in reader.aiter(page_size):
+            yield typing.cast(_K, key), self._value(value)
+
+    def close(self) -> None:
+        """Closes the connections reads of the whole map keep open."""
+        if self._reader is not None:
+            self._reader.close()
+
+    def _box_map_reader(self) -> BoxMapReader | None:
+        if self._app_client is None:
+            return None
+        with self._reader_lock:
+            if self._reader is None:
+                self._reader = BoxMapReader(self._app_client, self._map_name)
+            return self._reader
+
+    def get_value(self, key: _K) -> _V | None:
+        """Get a value from the map by key"""
+        key_value = _as_dict(key) if _is_struct(key) else key
+        value = self._state_accessor.get_map_value(self._map_name, key_value)
+        return None if value is None else self._value(value)
+
+    def _value(self, value: object) -> _V:
+        if self._struct_class and isinstance(value, dict):
+            return init_dataclass(
+                self._struct_class, typing.cast(dict[str, object], value)
+            )
+        return typing.cast(_V, value)
+
+
+class CachedAccessor(typing.Generic[_O, _T]):
+    """
+    A read-only property computed once per instance and kept in a `_cached_<name>` slot.
+
+    `functools.cached_property` needs an instance `__dict__`, which `__slots__` classes
+    don't have.
+    """
+
+    def __init__(self, build: Callable[[_O], _T]):
+        self._build = build
+        self._slot = ""
+        self.__doc__ = build.__doc__
+
+    def __set_name__(self, owner: type[_O], name: str) -> None:
+        self._slot = f"_cached_{name}"
+
+    @typing.overload
+    def __get__(
+        self, instance: None, owner: type[_O] | None = None
+    ) -> "CachedAccessor[_O, _T]": ...
+
+    @typing.overload
+    def __get__(self, instance: _O, owner: type[_O] | None = None) -> _T: ...
+
+    def __get__(
+        self, instance: _O | None, owner: type[_O] | None = None
+    ) -> "_T | CachedAccessor[_O, _T]":
+        if instance is None:
+            return self
+        try:
+            return typing.cast(_T, getattr(instance, self._slot))
+        except AttributeError:
+            value = self._build(instance)
+            setattr(instance, self._slot, value)
+            return value
+
+
+class _DecodingClient(TypedAppClient, typing.Protocol):
+    def decode_return_value(
+        self, method: str, return_value: algokit_utils.ABIReturn | None
+    ) -> object: ...
+
+
+def result_mapper(client: _DecodingClient, signature: str) -> _ResultMapper:
+    """
+    The return decoder a generated composer queues for `signature`, shared per method.
+
+    Struct returns need the client's dataclass conversion, so they keep a per-call mapper.
+    """
+    codec = method_codec(client.app_client.app_spec, signature)
+    if codec.generic:
+        return functools.partial(client.decode_return_value, signature)
+    return codec
+
+
+# The return of any generated method call, as its `SendAppTransactionResult` has it
+ReturnValue = algokit_utils.ABIValue | algokit_utils.ABIStruct | None
+
+
+class _AppSpecSource(typing.Protocol):
+    """The module-level `_APP_SPEC` of a client rewritten by `make_client_lazy`."""
+
+    def get(self) -> algokit_utils.Arc56Contract: ...
+
+
+_T_co = typing.TypeVar("_T_co", covariant=True)
+
+
+class _FromFields(typing.Protocol[_T_co]):
+    def __call__(self, **fields: object) -> _T_co: ...
+
+
+def _fields(params: object) -> dict[str, object]:
+    # The params dataclasses are flat, so asdict()'s recursive deepcopy buys nothing
+    return typing.cast(dict[str, object], vars(params))
+
+
+def _build(cls: type[_T], fields: dict[str, object]) -> _T:
+    """An instance of the params dataclass `cls` from `fields`, typed loosely."""
+    return typing.cast(_FromFields[_T], cls)(**fields)
+
+
+def _method_call(
+    method: str,
+    args: object | None,
+    params: algokit_utils.CommonAppCallParams | None,
+) -> algokit_utils.AppClientMethodCallParams:
+    return _build(
+        algokit_utils.AppClientMethodCallParams,
+        {
+            **_fields(params or NO_PARAMS),
+            "method": method,
+            "args": parse_abi_args(args),
+        },
+    )
+
+
+def call_params(
+    app_client: algokit_utils.AppClient,
+    method: str,
+    args: object | None,
+    params: algokit_utils.CommonAppCallParams | None,
+) -> algokit_utils.AppCallMethodCallParams:
+    """What a generated `params` method returns for a call to `method` with typed `args`."""
+    return app_client.params.call(_method_call(method, args, params))
+
+
+class ParamsBase:
+    """Base of a generated `<Contract>Params`; each method is `_call` with its signature."""
+
+    __slots__ = ("app_client",)
+
+    def __init__(self, app_client: algokit_utils.AppClient):
+        self.app_client = app_client
+
+    def _call(
+        self,
+        method: str,
+        args: object | None,
+        params: algokit_utils.CommonAppCallParams | None,
+    ) -> algokit_utils.AppCallMethodCallParams:
+        return call_params(self.app_client, method, args, params)
+
+    def clear_state(
+        self, params: algokit_utils.AppClientBareCallParams | None = None
+    ) -> algokit_utils.AppCallParams:
+        return self.app_client.params.bare.clear_state(params)
+
+
+class CreateTransactionParamsBase:
+    """Base of a generated `<Contract>CreateTransactionParams`."""
+
+    __slots__ = ("app_client",)
+
+    def __init__(self, app_client: algokit_utils.AppClient):
+        self.app_client = app_client
+
+    def _call(
+        self,
+        method: str,
+        args: object | None,
+        params: algokit_utils.CommonAppCallParams | None,
+    ) -> algokit_utils.BuiltTransactions:
+        return self.app_client.create_transaction.call(
+            _method_call(method, args, params)
+        )
+
+    def clear_state(
+        self, params: algokit_utils.AppClientBareCallParams | None = None
+    ) -> Transaction:
+        return self.app_client.create_transaction.bare.clear_state(params)
+
+
+class SendBase:
+    """
+    Base of a generated `<Contract>Send`.
+
+    A call that needs more opcodes than one app call has is sent in a group with the
+    `opup` calls `budget` pads it with, and its result is still that of the call alone.
+    Readonly calls are served from the `ReadonlyCallCache` installed on the client's
+    `AlgorandClient`, if there is one.
+    """
+
+    __slots__ = ("app_client",)
+
+    # None sends every call on its own, as generated
+    budget: typing.ClassVar[OpcodeBudget | None] = DEFAULT_BUDGET
+
+    def __init__(self, app_client: algokit_utils.AppClient):
+        self.app_client = app_client
+
+    def _call(
+        self,
+        method: str,
+        args: object | None,
+        params: algokit_utils.CommonAppCallParams | None,
+        send_params: algokit_utils.SendParams | None,
+    ) -> algokit_utils.SendAppTransactionResult[ReturnValue]:
+        call = _method_call(method, args, params)
+        codec = method_codec(self.app_client.app_spec, method)
+        cache = installed_cache(self.app_client.algorand)
+        if codec.readonly:
+            # Simulated with all the budget they could need
+            if cache is None:
+                return self.app_client.send.call(call, send_params=send_params)
+            return cache.read(
+                self.app_client,
+                method,
+                call,
+                lambda: self.app_client.send.call(call, send_params=send_params),
+            )
+        budget = self.budget
+        if budget is not None and not budget.fits(method, codec.method, call.args):
+            result = self._send_padded(budget, codec, call, send_params)
+        else:
+            result = self.app_client.send.call(call, send_params=send_params)
+        if cache is not None:
+            _observe(cache, result)
+        return result
+
+    def _send_padded(
+        self,
+        budget: OpcodeBudget,
+        codec: MethodCodec,
+        call: algokit_utils.AppClientMethodCallParams,
+        send_params: algokit_utils.SendParams | None,
+    ) -> algokit_utils.SendAppTransactionResult[ReturnValue]:
+        app_client = self.app_client
+        composer = app_client.algorand.new_group().add_app_call_method_call(
+            app_client.params.call(call)
+        )
+        # After the transactions it takes as arguments, and before the padding
+        index = composer.count() - 1
+        budget.ensure(composer, self)
+        result = composer.send(send_params)
+        sent = algokit_utils.SendAppTransactionResult[ReturnValue].from_composer_result(
+            result, index=index
+        )
+        # Its return is the group's first, whatever its transaction's index
+        return dataclasses.replace(
+            sent,
+            abi_return=result.returns[0].get_arc56_value(
+                app_client.app_spec.get_arc56_method(codec.signature),
+                app_client.app_spec.structs,
+            ),
+        )
+
+    def clear_state(
+        self,
+        params: algokit_utils.AppClientBareCallParams | None = None,
+        send_params: algokit_utils.SendParams | None = None,
+    ) -> algokit_utils.SendAppTransactionResult[algokit_utils.ABIReturn]:
+        return self.app_client.send.bare.clear_state(params, send_params=send_params)
+
+
+def _observe(
+    cache: ReadonlyCallCache,
+    result: algokit_utils.SendAppTransactionResult[ReturnValue],
+) -> None:
+    confirmation = typing.cast(dict[str, object] | None, result.confirmation)
+    if confirmation:
+        cache.observe(typing.cast(int, confirmation.get("confirmed-round", 0)))
+
+
+def client_part(
+    part: Callable[[algokit_utils.AppClient], _T],
+) -> CachedAccessor["AppClientBase", _T]:
+    """A client's `params`/`send`/... accessor, built on first use."""
+    return CachedAccessor(lambda client: part(client.app_client))
+
+
+class AppClientBase:
+    """
+    Base of a generated `<Contract>Client`.
+
+    Each client sets `_app_spec` and its parts with `client_part`, and keeps `new_group`
+    and its typed `decode_return_value` overloads.
+    """
+
+    _app_spec: typing.ClassVar[_AppSpecSource]
+
+    def __init__(
+        self,
+        app_client: algokit_utils.AppClient | None = None,
+        *,
+        algorand: algokit_utils.AlgorandClient | None = None,
+        app_id: int | None = None,
+        app_name: str | None = None,
+        default_sender: str | None = None,
+        default_signer: TransactionSigner | None = None,
+        approval_source_map: SourceMap | None = None,
+        clear_source_map: SourceMap | None = None,
+    ) -> None:
+        if app_client:
+            self.app_client = app_client
+        elif algorand and app_id:
+            self.app_client = algokit_utils.AppClient(
+                algokit_utils.AppClientParams(
+                    algorand=algorand,
+                    app_spec=self._app_spec.get(),
+                    app_id=app_id,
+                    app_name=app_name,
+                    default_sender=default_sender,
+                    default_signer=default_signer,
+                    approval_source_map=approval_source_map,
+                    clear_source_map=clear_source_map,
+                )
+            )
+        else:
+            raise ValueError(
+                "Either app_client or algorand and app_id must be provided"
+            )
+
+    @classmethod
+    def from_creator_and_name(
+        cls: type[_Self],
+        creator_address: str,
+        app_name: str,
+        algorand: algokit_utils.AlgorandClient,
+        default_sender: str | None = None,
+        default_signer: TransactionSigner | None = None,
+        approval_source_map: SourceMap | None = None,
+        clear_source_map: SourceMap | None = None,
+        ignore_cache: bool | None = None,
+        app_lookup_cache: algokit_utils.ApplicationLookup | None = None,
+    ) -> _Self:
+        spec = typing.cast(type[AppClientBase], cls)._app_spec.get()
+        return typing.cast(Callable[[algokit_utils.AppClient], _Self], cls)(
+            algokit_utils.AppClient.from_creator_and_name(
+                creator_address=creator_address,
+                app_name=app_name,
+                app_spec=spec,
+                algorand=algorand,
+                default_sender=default_sender,
+                default_signer=default_signer,
+                approval_source_map=approval_source_map,
+                clear_source_map=clear_source_map,
+                ignore_cache=ignore_cache,
+                app_lookup_cache=app_lookup_cache,
+            )
+        )
+
+    @classmethod
+    def from_network(
+        cls: type[_Self],
+        algorand: algokit_utils.AlgorandClient,
+        app_name: str | None = None,
+        default_sender: str | None = None,
+        default_signer: TransactionSigner | None = None,
+        approval_source_map: SourceMap | None = None,
+        clear_source_map: SourceMap | None = None,
+    ) -> _Self:
+        spec = typing.cast(type[AppClientBase], cls)._app_spec.get()
+        return typing.cast(Callable[[algokit_utils.AppClient], _Self], cls)(
+            algokit_utils.AppClient.from_network(
+                app_spec=spec,
+                algorand=algorand,
+                app_name=app_name,
+                default_sender=default_sender,
+                default_signer=default_signer,
+                approval_source_map=approval_source_map,
+                clear_source_map=clear_source_map,
+            )
+        )
+
+    @property
+    def app_id(self) -> int:
+        return self.app_client.app_id
+
+    @property
+    def app_address(self) -> str:
+        return self.app_client.app_address
+
+    @property
+    def app_name(self) -> str:
+        return self.app_client.app_name
+
+    @property
+    def app_spec(self) -> algokit_utils.Arc56Contract:
+        return self.app_client.app_spec
+
+    @property
+    def algorand(self) -> algokit_utils.AlgorandClient:
+        return self.app_client.algorand
+
+    def clone(
+        self: _Self,
+        app_name: str | None = None,
+        default_sender: str | None = None,
+        default_signer: TransactionSigner | None = None,
+        approval_source_map: SourceMap | None = None,
+        clear_source_map: SourceMap | None = None,
+    ) -> _Self:
+        app_client = typing.cast(AppClientBase, self).app_client
+        return typing.cast(Callable[[algokit_utils.AppClient], _Self], type(self))(
+            app_client.clone(
+                app_name=app_name,
+                default_sender=default_sender,
+                default_signer=default_signer,
+                approval_source_map=approval_source_map,
+                clear_source_map=clear_source_map,
+            )
+        )
+
+    def decode_return_value(
+        self, method: str, return_value: algokit_utils.ABIReturn | None
+    ) -> ReturnValue:
+        """Decode ABI return value for the given method."""
+        if return_value is None:
+            return None
+        arc56_method = self.app_spec.get_arc56_method(method)
+        decoded = return_value.get_arc56_value(arc56_method, self.app_spec.structs)
+        # Struct returns become the dataclass of the same name in the client's module
+        struct = arc56_method.returns.struct
+        if struct and isinstance(decoded, dict):
+            module = sys.modules[type(self).__module__]
+            struct_class = typing.cast(type | None, getattr(module, struct, None))
+            if struct_class:
+                return typing.cast(
+                    ReturnValue,
+                    init_dataclass(
+                        struct_class, typing.cast(dict[str, object], decoded)
+                    ),
+                )
+        return decoded
+
+
+class _DeployParams(typing.Protocol[_T_co]):
+    """A generated `<Contract>...Params` dataclass given to `deploy`."""
+
+    def to_algokit_utils_params(self) -> _T_co: ...
+
+
+_CreateParams = _DeployParams[
+    algokit_utils.AppClientMethodCallCreateParams
+    | algokit_utils.AppClientBareCallCreateParams
+]
+_UpdateParams = _DeployParams[
+    algokit_utils.AppClientMethodCallParams | algokit_utils.AppClientBareCallParams
+]
+
+
+class _HasAppFactory(typing.Protocol):
+    app_factory: algokit_utils.AppFactory
+
+
+def factory_part(
+    part: Callable[[algokit_utils.AppFactory], _T],
+) -> CachedAccessor[_HasAppFactory, _T]:
+    """A factory's `params`/`create_transaction`/`send` accessor, built on first use."""
+    return CachedAccessor(lambda factory: part(factory.app_factory))
+
+
+class AppFactoryBase(typing.Generic[_C]):
+    """
+    Base of a generated `<Contract>Factory`.
+
+    Each factory sets `_app_spec`, `_client` to its client class, and its parts with
+    `factory_part`.
+    """
+
+    _app_spec: typing.ClassVar[_AppSpecSource]
+    _client: Callable[[algokit_utils.AppClient], _C]
+
+    def __init__(
+        self,
+        algorand: algokit_utils.AlgorandClient,
+        *,
+        app_name: str | None = None,
+        default_sender: str | None = None,
+        default_signer: TransactionSigner | None = None,
+        version: str | None = None,
+        compilation_params: algokit_utils.AppClientCompilationParams | None = None,
+    ):
+        self.app_factory = algokit_utils.AppFactory(
+            params=algokit_utils.AppFactoryParams(
+                algorand=algorand,
+                app_spec=self._app_spec.get(),
+                app_name=app_name,
+                default_sender=default_sender,
+                default_signer=default_signer,
+                version=version,
+                compilation_params=compilation_params,
+            )
+        )
+
+    @property
+    def app_name(self) -> str:
+        return self.app_factory.app_name
+
+    @property
+    def app_spec(self) -> algokit_utils.Arc56Contract:
+        return self.app_factory.app_spec
+
+    @property
+    def algorand(self) -> algokit_utils.AlgorandClient:
+        return self.app_factory.algorand
+
+    def deploy(
+        self,
+        *,
+        on_update: algokit_utils.OnUpdate | None = None,
+        on_schema_break: algokit_utils.OnSchemaBreak | None = None,
+        create_params: _CreateParams | None = None,
+        update_params: _UpdateParams | None = None,
+        delete_params: _UpdateParams | None = None,
+        existing_deployments: algokit_utils.ApplicationLookup | None = None,
+        ignore_cache: bool = False,
+        app_name: str | None = None,
+        compilation_params: algokit_utils.AppClientCompilationParams | None = None,
+        send_params: algokit_utils.SendParams | None = None,
+    ) -> tuple[_C, algokit_utils.AppFactoryDeployResult]:
+        """Deploy the application"""
+        app_client, result = self.app_factory.deploy(
+            on_update=on_update,
+            on_schema_break=on_schema_break,
+            create_params=(
+                create_params.to_algokit_utils_params() if create_params else None
+            ),
+            update_params=(
+                update_params.to_algokit_utils_params() if update_params else None
+            ),
+            delete_params=(
+                delete_params.to_algokit_utils_params() if delete_params else None
+            ),
+            existing_deployments=existing_deployments,
+            ignore_cache=ignore_cache,
+            app_name=app_name,
+            compilation_params=compilation_params,
+            send_params=send_params,
+        )
+        return self._client(app_client), result
+
+    def get_app_client_by_creator_and_name(
+        self,
+        creator_address: str,
+        app_name: str,
+        default_sender: str | None = None,
+        default_signer: TransactionSigner | None = None,
+        ignore_cache: bool | None = None,
+        app_lookup_cache: algokit_utils.ApplicationLookup | None = None,
+        approval_source_map: SourceMap | None = None,
+        clear_source_map: SourceMap | None = None,
+    ) -> _C:
+        """Get an app client by creator address and name"""
+        return self._client(
+            self.app_factory.get_app_client_by_creator_and_name(
+                creator_address,
+                app_name,
+                default_sender,
+                default_signer,
+                ignore_cache,
+                app_lookup_cache,
+                approval_source_map,
+                clear_source_map,
+            )
+        )
+
+    def get_app_client_by_id(
+        self,
+        app_id: int,
+        app_name: str | None = None,
+        default_sender: str | None = None,
+        default_signer: TransactionSigner | None = None,
+        approval_source_map: SourceMap | None = None,
+        clear_source_map: SourceMap | None = None,
+    ) -> _C:
+        """Get an app client by app ID"""
+        return self._client(
+            self.app_factory.get_app_client_by_id(
+                app_id,
+                app_name,
+                default_sender,
+                default_signer,
+                approval_source_map,
+                clear_source_map,
+            )
+        )
+
+
+class FactoryCreateParamsBase:
+    """Base of a generated `<Contract>FactoryCreateParams`."""
+
+    __slots__ = ("app_factory",)
+
+    def __init__(self, app_factory: algokit_utils.AppFactory):
+        self.app_factory = app_factory
+
+    def bare(
+        self,
+        *,
+        params: algokit_utils.CommonAppCallCreateParams | None = None,
+        compilation_params: algokit_utils.AppClientCompilationParams | None = None,
+    ) -> algokit_utils.AppCreateParams:
+        """Creates an instance using a bare call"""
+        return self.app_factory.params.bare.create(
+            _build(
+                algokit_utils.AppFactoryCreateParams,
+                _fields(params or NO_CREATE_PARAMS),
+            ),
+            compilation_params=compilation_params,
+        )
+
+    def _create(
+        self,
+        method: str,
+        args: object | None,
+        params: algokit_utils.CommonAppCallCreateParams | None,
+        compilation_params: algokit_utils.AppClientCompilationParams | None,
+    ) -> algokit_utils.AppCreateMethodCallParams:
+        return self.app_factory.params.create(
+            _build(
+                algokit_utils.AppFactoryCreateMethodCallParams,
+                {
+                    **_fields(params or NO_CREATE_PARAMS),
+                    "method": method,
+                    "args": parse_abi_args(args),
+                },
+            ),
+            compilation_params=compilation_params,
+        )
+
+
+class FactoryUpdateParamsBase:
+    """Base of a generated `<Contract>FactoryUpdateParams`."""
+
+    __slots__ = ("app_factory",)
+
+    def __init__(self, app_factory: algokit_utils.AppFactory):
+        self.app_factory = app_factory
+
+    def bare(
+        self, *, params: algokit_utils.CommonAppCallCreateParams | None = None
+    ) -> algokit_utils.AppUpdateParams:
+        """Updates an instance using a bare call"""
+        return self.app_factory.params.bare.deploy_update(
+            _build(
+                algokit_utils.AppClientBareCallParams,
+                _fields(params or NO_CREATE_PARAMS),
+            )
+        )
+
+
+class FactoryDeleteParamsBase:
+    """Base of a generated `<Contract>FactoryDeleteParams`."""
+
+    __slots__ = ("app_factory",)
+
+    def __init__(self, app_factory: algokit_utils.AppFactory):
+        self.app_factory = app_factory
+
+    def bare(
+        self, *, params: algokit_utils.CommonAppCallCreateParams | None = None
+    ) -> algokit_utils.AppDeleteParams:
+        """Deletes an instance using a bare call"""
+        return self.app_factory.params.bare.deploy_delete(
+            _build(
+                algokit_utils.AppClientBareCallParams,
+                _fields(params or NO_CREATE_PARAMS),
+            )
+        )
+
+
+class FactoryCreateTransactionCreateBase:
+    """Base of a generated `<Contract>FactoryCreateTransactionCreate`."""
+
+    __slots__ = ("app_factory",)
+
+    def __init__(self, app_factory: algokit_utils.AppFactory):
+        self.app_factory = app_factory
+
+    def bare(
+        self, params: algokit_utils.CommonAppCallCreateParams | None = None
+    ) -> Transaction:
+        """Creates a new instance using a bare call"""
+        return self.app_factory.create_transaction.bare.create(
+            _build(
+                algokit_utils.AppFactoryCreateParams,
+                _fields(params or NO_CREATE_PARAMS),
+            )
+        )
+
+
+class FactorySendCreateBase(typing.Generic[_C]):
+    """Base of a generated `<Contract>FactorySendCreate`, which sets `_client`."""
+
+    __slots__ = ("app_factory",)
+
+    _client: Callable[[algokit_utils.AppClient], _C]
+
+    def __init__(self, app_factory: algokit_utils.AppFactory):
+        self.app_factory = app_factory
+
+    def bare(
+        self,
+        *,
+        params: algokit_utils.CommonAppCallCreateParams | None = None,
+        send_params: algokit_utils.SendParams | None = None,
+        compilation_params: algokit_utils.AppClientCompilationParams | None = None,
+    ) -> tuple[
+        _C, algokit_utils.SendAppCreateTransactionResult[algokit_utils.ABIReturn]
+    ]:
+        """Creates a new instance using a bare call"""
+        app_client, result = typing.cast(
+            tuple[
+                algokit_utils.AppClient,
+                algokit_utils.SendAppCreateTransactionResult[algokit_utils.ABIReturn],
+            ],
+            self.app_factory.send.bare.create(
+                _build(
+                    algokit_utils.AppFactoryCreateParams,
+                    _fields(params or NO_CREATE_PARAMS),
+                ),
+                send_params=send_params,
+                compilation_params=compilation_params,
+            ),
+        )
+        return self._client(app_client), result
+
+
+class ComposerBase(typing.Generic[_C]):
+    """
+    Base of a generated `<Contract>Composer`; each method is `_call` with its signature.
+
+    Before the group is sent or simulated, `budget` pads it with the `opup` calls it
+    needs to cover the opcodes of every app call in it.
+    """
+
+    __slots__ = ("_composer", "_result_mappers", "client")
+
+    # None sends and simulates the group as composed
+    budget: typing.ClassVar[OpcodeBudget | None] = DEFAULT_BUDGET
+
+    def __init__(self, client: _C):
+        self.client = client
+        self._composer = client.algorand.new_group()
+        self._result_mappers: list[_ResultMapper | None] = []
+
+    def _call(
+        self: _Self,
+        method: str,
+        args: object | None,
+        params: algokit_utils.CommonAppCallParams | None,
+    ) -> _Self:
+        composer = typing.cast(ComposerBase[AppClientBase], self)
+        client = composer.client
+        composer._composer.add_app_call_method_call(
+            client.app_client.params.call(_method_call(method, args, params))
+        )
+        composer._result_mappers.append(result_mapper(client, method))
+        return self
+
+    def clear_state(
+        self: _Self,
+        *,
+        args: list[bytes] | None = None,
+        params: algokit_utils.CommonAppCallParams | None = None,
+    ) -> _Self:
+        composer = typing.cast(ComposerBase[AppClientBase], self)
+        composer._composer.add_app_call(
+            composer.client.app_client.params.bare.clear_state(
+                _build(
+                    algokit_utils.AppClientBareCallParams,
+                    {**_fields(params or NO_PARAMS), "args": args},
+                )
+            )
+        )
+        return self
+
+    def add_transaction(
+        self: _Self, txn: Transaction, signer: TransactionSigner | None = None
+    ) -> _Self:
+        typing.cast(ComposerBase[AppClientBase], self)._composer.add_transaction(
+            txn, signer
+        )
+        return self
+
+    def composer(self) -> algokit_utils.TransactionComposer:
+        return self._composer
+
+    def _pad(self) -> None:
+        """Adds the `opup` calls the group needs for its opcode budget, if any."""
+        if self.budget is not None:
+            self.budget.ensure(
+                self._composer, typing.cast(ComposerBase[AppClientBase], self).client
+            )
+
+    def simulate(
+        self,
+        allow_more_logs: bool | None = None,
+        allow_empty_signatures: bool | None = None,
+        allow_unnamed_resources: bool | None = None,
+        extra_opcode_budget: int | None = None,
+        exec_trace_config: SimulateTraceConfig | None = None,
+        simulation_round: int | None = None,
+        skip_signatures: bool | None = None,
+    ) -> algokit_utils.SendAtomicTransactionComposerResults:
+        # A simulate given extra budget doesn't need padding to succeed
+        if extra_opcode_budget is None:
+            self._pad()
+        return self._composer.simulate(
+            allow_more_logs=allow_more_logs,
+            allow_empty_signatures=allow_empty_signatures,
+            allow_unnamed_resources=allow_unnamed_resources,
+            extra_opcode_budget=extra_opcode_budget,
+            exec_trace_config=exec_trace_config,
+            simulation_round=simulation_round,
+            skip_signatures=skip_signatures,
+        )
+
+    def send(
+        self, send_params: algokit_utils.SendParams | None = None
+    ) -> algokit_utils.SendAtomicTransactionComposerResults:
+        self._pad()
+        return self._composer.send(send_params)
+
+
+# Generated helper name -> the runtime name it is replaced with (None: just dropped,
+# the generated code keeps using it only through the replaced helpers)
+_SHARED = {
+    "_parse_abi_args": "parse_abi_args",
+    "_init_dataclass": "init_dataclass",
+    "_AppClientStateMethodsProtocol": "StateMethods",
+    "_MapState": "MapState",
+    "_KeyType": None,
+    "_ValueType": None,
+}
+
+
+# Generated class, by its name after the contract's -> the base it's derived from here,
+# the methods that base has in its place, and how its per-method bodies are shimmed
+_BASES: dict[str, tuple[str, frozenset[str], str | None]] = {
+    "Params": ("ParamsBase", frozenset({"__init__", "clear_state"}), "call"),
+    "CreateTransactionParams": (
+        "CreateTransactionParamsBase",
+        frozenset({"__init__", "clear_state"}),
+        "call",
+    ),
+    "Send": ("SendBase", frozenset({"__init__", "clear_state"}), "send"),
+    "Client": (
+        "AppClientBase",
+        frozenset(
+            {
+                "__init__",
+                "from_creator_and_name",
+                "from_network",
+                "app_id",
+                "app_address",
+                "app_name",
+                "app_spec",
+                "algorand",
+                "clone",
+            }
+        ),
+        None,
+    ),
+    "Factory": (
+        "AppFactoryBase",
+        frozenset(
+            {
+                "__init__",
+                "app_name",
+                "app_spec",
+                "algorand",
+                "deploy",
+                "get_app_client_by_creator_and_name",
+                "get_app_client_by_id",
+            }
+        ),
+        None,
+    ),
+    "FactoryCreateParams": (
+        "FactoryCreateParamsBase",
+        frozenset({"__init__", "bare"}),
+        "create",
+    ),
+    "FactoryUpdateParams": (
+        "FactoryUpdateParamsBase",
+        frozenset({"__init__", "bare"}),
+        None,
+    ),
+    "FactoryDeleteParams": (
+        "FactoryDeleteParamsBase",
+        frozenset({"__init__", "bare"}),
+        None,
+    ),
+    "FactoryCreateTransactionCreate": (
+        "FactoryCreateTransactionCreateBase",
+        frozenset({"__init__", "bare"}),
+        None,
+    ),
+    "FactorySendCreate": (
+        "FactorySendCreateBase",
+        frozenset({"__init__", "bare"}),
+        None,
+    ),
+    "Composer": (
+        "ComposerBase",
+        frozenset(
+            {
+                "__init__",
+                "clear_state",
+                "add_transaction",
+                "composer",
+                "simulate",
+                "send",
+            }
+        ),
+        "compose",
+    ),
+}
+# Bases parameterized with the contract's client class
+_GENERIC_BASES = frozenset({"AppFactoryBase", "FactorySendCreateBase", "ComposerBase"})
+# The call each kind of per-method body makes, and the shim replacing it
+_SHIMS = {
+    "call": (
+        r"self\.app_client\.(params|create_transaction)\.call\(",
+        "_call({}, params)",
+    ),
+    "send": (r"self\.app_client\.send\.call\(", "_call({}, params, send_params)"),
+    "compose": (r"self\._composer\.add_app_call_method_call\(", "_call({}, params)"),
+    "create": (
+        r"self\.app_factory\.params\.create\(",
+        "_create({}, params, compilation_params)",
+    ),
+}
+
+_Edit = tuple[int, int, list[str]]
+
+
+def share_client_runtime(client_file: Path) -> bool:
+    """
+    Rewrites a generated typed client to share the contract-agnostic code in this module.
+
+    Its helpers are imported from here, and those it never uses are dropped, and its
+    box maps are given their app client so they're read with `BoxMapReader`. Its
+    `*Params`, `*Send`, `*Client`, `*Factory*` and `*Composer` classes are derived from
+    the bases here instead of repeating them, and each method whose body only calls the
+    app with its signature is cut down to a `_call` naming it. Bodies that do more,
+    e.g. convert a struct return, are left as generated. Returns False if there was
+    nothing left to replace, e.g. because the client was already rewritten.
+    """
+    source = client_file.read_text()
+    shared_helpers, source = _share_helpers(source)
+    shared_classes, source = _share_classes(source)
+    shared_box_maps, source = _share_box_maps(source)
+    if not (shared_helpers or shared_classes or shared_box_maps):
+        return False
+    client_file.write_text(source)
+    return True
+
+
+def _share_helpers(source: str) -> tuple[bool, str]:
+    lines = source.splitlines(keepends=True)
+    shared = [
+        (name, _first_line(node) - 1, typing.cast(int, node.end_lineno))
+        for node in ast.parse(source).body
+        if (name := _defined_name(node)) in _SHARED
+    ]
+    if not shared:
+        return False, source
+    for _, start, end in reversed(shared):
+        del lines[start:end]
+    remaining = "".join(lines)
+    imports = [
+        f"{runtime_name} as {name}"
+        for name, _, _ in shared
+        if (runtime_name := _SHARED[name]) and re.search(rf"\b{name}\b", remaining)
+    ]
+    if imports:
+        lines.insert(
+            shared[0][1],
+            f"from smart_contracts._helpers.client_runtime import {', '.join(imports)}\n",
+        )
+    return True, "".join(lines)
+
+
+def _share_box_maps(source: str) -> tuple[bool, str]:
+    """Hands each box map its app client, so `MapState` can read it with `BoxMapReader`."""
+    if "MapState as _MapState" not in source:
+        return False, source
+    lines = source.splitlines(keepends=True)
+    calls = [
+        node
+        for node in _in_source_order(ast.parse(source))
+        if isinstance(node, ast.Call)
+        and isinstance(node.func, ast.Name)
+        and node.func.id == "_MapState"
+        and node.args
+        and ast.unparse(node.args[0]) == "self.app_client.state.box"
+        and not any(keyword.arg == "app_client" for keyword in node.keywords)
+    ]
+    # Bottom up, so each edit leaves the positions of those above it as they were
+    for call in reversed(calls):
+        last = call.args[-1]
+        line = typing.cast(int, last.end_lineno) - 1
+        column = typing.cast(int, last.end_col_offset)
+        lines[line] = (
+            lines[line][:column] + ", app_client=self.app_client" + lines[line][column:]
+        )
+    return bool(calls), "".join(lines)
+
+
+def _in_source_order(tree: ast.AST) -> list[ast.AST]:
+    nodes = list(ast.walk(tree))
+    nodes.sort(key=_position)
+    return nodes
+
+
+def _position(node: ast.AST) -> tuple[int, int]:
+    return (
+        typing.cast(int, getattr(node, "lineno", 0)),
+        typing.cast(int, getattr(node, "col_offset", 0)),
+    )
+
+
+def _share_classes(source: str) -> tuple[bool, str]:
+    tree = ast.parse(source)
+    classes = {node.name: node for node in tree.body if isinstance(node, ast.ClassDef)}
+    contracts = [
+        name.removesuffix("Client")
+        for name in classes
+        if name.endswith("Client")
+        and name.removesuffix("Client") + "Composer" in classes
+    ]
+    # The bases read the app spec that `make_client_lazy` sets up
+    if len(contracts) != 1 or "_APP_SPEC" not in {
+        _defined_name(node) for node in tree.body
+    }:
+        return False, source
+    contract = contracts[0]
+    client = f"{contract}Client"
+    lines = source.splitlines(keepends=True)
+    edits: list[_Edit] = []
+    bases: set[str] = set()
+    for suffix, (base, provided, shim) in _BASES.items():
+        node = classes.get(contract + suffix)
+        if node is None or any(ast.unparse(b).startswith("_") for b in node.bases):
+            continue
+        edits.extend(_derive(node, lines, base, provided, shim, client))
+        bases.add(base)
+    if not bases:
+        return False, source
+    for start, end, replacement in sorted(edits, reverse=True):
+        lines[start:end] = replacement
+    source = _move_factory_after_its_parts("".join(lines), contract)
+    if {"AppClientBase", "AppFactoryBase"} & bases:
+        bases |= {"client_part", "factory_part"}
+    names = ", ".join(f"{name} as _{name}" for name in sorted(bases))
+    lines = source.splitlines(keepends=True)
+    first_class = next(
+        _first_line(node)
+        for node in ast.parse(source).body
+        if isinstance(node, ast.ClassDef)
+    )
+    lines.insert(
+        first_class - 1,
+        f"from smart_contracts._helpers.client_runtime import {names}\n\n",
+    )
+    # Removed methods leave their blank lines behind
+    source = re.sub(r"\n(?:[ \t]*\n){3,}", "\n\n\n", "".join(lines))
+    return True, re.sub(r"\n(?:[ \t]*\n){2,}(?=[ \t]+\S)", "\n\n", source)
+
+
+def _derive(
+    node: ast.ClassDef,
+    lines: list[str],
+    base: str,
+    provided: frozenset[str],
+    shim: str | None,
+    client: str,
+) -> list[_Edit]:
+    """The edits deriving `node` from `base` and shimming its per-method bodies."""
+    header = node.lineno - 1
+    bases = [f"_{base}[{client}]" if base in _GENERIC_BASES else f"_{base}"]
+    bases.extend(ast.get_source_segment("".join(lines), b) or "" for b in node.bases)
+    edits: list[_Edit] = [
+        (
+            header,
+            header + 1,
+            [
+                re.sub(
+                    r"^class (\w+)[^:]*:",
+                    rf"class \1({', '.join(bases)}):",
+                    lines[header],
+                )
+            ],
+        )
+    ]
+
+    body: list[str] = []
+    if base not in ("AppClientBase", "AppFactoryBase"):
+        body.append("__slots__ = ()")
+    if base in ("AppClientBase", "AppFactoryBase"):
+        body.append("_app_spec = _APP_SPEC")
+    if base in ("AppFactoryBase", "FactorySendCreateBase"):
+        body.append(f"_client = {client}")
+    for item in node.body:
+        if isinstance(item, ast.FunctionDef) and item.name == "__init__":
+            body.extend(_parts(item, base))
+
+    first = node.body[0]
+    indent = " " * first.col_offset
+    added = [f"{indent}{line}\n" for line in body]
+    if isinstance(first, ast.Expr) and isinstance(first.value, ast.Constant):
+        at = typing.cast(int, first.end_lineno)
+        edits.append((at, at, ["\n", *added]))
+    else:
+        edits[0][2].extend(added)
+
+    for item in node.body:
+        if not isinstance(item, ast.FunctionDef):
+            continue
+        if item.name in provided:
+            edits.append((_first_line(item) - 1, typing.cast(int, item.end_lineno), []))
+        elif item.name == "decode_return_value" and not item.decorator_list:
+            edits.append(
+                _shim(item, lines, "super().decode_return_value(method, return_value)")
+            )
+        elif shim is not None:
+            call = _shim_call(item, lines, shim)
+            if call is not None:
+                edits.append(_shim(item, lines, call))
+    return edits
+
+
+def _parts(init: ast.FunctionDef, base: str) -> list[str]:
+    """`params = _client_part(BankParams)` and such, for each part `init` builds."""
+    part = {"AppClientBase": "_client_part", "AppFactoryBase": "_factory_part"}.get(
+        base
+    )
+    if part is None:
+        return []
+    parts = []
+    for statement in init.body:
+        attribute = _self_attribute(statement)
+        value = typing.cast(ast.Assign, statement).value if attribute else None
+        if (
+            isinstance(value, ast.Call)
+            and isinstance(value.func, ast.Name)
+            and len(value.args) == 1
+        ):
+            parts.append(f"{attribute} = {part}({value.func.id})")
+    return parts
+
+
+def _shim_call(function: ast.FunctionDef, lines: list[str], shim: str) -> str | None:
+    """The one call `function`'s body can be cut down to, if it's a plain method call."""
+    source = "".join(lines[function.lineno - 1 : function.end_lineno])
+    pattern, call = _SHIMS[shim]
+    if not re.search(pattern, source):
+        return None
+    # Anything done with the response beyond returning it is left as generated
+    if shim == "send" and "parsed_response = response\n" not in source:
+        return None
+    signatures = [
+        node.value
+        for node in ast.walk(function)
+        if isinstance(node, ast.Constant)
+        and isinstance(node.value, str)
+        and re.fullmatch(r"\w+\(.*\).*", node.value)
+    ]
+    if len(set(signatures)) != 1:
+        return None
+    parameters = {arg.arg for arg in [*function.args.args, *function.args.kwonlyargs]}
+    args = "args" if "args" in parameters else "None"
+    return "self." + call.format(f"{signatures[0]!r}, {args}").replace("'", '"')
+
+
+def _shim(function: ast.FunctionDef, lines: list[str], call: str) -> _Edit:
+    """Replaces the body of `function`, keeping its signature and docstring, with `call`."""
+    body = function.body
+    keep = typing.cast(int, typing.cast(ast.expr, function.returns).end_lineno)
+    if isinstance(body[0], ast.Expr) and isinstance(body[0].value, ast.Constant):
+        keep = typing.cast(int, body[0].end_lineno)
+    indent = " " * body[0].col_offset
+    end = typing.cast(int, function.end_lineno)
+    return keep, end, [f"{indent}return {call}\n"]
+
+
+def _move_factory_after_its_parts(source: str, contract: str) -> str:
+    """The factory's parts are class attributes now, so it has to follow their classes."""
+    nodes = [node for node in ast.parse(source).body if isinstance(node, ast.ClassDef)]
+    factory = next((n for n in nodes if n.name == f"{contract}Factory"), None)
+    parts = [
+        n for n in nodes if n.name.startswith(f"{contract}Factory") and n is not factory
+    ]
+    if factory is None or not parts or parts[-1].lineno < factory.lineno:
+        return source
+    lines = source.splitlines(keepends=True)
+    start, end = _first_line(factory) - 1, typing.cast(int, factory.end_lineno)
+    moved = lines[start:end]
+    at = typing.cast(int, parts[-1].end_lineno)
+    return "".join([*lines[:start], *lines[end:at], "\n\n", *moved, *lines[at:]])
+
+
+def _defined_name(node: ast.stmt) -> str | None:
+    if isinstance(node, ast.FunctionDef | ast.ClassDef):
+        return node.name
+    if isinstance(node, ast.Assign) and len(node.targets) == 1:
+        target = node.targets[0]
+        if isinstance(target, ast.Name):
+            return target.id
+    return None
+
+
+def _first_line(node: ast.stmt) -> int:
+    if isinstance(node, ast.FunctionDef | ast.ClassDef) and node.decorator_list:
+        return node.decorator_list[0].lineno
+    return node.lineno
+
+
+_RESULT_MAPPER = re.compile(
+    r"lambda v: self\.client\.decode_return_value\(\s*(\"[^\"]*\"),\s*v\s*\)"
+)
+_SLIM_REPLACEMENTS = (
+    (_RESULT_MAPPER, r"_result_mapper(self.client, \1)", "result_mapper"),
+    (
+        re.compile(r"params or algokit_utils\.CommonAppCallParams\(\)"),
+        "params or _NO_PARAMS",
+        "NO_PARAMS",
+    ),
+    (
+        re.compile(r"params or algokit_utils\.CommonAppCallCreateParams\(\)"),
+        "params or _NO_CREATE_PARAMS",
+        "NO_CREATE_PARAMS",
+    ),
+    # The params dataclasses are flat, so asdict()'s recursive deepcopy buys nothing
+    (re.compile(r"\*\*dataclasses\.asdict\(params\)"), "**vars(params)", None),
+)
+
+
+def slim_client(client_file: Path) -> bool:
+    """
+    Rewrites a generated typed client to allocate less per call and per state read.
+
+    - Helper classes that only hold references set in `__init__` (`*Params`, `*Send`,
+      `*State`, `*Composer`, ...) get `__slots__`.
+    - Properties that wrap the app client in a new private accessor object, such as
+      `state.global_state` or `state.box.deposits`, build it once per instance.
+    - Composers queue one shared result mapper per method instead of a new lambda.
+    - Omitted call params default to shared frozen instances, and are copied shallowly.
+
+    Returns False if there was nothing left to rewrite.
+    """
+    original = client_file.read_text()
+    lines = original.splitlines(keepends=True)
+    # Line index -> replacement lines, applied bottom-up so earlier indexes stay valid
+    edits: dict[int, list[str]] = {}
+    imports: set[str] = set()
+    for node in ast.parse(original).body:
+        if isinstance(node, ast.ClassDef) and _slot_class(node, lines, edits):
+            imports.add("CachedAccessor")
+    for index in sorted(edits, reverse=True):
+        lines[index : index + 1] = edits[index]
+    source = "".join(lines)
+    for pattern, replacement, runtime_name in _SLIM_REPLACEMENTS:
+        source, count = pattern.subn(replacement, source)
+        if count and runtime_name:
+            imports.add(runtime_name)
+    if source == original:
+        return False
+    if imports:
+        lines = source.splitlines(keepends=True)
+        first_class = next(
+            _first_line(node)
+            for node in ast.parse(source).body
+            if isinstance(node, ast.ClassDef)
+        )
+        names = ", ".join(f"{name} as _{name}" for name in sorted(imports))
+        lines.insert(
+            first_class - 1,
+            f"from smart_contracts._helpers.client_runtime import {names}\n\n",
+        )
+        source = "".join(lines)
+    client_file.write_text(source)
+    return True
+
+
+def _slot_class(
+    node: ast.ClassDef, lines: list[str], edits: dict[int, list[str]]
+) -> bool:
+    """Adds `__slots__` to a reference-holding class; True if it has cached accessors."""
+    if node.bases or node.decorator_list:
+        return False
+    inits = [
+        item
+        for item in node.body
+        if isinstance(item, ast.FunctionDef) and item.name == "__init__"
+    ]
+    if len(inits) != 1 or any(_defined_name(item) == "__slots__" for item in node.body):
+        return False
+    attributes = [_self_attribute(statement) for statement in inits[0].body]
+    if not all(attributes):
+        return False
+    slots = typing.cast(list[str], attributes)
+    accessors = False
+    for item in node.body:
+        if isinstance(item, ast.FunctionDef) and _is_accessor(item):
+            decorator = item.decorator_list[0]
+            line = lines[decorator.lineno - 1]
+            edits[decorator.lineno - 1] = [
+                line.replace("@property", "@_CachedAccessor")
+            ]
+            slots.append(f"_cached_{item.name}")
+            accessors = True
+    first = node.body[0]
+    has_docstring = isinstance(first, ast.Expr) and isinstance(
+        first.value, ast.Constant
+    )
+    indent = " " * first.col_offset
+    slots_line = f"{indent}__slots__ = ({', '.join(repr(slot) for slot in slots)},)\n"
+    if has_docstring:
+        at = typing.cast(int, first.end_lineno) - 1
+        edits[at] = [lines[at], "\n", slots_line]
+    else:
+        at = _first_line(first) - 1
+        edits[at] = [slots_line, "\n", *edits.get(at, [lines[at]])]
+    return accessors
+
+
+def _self_attribute(statement: ast.stmt) -> str | None:
+    targets = (
+        statement.targets
+        if isinstance(statement, ast.Assign)
+        else [statement.target] if isinstance(statement, ast.AnnAssign) else []
+    )
+    if len(targets) != 1:
+        return None
+    target = targets[0]
+    if (
+        isinstance(target, ast.Attribute)
+        and isinstance(target.value, ast.Name)
+        and target.value.id == "self"
+    ):
+        return target.attr
+    return None
+
+
+def _is_accessor(function: ast.FunctionDef) -> bool:
+    # `@property` whose body only returns a new private accessor object
+    decorators = function.decorator_list
+    if len(decorators) != 1 or not (
+        isinstance(decorators[0], ast.Name) and decorators[0].id == "property"
+    ):
+        return False
+    body = function.body
+    if (
+        body
+        and isinstance(body[0], ast.Expr)
+        and isinstance(body[0].value, ast.Constant)
+    ):
+        body = body[1:]
+    return (
+        len(body) == 1
+        and isinstance(body[0], ast.Return)
+        and isinstance(body[0].value, ast.Call)
+        and isinstance(body[0].value.func, ast.Name)
+        and body[0].value.func.id.startswith("_")
+    )
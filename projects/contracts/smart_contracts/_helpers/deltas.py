@@ -0,0 +1,34 @@
+import typing
+
+import msgpack
+from algosdk.v2client.algod import AlgodClient
+
+# How algod's ledger keys a box: this, the app ID as 8 big-endian bytes, the name.
+BOX_KEY_PREFIX = b"bx:"
+
+
+def box_deltas(
+    algod: AlgodClient, app_id: int, round_: int
+) -> dict[bytes, bytes | None]:
+    """
+    The boxes of `app_id` that `round_` changed: name to new value, None if deleted.
+
+    Read from the round's ledger state delta, so every change counts whichever call,
+    inner or outer, made it. algod serves deltas for the rounds it still holds in
+    memory, a few hundred back on a regular node and until synced past on a follower
+    node; for others it answers 404.
+    """
+    raw = typing.cast(
+        bytes, algod.get_ledger_state_delta(round_, response_format="msgpack")
+    )
+    # Go strings, i.e. ledger keys, aren't necessarily UTF-8, so keys stay bytes
+    delta = typing.cast(
+        dict[bytes, object], msgpack.unpackb(raw, raw=True, strict_map_key=False)
+    )
+    mods = typing.cast(dict[bytes, dict[bytes, bytes]], delta.get(b"KvMods", {}))
+    prefix = BOX_KEY_PREFIX + app_id.to_bytes(8, "big")
+    return {
+        key[len(prefix) :]: mod.get(b"Data")
+        for key, mod in mods.items()
+        if key.startswith(prefix)
+    }
@@ -0,0 +1,272 @@
+import collections
+import logging
+import os
+import threading
+import time
+import typing
+from collections.abc import Callable, Mapping, Sequence
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from dataclasses import dataclass
+
+import algokit_utils
+from algokit_utils import ClientManager
+from algosdk.v2client.algod import AlgodClient
+
+logger = logging.getLogger(__name__)
+
+# Latencies kept per endpoint for its percentiles.
+LATENCY_WINDOW = 256
+# How long a read waits on an endpoint without enough latencies for a percentile.
+DEFAULT_HEDGE_DELAY = 0.05
+# Seconds an endpoint is passed over after failing, before traffic tries it again.
+DEFAULT_COOLDOWN = 5.0
+
+# Latencies an endpoint needs before its own percentile sets when reads are hedged.
+_MIN_SAMPLES = 20
+# Worth asking another node: this one is overloaded or restarting.
+_RETRY_STATUSES = frozenset({429, 500, 502, 503, 504})
+# POSTs that read, and so are hedged like GETs
+_READ_POSTS = frozenset({"/transactions/simulate", "/teal/compile"})
+
+_Response = dict[str, object] | bytes
+_Call = Callable[[AlgodClient], _Response]
+
+
+def _transient(e: BaseException) -> bool:
+    """Connection failures and overload responses, which another node may not have."""
+    status = typing.cast(dict[str, object], vars(e)).get("code")
+    return isinstance(e, OSError) or status in _RETRY_STATUSES
+
+
+@dataclass(frozen=True)
+class EndpointStats:
+    address: str
+    requests: int
+    failures: int
+    # Reads that went to another node as well because this one was slow
+    hedged: int
+    healthy: bool
+    p50: float
+    p95: float
+    p99: float
+
+
+class _Endpoint:
+    def __init__(self, algod: AlgodClient):
+        self.algod = algod
+        self.latencies: collections.deque[float] = collections.deque(
+            maxlen=LATENCY_WINDOW
+        )
+        self.requests = 0
+        self.failures = 0
+        self.hedged = 0
+        self.down_until = 0.0
+
+    def percentile(self, q: float) -> float:
+        if not self.latencies:
+            return 0.0
+        ordered = sorted(self.latencies)
+        return ordered[min(int(len(ordered) * q), len(ordered) - 1)]
+
+
+class HedgedAlgodClient(AlgodClient):
+    """
+    An `AlgodClient` over several algod nodes: hedged reads, failover for the rest.
+
+    GETs, simulate and compile go to the healthy node with the lowest median latency;
+    if it hasn't answered within its own `hedge_percentile` latency, the request is
+    sent to the next node too and whichever answers first wins. Submissions go to one
+    node at a time, moving on to the next when one can't be reached or is overloaded,
+    which is safe since a signed transaction resent to another node has the same ID.
+    A node that fails that way sits out for `cooldown` seconds unless every node has.
+
+    Nodes can lag each other by a round, so hedged reads can come from either side of
+    a new block. `stats` has each node's request counts and latency percentiles.
+    """
+
+    def __init__(
+        self,
+        nodes: Sequence[AlgodClient],
+        *,
+        hedge_percentile: float = 0.95,
+        hedge_delay: float = DEFAULT_HEDGE_DELAY,
+        cooldown: float = DEFAULT_COOLDOWN,
+    ):
+        if not nodes:
+            raise ValueError("HedgedAlgodClient needs at least one algod node")
+        super().__init__(nodes[0].algod_token, nodes[0].algod_address, nodes[0].headers)
+        self._endpoints = [_Endpoint(node) for node in nodes]
+        self._hedge_percentile = hedge_percentile
+        self._hedge_delay = hedge_delay
+        self._cooldown = cooldown
+        self._lock = threading.Lock()
+        # Losing hedges finish in the background, so allow two per node in flight
+        self._executor = ThreadPoolExecutor(
+            4 * len(nodes), thread_name_prefix="algod-hedge"
+        )
+
+    def algod_request(
+        self,
+        method: str,
+        requrl: str,
+        params: object = None,
+        data: bytes | None = None,
+        headers: dict[str, str] | None = None,
+        response_format: str | None = "json",
+        timeout: int | None = 30,
+    ) -> _Response:
+        def call(algod: AlgodClient) -> _Response:
+            return typing.cast(
+                _Response,
+                algod.algod_request(
+                    method,
+                    requrl,
+                    typing.cast(Mapping[str, object] | None, params),
+                    data,
+                    headers,
+                    response_format,
+                    timeout,
+                ),
+            )
+
+        if method == "GET" or requrl in _READ_POSTS:
+            return self._hedged(call)
+        return self._failover(call, self._ranked())
+
+    @property
+    def stats(self) -> list[EndpointStats]:
+        now = time.monotonic()
+        with self._lock:
+            return [
+                EndpointStats(
+                    address=endpoint.algod.algod_address,
+                    requests=endpoint.requests,
+                    failures=endpoint.failures,
+                    hedged=endpoint.hedged,
+                    healthy=endpoint.down_until <= now,
+                    p50=endpoint.percentile(0.5),
+                    p95=endpoint.percentile(0.95),
+                    p99=endpoint.percentile(0.99),
+                )
+                for endpoint in self._endpoints
+            ]
+
+    def close(self) -> None:
+        self._executor.shutdown(wait=False)
+
+    def _ranked(self) -> list[_Endpoint]:
+        """Healthy endpoints, fastest first, then the rest, soonest back first."""
+        now = time.monotonic()
+        with self._lock:
+
+            def rank(endpoint: _Endpoint) -> tuple[bool, float]:
+                if endpoint.down_until > now:
+                    return True, endpoint.down_until
+                return False, endpoint.percentile(0.5)
+
+            return sorted(self._endpoints, key=rank)
+
+    def _timed(self, endpoint: _Endpoint, call: _Call) -> _Response:
+        started = time.perf_counter()
+        try:
+            response = call(endpoint.algod)
+        except Exception as e:
+            with self._lock:
+                endpoint.requests += 1
+                if _transient(e):
+                    endpoint.failures += 1
+                    endpoint.down_until = time.monotonic() + self._cooldown
+                else:
+                    # The node answered; the request itself was at fault
+                    endpoint.latencies.append(time.perf_counter() - started)
+            raise
+        with self._lock:
+            endpoint.requests += 1
+            endpoint.latencies.append(time.perf_counter() - started)
+            endpoint.down_until = 0.0
+        return response
+
+    def _hedged(self, call: _Call) -> _Response:
+        ranked = self._ranked()
+        primary = ranked[0]
+        with self._lock:
+            if len(primary.latencies) >= _MIN_SAMPLES:
+                delay = primary.percentile(self._hedge_percentile)
+            else:
+                delay = self._hedge_delay
+        started = time.perf_counter()
+        first = self._executor.submit(self._timed, primary, call)
+        wait([first], timeout=delay)
+        if len(ranked) == 1 or (first.done() and not _failed_over(first)):
+            return first.result()
+        if not first.done():
+            with self._lock:
+                primary.hedged += 1
+            logger.debug(
+                f"Hedging a read to {ranked[1].algod.algod_address}: "
+                f"{primary.algod.algod_address} took over {delay * 1000:.0f}ms"
+            )
+        pending = {first, self._executor.submit(self._timed, ranked[1], call)}
+        while pending:
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                if not _failed_over(future):
+                    if not first.done():
+                        # It has taken this long at least, so it isn't asked first
+                        # again before its own answer comes in
+                        with self._lock:
+                            primary.latencies.append(time.perf_counter() - started)
+                    return future.result()
+        # Both failed in a way another node might not: try the remaining ones in turn
+        return self._failover(call, ranked[2:], first.exception())
+
+    def _failover(
+        self,
+        call: _Call,
+        endpoints: list[_Endpoint],
+        error: BaseException | None = None,
+    ) -> _Response:
+        for endpoint in endpoints:
+            try:
+                return self._timed(endpoint, call)
+            except Exception as e:
+                if not _transient(e):
+                    raise
+                logger.info(f"algod at {endpoint.algod.algod_address} failed: {e}")
+                error = e
+        raise typing.cast(BaseException, error)
+
+
+def _failed_over(future: "Future[_Response]") -> bool:
+    error = future.exception()
+    return error is not None and _transient(error)
+
+
+def algorand_from_environment() -> algokit_utils.AlgorandClient:
+    """
+    `AlgorandClient.from_environment()`, over every node in `ALGOD_SERVERS` if it's set.
+
+    `ALGOD_SERVERS` is a comma-separated list of algod URLs (ports included) sharing
+    `ALGOD_TOKEN`; indexer and kmd are configured from the environment as usual.
+    """
+    servers = os.getenv("ALGOD_SERVERS")
+    if not servers:
+        return algokit_utils.AlgorandClient.from_environment()
+    token = os.getenv("ALGOD_TOKEN", "")
+    algod = HedgedAlgodClient(
+        [AlgodClient(token, server.strip()) for server in servers.split(",")]
+    )
+    configs = ClientManager.get_config_from_environment_or_localnet()
+    return algokit_utils.AlgorandClient.from_clients(
+        algod=algod,
+        indexer=(
+            ClientManager.get_indexer_client(configs.indexer_config)
+            if configs.indexer_config
+            else None
+        ),
+        kmd=(
+            ClientManager.get_kmd_client(configs.kmd_config)
+            if configs.kmd_config
+            else None
+        ),
+    )
@@ -0,0 +1,229 @@
+import dataclasses
+import threading
+import typing
+from collections.abc import Callable, Iterable
+
+import algokit_utils
+from algosdk import abi
+
+from smart_contracts._helpers.readonly import TypedAppClient
+
+_Convert = Callable[[object], object]
+_MethodArgs = list[
+    algokit_utils.ABIValue
+    | algokit_utils.ABIStruct
+    | algokit_utils.AppMethodCallTransactionArgument
+    | None
+]
+
+_NO_PARAMS = algokit_utils.CommonAppCallParams()
+
+
+def _identity(value: object) -> object:
+    return value
+
+
+def _to_tuples(value: object) -> object:
+    """Turns struct dataclasses into the nested tuples the ABI encoder expects."""
+    if isinstance(value, tuple):
+        return tuple(_to_tuples(item) for item in value)
+    if isinstance(value, list):
+        return [_to_tuples(item) for item in value]
+    if hasattr(value, "__dataclass_fields__"):
+        fields = typing.cast(dict[str, object], vars(value))
+        return tuple(_to_tuples(field) for field in fields.values())
+    return value
+
+
+@dataclasses.dataclass(frozen=True)
+class MethodCodec:
+    """
+    Everything about one ABI method that the generated clients work out again on every call.
+
+    `convert` holds one argument converter per position, picked once from its ABI type:
+    only tuple-typed arguments can hold struct dataclasses, so every other argument is
+    passed through untouched.
+    """
+
+    signature: str
+    method: abi.Method
+    selector: bytes
+    readonly: bool
+    convert: tuple[_Convert, ...]
+    # Methods needing the generic path: struct-typed args/returns or default argument values
+    generic: bool
+
+    @staticmethod
+    def compile(app_spec: algokit_utils.Arc56Contract, signature: str) -> "MethodCodec":
+        arc56_method = app_spec.get_arc56_method(signature)
+        method = arc56_method.to_abi_method()
+        return MethodCodec(
+            signature=signature,
+            method=method,
+            selector=method.get_selector(),
+            readonly=bool(arc56_method.readonly),
+            convert=tuple(
+                _to_tuples if "(" in str(arg.type) else _identity
+                for arg in arc56_method.args
+            ),
+            generic=bool(arc56_method.returns.struct)
+            or any(arg.struct or arg.default_value for arg in arc56_method.args),
+        )
+
+    def args(self, args: object) -> _MethodArgs:
+        """Method arguments from a typed client's `tuple` or `*Args` dataclass."""
+        if isinstance(args, tuple):
+            values: Iterable[object] = args
+        else:
+            values = typing.cast(dict[str, object], vars(args)).values()
+        return typing.cast(
+            _MethodArgs,
+            [
+                convert(value)
+                for convert, value in zip(self.convert, values, strict=True)
+            ],
+        )
+
+    def decode(self, abi_return: algokit_utils.ABIReturn | None) -> object:
+        """The decoded return value; struct returns take the generic path instead."""
+        if abi_return is None:
+            return None
+        if abi_return.decode_error:
+            raise abi_return.decode_error
+        return typing.cast(object, abi_return.value)
+
+    # A codec doubles as the result mapper generated composers keep per queued call
+    __call__ = decode
+
+
+class _CodecCache:
+    def __init__(self) -> None:
+        # Keyed by id(), and each entry keeps its spec alive so the id can't be reused
+        self._codecs: dict[
+            int, tuple[algokit_utils.Arc56Contract, dict[str, MethodCodec]]
+        ] = {}
+        self._lock = threading.Lock()
+
+    def get(self, app_spec: algokit_utils.Arc56Contract, signature: str) -> MethodCodec:
+        entry = self._codecs.get(id(app_spec))
+        codec = entry[1].get(signature) if entry else None
+        if codec is not None:
+            return codec
+        codec = MethodCodec.compile(app_spec, signature)
+        with self._lock:
+            _, codecs = self._codecs.setdefault(id(app_spec), (app_spec, {}))
+            return codecs.setdefault(signature, codec)
+
+
+_codecs = _CodecCache()
+
+
+def method_codec(app_spec: algokit_utils.Arc56Contract, signature: str) -> MethodCodec:
+    """The process-wide codec for one method of an app spec."""
+    return _codecs.get(app_spec, signature)
+
+
+class FastCalls:
+    """
+    Builds and sends method calls for a typed client without its generic per-call work.
+
+    The first call to each method goes through the typed client's own `AppClient`, and the
+    sender, signer and app ID it resolves are reused from then on. Later calls skip the
+    dataclass introspection, `asdict`/`deepcopy` of the params, the method lookup in the
+    app spec and the `Method` object rebuild. A call that overrides the sender or signer,
+    or whose method has struct or default arguments, always takes the generic path.
+    """
+
+    def __init__(self, client: TypedAppClient):
+        self._app_client = client.app_client
+        self._templates: dict[str, algokit_utils.AppCallMethodCallParams] = {}
+
+    def codec(self, signature: str) -> MethodCodec:
+        return method_codec(self._app_client.app_spec, signature)
+
+    def params(
+        self,
+        signature: str,
+        args: object = (),
+        params: algokit_utils.CommonAppCallParams | None = None,
+    ) -> algokit_utils.AppCallMethodCallParams:
+        codec = self.codec(signature)
+        params = params or _NO_PARAMS
+        template = self._templates.get(signature)
+        if template is None or codec.generic or params.sender or params.signer:
+            return self._generic(codec, args, params)
+        return algokit_utils.AppCallMethodCallParams(
+            app_id=template.app_id,
+            method=codec.method,
+            args=codec.args(args),
+            on_complete=template.on_complete,
+            sender=template.sender,
+            signer=template.signer,
+            account_references=params.account_references,
+            app_references=params.app_references,
+            asset_references=params.asset_references,
+            box_references=params.box_references,
+            extra_fee=params.extra_fee,
+            lease=params.lease,
+            max_fee=params.max_fee,
+            note=params.note,
+            rekey_to=params.rekey_to,
+            static_fee=params.static_fee,
+            validity_window=params.validity_window,
+            first_valid_round=params.first_valid_round,
+            last_valid_round=params.last_valid_round,
+        )
+
+    def _generic(
+        self,
+        codec: MethodCodec,
+        args: object,
+        params: algokit_utils.CommonAppCallParams,
+    ) -> algokit_utils.AppCallMethodCallParams:
+        result = self._app_client.params.call(_client_params(codec, args, params))
+        if not (codec.generic or params.sender or params.signer):
+            self._templates.setdefault(codec.signature, result)
+        return result
+
+    def send(
+        self,
+        signature: str,
+        args: object = (),
+        params: algokit_utils.CommonAppCallParams | None = None,
+        send_params: algokit_utils.SendParams | None = None,
+    ) -> object:
+        """Sends the call and returns its decoded ABI return value."""
+        codec = self.codec(signature)
+        if codec.readonly or codec.generic:
+            # Readonly calls are simulated and struct returns need the app spec, as in AppClient
+            result = self._app_client.send.call(
+                _client_params(codec, args, params or _NO_PARAMS), send_params
+            )
+            return typing.cast(object, result.abi_return)
+        call = self.params(signature, args, params)
+        sent = self._app_client.algorand.send.app_call_method_call(call, send_params)
+        return codec.decode(sent.abi_return)
+
+
+def _client_params(
+    codec: MethodCodec, args: object, params: algokit_utils.CommonAppCallParams
+) -> algokit_utils.AppClientMethodCallParams:
+    return algokit_utils.AppClientMethodCallParams(
+        method=codec.signature,
+        args=codec.args(args),
+        account_references=params.account_references,
+        app_references=params.app_references,
+        asset_references=params.asset_references,
+        box_references=params.box_references,
+        extra_fee=params.extra_fee,
+        lease=params.lease,
+        max_fee=params.max_fee,
+        note=params.note,
+        rekey_to=params.rekey_to,
+        sender=params.sender,
+        signer=params.signer,
+        static_fee=params.static_fee,
+        validity_window=params.validity_window,
+        first_valid_round=params.first_valid_round,
+        last_valid_round=params.last_valid_round,
+    )
@@ -0,0 +1,268 @@
+import base64
+import dataclasses
+import logging
+import re
+import threading
+import typing
+from collections.abc import Callable
+from dataclasses import dataclass
+
+import algokit_utils
+from algosdk import abi
+
+from smart_contracts._helpers.readonly import TypedAppClient
+from smart_contracts._helpers.resources import (
+    BoxMapKeys,
+    Resources,
+    assign_references,
+    transaction_sender,
+)
+
+logger = logging.getLogger(__name__)
+
+# Where a value comes from in a call: ("sender",), ("txn_sender", i) for the sender of
+# transaction argument i, or ("args", i, ...) for argument i and the indexes into it
+_Path = tuple[str | int, ...]
+_Key = tuple[str, tuple[object, ...]]
+_Json = dict[str, object]
+_R = typing.TypeVar("_R")
+_Send = Callable[
+    [algokit_utils.CommonAppCallParams, algokit_utils.SendParams | None], _R
+]
+
+_SENDER: _Path = ("sender",)
+
+# algod's complaints about a resource a call used without a reference to it
+_MISSING_REFERENCE = re.compile(
+    r"(unavailable|invalid) (box|account|app|asset)|box (read|write) budget",
+    re.IGNORECASE,
+)
+
+
+@dataclass(frozen=True)
+class Footprint:
+    """
+    The resources a method call touched, recorded relative to the call.
+
+    Boxes are kept as the map they belong to and the path of the call value keying
+    them; accounts and apps as the path of the call value they equal, or as themselves
+    when no value did.
+    """
+
+    boxes: tuple[tuple[str, _Path], ...] = ()
+    accounts: tuple[_Path | str, ...] = ()
+    apps: tuple[_Path | int, ...] = ()
+
+    def resources(
+        self, values: dict[_Path, object], maps: dict[str, BoxMapKeys]
+    ) -> Resources:
+        return Resources(
+            boxes=frozenset(maps[name].ref(values[path]) for name, path in self.boxes),
+            accounts=frozenset(
+                typing.cast(
+                    str, values[account] if isinstance(account, tuple) else account
+                )
+                for account in self.accounts
+            ),
+            apps=frozenset(
+                typing.cast(int, values[app] if isinstance(app, tuple) else app)
+                for app in self.apps
+            ),
+        )
+
+
+def _walk(values: dict[_Path, object], path: _Path, value: object) -> None:
+    values[path] = value
+    if isinstance(value, list | tuple):
+        for index, item in enumerate(typing.cast(list[object], value)):
+            _walk(values, (*path, index), item)
+
+
+def _values(params: algokit_utils.AppCallMethodCallParams) -> dict[_Path, object]:
+    """Every value a call's resources could be keyed by, most likely ones first."""
+    values: dict[_Path, object] = {_SENDER: params.sender}
+    args = typing.cast(list[object] | None, params.args) or []
+    for index, (arg, spec) in enumerate(zip(args, params.method.args, strict=False)):
+        if abi.is_abi_transaction_type(spec.type):
+            values[("txn_sender", index)] = transaction_sender(arg)
+        else:
+            _walk(values, ("args", index), arg)
+    return values
+
+
+def _shape(values: dict[_Path, object]) -> tuple[object, ...]:
+    """
+    The lengths of a call's arrays and which of its values are its sender.
+
+    Calls of the same method and shape touch resources at the same paths, as long as
+    the method keys them by its arguments and sender alone.
+    """
+    sender = values[_SENDER]
+    shape: list[object] = []
+    for path, value in values.items():
+        if isinstance(value, list | tuple):
+            shape.append((path, len(typing.cast(list[object], value))))
+        elif path != _SENDER and value == sender:
+            shape.append(path)
+    return tuple(shape)
+
+
+def _path_of(values: dict[_Path, object], value: object) -> _Path | None:
+    return next((path for path, known in values.items() if known == value), None)
+
+
+def _accessed(response: _Json) -> list[_Json]:
+    """Unnamed resources accessed by the simulated group and by each of its calls."""
+    group = typing.cast(list[_Json], response["txn-groups"])[0]
+    results = [group, *typing.cast(list[_Json], group["txn-results"])]
+    return [
+        typing.cast(_Json, result["unnamed-resources-accessed"])
+        for result in results
+        if "unnamed-resources-accessed" in result
+    ]
+
+
+def missing_reference(e: Exception) -> bool:
+    """Whether `e` is algod rejecting a call for a resource it had no reference to."""
+    return _MISSING_REFERENCE.search(str(e)) is not None
+
+
+class FootprintCache:
+    """
+    Attaches the references a typed client's call needs without simulating it first.
+
+    The first call of each method and shape (see `_shape`) is simulated once, as
+    `populate_app_call_resources` would, and the boxes it touched are traced back to
+    the app spec's box maps and to the call values keying them: `Bank.deposit` touches
+    the `deposits` box keyed by its payment's sender, `Bank.withdraw` the one keyed by
+    its own sender. Later calls of that shape get their references from that
+    footprint and are sent without a simulate.
+
+    A call whose footprint involves anything else (local state, asset holdings, boxes
+    of other apps or outside any map) keeps being populated by simulate. So does one
+    rejected for a missing reference, after its footprint is dropped and relearned.
+    """
+
+    def __init__(self, client: TypedAppClient):
+        self._client = client
+        app_spec = client.app_client.app_spec
+        self._maps = {
+            name: BoxMapKeys(app_spec, name, client.app_client.app_id)
+            for name in app_spec.state.maps.box
+        }
+        self._footprints: dict[_Key, Footprint | None] = {}
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.fallbacks = 0
+
+    def send(
+        self,
+        call: algokit_utils.AppCallMethodCallParams,
+        params: algokit_utils.CommonAppCallParams | None,
+        send_params: algokit_utils.SendParams | None,
+        send: _Send[_R],
+    ) -> _R:
+        """
+        Sends `call` through the typed client's `send` with references from its footprint.
+
+        `call` is the typed client's `params.<method>` for the same arguments and
+        `params`; calls that already carry references are sent unchanged.
+        """
+        params = params or algokit_utils.CommonAppCallParams()
+        if params.box_references or params.account_references or params.app_references:
+            return send(params, send_params)
+        values = _values(call)
+        key = (call.method.get_signature(), _shape(values))
+        with self._lock:
+            known = key in self._footprints
+            footprint = self._footprints.get(key)
+            if known:
+                self.hits += 1
+            else:
+                self.misses += 1
+        if not known:
+            response = self._simulate(call)
+            # A failed simulate says nothing about the footprint; the next call retries
+            if response is not None:
+                footprint = self._learn(response, values)
+                with self._lock:
+                    self._footprints[key] = footprint
+        if footprint is not None:
+            resources = footprint.resources(values, self._maps)
+            references = assign_references([self._client.app_client.app_id], resources)
+            if references is not None:
+                referenced = algokit_utils.SendParams(**(send_params or {}))
+                referenced["populate_app_call_resources"] = False
+                try:
+                    return send(
+                        dataclasses.replace(
+                            params,
+                            box_references=list(references[0].boxes),
+                            account_references=references[0].accounts,
+                            app_references=references[0].apps,
+                        ),
+                        referenced,
+                    )
+                except Exception as e:
+                    if not missing_reference(e):
+                        raise
+                    logger.info(f"Dropping the footprint of {key[0]}: {e}")
+                    with self._lock:
+                        self._footprints.pop(key, None)
+                        self.fallbacks += 1
+        return send(params, send_params)
+
+    def _simulate(self, call: algokit_utils.AppCallMethodCallParams) -> _Json | None:
+        """The simulate response for `call` on its own, or None if it failed."""
+        composer = self._client.app_client.algorand.new_group()
+        composer.add_app_call_method_call(call)
+        try:
+            result = composer.simulate(
+                allow_unnamed_resources=True, skip_signatures=True
+            )
+        except Exception as e:
+            logger.debug(f"Simulating {call.method.name} failed, not caching: {e}")
+            return None
+        response = typing.cast(_Json, result.simulate_response)
+        failure = typing.cast(list[_Json], response["txn-groups"])[0].get(
+            "failure-message"
+        )
+        if failure:
+            logger.debug(
+                f"Simulating {call.method.name} failed, not caching: {failure}"
+            )
+            return None
+        return response
+
+    def _learn(self, response: _Json, values: dict[_Path, object]) -> Footprint | None:
+        """The footprint a successful simulate shows, or None if it can't be expressed."""
+        boxes: list[tuple[str, _Path]] = []
+        accounts: list[_Path | str] = []
+        apps: list[_Path | int] = []
+        for accessed in _accessed(response):
+            if set(accessed) - {"boxes", "accounts", "apps", "extra-box-refs"}:
+                return None
+            for box in typing.cast(list[_Json], accessed.get("boxes", [])):
+                name = base64.b64decode(typing.cast(str, box.get("name", "")))
+                if box["app"] != self._client.app_client.app_id:
+                    return None
+                source = self._box_source(name, values)
+                if source is None:
+                    return None
+                boxes.append(source)
+            for account in typing.cast(list[str], accessed.get("accounts", [])):
+                accounts.append(_path_of(values, account) or account)
+            for app in typing.cast(list[int], accessed.get("apps", [])):
+                apps.append(_path_of(values, app) or app)
+        return Footprint(tuple(boxes), tuple(accounts), tuple(apps))
+
+    def _box_source(
+        self, name: bytes, values: dict[_Path, object]
+    ) -> tuple[str, _Path] | None:
+        for map_name, keys in self._maps.items():
+            key = keys.key(name)
+            path = None if key is None else _path_of(values, key)
+            if path is not None:
+                return map_name, path
+        return None
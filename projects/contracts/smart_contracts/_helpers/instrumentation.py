@@ -0,0 +1,490 @@
+import bisect
+import contextvars
+import json
+import os
+import tempfile
+import threading
+import time
+import typing
+from collections.abc import Callable, Iterator, Mapping, Sequence
+from dataclasses import dataclass
+
+import algokit_utils
+from algosdk import transaction
+from algosdk.atomic_transaction_composer import TransactionSigner
+from algosdk.v2client.algod import AlgodClient
+
+from smart_contracts._helpers.budget import TypedComposer
+from smart_contracts._helpers.client_runtime import (
+    ReturnValue,
+    SendBase,
+    parse_abi_args,
+)
+from smart_contracts._helpers.fastcall import method_codec
+from smart_contracts._helpers.readonly import TypedAppClient
+
+_R = typing.TypeVar("_R")
+
+# What a call spends its time on, in the order a sent call goes through them.
+STAGES = ("build", "simulate", "sign", "submit", "confirm")
+# Upper bounds, in seconds, of the latency buckets `HistogramCollector` counts into.
+DEFAULT_BUCKETS = (
+    0.0005,
+    0.001,
+    0.0025,
+    0.005,
+    0.01,
+    0.025,
+    0.05,
+    0.1,
+    0.25,
+    0.5,
+    1.0,
+    2.5,
+    5.0,
+    10.0,
+    30.0,
+    60.0,
+)
+
+_Response = dict[str, object] | bytes
+
+
+@dataclass(frozen=True)
+class StageEvent:
+    method: str
+    stage: str
+    # Transactions in the group, as far as the call knew at the end of the stage
+    group_size: int
+    # Requests to algod made during the stage
+    round_trips: int
+    bytes_sent: int
+    bytes_received: int
+    elapsed: float
+    # The call raised during this stage
+    failed: bool
+
+
+class Hook(typing.Protocol):
+    """Called as each stage of an instrumented call starts and ends."""
+
+    def before(self, method: str, stage: str) -> None: ...
+
+    def after(self, event: StageEvent) -> None: ...
+
+
+class _Trace:
+    """The stages of one call, entered as its algod requests and signing show them."""
+
+    __slots__ = (
+        "bytes_received",
+        "bytes_sent",
+        "group_size",
+        "hooks",
+        "method",
+        "readonly",
+        "round_trips",
+        "stage",
+        "started",
+    )
+
+    def __init__(
+        self, hooks: list[Hook], method: str, group_size: int, *, readonly: bool
+    ):
+        self.hooks = hooks
+        self.method = method
+        self.group_size = group_size
+        self.readonly = readonly
+        self.stage = ""
+        self.started = 0.0
+        self.round_trips = self.bytes_sent = self.bytes_received = 0
+
+    def enter(self, stage: str) -> None:
+        if stage == self.stage:
+            return
+        now = time.perf_counter()
+        if self.stage:
+            self._emit(now, failed=False)
+        self.stage = stage
+        self.started = now
+        self.round_trips = self.bytes_sent = self.bytes_received = 0
+        for hook in self.hooks:
+            hook.before(self.method, stage)
+
+    def finish(self, *, failed: bool) -> None:
+        self._emit(time.perf_counter(), failed=failed)
+
+    def _emit(self, now: float, *, failed: bool) -> None:
+        event = StageEvent(
+            method=self.method,
+            stage=self.stage,
+            group_size=self.group_size,
+            round_trips=self.round_trips,
+            bytes_sent=self.bytes_sent,
+            bytes_received=self.bytes_received,
+            elapsed=now - self.started,
+            failed=failed,
+        )
+        for hook in self.hooks:
+            hook.after(event)
+
+
+_current: contextvars.ContextVar[_Trace | None] = contextvars.ContextVar(
+    "instrumented_call", default=None
+)
+
+
+def transaction_count(args: object) -> int:
+    """The size of the group a single method call with `args` sends."""
+    parsed = parse_abi_args(args) or []
+    return 1 + sum(
+        isinstance(arg, algokit_utils.AppMethodCallTransactionArgument)
+        for arg in parsed
+    )
+
+
+class Instrumentation:
+    """
+    Hooks called around each stage of the calls made through instrumented clients.
+
+    A call is made up of the stages in `STAGES`: building its params and group,
+    simulating it to populate resources (or, for a readonly call, to answer it),
+    signing, submitting and waiting for confirmation. Stages are told apart by the
+    algod requests a call makes, so its `AlgorandClient` has to use an algod client
+    from `algod`; signing is only told apart from building when the call simulates
+    first, or signs with a signer from `signer`. A stage is left out when a call
+    doesn't go through it.
+
+    With no hooks, instrumented calls and requests go straight through: the cost is a
+    check of `hooks` per call and a context variable lookup per request.
+    """
+
+    def __init__(self, hooks: Sequence[Hook] = ()):
+        self.hooks = list(hooks)
+
+    def run(
+        self,
+        method: str,
+        call: Callable[[], _R],
+        *,
+        group_size: int = 1,
+        readonly: bool = False,
+    ) -> _R:
+        """Calls `call` as one instrumented call of `method`."""
+        if not self.hooks:
+            return call()
+        trace = _Trace(list(self.hooks), method, group_size, readonly=readonly)
+        token = _current.set(trace)
+        failed = True
+        try:
+            trace.enter("build")
+            result = call()
+            failed = False
+            return result
+        finally:
+            _current.reset(token)
+            trace.finish(failed=failed)
+
+    def send(
+        self,
+        composer: TypedComposer,
+        send_params: algokit_utils.SendParams | None = None,
+    ) -> algokit_utils.SendAtomicTransactionComposerResults:
+        """
+        Sends a typed composer's group, e.g. a `BankComposer`'s, as one instrumented
+        call named after the methods it calls.
+
+        It's sent with the composer's own `send`, so any `opup` padding is part of it.
+        """
+        if not self.hooks:
+            return composer.send(send_params)
+
+        def send() -> algokit_utils.SendAtomicTransactionComposerResults:
+            # Before padding, which building for good would rule out; an instrumented
+            # signer sees the padded group
+            built = composer.composer().build_transactions()
+            trace = _current.get()
+            if trace is not None:
+                trace.group_size = len(built.transactions)
+                names = [method.name for method in built.method_calls.values()]
+                trace.method = "+".join(dict.fromkeys(names, True)) or "group"
+            return composer.send(send_params)
+
+        return self.run("group", send)
+
+    def algod(self, algod: AlgodClient) -> "InstrumentedAlgodClient":
+        return InstrumentedAlgodClient(algod)
+
+    def signer(self, signer: TransactionSigner) -> "InstrumentedSigner":
+        return InstrumentedSigner(signer)
+
+
+class InstrumentedSend(SendBase):
+    """
+    Base of a typed client's `send` counterpart whose calls are timed stage by stage.
+
+    Derived alongside the generated `<Contract>Send`, e.g. `InstrumentedBankSend(
+    InstrumentedSend, BankSend)`, so it has every one of its methods. Each call runs
+    through `instrumentation`'s hooks, named after its method, and `group` sends a
+    typed composer the same way. For requests to be told apart by stage, `client` has
+    to send through an `Instrumentation.algod` client.
+    """
+
+    __slots__ = ("client", "instrumentation")
+
+    def __init__(self, client: TypedAppClient, instrumentation: Instrumentation):
+        super().__init__(client.app_client)
+        self.client = client
+        self.instrumentation = instrumentation
+
+    def _call(
+        self,
+        method: str,
+        args: object | None,
+        params: algokit_utils.CommonAppCallParams | None,
+        send_params: algokit_utils.SendParams | None,
+    ) -> algokit_utils.SendAppTransactionResult[ReturnValue]:
+        send = super()._call
+        codec = method_codec(self.app_client.app_spec, method)
+        return self.instrumentation.run(
+            codec.method.name,
+            lambda: send(method, args, params, send_params),
+            group_size=transaction_count(args),
+            readonly=codec.readonly,
+        )
+
+    def clear_state(
+        self,
+        params: algokit_utils.AppClientBareCallParams | None = None,
+        send_params: algokit_utils.SendParams | None = None,
+    ) -> algokit_utils.SendAppTransactionResult[algokit_utils.ABIReturn]:
+        clear_state = super().clear_state
+        return self.instrumentation.run(
+            "clear_state", lambda: clear_state(params, send_params)
+        )
+
+    def group(
+        self,
+        composer: TypedComposer,
+        send_params: algokit_utils.SendParams | None = None,
+    ) -> algokit_utils.SendAtomicTransactionComposerResults:
+        return self.instrumentation.send(composer, send_params)
+
+
+class InstrumentedAlgodClient(AlgodClient):
+    """An `AlgodClient` that attributes its requests to the stages of the call in flight."""
+
+    def __init__(self, algod: AlgodClient):
+        super().__init__(algod.algod_token, algod.algod_address, algod.headers)
+        self._algod = algod
+
+    def algod_request(
+        self,
+        method: str,
+        requrl: str,
+        params: object = None,
+        data: bytes | None = None,
+        headers: dict[str, str] | None = None,
+        response_format: str | None = "json",
+        timeout: int | None = 30,
+    ) -> _Response:
+        trace = _current.get()
+        # The stage this request starts, if any; its response ends that stage
+        starts: str | None = None
+        if trace is not None:
+            if method == "POST" and requrl == "/transactions/simulate":
+                # Once submitted, e.g. to debug a failure, it's part of that stage
+                if trace.stage in ("build", "sign"):
+                    starts = "simulate"
+            elif method == "POST" and requrl == "/transactions":
+                starts = "submit"
+            if starts is not None:
+                trace.enter(starts)
+            trace.round_trips += 1
+            trace.bytes_sent += len(data or b"")
+        response = typing.cast(
+            _Response,
+            self._algod.algod_request(
+                method,
+                requrl,
+                typing.cast(Mapping[str, object] | None, params),
+                data,
+                headers,
+                response_format,
+                timeout,
+            ),
+        )
+        if trace is not None:
+            trace.bytes_received += (
+                len(response)
+                if isinstance(response, bytes)
+                # As algod encoded it, give or take whitespace
+                else len(json.dumps(response, separators=(",", ":")))
+            )
+            if starts == "simulate" and not trace.readonly:
+                trace.enter("sign")
+            elif starts == "submit":
+                trace.enter("confirm")
+        return response
+
+
+class InstrumentedSigner(TransactionSigner):
+    """A signer whose signing counts as the sign stage of the call in flight."""
+
+    def __init__(self, signer: TransactionSigner):
+        super().__init__()
+        self.signer = signer
+
+    def sign_transactions(
+        self, txn_group: list[transaction.Transaction], indexes: list[int]
+    ) -> list[transaction.GenericSignedTransaction]:
+        trace = _current.get()
+        if trace is not None:
+            trace.enter("sign")
+            trace.group_size = len(txn_group)
+        return self.signer.sign_transactions(txn_group, indexes)
+
+
+class _Series:
+    __slots__ = (
+        "buckets",
+        "bytes_received",
+        "bytes_sent",
+        "count",
+        "failures",
+        "round_trips",
+        "total",
+        "transactions",
+    )
+
+    def __init__(self, buckets: int):
+        # One count per bucket, plus one for anything slower than the last
+        self.buckets = [0] * (buckets + 1)
+        self.count = 0
+        self.total = 0.0
+        self.round_trips = 0
+        self.bytes_sent = 0
+        self.bytes_received = 0
+        self.transactions = 0
+        self.failures = 0
+
+
+class HistogramCollector:
+    """
+    A `Hook` keeping a latency histogram and request totals per method and stage.
+
+    Recording a stage costs a bisect and a few additions under a lock. `prometheus`
+    renders the histograms in the Prometheus text format, e.g. for node_exporter's
+    textfile collector, and `snapshot` as plain data for JSON.
+    """
+
+    def __init__(
+        self,
+        buckets: Sequence[float] = DEFAULT_BUCKETS,
+        *,
+        namespace: str = "algonomists",
+    ):
+        self.bounds = tuple(sorted(buckets))
+        self.namespace = namespace
+        self._series: dict[tuple[str, str], _Series] = {}
+        self._lock = threading.Lock()
+
+    def before(self, method: str, stage: str) -> None:
+        pass
+
+    def after(self, event: StageEvent) -> None:
+        key = (event.method, event.stage)
+        bucket = bisect.bisect_left(self.bounds, event.elapsed)
+        with self._lock:
+            series = self._series.get(key)
+            if series is None:
+                series = self._series[key] = _Series(len(self.bounds))
+            series.buckets[bucket] += 1
+            series.count += 1
+            series.total += event.elapsed
+            series.round_trips += event.round_trips
+            series.bytes_sent += event.bytes_sent
+            series.bytes_received += event.bytes_received
+            series.transactions += event.group_size
+            series.failures += event.failed
+
+    def snapshot(self) -> dict[str, dict[str, dict[str, object]]]:
+        """Per method, per stage: counts, seconds, totals and cumulative buckets."""
+        with self._lock:
+            snapshot: dict[str, dict[str, dict[str, object]]] = {}
+            for (method, stage), series in sorted(self._series.items()):
+                snapshot.setdefault(method, {})[stage] = {
+                    "count": series.count,
+                    "seconds": series.total,
+                    "round_trips": series.round_trips,
+                    "bytes_sent": series.bytes_sent,
+                    "bytes_received": series.bytes_received,
+                    "transactions": series.transactions,
+                    "failures": series.failures,
+                    "buckets": {
+                        str(bound): count
+                        for bound, count in zip(
+                            [*self.bounds, "+Inf"], _cumulative(series.buckets)
+                        )
+                    },
+                }
+            return snapshot
+
+    def prometheus(self) -> str:
+        name = f"{self.namespace}_call_stage"
+        lines = [
+            f"# HELP {name}_seconds Time instrumented calls spent in each stage.",
+            f"# TYPE {name}_seconds histogram",
+        ]
+        totals: dict[str, list[str]] = {
+            "round_trips": [],
+            "bytes_sent": [],
+            "bytes_received": [],
+            "transactions": [],
+            "failures": [],
+        }
+        with self._lock:
+            for (method, stage), series in sorted(self._series.items()):
+                labels = f'method="{_escape(method)}",stage="{stage}"'
+                for bound, count in zip(
+                    [*map(repr, self.bounds), "+Inf"], _cumulative(series.buckets)
+                ):
+                    lines.append(
+                        f'{name}_seconds_bucket{{{labels},le="{bound}"}} {count}'
+                    )
+                lines.append(f"{name}_seconds_sum{{{labels}}} {series.total!r}")
+                lines.append(f"{name}_seconds_count{{{labels}}} {series.count}")
+                for total, samples in totals.items():
+                    value = typing.cast(int, getattr(series, total))
+                    samples.append(f"{name}_{total}_total{{{labels}}} {value}")
+        for total, samples in totals.items():
+            lines.append(f"# TYPE {name}_{total}_total counter")
+            lines.extend(samples)
+        return "\n".join(lines) + "\n"
+
+    def write_prometheus(self, path: str | os.PathLike[str]) -> None:
+        _write_atomically(path, self.prometheus())
+
+    def write_json(self, path: str | os.PathLike[str]) -> None:
+        _write_atomically(path, json.dumps(self.snapshot(), indent=2))
+
+
+def _cumulative(counts: list[int]) -> Iterator[int]:
+    total = 0
+    for count in counts:
+        total += count
+        yield total
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def _write_atomically(path: str | os.PathLike[str], text: str) -> None:
+    """Writes beside `path` and renames, so a scraper never reads half a file."""
+    directory = os.path.dirname(os.fspath(path)) or "."
+    with tempfile.NamedTemporaryFile(
+        "w", dir=directory, delete=False, suffix=".tmp"
+    ) as file:
+        file.write(text)
+    os.replace(file.name, path)
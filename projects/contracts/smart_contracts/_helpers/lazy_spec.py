@@ -0,0 +1,141 @@
+import json
+import re
+import threading
+import typing
+from pathlib import Path
+
+import algokit_utils
+from algokit_utils.applications.app_spec.arc56 import Source, SourceInfoModel
+
+# JSON keys carrying the base64 TEAL and PC-to-error mappings. Only deployment and
+# logic error reporting read them, so they are parsed on first access.
+_DEFERRED_KEYS = ("source", "sourceInfo")
+
+_EAGER_SPEC = "APP_SPEC = algokit_utils.Arc56Contract.from_json(_APP_SPEC_JSON)\n"
+_LAZY_SPEC = """\
+from smart_contracts._helpers.lazy_spec import LazyAppSpec
+_APP_SPEC = LazyAppSpec(_APP_SPEC_JSON)
+
+
+def __getattr__(name: str) -> typing.Any:
+    # Keeps `APP_SPEC` importable while only parsing it on first use
+    if name == "APP_SPEC":
+        return _APP_SPEC.get()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+"""
+_SPEC_REFERENCE = re.compile(r"\bapp_spec=APP_SPEC\b")
+
+
+class _Arc56Contract(algokit_utils.Arc56Contract):
+    """`Arc56Contract` whose `source` and `source_info` are decoded when first read."""
+
+    _raw: dict[str, dict[str, object]]
+    _parsed: dict[str, object]
+
+    def _deferred(self, key: str, parse: typing.Callable[[], object]) -> object:
+        if key not in self._parsed:
+            self._parsed[key] = parse()
+        return self._parsed[key]
+
+    @property
+    def source(self) -> Source | None:
+        raw = self._raw.get("source")
+        return typing.cast(
+            Source | None,
+            self._deferred("source", lambda: Source.from_dict(raw) if raw else None),
+        )
+
+    @source.setter
+    def source(self, value: Source | None) -> None:
+        self._parsed["source"] = value
+
+    @property
+    def source_info(self) -> SourceInfoModel | None:
+        raw = self._raw.get("sourceInfo")
+        return typing.cast(
+            SourceInfoModel | None,
+            self._deferred(
+                "source_info",
+                lambda: SourceInfoModel.from_dict(_snake_case(raw)) if raw else None,
+            ),
+        )
+
+    @source_info.setter
+    def source_info(self, value: SourceInfoModel | None) -> None:
+        self._parsed["source_info"] = value
+
+
+def _snake_case(raw: dict[str, object]) -> dict[str, object]:
+    def convert(value: object) -> object:
+        if isinstance(value, dict):
+            return {
+                re.sub(r"(?<!^)(?=[A-Z])", "_", str(k)).lower(): convert(v)
+                for k, v in typing.cast(dict[str, object], value).items()
+            }
+        if isinstance(value, list):
+            return [convert(item) for item in typing.cast(list[object], value)]
+        return value
+
+    return typing.cast(dict[str, object], convert(raw))
+
+
+_specs: dict[str, algokit_utils.Arc56Contract] = {}
+_specs_lock = threading.Lock()
+
+
+def parse_app_spec(spec_json: str) -> algokit_utils.Arc56Contract:
+    """
+    Parses an ARC-56 spec once per process, leaving TEAL sources and source info raw.
+
+    Cached on the JSON text, so every client of the same contract shares one spec.
+    """
+    with _specs_lock:
+        if spec_json not in _specs:
+            _specs[spec_json] = _parse(spec_json)
+        return _specs[spec_json]
+
+
+def _parse(spec_json: str) -> algokit_utils.Arc56Contract:
+    spec = typing.cast(dict[str, object], json.loads(spec_json))
+    deferred = {key: spec.pop(key) for key in _DEFERRED_KEYS if key in spec}
+    eager = algokit_utils.Arc56Contract.from_dict(spec)
+    # Skip __init__, which would assign the deferred fields through their setters
+    contract = _Arc56Contract.__new__(_Arc56Contract)
+    fields = typing.cast(dict[str, object], vars(eager))
+    typing.cast(dict[str, object], vars(contract)).update(
+        (name, value)
+        for name, value in fields.items()
+        if name not in ("source", "source_info")
+    )
+    contract._raw = typing.cast(dict[str, dict[str, object]], deferred)
+    contract._parsed = {}
+    return contract
+
+
+class LazyAppSpec:
+    """An app spec that is parsed on the first `get()`, not when its module is imported."""
+
+    def __init__(self, spec_json: str):
+        self._spec_json = spec_json
+        self._spec: algokit_utils.Arc56Contract | None = None
+
+    def get(self) -> algokit_utils.Arc56Contract:
+        # parse_app_spec is synchronised, so racing first calls still share one spec
+        if self._spec is None:
+            self._spec = parse_app_spec(self._spec_json)
+        return self._spec
+
+
+def make_client_lazy(client_file: Path) -> bool:
+    """
+    Rewrites a generated typed client to parse its app spec on first use.
+
+    Returns False if the client doesn't have the expected eager `APP_SPEC` line, e.g.
+    because it was already rewritten.
+    """
+    source = client_file.read_text()
+    if _EAGER_SPEC not in source:
+        return False
+    source = source.replace(_EAGER_SPEC, _LAZY_SPEC)
+    client_file.write_text(_SPEC_REFERENCE.sub("app_spec=_APP_SPEC.get()", source))
+    return True
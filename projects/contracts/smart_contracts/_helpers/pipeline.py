@@ -0,0 +1,407 @@
+import hashlib
+import logging
+import os
+import re
+import statistics
+import threading
+import time
+import typing
+from collections.abc import Callable
+from concurrent.futures import Future
+from dataclasses import dataclass
+from types import TracebackType
+
+import algokit_utils
+from algosdk import transaction
+from algosdk.atomic_transaction_composer import (
+    AtomicTransactionComposer,
+    TransactionWithSigner,
+)
+
+from smart_contracts._helpers.rounds import RoundTracker
+
+logger = logging.getLogger(__name__)
+
+# Groups submitted but not yet confirmed or failed before `submit` starts blocking.
+DEFAULT_WINDOW = 64
+# Attempts at a group beyond the first, whether resent as-is or rebuilt.
+DEFAULT_RETRIES = 3
+
+# Worth sending the same signed group again: algod is overloaded or restarting.
+_RETRY_STATUSES = frozenset({429, 500, 502, 503, 504})
+# Pool errors that another attempt would only hit again: the group's own logic or
+# balances reject it, not its timing.
+_PERMANENT_POOL_ERROR = re.compile(
+    r"logic eval error|rejected by logic|overspend|below min|"
+    r"asset \d+ missing from|has not opted in"
+)
+# Seconds to back off after the poller fails to reach algod.
+_POLL_BACKOFF = 0.5
+
+_Json = dict[str, object]
+_AddToComposer = Callable[[algokit_utils.TransactionComposer], object]
+
+
+@dataclass(frozen=True)
+class GroupResult:
+    """A confirmed group, as resolved by the future `BulkSubmitter.submit` returned."""
+
+    tx_ids: list[str]
+    confirmed_round: int
+    returns: list[algokit_utils.ABIReturn]
+    attempts: int
+    # Seconds from `submit` to the poll that saw the group confirmed
+    latency: float
+
+
+@dataclass(frozen=True)
+class SubmitStats:
+    submitted: int
+    confirmed: int
+    failed: int
+    retries: int
+    in_flight: int
+    peak_in_flight: int
+    elapsed: float
+    latency_p50: float
+    latency_p95: float
+    latency_max: float
+
+    @property
+    def groups_per_second(self) -> float:
+        return self.confirmed / self.elapsed if self.elapsed else 0.0
+
+
+class _Group:
+    """A submitted group: how to rebuild it, and the attempt currently out."""
+
+    def __init__(self, build: _AddToComposer, lease: bytes):
+        self.build = build
+        self.lease = lease
+        self.future: Future[GroupResult] = Future()
+        self.submitted_at = time.monotonic()
+        self.attempts = 0
+        self.atc = AtomicTransactionComposer()
+        self.signed: list[transaction.GenericSignedTransaction] = []
+        self.last_valid = 0
+        # False while the current attempt still has to reach algod
+        self.sent = False
+
+
+def _lease(key: bytes | str | None) -> bytes:
+    if key is None:
+        return os.urandom(32)
+    return hashlib.sha256(key.encode() if isinstance(key, str) else key).digest()
+
+
+def _leased(atc: AtomicTransactionComposer, lease: bytes) -> AtomicTransactionComposer:
+    """
+    A copy of a built group with a lease on every transaction that didn't have one.
+
+    Leases are derived from the group's lease and each transaction's position, so two
+    transactions from one sender in the same group don't collide, and every attempt at
+    the group uses the same ones.
+    """
+    leased = AtomicTransactionComposer()
+    for index, tws in enumerate(atc.txn_list):
+        txn = tws.txn
+        txn.group = None
+        if not typing.cast(bytes | None, txn.lease):
+            txn.lease = hashlib.sha256(lease + index.to_bytes(1, "big")).digest()
+        leased.add_transaction(TransactionWithSigner(txn, tws.signer))
+    leased.method_dict = dict(atc.method_dict)
+    leased.build_group()
+    return leased
+
+
+def _status(e: Exception) -> object:
+    """The HTTP status of an `AlgodHTTPError`, None for anything else."""
+    return typing.cast(dict[str, object], vars(e)).get("code")
+
+
+def _transient(e: Exception) -> bool:
+    return isinstance(e, OSError) or _status(e) in _RETRY_STATUSES
+
+
+def _already_in_ledger(e: Exception) -> bool:
+    return _status(e) is not None and "already in ledger" in str(e)
+
+
+class BulkSubmitter:
+    """
+    Keeps up to `window` groups in flight and confirms them with one sweep per round.
+
+    `submit` builds, signs and sends a group right away and returns a future for its
+    result, blocking only while `window` groups are still unconfirmed. A single
+    background thread waits for each new round and then checks every pending group
+    once, so confirmation costs one status long-poll per round rather than one per
+    group.
+
+    Every transaction gets a lease derived from the group's `key` (random if none is
+    given). A group rejected for a transient reason is sent again as-is; one that falls
+    out of the pool or expires unconfirmed is rebuilt with fresh params under the same
+    leases, up to `retries` times. The ledger rejects a transaction whose sender and
+    lease match one that confirmed and is still within its validity window, so a
+    rebuilt attempt can't apply on top of an earlier one that was only slow. A group the
+    pool evicts because its logic or balances reject it fails without another attempt.
+
+    Submitting a `key` that was already submitted returns the first future, until that
+    group has failed or the round its lease expires in has passed.
+    """
+
+    def __init__(
+        self,
+        algorand: algokit_utils.AlgorandClient,
+        *,
+        window: int = DEFAULT_WINDOW,
+        retries: int = DEFAULT_RETRIES,
+        rounds: RoundTracker | None = None,
+    ):
+        self._algorand = algorand
+        self._algod = algorand.client.algod
+        self._retries = retries
+        self._rounds = rounds
+        self._window = threading.BoundedSemaphore(window)
+        self._lock = threading.Lock()
+        self._changed = threading.Condition(self._lock)
+        self._pending: dict[int, _Group] = {}
+        # Keyed groups whose future a resubmitted key still gets
+        self._by_lease: dict[bytes, _Group] = {}
+        self._closed = False
+        self._started = time.monotonic()
+        self._latencies: list[float] = []
+        self._submitted = 0
+        self._confirmed = 0
+        self._failed = 0
+        self._retried = 0
+        self._peak = 0
+        self._poller = threading.Thread(
+            target=self._poll, name="bulk-submit-poll", daemon=True
+        )
+        self._poller.start()
+
+    def submit(
+        self, build: _AddToComposer, key: bytes | str | None = None
+    ) -> Future[GroupResult]:
+        """
+        Sends the group `build` adds to a fresh composer; `build` runs again on retries.
+
+        Blocks while the window is full. Errors building or sending the group, other
+        than transient ones, are raised by the returned future, not by this call.
+        """
+        group = _Group(build, _lease(key))
+        with self._lock:
+            if self._closed:
+                raise RuntimeError("BulkSubmitter is closed")
+            if key is not None:
+                existing = self._by_lease.get(group.lease)
+                if existing is not None:
+                    return existing.future
+                self._by_lease[group.lease] = group
+            self._submitted += 1
+        self._window.acquire()
+        try:
+            self._attempt(group)
+        except Exception as e:
+            self._settle(group, failure=e)
+            return group.future
+        with self._lock:
+            self._pending[id(group)] = group
+            self._peak = max(self._peak, len(self._pending))
+            self._changed.notify()
+        return group.future
+
+    @property
+    def stats(self) -> SubmitStats:
+        with self._lock:
+            latencies = sorted(self._latencies)
+            return SubmitStats(
+                submitted=self._submitted,
+                confirmed=self._confirmed,
+                failed=self._failed,
+                retries=self._retried,
+                in_flight=len(self._pending),
+                peak_in_flight=self._peak,
+                elapsed=time.monotonic() - self._started,
+                latency_p50=statistics.median(latencies) if latencies else 0.0,
+                latency_p95=latencies[int(len(latencies) * 0.95)] if latencies else 0.0,
+                latency_max=latencies[-1] if latencies else 0.0,
+            )
+
+    def close(self, *, wait: bool = True) -> None:
+        """Stops taking groups; with `wait`, blocks until those in flight have settled."""
+        with self._lock:
+            self._closed = True
+            self._changed.notify()
+        if wait:
+            self._poller.join()
+
+    def __enter__(self) -> "BulkSubmitter":
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_value: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        self.close()
+
+    def _attempt(self, group: _Group) -> None:
+        """Builds, leases, signs and sends a new attempt at the group."""
+        group.attempts += 1
+        if group.attempts == 1:
+            composer = self._algorand.new_group()
+        else:
+            # The cached params may be what let the last attempt expire
+            composer = algokit_utils.TransactionComposer(
+                algod=self._algod,
+                get_signer=self._algorand.account.get_signer,
+                get_suggested_params=lambda: self._algod.suggested_params(),
+            )
+        group.build(composer)
+        group.atc = _leased(composer.build().atc, group.lease)
+        group.signed = group.atc.gather_signatures()
+        group.last_valid = min(
+            typing.cast(int, tws.txn.last_valid_round) for tws in group.atc.txn_list
+        )
+        self._send(group)
+
+    def _send(self, group: _Group) -> None:
+        try:
+            self._algod.send_transactions(group.signed)
+        except Exception as e:
+            if not (_transient(e) or _already_in_ledger(e)):
+                raise
+            # Sending the same bytes again is harmless: a duplicate is just rejected
+            group.sent = _already_in_ledger(e)
+            if not group.sent:
+                logger.debug(f"Sending group {group.atc.tx_ids[0]} failed: {e}")
+            return
+        group.sent = True
+
+    def _poll(self) -> None:
+        round_ = swept = 0
+        while True:
+            with self._lock:
+                while not self._pending and not self._closed:
+                    self._changed.wait()
+                if not self._pending:
+                    return
+            try:
+                # Returns as soon as a round after `round_` is committed
+                status = typing.cast(
+                    dict[str, int], self._algod.status_after_block(round_)
+                )
+            except Exception as e:
+                logger.warning(f"Polling algod for new rounds failed: {e}")
+                time.sleep(_POLL_BACKOFF)
+                continue
+            round_ = max(round_, status["last-round"])
+            # The long-poll can also time out; nothing can have changed in that case
+            if round_ == swept:
+                continue
+            swept = round_
+            if self._rounds is not None:
+                self._rounds.observe(round_)
+            with self._lock:
+                groups = list(self._pending.values())
+                # A confirmed group's leases lapse after its last valid round
+                for lease, keyed in list(self._by_lease.items()):
+                    if keyed.future.done() and keyed.last_valid < round_:
+                        del self._by_lease[lease]
+            for group in groups:
+                try:
+                    self._check(group, round_)
+                except Exception as e:
+                    self._settle(group, failure=e)
+
+    def _check(self, group: _Group, round_: int) -> None:
+        if not group.sent:
+            if round_ <= group.last_valid:
+                self._retry(group, "algod was unavailable", resend=True)
+            else:
+                self._retry(group, "it expired before algod was available")
+            return
+        try:
+            info = typing.cast(
+                _Json, self._algod.pending_transaction_info(group.atc.tx_ids[-1])
+            )
+        except Exception as e:
+            if _status(e) != 404:
+                if _transient(e):
+                    return
+                raise
+            self._retry(group, "it dropped out of the pool")
+            return
+        if typing.cast(int, info.get("confirmed-round", 0)) > 0:
+            self._confirm(group, info)
+        elif info.get("pool-error"):
+            error = typing.cast(str, info["pool-error"])
+            if _PERMANENT_POOL_ERROR.search(error):
+                raise RuntimeError(f"Group {group.atc.tx_ids[0]} was rejected: {error}")
+            self._retry(group, f"it was rejected: {error}")
+        elif round_ > group.last_valid:
+            self._retry(group, "it expired")
+
+    def _retry(self, group: _Group, reason: str, *, resend: bool = False) -> None:
+        if group.attempts > self._retries:
+            raise RuntimeError(
+                f"Group {group.atc.tx_ids[0]} not confirmed after {group.attempts} "
+                f"attempts; last one failed because {reason}"
+            )
+        logger.info(f"Retrying group {group.atc.tx_ids[0]} because {reason}")
+        with self._lock:
+            self._retried += 1
+        if resend:
+            group.attempts += 1
+            self._send(group)
+        else:
+            self._attempt(group)
+
+    def _confirm(self, group: _Group, last: _Json) -> None:
+        tx_ids = group.atc.tx_ids
+        infos = {len(tx_ids) - 1: last}
+        for index in group.atc.method_dict:
+            if index not in infos:
+                infos[index] = typing.cast(
+                    _Json, self._algod.pending_transaction_info(tx_ids[index])
+                )
+        returns = [
+            algokit_utils.ABIReturn(
+                group.atc.parse_result(method, tx_ids[index], infos[index])
+            )
+            for index, method in sorted(group.atc.method_dict.items())
+        ]
+        self._settle(
+            group,
+            result=GroupResult(
+                tx_ids=list(tx_ids),
+                confirmed_round=typing.cast(int, last["confirmed-round"]),
+                returns=returns,
+                attempts=group.attempts,
+                latency=time.monotonic() - group.submitted_at,
+            ),
+        )
+
+    def _settle(
+        self,
+        group: _Group,
+        result: GroupResult | None = None,
+        failure: Exception | None = None,
+    ) -> None:
+        with self._lock:
+            self._pending.pop(id(group), None)
+            if result is not None:
+                self._confirmed += 1
+                self._latencies.append(result.latency)
+            else:
+                self._failed += 1
+                # Its key can be submitted afresh; the leases still stop a double apply
+                if self._by_lease.get(group.lease) is group:
+                    del self._by_lease[group.lease]
+        self._window.release()
+        if result is not None:
+            group.future.set_result(result)
+        else:
+            group.future.set_exception(typing.cast(Exception, failure))
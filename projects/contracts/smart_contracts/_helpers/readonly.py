@@ -0,0 +1,154 @@
+import threading
+import typing
+import weakref
+from collections import OrderedDict
+from collections.abc import Callable, Hashable
+
+import algokit_utils
+
+from smart_contracts._helpers.rounds import RoundTracker
+
+_CacheKey = tuple[int, str, Hashable, int]
+_R = typing.TypeVar("_R")
+
+_installed: (
+    "weakref.WeakKeyDictionary[algokit_utils.AlgorandClient, ReadonlyCallCache]"
+) = weakref.WeakKeyDictionary()
+_installed_lock = threading.Lock()
+
+
+class _UnhashableError(Exception):
+    pass
+
+
+def _hashable(value: object) -> Hashable:
+    """`value` with its lists, dicts and dataclasses turned into tuples, to key the cache."""
+    if isinstance(value, list | tuple):
+        items = typing.cast(list[object] | tuple[object, ...], value)
+        return tuple(_hashable(item) for item in items)
+    if isinstance(value, dict):
+        entries = typing.cast(dict[object, object], value)
+        return tuple((_hashable(k), _hashable(v)) for k, v in entries.items())
+    if isinstance(value, bytearray):
+        return bytes(value)
+    fields = typing.cast(
+        dict[str, object] | None, getattr(value, "__dataclass_fields__", None)
+    )
+    if fields is not None:
+        values = (typing.cast(object, getattr(value, name)) for name in fields)
+        return (type(value), *(_hashable(field) for field in values))
+    try:
+        hash(value)
+    except TypeError as e:
+        # e.g. a transaction passed as an argument
+        raise _UnhashableError from e
+    return value
+
+
+class TypedAppClient(typing.Protocol):
+    """Anything exposing the underlying `AppClient`, i.e. every generated `*Client`."""
+
+    @property
+    def app_client(self) -> algokit_utils.AppClient: ...
+
+
+class ReadonlyCallCache:
+    """
+    Serves readonly ABI calls from a local cache keyed by `(app, method, args, last_round)`.
+
+    Readonly methods are always simulated by `AppClient.send.call`, so they never cost fees,
+    but each call is still a round trip to algod. Results can only change when a new block
+    is committed, so identical calls within the same round are answered from memory.
+
+    Typed clients built from an `AlgorandClient` passed to `install` read through the
+    cache too: their readonly `send` methods are keyed by their call params as well, and
+    the rounds the others' sends are confirmed in are folded into `last_round`. Calls
+    with arguments that can't be hashed, e.g. transactions, are always simulated.
+    """
+
+    def __init__(self, rounds: RoundTracker, max_entries: int = 1024):
+        self._rounds = rounds
+        self._max_entries = max_entries
+        self._entries: OrderedDict[_CacheKey, object] = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def call(
+        self,
+        client: TypedAppClient,
+        method: str,
+        args: tuple[algokit_utils.ABIValue, ...] = (),
+    ) -> object:
+        """Returns the ABI return value of a readonly `method`, simulating only on a cache miss."""
+        app_client = client.app_client
+        if not app_client.app_spec.get_arc56_method(method).readonly:
+            raise ValueError(f"Method {method} is not readonly and cannot be cached")
+
+        result = self.read(
+            app_client,
+            method,
+            args,
+            lambda: app_client.send.call(
+                algokit_utils.AppClientMethodCallParams(method=method, args=list(args))
+            ),
+        )
+        return result.abi_return
+
+    def read(
+        self,
+        app_client: algokit_utils.AppClient,
+        method: str,
+        call: object,
+        simulate: Callable[[], _R],
+    ) -> _R:
+        """
+        What `simulate` returned for the same `call` to `method` this round, else its result.
+
+        `call` is whatever identifies the call beyond the app and method, its args and any
+        params; lists, dicts and dataclasses in it are compared by value.
+        """
+        try:
+            key: _CacheKey = (
+                app_client.app_id,
+                method,
+                _hashable(call),
+                self._rounds.last_round,
+            )
+        except _UnhashableError:
+            return simulate()
+        with self._lock:
+            if key in self._entries:
+                self.hits += 1
+                self._entries.move_to_end(key)
+                return typing.cast(_R, self._entries[key])
+            self.misses += 1
+
+        result = simulate()
+        with self._lock:
+            self._entries[key] = result
+            while len(self._entries) > self._max_entries:
+                self._entries.popitem(last=False)
+        return result
+
+    def observe(self, round_: int) -> None:
+        """Records that a transaction was confirmed in `round_`, so later reads see it."""
+        self._rounds.observe(round_)
+
+    def install(
+        self, algorand: algokit_utils.AlgorandClient
+    ) -> algokit_utils.AlgorandClient:
+        """Makes the typed clients built from `algorand` serve readonly calls from this cache."""
+        with _installed_lock:
+            _installed[algorand] = self
+        return algorand
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+
+def installed_cache(algorand: algokit_utils.AlgorandClient) -> ReadonlyCallCache | None:
+    """The cache installed on `algorand`, if any."""
+    with _installed_lock:
+        return _installed.get(algorand)
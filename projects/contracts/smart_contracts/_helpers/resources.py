@@ -0,0 +1,191 @@
+import base64
+import math
+import typing
+from collections.abc import Sequence
+from dataclasses import dataclass, field
+
+import algokit_utils
+from algokit_utils.applications.abi import (
+    get_abi_decoded_value,
+    get_abi_encoded_value,
+    get_abi_tuple_type_from_abi_struct_definition,
+)
+from algosdk import abi
+from algosdk.atomic_transaction_composer import TransactionWithSigner
+
+# Protocol limits on the references one app call can carry.
+MAX_TXN_REFERENCES = 8
+MAX_TXN_ACCOUNTS = 4
+
+# Bytes of box reads and writes each box reference adds to the group's pooled quota.
+BOX_IO_BUDGET = 1024
+
+_AVM_SIZES = {"AVMUint64": 8}
+
+
+class BoxRef(typing.NamedTuple):
+    """A box an app call touches, with the bytes it counts against the I/O quota."""
+
+    app_id: int
+    name: bytes
+    size: int
+
+
+@dataclass(frozen=True)
+class Resources:
+    """
+    What a call needs to be able to reference, wherever in its group the references go.
+
+    Apps at v9+ share resources across the group, so a box, account or app referenced
+    by any app call in the group is available to all of them.
+    """
+
+    boxes: frozenset[BoxRef] = frozenset()
+    accounts: frozenset[str] = frozenset()
+    apps: frozenset[int] = frozenset()
+
+    def __or__(self, other: "Resources") -> "Resources":
+        return Resources(
+            self.boxes | other.boxes,
+            self.accounts | other.accounts,
+            self.apps | other.apps,
+        )
+
+
+NO_RESOURCES = Resources()
+
+
+@dataclass(frozen=True)
+class TxnReferences:
+    """The references assigned to one app call in a packed group."""
+
+    boxes: list[algokit_utils.BoxReference] = field(default_factory=list)
+    accounts: list[str] = field(default_factory=list)
+    apps: list[int] = field(default_factory=list)
+
+    @property
+    def count(self) -> int:
+        return len(self.boxes) + len(self.accounts) + len(self.apps)
+
+
+def transaction_sender(txn: object) -> str:
+    """Sender of a transaction passed as a method argument, in any form it can take."""
+    if isinstance(txn, TransactionWithSigner):
+        txn = txn.txn
+    # Transactions and `PaymentParams` both carry it as a plain attribute
+    sender = typing.cast(dict[str, object], vars(txn)).get("sender")
+    if not isinstance(sender, str):
+        raise ValueError(f"Can't tell the sender of {type(txn).__name__}")
+    return sender
+
+
+def _value_size(
+    value_type: str, structs: dict[str, list[algokit_utils.StructField]]
+) -> int:
+    if value_type in _AVM_SIZES:
+        return _AVM_SIZES[value_type]
+    abi_type: abi.ABIType
+    if value_type in structs:
+        abi_type = get_abi_tuple_type_from_abi_struct_definition(
+            structs[value_type], structs
+        )
+    else:
+        abi_type = abi.ABIType.from_string(value_type)
+    if abi_type.is_dynamic():
+        raise ValueError(f"Box values of dynamic type {value_type} have no fixed size")
+    return abi_type.byte_len()
+
+
+class BoxMapKeys:
+    """
+    Box names and sizes for an ARC-56 box map, derived from the app spec alone.
+
+    Names are the map's prefix followed by the ABI-encoded key, as the contract stores
+    them, so references can be built without asking algod which boxes a call touches.
+    """
+
+    def __init__(
+        self, app_spec: algokit_utils.Arc56Contract, map_name: str, app_id: int
+    ):
+        metadata = app_spec.state.maps.box[map_name]
+        self._app_id = app_id
+        self._prefix = base64.b64decode(metadata.prefix or "")
+        self._key_type = metadata.key_type
+        self._structs = app_spec.structs
+        self._value_size = _value_size(metadata.value_type, app_spec.structs)
+
+    def name(self, key: object) -> bytes:
+        return self._prefix + get_abi_encoded_value(key, self._key_type, self._structs)
+
+    def key(self, name: bytes) -> object | None:
+        """The key whose box `name` is, or None if it isn't a box of this map."""
+        if not name.startswith(self._prefix):
+            return None
+        try:
+            key = get_abi_decoded_value(
+                name[len(self._prefix) :], self._key_type, self._structs
+            )
+        except Exception:
+            return None
+        # Decoding alone lets through e.g. uint64 keys of the wrong length
+        return key if self.name(key) == name else None
+
+    def ref(self, key: object) -> BoxRef:
+        name = self.name(key)
+        return BoxRef(self._app_id, name, len(name) + self._value_size)
+
+
+def assign_references(
+    app_ids: Sequence[int], resources: Resources
+) -> list[TxnReferences] | None:
+    """
+    Spreads `resources` over app calls to `app_ids`, or returns None if they don't fit.
+
+    A box goes on a call to the app that owns it, so it can use the app-0 shorthand and
+    cost one slot, and on whichever such call has the most slots left, which keeps room
+    for accounts on every call. When the boxes' bytes exceed the quota their references
+    bring, empty box references are added to make up the difference. Apps called in the
+    group are available already and aren't referenced again.
+    """
+    references = [TxnReferences() for _ in app_ids]
+    if not references:
+        return None if resources != NO_RESOURCES else references
+
+    def free(index: int) -> int:
+        return MAX_TXN_REFERENCES - references[index].count
+
+    def place(
+        candidates: Sequence[int], room: typing.Callable[[int], int]
+    ) -> int | None:
+        best = max(candidates, key=room, default=None)
+        return best if best is not None and room(best) > 0 else None
+
+    everywhere = range(len(app_ids))
+    boxes = sorted(resources.boxes)
+    io_refs = math.ceil(sum(box.size for box in boxes) / BOX_IO_BUDGET)
+    for box in boxes:
+        owners = [index for index, app_id in enumerate(app_ids) if app_id == box.app_id]
+        index = place(owners, free)
+        if index is None:
+            return None
+        references[index].boxes.append(algokit_utils.BoxReference(0, box.name))
+    for _ in range(io_refs - len(boxes)):
+        index = place(everywhere, free)
+        if index is None:
+            return None
+        references[index].boxes.append(algokit_utils.BoxReference(0, b""))
+
+    def account_room(index: int) -> int:
+        return min(free(index), MAX_TXN_ACCOUNTS - len(references[index].accounts))
+
+    for account in sorted(resources.accounts):
+        index = place(everywhere, account_room)
+        if index is None:
+            return None
+        references[index].accounts.append(account)
+    for app_id in sorted(resources.apps - set(app_ids)):
+        index = place(everywhere, free)
+        if index is None:
+            return None
+        references[index].apps.append(app_id)
+    return references
@@ -0,0 +1,52 @@
+import threading
+import time
+import typing
+
+from algosdk.v2client.algod import AlgodClient
+
+# Average block time on MainNet/TestNet; LocalNet in dev mode produces blocks on demand.
+DEFAULT_ROUND_INTERVAL = 2.8
+
+
+class RoundTracker:
+    """
+    Tracks the last committed round without asking algod on every read.
+
+    The round is refreshed from `/v2/status` at most once per `interval` seconds, and
+    any round observed elsewhere (e.g. in a simulate response) is folded in via `observe`.
+    """
+
+    def __init__(self, algod: AlgodClient, interval: float = DEFAULT_ROUND_INTERVAL):
+        self._algod = algod
+        self._interval = interval
+        self._lock = threading.Lock()
+        self._last_round = 0
+        self._refreshed_at = float("-inf")
+
+    @property
+    def last_round(self) -> int:
+        """The most recent round seen, refreshing from algod if the cached value is stale."""
+        with self._lock:
+            if time.monotonic() - self._refreshed_at >= self._interval:
+                status = typing.cast(dict[str, int], self._algod.status())
+                self._last_round = max(self._last_round, status["last-round"])
+                self._refreshed_at = time.monotonic()
+            return self._last_round
+
+    def observe(self, round_: int) -> None:
+        """Records a round seen in another algod response."""
+        with self._lock:
+            if round_ > self._last_round:
+                self._last_round = round_
+                self._refreshed_at = time.monotonic()
+
+    def wait_for(self, round_: int) -> int:
+        """Blocks until algod has committed `round_`, returning the last round seen."""
+        last_round = self.last_round
+        while last_round < round_:
+            status = typing.cast(
+                dict[str, int], self._algod.status_after_block(last_round)
+            )
+            last_round = max(last_round, status["last-round"])
+            self.observe(last_round)
+        return last_round
@@ -0,0 +1,283 @@
+import contextlib
+import itertools
+import multiprocessing
+import threading
+import time
+import typing
+from collections.abc import Callable, Iterator, Sequence
+from concurrent.futures import Executor, Future, ProcessPoolExecutor, ThreadPoolExecutor
+from dataclasses import dataclass
+
+import algokit_utils
+from algosdk.atomic_transaction_composer import TransactionSigner
+from algosdk.v2client.algod import AlgodClient
+
+from smart_contracts._helpers.readonly import TypedAppClient
+
+_C = typing.TypeVar("_C", bound=TypedAppClient)
+_C_co = typing.TypeVar("_C_co", bound=TypedAppClient, covariant=True)
+_R = typing.TypeVar("_R")
+
+
+class ClientType(typing.Protocol[_C_co]):
+    """A generated client class, e.g. `BankClient`, as called to build one client."""
+
+    def __call__(
+        self,
+        *,
+        algorand: algokit_utils.AlgorandClient,
+        app_id: int,
+        default_sender: str | None = None,
+        default_signer: TransactionSigner | None = None,
+    ) -> _C_co: ...
+
+
+@dataclass(frozen=True)
+class SenderStats:
+    address: str
+    calls: int
+    failures: int
+    in_flight: int
+    peak_in_flight: int
+    # Seconds spent in calls from this sender, summed over the calls
+    busy: float
+
+    @property
+    def mean_latency(self) -> float:
+        return self.busy / self.calls if self.calls else 0.0
+
+
+class _Sender:
+    def __init__(self, address: str):
+        self.address = address
+        self.calls = 0
+        self.failures = 0
+        self.in_flight = 0
+        self.peak_in_flight = 0
+        self.busy = 0.0
+
+
+@dataclass(frozen=True)
+class _WorkerConfig:
+    """What a worker process needs to build its own clients; all of it pickles."""
+
+    client_type: ClientType[TypedAppClient]
+    app_id: int
+    algod_address: str
+    algod_token: str
+    algod_headers: dict[str, str] | None
+    keys: list[str]
+
+
+@dataclass(frozen=True)
+class _Outcome:
+    result: object
+    error: BaseException | None
+    elapsed: float
+
+
+# The clients of a worker process started by `SenderPool.process_executor`, by sender
+_worker_clients: dict[str, TypedAppClient] = {}
+
+
+def _init_worker(config: _WorkerConfig) -> None:
+    algorand = algokit_utils.AlgorandClient.from_clients(
+        AlgodClient(config.algod_token, config.algod_address, config.algod_headers)
+    )
+    for key in config.keys:
+        account = algokit_utils.SigningAccount(private_key=key)
+        algorand.account.set_signer_from_account(account)
+        _worker_clients[account.address] = config.client_type(
+            algorand=algorand, app_id=config.app_id, default_sender=account.address
+        )
+
+
+def _run_in_worker(address: str, fn: Callable[[TypedAppClient], object]) -> _Outcome:
+    client = _worker_clients.get(address)
+    if client is None:
+        raise RuntimeError(
+            "Worker process has no clients; create the executor with "
+            "SenderPool.process_executor"
+        )
+    started = time.perf_counter()
+    try:
+        return _Outcome(fn(client), None, time.perf_counter() - started)
+    except Exception as e:
+        return _Outcome(None, e, time.perf_counter() - started)
+
+
+class SenderPool(typing.Generic[_C]):
+    """
+    Typed clients for one app, one per sender account, with calls spread between them.
+
+    Each account's signer is registered with `algorand`, and each gets its own client
+    with the account as `default_sender`. `lease` and `run` hand a call the client of
+    the sender with the fewest calls in flight (taking turns between equally idle
+    ones), so no account's transactions queue behind each other, and record per-sender
+    metrics in `stats`. `worker_client` instead pins one sender to the calling thread.
+
+    `submit` works with a `ThreadPoolExecutor` or with the `ProcessPoolExecutor` from
+    `process_executor`, whose workers build their own clients and signers for every
+    account; the sender is still picked, and its metrics kept, in this process.
+    """
+
+    def __init__(
+        self,
+        client_type: ClientType[_C],
+        algorand: algokit_utils.AlgorandClient,
+        app_id: int,
+        accounts: Sequence[algokit_utils.SigningAccount],
+    ):
+        if not accounts:
+            raise ValueError("SenderPool needs at least one sender account")
+        self._client_type = client_type
+        self._algorand = algorand
+        self._app_id = app_id
+        self._keys = [account.private_key for account in accounts]
+        self._clients: dict[str, _C] = {}
+        self._senders: dict[str, _Sender] = {}
+        for account in accounts:
+            algorand.account.set_signer_from_account(account)
+            self._clients[account.address] = client_type(
+                algorand=algorand, app_id=app_id, default_sender=account.address
+            )
+            self._senders[account.address] = _Sender(account.address)
+        self._order = itertools.cycle(list(self._clients))
+        self._lock = threading.Lock()
+        self._local = threading.local()
+        self._pinned: dict[str, int] = dict.fromkeys(self._clients, 0)
+
+    @property
+    def addresses(self) -> list[str]:
+        return list(self._clients)
+
+    def client(self, address: str) -> _C:
+        return self._clients[address]
+
+    @contextlib.contextmanager
+    def lease(self) -> Iterator[_C]:
+        """The client of the least busy sender, for the duration of one call or group."""
+        sender = self._start()
+        started = time.perf_counter()
+        failed = False
+        try:
+            yield self._clients[sender.address]
+        except BaseException:
+            failed = True
+            raise
+        finally:
+            self._finish(sender, time.perf_counter() - started, failed=failed)
+
+    def run(self, fn: Callable[[_C], _R]) -> _R:
+        """Calls `fn` with a leased client."""
+        with self.lease() as client:
+            return fn(client)
+
+    def worker_client(self) -> _C:
+        """
+        A client pinned to the calling thread, from the sender pinned to fewest threads.
+
+        Calls made through it aren't counted in `stats`.
+        """
+        address = typing.cast(str | None, getattr(self._local, "address", None))
+        if address is None:
+            with self._lock:
+                address = min(self._pinned, key=self._pinned.__getitem__)
+                self._pinned[address] += 1
+            self._local.address = address
+        return self._clients[address]
+
+    def thread_executor(self, max_workers: int | None = None) -> ThreadPoolExecutor:
+        return ThreadPoolExecutor(max_workers or len(self._clients))
+
+    def process_executor(self, max_workers: int | None = None) -> ProcessPoolExecutor:
+        """A process pool whose workers each build clients for every sender."""
+        algod = self._algorand.client.algod
+        config = _WorkerConfig(
+            client_type=typing.cast(ClientType[TypedAppClient], self._client_type),
+            app_id=self._app_id,
+            algod_address=algod.algod_address,
+            algod_token=algod.algod_token,
+            algod_headers=algod.headers,
+            keys=self._keys,
+        )
+        return ProcessPoolExecutor(
+            max_workers,
+            # Forking a process that runs threads, e.g. HTTP pools, can deadlock
+            mp_context=multiprocessing.get_context("spawn"),
+            initializer=_init_worker,
+            initargs=(config,),
+        )
+
+    def submit(self, executor: Executor, fn: Callable[[_C], _R]) -> Future[_R]:
+        """
+        Runs `fn` on `executor` with a client picked for it.
+
+        For worker processes `fn` is pickled, so it has to be a module-level function
+        or a `functools.partial` of one.
+        """
+        if not isinstance(executor, ProcessPoolExecutor):
+            return executor.submit(self.run, fn)
+        sender = self._start()
+        future: Future[_R] = Future()
+
+        def settle(done: Future[_Outcome]) -> None:
+            error = done.exception()
+            if error is not None:
+                self._finish(sender, 0.0, failed=True)
+                future.set_exception(error)
+                return
+            outcome = done.result()
+            self._finish(sender, outcome.elapsed, failed=outcome.error is not None)
+            if outcome.error is not None:
+                future.set_exception(outcome.error)
+            else:
+                future.set_result(typing.cast(_R, outcome.result))
+
+        try:
+            outcome = executor.submit(
+                _run_in_worker,
+                sender.address,
+                typing.cast(Callable[[TypedAppClient], object], fn),
+            )
+        except BaseException:
+            self._finish(sender, 0.0, failed=True)
+            raise
+        outcome.add_done_callback(settle)
+        return future
+
+    @property
+    def stats(self) -> dict[str, SenderStats]:
+        with self._lock:
+            return {
+                address: SenderStats(
+                    address=address,
+                    calls=sender.calls,
+                    failures=sender.failures,
+                    in_flight=sender.in_flight,
+                    peak_in_flight=sender.peak_in_flight,
+                    busy=sender.busy,
+                )
+                for address, sender in self._senders.items()
+            }
+
+    def _start(self) -> _Sender:
+        with self._lock:
+            # The next sender in turn, unless another has fewer calls in flight
+            turn = next(self._order)
+
+            def busyness(candidate: _Sender) -> tuple[int, bool]:
+                return candidate.in_flight, candidate.address != turn
+
+            sender = min(self._senders.values(), key=busyness)
+            sender.calls += 1
+            sender.in_flight += 1
+            sender.peak_in_flight = max(sender.peak_in_flight, sender.in_flight)
+            return sender
+
+    def _finish(self, sender: _Sender, elapsed: float, *, failed: bool) -> None:
+        with self._lock:
+            sender.in_flight -= 1
+            sender.busy += elapsed
+            if failed:
+                sender.failures += 1
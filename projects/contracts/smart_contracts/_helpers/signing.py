@@ -0,0 +1,184 @@
+import base64
+import math
+import multiprocessing
+import os
+import typing
+from collections.abc import Iterable, Sequence
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from dataclasses import dataclass
+from types import TracebackType
+
+import algokit_utils
+from algosdk import account, constants, encoding, transaction
+from algosdk.atomic_transaction_composer import (
+    AccountTransactionSigner,
+    TransactionWithSigner,
+)
+from algosdk.v2client.algod import AlgodClient
+from nacl.signing import SigningKey
+
+# Most groups handed to a worker at once; pickling and IPC are paid per chunk.
+DEFAULT_CHUNK_SIZE = 64
+
+# A chunk of groups and the keys of every sender in it, by address
+_Task = tuple[list[list[transaction.Transaction]], dict[str, str]]
+_Group = algokit_utils.TransactionComposer | Sequence[TransactionWithSigner]
+
+# msgpack keys of a signed transaction, each with the header of its bytes value
+_SGNR = b"\xa4sgnr\xc4\x20"
+_SIG = b"\xa3sig\xc4\x40"
+_TXN = b"\xa3txn"
+
+
+@dataclass(frozen=True)
+class SignedGroup:
+    tx_ids: list[str]
+    # The signed transactions msgpack-encoded back to back, the body algod's
+    # `POST /v2/transactions` takes for a group
+    blob: bytes
+    # The rounds every transaction in the group is valid for
+    first_valid: int
+    last_valid: int
+
+    def send(self, algod: AlgodClient) -> str:
+        """Submits the group as-is; returns the ID of its first transaction."""
+        return algod.send_raw_transaction(base64.b64encode(self.blob))
+
+
+def _built(group: _Group) -> list[TransactionWithSigner]:
+    if isinstance(group, algokit_utils.TransactionComposer):
+        # Assigns the group ID, unless an earlier build already did
+        return group.build().transactions
+    return list(group)
+
+
+def _keys(group: list[TransactionWithSigner]) -> dict[str, str]:
+    keys: dict[str, str] = {}
+    for tws in group:
+        sender = typing.cast(str, tws.txn.sender)
+        if not isinstance(tws.signer, AccountTransactionSigner):
+            raise ValueError(
+                f"{sender} signs with a {type(tws.signer).__name__}; only accounts "
+                "with a private key can be signed for in a signing pool"
+            )
+        keys[sender] = tws.signer.private_key
+    return keys
+
+
+def _sign_chunk(task: _Task) -> list[SignedGroup]:
+    """
+    Signs a chunk of groups, encoding each transaction once.
+
+    Equivalent to `AccountTransactionSigner.sign_transactions`, `get_txid` and
+    `msgpack_encode` on the result, which between them encode every transaction three
+    times and cost more than the signature itself. The canonical encoding of the
+    transaction is embedded as-is in that of the signed transaction, whose few other
+    fields are written here in their sorted, canonical order.
+    """
+    groups, keys = task
+    signing_keys: dict[str, tuple[SigningKey, bytes]] = {}
+    for sender, key in keys.items():
+        address = typing.cast(str, account.address_from_private_key(key))
+        signing_keys[sender] = (
+            SigningKey(base64.b64decode(key)[: constants.key_len_bytes]),
+            (
+                b""
+                if address == sender
+                else _SGNR + typing.cast(bytes, encoding.decode_address(address))
+            ),
+        )
+    signed: list[SignedGroup] = []
+    for group in groups:
+        tx_ids: list[str] = []
+        blob = bytearray()
+        for txn in group:
+            signing_key, signer = signing_keys[typing.cast(str, txn.sender)]
+            message = constants.txid_prefix + base64.b64decode(
+                typing.cast(str, encoding.msgpack_encode(txn))
+            )
+            tx_ids.append(
+                base64.b32encode(typing.cast(bytes, encoding.checksum(message)))
+                .decode()
+                .rstrip("=")
+            )
+            # A map of sgnr (if rekeyed), sig and txn
+            blob += b"\x83" if signer else b"\x82"
+            blob += signer
+            blob += _SIG + signing_key.sign(message).signature
+            blob += _TXN + message[len(constants.txid_prefix) :]
+        signed.append(
+            SignedGroup(
+                tx_ids,
+                bytes(blob),
+                max(typing.cast(int, txn.first_valid_round) for txn in group),
+                min(typing.cast(int, txn.last_valid_round) for txn in group),
+            )
+        )
+    return signed
+
+
+class SigningPool:
+    """
+    Signs built groups on several cores, for batches too large to sign one at a time.
+
+    `sign` takes unsent composers (a typed composer's `.composer()`, or
+    `ChunkedComposer.composers()`) or already built groups, and returns each group
+    signed and encoded, in order, ready to send with `SignedGroup.send`. Groups are
+    built before they are handed out and transactions are only signed, never changed,
+    so group IDs and transaction IDs stay as built.
+
+    Workers are processes by default. With `threads`, they are threads instead:
+    PyNaCl releases the GIL while it signs, so they still overlap there, but not in
+    the encoding around it. Only transactions whose signer holds a private key
+    (`AccountTransactionSigner`) can be signed here; the keys are sent to the workers
+    with each chunk of groups.
+    """
+
+    def __init__(
+        self,
+        *,
+        workers: int | None = None,
+        threads: bool = False,
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+    ):
+        self.workers = workers or os.cpu_count() or 1
+        self._chunk_size = chunk_size
+        self._executor: Executor
+        if threads:
+            self._executor = ThreadPoolExecutor(self.workers)
+        else:
+            # Forking a process that runs threads, e.g. HTTP pools, can deadlock
+            self._executor = ProcessPoolExecutor(
+                self.workers, mp_context=multiprocessing.get_context("spawn")
+            )
+
+    def sign(self, groups: Iterable[_Group]) -> list[SignedGroup]:
+        built = [_built(group) for group in groups]
+        # Small batches are still spread over every worker
+        size = min(self._chunk_size, math.ceil(len(built) / self.workers)) or 1
+        tasks: list[_Task] = []
+        for start in range(0, len(built), size):
+            chunk = built[start : start + size]
+            keys: dict[str, str] = {}
+            for group in chunk:
+                keys.update(_keys(group))
+            tasks.append(([[tws.txn for tws in group] for group in chunk], keys))
+        return [
+            signed
+            for chunk in self._executor.map(_sign_chunk, tasks)
+            for signed in chunk
+        ]
+
+    def close(self) -> None:
+        self._executor.shutdown()
+
+    def __enter__(self) -> "SigningPool":
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_value: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        self.close()
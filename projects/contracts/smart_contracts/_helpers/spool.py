@@ -0,0 +1,343 @@
+import base64
+import logging
+import mmap
+import os
+import struct
+import typing
+from collections.abc import Iterable, Iterator
+from dataclasses import dataclass
+from types import TracebackType
+
+from algosdk.v2client.algod import AlgodClient
+
+from smart_contracts._helpers.rounds import RoundTracker
+from smart_contracts._helpers.signing import SignedGroup
+
+logger = logging.getLogger(__name__)
+
+# Groups sent but not yet seen in a block before `drain` waits for the next round.
+DEFAULT_WINDOW = 1024
+
+# Worth sending the same signed group again: algod is overloaded or restarting.
+_RETRY_STATUSES = frozenset({429, 500, 502, 503, 504})
+# An index entry: where the group's bytes are, its validity, and its first tx ID,
+# kept in base32 as algod reports it
+_INDEX = struct.Struct("<QIQQ52s")
+# The start of an index entry: where the group's bytes are
+_LOCATION = struct.Struct("<QI")
+# A settled entry: record number and confirmed round, 0 if it never confirmed
+_SETTLED = struct.Struct("<QQ")
+# Record number of the settled entries that checkpoint the last round swept
+_CHECKPOINT = 2**64 - 1
+_BUFFER_SIZE = 1 << 20
+
+
+@dataclass(frozen=True)
+class DrainResult:
+    confirmed: int
+    # Groups whose validity ran out unconfirmed, or that algod turned away; they
+    # have to be rebuilt and signed again
+    unconfirmed: int
+    sent: int
+    # Blocks whose transaction IDs were fetched to find spooled groups
+    rounds_swept: int
+
+
+@dataclass(frozen=True)
+class _Record:
+    offset: int
+    length: int
+    first_valid: int
+    last_valid: int
+    tx_id: str
+
+
+def _status(e: Exception) -> object:
+    """The HTTP status of an `AlgodHTTPError`, None for anything else."""
+    return typing.cast(dict[str, object], vars(e)).get("code")
+
+
+def _transient(e: Exception) -> bool:
+    return isinstance(e, OSError) or _status(e) in _RETRY_STATUSES
+
+
+def _already_in_ledger(e: Exception) -> bool:
+    return _status(e) is not None and "already in ledger" in str(e)
+
+
+def _truncate(path: str, size: int) -> None:
+    if os.path.getsize(path) > size:
+        logger.warning(f"Dropping a partly written tail of {path}")
+        os.truncate(path, size)
+
+
+class TransactionSpool:
+    """
+    An append-only file of signed groups, drained to algod with crash-safe bookkeeping.
+
+    `append` writes groups to `path` and returns once they are on disk, so a group
+    that is only ever sent after being spooled can't be lost track of. The file holds
+    the groups' msgpack-encoded signed transactions back to back, the format `goal
+    clerk rawsend` reads; `path.idx` indexes them with fixed-width entries and
+    `path.done` logs each group as it settles, with the last round swept.
+
+    `drain` sends every unsettled group, keeping up to `window` of them in flight, and
+    fetches the transaction IDs of each new block once to find which of them
+    confirmed. After a crash, the next `drain` first sweeps the blocks committed since
+    the last round the log records, then resends what is still unconfirmed and valid:
+    resending a signed group that already confirmed is rejected by algod, never
+    applied twice. Groups that expired unconfirmed are logged as settled without a
+    round.
+
+    Partly written entries left by a crash are dropped when the spool is opened. Not
+    safe for use by several threads or processes at once.
+    """
+
+    def __init__(self, path: str | os.PathLike[str]):
+        self.path = os.fspath(path)
+        self._index_path = self.path + ".idx"
+        self._done_path = self.path + ".done"
+        for name in (self.path, self._index_path, self._done_path):
+            open(name, "ab").close()
+        # The index as written, unpacked an entry at a time as records are needed
+        self._entries = bytearray()
+        self._recover()
+        self._settled: dict[int, int] = {}
+        self._checkpoint = 0
+        with open(self._done_path, "rb") as done:
+            settled = typing.cast(
+                Iterator[tuple[int, int]], _SETTLED.iter_unpack(done.read())
+            )
+            for record, round_ in settled:
+                if record == _CHECKPOINT:
+                    self._checkpoint = max(self._checkpoint, round_)
+                else:
+                    self._settled[record] = round_
+        self._data = open(self.path, "ab", buffering=_BUFFER_SIZE)
+        self._index = open(self._index_path, "ab", buffering=_BUFFER_SIZE)
+        self._done = open(self._done_path, "ab", buffering=_BUFFER_SIZE)
+        self._map: mmap.mmap | None = None
+
+    def __len__(self) -> int:
+        return len(self._entries) // _INDEX.size
+
+    def append(self, groups: Iterable[SignedGroup]) -> list[int]:
+        """Spools `groups`, returning their record numbers once they are on disk."""
+        offset = self._data.tell()
+        first = len(self)
+        entries = bytearray()
+        for group in groups:
+            self._data.write(group.blob)
+            # A group confirms as a whole, so one of its IDs is enough to find it
+            entries += _INDEX.pack(
+                offset,
+                len(group.blob),
+                group.first_valid,
+                group.last_valid,
+                group.tx_ids[0].encode(),
+            )
+            offset += len(group.blob)
+        # Data first: an index entry is only ever written for bytes already on disk
+        _sync(self._data)
+        self._index.write(entries)
+        _sync(self._index)
+        self._entries += entries
+        return list(range(first, len(self)))
+
+    def status(self, record: int) -> int | None:
+        """The round the group confirmed in, 0 if it never will, None while unsettled."""
+        return self._settled.get(record)
+
+    @property
+    def pending(self) -> list[int]:
+        return [r for r in range(len(self)) if r not in self._settled]
+
+    def drain(
+        self,
+        algod: AlgodClient,
+        *,
+        window: int = DEFAULT_WINDOW,
+        rounds: RoundTracker | None = None,
+    ) -> DrainResult:
+        """Sends every unsettled group and waits until each has confirmed or expired."""
+        unsent = self.pending
+        by_tx_id = {self._record(r).tx_id: r for r in unsent}
+        last_round = typing.cast(dict[str, int], algod.status())["last-round"]
+        confirmed = unconfirmed = sent = swept = 0
+        if self._checkpoint == 0:
+            # Nothing was sent before now, so no earlier block can hold a group
+            self._settle([], last_round)
+        else:
+            # Whatever a drain that crashed sent and didn't see confirm
+            found, swept = self._sweep(algod, by_tx_id, last_round)
+            confirmed += found
+        unsent = [r for r in unsent if r not in self._settled]
+        unsent.reverse()
+        in_flight: set[int] = set()
+        while unsent or in_flight:
+            expired: list[tuple[int, int]] = []
+            while unsent and len(in_flight) < window:
+                record = unsent.pop()
+                if self._record(record).last_valid <= last_round:
+                    expired.append((record, 0))
+                    continue
+                try:
+                    self._send(algod, record)
+                except Exception as e:
+                    if _transient(e):
+                        # Tried again after the next round
+                        logger.debug(f"Sending spooled group {record} failed: {e}")
+                        unsent.append(record)
+                        break
+                    if _status(e) is None:
+                        raise
+                    logger.warning(f"algod rejected spooled group {record}: {e}")
+                    expired.append((record, 0))
+                    continue
+                sent += 1
+                in_flight.add(record)
+            unconfirmed += len(expired)
+            self._settle(expired, None)
+            if not in_flight and not unsent:
+                break
+            status = typing.cast(dict[str, int], algod.status_after_block(last_round))
+            if status["last-round"] <= last_round:
+                continue
+            found, count = self._sweep(
+                algod,
+                {self._record(r).tx_id: r for r in in_flight},
+                status["last-round"],
+            )
+            confirmed += found
+            swept += count
+            last_round = status["last-round"]
+            if rounds is not None:
+                rounds.observe(last_round)
+            in_flight = {r for r in in_flight if r not in self._settled}
+            lapsed = [
+                (r, 0) for r in in_flight if self._record(r).last_valid <= last_round
+            ]
+            unconfirmed += len(lapsed)
+            self._settle(lapsed, last_round)
+            in_flight.difference_update(r for r, _ in lapsed)
+        return DrainResult(
+            confirmed=confirmed,
+            unconfirmed=unconfirmed,
+            sent=sent,
+            rounds_swept=swept,
+        )
+
+    def close(self) -> None:
+        if self._map is not None:
+            self._map.close()
+        for file in (self._data, self._index, self._done):
+            file.close()
+
+    def __enter__(self) -> "TransactionSpool":
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_value: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        self.close()
+
+    def _recover(self) -> None:
+        """Reads the index, dropping entries and data a crash left partly written."""
+        with open(self._index_path, "rb") as index:
+            self._entries = bytearray(index.read())
+        del self._entries[len(self._entries) - len(self._entries) % _INDEX.size :]
+        data_size = os.path.getsize(self.path)
+        end = 0
+        # Only the last entries can point past the data synced before them
+        while self._entries:
+            last = self._record(len(self) - 1)
+            end = last.offset + last.length
+            if end <= data_size:
+                break
+            del self._entries[-_INDEX.size :]
+            end = 0
+        _truncate(self._index_path, len(self._entries))
+        _truncate(self.path, end)
+        size = os.path.getsize(self._done_path)
+        _truncate(self._done_path, size - size % _SETTLED.size)
+
+    def _record(self, record: int) -> _Record:
+        offset, length, first_valid, last_valid, tx_id = typing.cast(
+            tuple[int, int, int, int, bytes],
+            _INDEX.unpack_from(self._entries, record * _INDEX.size),
+        )
+        return _Record(offset, length, first_valid, last_valid, tx_id.decode())
+
+    def blob(self, record: int) -> bytes:
+        """The group's signed transactions as spooled, read through a memory map."""
+        offset, length = typing.cast(
+            tuple[int, int], _LOCATION.unpack_from(self._entries, record * _INDEX.size)
+        )
+        end = offset + length
+        if self._map is None or len(self._map) < end:
+            self._data.flush()
+            if self._map is not None:
+                self._map.close()
+            with open(self.path, "rb") as data:
+                self._map = mmap.mmap(data.fileno(), 0, access=mmap.ACCESS_READ)
+        return self._map[offset:end]
+
+    def _send(self, algod: AlgodClient, record: int) -> None:
+        try:
+            algod.send_raw_transaction(base64.b64encode(self.blob(record)))
+        except Exception as e:
+            # Sent before a crash; the sweep of its block records it
+            if not _already_in_ledger(e):
+                raise
+
+    def _sweep(
+        self, algod: AlgodClient, by_tx_id: dict[str, int], to: int
+    ) -> tuple[int, int]:
+        """
+        Settles the groups found in blocks after the checkpoint up to `to`.
+
+        Only the blocks within the groups' validity are fetched, and none once every
+        group has been found. Returns the groups found and the blocks fetched.
+        """
+        found: list[tuple[int, int]] = []
+        start = self._checkpoint + 1
+        end = to
+        if by_tx_id:
+            records = [self._record(r) for r in by_tx_id.values()]
+            start = max(start, min(r.first_valid for r in records))
+            end = min(end, max(r.last_valid for r in records))
+        swept = 0
+        for round_ in range(start, end + 1):
+            if not by_tx_id:
+                break
+            swept += 1
+            response = typing.cast(
+                dict[str, list[str] | None], algod.get_block_txids(round_)
+            )
+            for tx_id in response.get("blockTxids") or []:
+                record = by_tx_id.pop(tx_id, None)
+                if record is not None:
+                    found.append((record, round_))
+        self._settle(found, to)
+        return len(found), swept
+
+    def _settle(self, settled: list[tuple[int, int]], checkpoint: int | None) -> None:
+        """Logs settled groups, then the round swept, and syncs them to disk."""
+        entries = bytearray()
+        for record, round_ in settled:
+            entries += _SETTLED.pack(record, round_)
+            self._settled[record] = round_
+        if checkpoint is not None and checkpoint > self._checkpoint:
+            entries += _SETTLED.pack(_CHECKPOINT, checkpoint)
+            self._checkpoint = checkpoint
+        if entries:
+            self._done.write(entries)
+            _sync(self._done)
+
+
+def _sync(file: typing.BinaryIO) -> None:
+    file.flush()
+    os.fsync(file.fileno())
@@ -0,0 +1,299 @@
+import threading
+import time
+import typing
+from collections import OrderedDict
+from collections.abc import Callable, Sequence
+from concurrent.futures import Future
+from dataclasses import dataclass
+
+import algokit_utils
+
+from smart_contracts._helpers.budget import TypedComposer
+from smart_contracts._helpers.client_runtime import ReturnValue, SendBase
+from smart_contracts._helpers.fastcall import method_codec
+from smart_contracts._helpers.readonly import TypedAppClient
+from smart_contracts._helpers.rounds import RoundTracker
+
+_T = typing.TypeVar("_T")
+_K = typing.TypeVar("_K")
+_V = typing.TypeVar("_V")
+
+_CacheKey = tuple[int, str, str, str]
+
+
+class _Sent(typing.Protocol):
+    """What sending a call or group returns, e.g. a `SendAppTransactionResult`."""
+
+    @property
+    def confirmations(self) -> Sequence[object]: ...
+
+
+_S = typing.TypeVar("_S", bound=_Sent)
+
+
+@dataclass(frozen=True)
+class _Entry:
+    value: object
+    round: int
+    stored_at: float
+
+
+class StateCache:
+    """
+    Serves global state and box map reads from memory, shared across threads.
+
+    Entries are dropped once a new round is seen, or after `ttl` seconds if one is given.
+    Concurrent misses for the same key share a single algod request. After a call to an
+    app confirmed in round R, reads of that app wait until algod has reached R and ignore
+    anything cached from before it. Calls sent through `send` or `send_group`, which the
+    `Cached*Client` wrappers use, are recorded that way automatically; `written` records
+    any sent otherwise.
+    """
+
+    def __init__(
+        self,
+        rounds: RoundTracker,
+        ttl: float | None = None,
+        max_entries: int = 4096,
+    ):
+        self._rounds = rounds
+        self._ttl = ttl
+        self._max_entries = max_entries
+        self._entries: OrderedDict[_CacheKey, _Entry] = OrderedDict()
+        self._inflight: dict[_CacheKey, tuple[int, Future[object]]] = {}
+        self._floors: dict[int, int] = {}
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.coalesced = 0
+
+    def global_value(
+        self, client: TypedAppClient, name: str
+    ) -> algokit_utils.ABIValue | None:
+        app_client = client.app_client
+        return self.get(
+            (app_client.app_id, "global", name, ""),
+            lambda: app_client.state.global_state.get_value(name),
+        )
+
+    def global_values(self, client: TypedAppClient) -> dict[str, object]:
+        app_client = client.app_client
+        return self.get(
+            (app_client.app_id, "globals", "", ""),
+            lambda: typing.cast(
+                dict[str, object], app_client.state.global_state.get_all()
+            ),
+        )
+
+    def map_value(self, client: TypedAppClient, map_name: str, key: object) -> object:
+        app_client = client.app_client
+        return self.get(
+            (app_client.app_id, "box", map_name, repr(key)),
+            lambda: typing.cast(
+                object, app_client.state.box.get_map_value(map_name, key)
+            ),
+        )
+
+    def map(self, client: TypedAppClient, map_name: str) -> dict[str, object]:
+        app_client = client.app_client
+        return self.get(
+            (app_client.app_id, "map", map_name, ""),
+            lambda: dict[str, object](app_client.state.box.get_map(map_name)),
+        )
+
+    def get(self, key: _CacheKey, fetch: Callable[[], _T]) -> _T:
+        """Returns the cached value for `key`, calling `fetch` at most once per miss."""
+        floor = self._floors.get(key[0], 0)
+        round_ = self._rounds.last_round
+        if round_ < floor:
+            round_ = self._rounds.wait_for(floor)
+
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and self._is_fresh(entry, round_, floor):
+                self.hits += 1
+                self._entries.move_to_end(key)
+                return typing.cast(_T, entry.value)
+            inflight = self._inflight.get(key)
+            leader = False
+            # A request started before the last write may return stale state, so don't join it
+            if inflight is not None and inflight[0] >= floor:
+                self.coalesced += 1
+            else:
+                self.misses += 1
+                inflight = (round_, Future())
+                self._inflight[key] = inflight
+                leader = True
+
+        future = inflight[1]
+        if not leader:
+            return typing.cast(_T, future.result())
+
+        try:
+            value = fetch()
+        except BaseException as ex:
+            self._finish(key, inflight)
+            future.set_exception(ex)
+            raise
+        self._finish(key, inflight, _Entry(value, round_, time.monotonic()))
+        future.set_result(value)
+        return value
+
+    def send(self, client: TypedAppClient, call: Callable[[], _S]) -> _S:
+        """Sends a call to `client`'s app with `call`, and records the round it confirmed in."""
+        result = call()
+        rounds = [
+            typing.cast(
+                int,
+                typing.cast(dict[str, object], confirmation).get("confirmed-round", 0),
+            )
+            for confirmation in result.confirmations
+            if not isinstance(confirmation, bytes)
+        ]
+        # Simulated, i.e. readonly, calls have no confirmed round
+        if max(rounds, default=0) > 0:
+            self.written(client, max(rounds))
+        return result
+
+    def send_group(
+        self,
+        client: TypedAppClient,
+        composer: TypedComposer,
+        send_params: algokit_utils.SendParams | None = None,
+    ) -> algokit_utils.SendAtomicTransactionComposerResults:
+        """
+        Sends a typed composer's group calling `client`'s app, padded as its `send` pads
+        it, and records the round it confirmed in.
+        """
+        return self.send(client, lambda: composer.send(send_params))
+
+    def written(self, client: TypedAppClient, confirmed_round: int) -> None:
+        """Records that a call to `client`'s app confirmed in `confirmed_round`."""
+        app_id = client.app_client.app_id
+        with self._lock:
+            self._floors[app_id] = max(self._floors.get(app_id, 0), confirmed_round)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def _is_fresh(self, entry: _Entry, round_: int, floor: int) -> bool:
+        if entry.round < floor:
+            return False
+        if self._ttl is not None:
+            return time.monotonic() - entry.stored_at < self._ttl
+        return entry.round >= round_
+
+    def _finish(
+        self,
+        key: _CacheKey,
+        inflight: tuple[int, Future[object]],
+        entry: _Entry | None = None,
+    ) -> None:
+        with self._lock:
+            if self._inflight.get(key) is inflight:
+                del self._inflight[key]
+            if entry is not None:
+                self._entries[key] = entry
+                self._entries.move_to_end(key)
+                while len(self._entries) > self._max_entries:
+                    self._entries.popitem(last=False)
+
+
+class CachedMapState(typing.Generic[_K, _V]):
+    """A typed client's box map accessor served through a `StateCache`."""
+
+    def __init__(self, cache: StateCache, client: TypedAppClient, map_name: str):
+        self._cache = cache
+        self._client = client
+        self._map_name = map_name
+
+    def get_map(self) -> dict[_K, _V]:
+        return typing.cast(dict[_K, _V], self._cache.map(self._client, self._map_name))
+
+    def get_value(self, key: _K) -> _V | None:
+        return typing.cast(
+            _V | None, self._cache.map_value(self._client, self._map_name, key)
+        )
+
+
+class CachedSend(SendBase):
+    """
+    Base of a typed client's `send` counterpart that tells a `StateCache` about every write.
+
+    Derived alongside the generated `<Contract>Send`, e.g. `CachedBankSend(CachedSend,
+    BankSend)`, so it has every one of its methods, each sent and padded as generated.
+    Readonly calls are simulated and never write, so they go straight through.
+    """
+
+    __slots__ = ("cache", "client")
+
+    def __init__(self, client: TypedAppClient, cache: StateCache):
+        super().__init__(client.app_client)
+        self.client = client
+        self.cache = cache
+
+    def _call(
+        self,
+        method: str,
+        args: object | None,
+        params: algokit_utils.CommonAppCallParams | None,
+        send_params: algokit_utils.SendParams | None,
+    ) -> algokit_utils.SendAppTransactionResult[ReturnValue]:
+        send = super()._call
+        if method_codec(self.app_client.app_spec, method).readonly:
+            return send(method, args, params, send_params)
+        return self.cache.send(
+            self.client, lambda: send(method, args, params, send_params)
+        )
+
+    def clear_state(
+        self,
+        params: algokit_utils.AppClientBareCallParams | None = None,
+        send_params: algokit_utils.SendParams | None = None,
+    ) -> algokit_utils.SendAppTransactionResult[algokit_utils.ABIReturn]:
+        clear_state = super().clear_state
+        return self.cache.send(self.client, lambda: clear_state(params, send_params))
+
+    def group(
+        self,
+        composer: TypedComposer,
+        send_params: algokit_utils.SendParams | None = None,
+    ) -> algokit_utils.SendAtomicTransactionComposerResults:
+        return self.cache.send_group(self.client, composer, send_params)
+
+
+class _CachedGlobalReads:
+    def __init__(self, cache: StateCache, client: TypedAppClient):
+        self._cache = cache
+        self._client = client
+
+    def get_value(self, name: str) -> algokit_utils.ABIValue | None:
+        return self._cache.global_value(self._client, name)
+
+    def get_all(self) -> dict[str, object]:
+        return self._cache.global_values(self._client)
+
+
+class _CachedStateReads:
+    def __init__(self, cache: StateCache, client: TypedAppClient):
+        self.global_state = _CachedGlobalReads(cache, client)
+
+
+class CachedReads:
+    """
+    Stands in for a typed client's `AppClient` in its generated state classes, so the
+    global state reads they make go through a `StateCache`.
+
+    E.g. `BankState(cached_reads(cache, client)).global_state` has a property per key,
+    typed as generated.
+    """
+
+    def __init__(self, cache: StateCache, client: TypedAppClient):
+        self.app_spec = client.app_client.app_spec
+        self.state = _CachedStateReads(cache, client)
+
+
+def cached_reads(cache: StateCache, client: TypedAppClient) -> algokit_utils.AppClient:
+    """A `CachedReads` for `client`, typed as the `AppClient` it stands in for."""
+    return typing.cast(algokit_utils.AppClient, CachedReads(cache, client))
@@ -0,0 +1,156 @@
+import copy
+import logging
+import threading
+import time
+import typing
+import weakref
+
+import algokit_utils
+from algosdk import transaction
+from algosdk.v2client.algod import AlgodClient
+
+from smart_contracts._helpers.rounds import RoundTracker
+
+logger = logging.getLogger(__name__)
+
+# Seconds to back off after the refresher fails to reach algod.
+_REFRESH_BACKOFF = 1.0
+# Seconds an installed client keeps params refreshed per round if no newer ones come,
+# e.g. on a dev-mode localnet where rounds only pass with transactions.
+DEFAULT_CLIENT_TIMEOUT = 30.0
+
+_caches: dict[tuple[str, str], "SuggestedParamsCache"] = {}
+_caches_lock = threading.Lock()
+
+
+class SuggestedParamsCache:
+    """
+    Suggested params for one algod node, refreshed in the background and shared.
+
+    A daemon thread, started by the first `get`, long-polls for each new round and
+    fetches params once for it, or with `ttl` set simply refetches every `ttl` seconds.
+    `get` then only returns a copy of the latest params; it fetches them itself before
+    the first refresh has landed, or while the refresher can't reach algod.
+
+    Clients passed to `install` are handed every refresh through AlgoKit's own
+    suggested-params cache. They keep it for `ttl`, or `DEFAULT_CLIENT_TIMEOUT`
+    when refreshing per round, and fetch params themselves once it lapses, as they do
+    when the refresher fails.
+    """
+
+    def __init__(
+        self,
+        algod: AlgodClient,
+        *,
+        ttl: float | None = None,
+        rounds: RoundTracker | None = None,
+    ):
+        self._algod = algod
+        self._ttl = ttl
+        self._client_timeout = ttl if ttl is not None else DEFAULT_CLIENT_TIMEOUT
+        self._rounds = rounds
+        self._lock = threading.Lock()
+        self._params: transaction.SuggestedParams | None = None
+        self._round = 0
+        self._stale = True
+        self._closed = threading.Event()
+        self._refresher: threading.Thread | None = None
+        self._clients: weakref.WeakSet[algokit_utils.AlgorandClient] = weakref.WeakSet()
+        self.refreshes = 0
+
+    def get(self) -> transaction.SuggestedParams:
+        with self._lock:
+            if self._refresher is None:
+                self._refresher = threading.Thread(
+                    target=self._refresh_forever, name="suggested-params", daemon=True
+                )
+                self._refresher.start()
+            params = self._params
+            if params is not None and not self._stale:
+                # Composers set fees on the params they're given
+                return copy.copy(params)
+        return copy.copy(self._refresh())
+
+    def install(
+        self, algorand: algokit_utils.AlgorandClient
+    ) -> algokit_utils.AlgorandClient:
+        """Makes `algorand`, and every composer and typed client built from it, use this cache."""
+        # Only applies to params the client fetches itself. Documented in milliseconds,
+        # but AlgoKit adds it to `time.time()` as is, so what's pushed has its own expiry
+        algorand.set_suggested_params_cache_timeout(int(self._client_timeout))
+        params = self.get()
+        with self._lock:
+            self._clients.add(algorand)
+        algorand.set_suggested_params_cache(params, time.time() + self._client_timeout)
+        return algorand
+
+    def close(self) -> None:
+        """Stops the refresher; `get` fetches params itself from then on."""
+        self._closed.set()
+        with self._lock:
+            self._stale = True
+            self._clients.clear()
+
+    def _refresh(self) -> transaction.SuggestedParams:
+        params = self._algod.suggested_params()
+        round_ = typing.cast(int, params.first)
+        with self._lock:
+            # A slower fetch mustn't replace params from a later round
+            latest = round_ >= self._round
+            if latest:
+                self._params = params
+                self._round = round_
+            self._stale = self._closed.is_set()
+            self.refreshes += 1
+            clients = list(self._clients)
+        if latest:
+            # Each client copies what it hands out, so they can share one object
+            until = time.time() + self._client_timeout
+            for algorand in clients:
+                algorand.set_suggested_params_cache(params, until)
+        if self._rounds is not None:
+            self._rounds.observe(round_)
+        return params
+
+    def _refresh_forever(self) -> None:
+        round_ = 0
+        while not self._closed.is_set():
+            try:
+                if self._ttl is not None:
+                    self._refresh()
+                    self._closed.wait(self._ttl)
+                    continue
+                status = typing.cast(
+                    dict[str, int], self._algod.status_after_block(round_)
+                )
+                if status["last-round"] > round_:
+                    round_ = status["last-round"]
+                    self._refresh()
+            except Exception as e:
+                logger.warning(f"Refreshing suggested params failed: {e}")
+                with self._lock:
+                    self._stale = True
+                    clients = list(self._clients)
+                    params = self._params
+                # Lapse what the clients hold so they fetch params themselves meanwhile
+                if params is not None:
+                    for algorand in clients:
+                        algorand.set_suggested_params_cache(params, time.time())
+                self._closed.wait(_REFRESH_BACKOFF)
+
+
+def shared_params(algod: AlgodClient) -> SuggestedParamsCache:
+    """The process-wide cache for the node `algod` talks to, created on first use."""
+    key = (algod.algod_address, algod.algod_token)
+    with _caches_lock:
+        cache = _caches.get(key)
+        if cache is None:
+            cache = _caches[key] = SuggestedParamsCache(algod)
+        return cache
+
+
+def use_shared_params(
+    algorand: algokit_utils.AlgorandClient,
+) -> algokit_utils.AlgorandClient:
+    """Points `algorand` at the process-wide cache for its algod node."""
+    return shared_params(algorand.client.algod).install(algorand)
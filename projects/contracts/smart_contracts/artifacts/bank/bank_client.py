@@ -19,50 +19,23 @@ from algosdk.v2client.models import SimulateTraceConfig
 import algokit_utils
 from algokit_utils import AlgorandClient as _AlgoKitAlgorandClient
 
-_APP_SPEC_JSON = r"""{"arcs": [22, 28], "bareActions": {"call": [], "create": ["NoOp"]}, "methods": [{"actions": {"call": ["NoOp"], "create": []}, "args": [{"type": "string", "name": "memo"}, {"type": "pay", "name": "pay_txn"}], "name": "deposit", "returns": {"type": "uint64"}, "desc": "Accepts a payment into the app escrow and records sender's deposited balance", "events": [], "readonly": false, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [{"type": "uint64", "name": "amount"}], "name": "withdraw", "returns": {"type": "uint64"}, "desc": "Sends ALGO back to the caller from their recorded balance", "events": [], "readonly": false, "recommendations": {}}], "name": "Bank", "state": {"keys": {"box": {}, "global": {"total_deposit": {"key": "dG90YWxfZGVwb3NpdA==", "keyType": "AVMString", "valueType": "AVMUint64"}}, "local": {}}, "maps": {"box": {"deposits": {"keyType": "address", "valueType": "uint64", "prefix": ""}}, "global": {}, "local": {}}, "schema": {"global": {"bytes": 0, "ints": 1}, "local": {"bytes": 0, "ints": 0}}}, "structs": {}, "byteCode": {"approval": "CiACAQAmAg10b3RhbF9kZXBvc2l0BBUffHUxGEAAAygjZzEbQQBNggIEn1l8MgQxIUF2NhoAjgIAFwACI0MxGRREMRhENhoBF4gAeBYpTFCwIkMxGRREMRhENhoBVwIAMRYiCUk4ECISRIgAEhYpTFCwIkMxGUD/wzEYFEQiQ4oCAYv/OAcyChJEi/84CElEi/84AEm+TBdMQQAeiwKLAAgWiwFMvyMoZUSLAAgoTGeLAb5MF0xEjACJiwAWiwFMv0L/4ooBATEAvkwXTESL/0SL/0sBDkSxMQCL/7IIsgcishAjsgGzi/8JSUAACDEAvEiLAEyJMQCLABa/Qv/z", "clear": "CoEBQw=="}, "compilerInfo": {"compiler": "puya", "compilerVersion": {"major": 4, "minor": 7, "patch": 0}}, "events": [], "networks": {}, "source": {"approval": "I3ByYWdtYSB2ZXJzaW9uIDEwCiNwcmFnbWEgdHlwZXRyYWNrIGZhbHNlCgovLyBzbWFydF9jb250cmFjdHMuYmFuay5jb250cmFjdC5CYW5rLl9fYWxnb3B5X2VudHJ5cG9pbnRfd2l0aF9pbml0KCkgLT4gdWludDY0OgptYWluOgogICAgaW50Y2Jsb2NrIDEgMAogICAgYnl0ZWNibG9jayAidG90YWxfZGVwb3NpdCIgMHgxNTFmN2M3NQogICAgdHhuIEFwcGxpY2F0aW9uSUQKICAgIGJueiBtYWluX2FmdGVyX2lmX2Vsc2VAMgogICAgLy8gc21hcnRfY29udHJhY3RzL2JhbmsvY29udHJhY3QucHk6MTEKICAgIC8vIHNlbGYudG90YWxfZGVwb3NpdCA9IFVJbnQ2NCgwKQogICAgYnl0ZWNfMCAvLyAidG90YWxfZGVwb3NpdCIKICAgIGludGNfMSAvLyAwCiAgICBhcHBfZ2xvYmFsX3B1dAoKbWFpbl9hZnRlcl9pZl9lbHNlQDI6CiAgICAvLyBzbWFydF9jb250cmFjdHMvYmFuay9jb250cmFjdC5weTo1CiAgICAvLyBjbGFzcyBCYW5rKEFSQzRDb250cmFjdCk6CiAgICB0eG4gTnVtQXBwQXJncwogICAgYnogbWFpbl9iYXJlX3JvdXRpbmdANwogICAgcHVzaGJ5dGVzcyAweDlmNTk3YzMyIDB4MzEyMTQxNzYgLy8gbWV0aG9kICJkZXBvc2l0KHN0cmluZyxwYXkpdWludDY0IiwgbWV0aG9kICJ3aXRoZHJhdyh1aW50NjQpdWludDY0IgogICAgdHhuYSBBcHBsaWNhdGlvbkFyZ3MgMAogICAgbWF0Y2ggbWFpbl9kZXBvc2l0X3JvdXRlQDUgbWFpbl93aXRoZHJhd19yb3V0ZUA2CgptYWluX2FmdGVyX2lmX2Vsc2VAOToKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9iYW5rL2NvbnRyYWN0LnB5OjUKICAgIC8vIGNsYXNzIEJhbmsoQVJDNENvbnRyYWN0KToKICAgIGludGNfMSAvLyAwCiAgICByZXR1cm4KCm1haW5fd2l0aGRyYXdfcm91dGVANjoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9iYW5rL2NvbnRyYWN0LnB5OjI4CiAgICAvLyBAYWJpbWV0aG9kKCkKICAgIHR4biBPbkNvbXBsZXRpb24KICAgICEKICAgIGFzc2VydCAvLyBPbkNvbXBsZXRpb24gaXMgbm90IE5vT3AKICAgIHR4biBBcHBsaWNhdGlvbklECiAgICBhc3NlcnQgLy8gY2FuIG9ubHkgY2FsbCB3aGVuIG5vdCBjcmVhdGluZwogICAgLy8gc21hcnRfY29udHJhY3RzL2JhbmsvY29udHJhY3QucHk6NQogICAgLy8gY2xhc3MgQmFuayhBUkM0Q29udHJhY3QpOgogICAgdHhuYSBBcHBsaWNhdGlvbkFyZ3MgMQogICAgYnRvaQogICAgLy8gc21hcnRfY29udHJhY3RzL2JhbmsvY29udHJhY3QucHk6MjgKICAgIC8vIEBhYmltZXRob2QoKQogICAgY2FsbHN1YiB3aXRoZHJhdwogICAgaXRvYgogICAgYnl0ZWNfMSAvLyAweDE1MWY3Yzc1CiAgICBzd2FwCiAgICBjb25jYXQKICAgIGxvZwogICAgaW50Y18wIC8vIDEKICAgIHJldHVybgoKbWFpbl9kZXBvc2l0X3JvdXRlQDU6CiAgICAvLyBzbWFydF9jb250cmFjdHMvYmFuay9jb250cmFjdC5weToxMwogICAgLy8gQGFiaW1ldGhvZCgpCiAgICB0eG4gT25Db21wbGV0aW9uCiAgICAhCiAgICBhc3NlcnQgLy8gT25Db21wbGV0aW9uIGlzIG5vdCBOb09wCiAgICB0eG4gQXBwbGljYXRpb25JRAogICAgYXNzZXJ0IC8vIGNhbiBvbmx5IGNhbGwgd2hlbiBub3QgY3JlYXRpbmcKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9iYW5rL2NvbnRyYWN0LnB5OjUKICAgIC8vIGNsYXNzIEJhbmsoQVJDNENvbnRyYWN0KToKICAgIHR4bmEgQXBwbGljYXRpb25BcmdzIDEKICAgIGV4dHJhY3QgMiAwCiAgICB0eG4gR3JvdXBJbmRleAogICAgaW50Y18wIC8vIDEKICAgIC0KICAgIGR1cAogICAgZ3R4bnMgVHlwZUVudW0KICAgIGludGNfMCAvLyBwYXkKICAgID09CiAgICBhc3NlcnQgLy8gdHJhbnNhY3Rpb24gdHlwZSBpcyBwYXkKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9iYW5rL2NvbnRyYWN0LnB5OjEzCiAgICAvLyBAYWJpbWV0aG9kKCkKICAgIGNhbGxzdWIgZGVwb3NpdAogICAgaXRvYgogICAgYnl0ZWNfMSAvLyAweDE1MWY3Yzc1CiAgICBzd2FwCiAgICBjb25jYXQKICAgIGxvZwogICAgaW50Y18wIC8vIDEKICAgIHJldHVybgoKbWFpbl9iYXJlX3JvdXRpbmdANzoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9iYW5rL2NvbnRyYWN0LnB5OjUKICAgIC8vIGNsYXNzIEJhbmsoQVJDNENvbnRyYWN0KToKICAgIHR4biBPbkNvbXBsZXRpb24KICAgIGJueiBtYWluX2FmdGVyX2lmX2Vsc2VAOQogICAgdHhuIEFwcGxpY2F0aW9uSUQKICAgICEKICAgIGFzc2VydCAvLyBjYW4gb25seSBjYWxsIHdoZW4gY3JlYXRpbmcKICAgIGludGNfMCAvLyAxCiAgICByZXR1cm4KCgovLyBzbWFydF9jb250cmFjdHMuYmFuay5jb250cmFjdC5CYW5rLmRlcG9zaXQobWVtbzogYnl0ZXMsIHBheV90eG46IHVpbnQ2NCkgLT4gdWludDY0OgpkZXBvc2l0OgogICAgLy8gc21hcnRfY29udHJhY3RzL2JhbmsvY29udHJhY3QucHk6MTMtMTQKICAgIC8vIEBhYmltZXRob2QoKQogICAgLy8gZGVmIGRlcG9zaXQoc2VsZiwgbWVtbzogU3RyaW5nLCBwYXlfdHhuOiBndHhuLlBheW1lbnRUcmFuc2FjdGlvbikgLT4gVUludDY0OgogICAgcHJvdG8gMiAxCiAgICAvLyBzbWFydF9jb250cmFjdHMvYmFuay9jb250cmFjdC5weToxNgogICAgLy8gYXNzZXJ0IHBheV90eG4ucmVjZWl2ZXIgPT0gR2xvYmFsLmN1cnJlbnRfYXBwbGljYXRpb25fYWRkcmVzcywgIlJlY2VpdmVyIG11c3QgYmUgdGhlIGNvbnRyYWN0IGFkZHJlc3MiCiAgICBmcmFtZV9kaWcgLTEKICAgIGd0eG5zIFJlY2VpdmVyCiAgICBnbG9iYWwgQ3VycmVudEFwcGxpY2F0aW9uQWRkcmVzcwogICAgPT0KICAgIGFzc2VydCAvLyBSZWNlaXZlciBtdXN0IGJlIHRoZSBjb250cmFjdCBhZGRyZXNzCiAgICAvLyBzbWFydF9jb250cmFjdHMvYmFuay9jb250cmFjdC5weToxNwogICAgLy8gYXNzZXJ0IHBheV90eG4uYW1vdW50ID4gMCwgIkRlcG9zaXQgYW1vdW50IG11c3QgYmUgZ3JlYXRlciB0aGFuIHplcm8iCiAgICBmcmFtZV9kaWcgLTEKICAgIGd0eG5zIEFtb3VudAogICAgZHVwCiAgICBhc3NlcnQgLy8gRGVwb3NpdCBhbW91bnQgbXVzdCBiZSBncmVhdGVyIHRoYW4gemVybwogICAgLy8gc21hcnRfY29udHJhY3RzL2JhbmsvY29udHJhY3QucHk6MTkKICAgIC8vIGFtb3VudCwgZXhpc3RzID0gc2VsZi5kZXBvc2l0cy5tYXliZShwYXlfdHhuLnNlbmRlcikKICAgIGZyYW1lX2RpZyAtMQogICAgZ3R4bnMgU2VuZGVyCiAgICBkdXAKICAgIGJveF9nZXQKICAgIHN3YXAKICAgIGJ0b2kKICAgIHN3YXAKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9iYW5rL2NvbnRyYWN0LnB5OjIwCiAgICAvLyBpZiBleGlzdHM6CiAgICBieiBkZXBvc2l0X2Vsc2VfYm9keUAyCiAgICAvLyBzbWFydF9jb250cmFjdHMvYmFuay9jb250cmFjdC5weToyMQogICAgLy8gc2VsZi5kZXBvc2l0c1twYXlfdHhuLnNlbmRlcl0gPSBhbW91bnQgKyBwYXlfdHhuLmFtb3VudAogICAgZnJhbWVfZGlnIDIKICAgIGZyYW1lX2RpZyAwCiAgICArCiAgICBpdG9iCiAgICBmcmFtZV9kaWcgMQogICAgc3dhcAogICAgYm94X3B1dAoKZGVwb3NpdF9hZnRlcl9pZl9lbHNlQDM6CiAgICAvLyBzbWFydF9jb250cmFjdHMvYmFuay9jb250cmFjdC5weToyNQogICAgLy8gc2VsZi50b3RhbF9kZXBvc2l0ICs9IHBheV90eG4uYW1vdW50CiAgICBpbnRjXzEgLy8gMAogICAgYnl0ZWNfMCAvLyAidG90YWxfZGVwb3NpdCIKICAgIGFwcF9nbG9iYWxfZ2V0X2V4CiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi50b3RhbF9kZXBvc2l0IGV4aXN0cwogICAgZnJhbWVfZGlnIDAKICAgICsKICAgIGJ5dGVjXzAgLy8gInRvdGFsX2RlcG9zaXQiCiAgICBzd2FwCiAgICBhcHBfZ2xvYmFsX3B1dAogICAgLy8gc21hcnRfY29udHJhY3RzL2JhbmsvY29udHJhY3QucHk6MjYKICAgIC8vIHJldHVybiBzZWxmLmRlcG9zaXRzW3BheV90eG4uc2VuZGVyXQogICAgZnJhbWVfZGlnIDEKICAgIGJveF9nZXQKICAgIHN3YXAKICAgIGJ0b2kKICAgIHN3YXAKICAgIGFzc2VydCAvLyBjaGVjayBzZWxmLmRlcG9zaXRzIGVudHJ5IGV4aXN0cwogICAgZnJhbWVfYnVyeSAwCiAgICByZXRzdWIKCmRlcG9zaXRfZWxzZV9ib2R5QDI6CiAgICAvLyBzbWFydF9jb250cmFjdHMvYmFuay9jb250cmFjdC5weToyMwogICAgLy8gc2VsZi5kZXBvc2l0c1twYXlfdHhuLnNlbmRlcl0gPSBwYXlfdHhuLmFtb3VudAogICAgZnJhbWVfZGlnIDAKICAgIGl0b2IKICAgIGZyYW1lX2RpZyAxCiAgICBzd2FwCiAgICBib3hfcHV0CiAgICBiIGRlcG9zaXRfYWZ0ZXJfaWZfZWxzZUAzCgoKLy8gc21hcnRfY29udHJhY3RzLmJhbmsuY29udHJhY3QuQmFuay53aXRoZHJhdyhhbW91bnQ6IHVpbnQ2NCkgLT4gdWludDY0Ogp3aXRoZHJhdzoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9iYW5rL2NvbnRyYWN0LnB5OjI4LTI5CiAgICAvLyBAYWJpbWV0aG9kKCkKICAgIC8vIGRlZiB3aXRoZHJhdyhzZWxmLCBhbW91bnQ6IFVJbnQ2NCkgLT4gVUludDY0OgogICAgcHJvdG8gMSAxCiAgICAvLyBzbWFydF9jb250cmFjdHMvYmFuay9jb250cmFjdC5weTozMQogICAgLy8gY3VycmVudCwgZXhpc3RzID0gc2VsZi5kZXBvc2l0cy5tYXliZShUeG4uc2VuZGVyKQogICAgdHhuIFNlbmRlcgogICAgYm94X2dldAogICAgc3dhcAogICAgYnRvaQogICAgLy8gc21hcnRfY29udHJhY3RzL2JhbmsvY29udHJhY3QucHk6MzIKICAgIC8vIGFzc2VydCBleGlzdHMsICJObyBkZXBvc2l0cyBmb3VuZCBmb3IgdGhpcyBhY2NvdW50IgogICAgc3dhcAogICAgYXNzZXJ0IC8vIE5vIGRlcG9zaXRzIGZvdW5kIGZvciB0aGlzIGFjY291bnQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9iYW5rL2NvbnRyYWN0LnB5OjMzCiAgICAvLyBhc3NlcnQgYW1vdW50ID4gMCwgIldpdGhkcmF3YWwgYW1vdW50IG11c3QgYmUgZ3JlYXRlciB0aGFuIHplcm8iCiAgICBmcmFtZV9kaWcgLTEKICAgIGFzc2VydCAvLyBXaXRoZHJhd2FsIGFtb3VudCBtdXN0IGJlIGdyZWF0ZXIgdGhhbiB6ZXJvCiAgICAvLyBzbWFydF9jb250cmFjdHMvYmFuay9jb250cmFjdC5weTozNAogICAgLy8gYXNzZXJ0IGFtb3VudCA8PSBjdXJyZW50LCAiV2l0aGRyYXdhbCBhbW91bnQgZXhjZWVkcyBiYWxhbmNlIgogICAgZnJhbWVfZGlnIC0xCiAgICBkaWcgMQogICAgPD0KICAgIGFzc2VydCAvLyBXaXRoZHJhd2FsIGFtb3VudCBleGNlZWRzIGJhbGFuY2UKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9iYW5rL2NvbnRyYWN0LnB5OjM2CiAgICAvLyBpdHhuLlBheW1lbnQocmVjZWl2ZXI9VHhuLnNlbmRlciwgYW1vdW50PWFtb3VudCwgZmVlPTApLnN1Ym1pdCgpCiAgICBpdHhuX2JlZ2luCiAgICB0eG4gU2VuZGVyCiAgICBmcmFtZV9kaWcgLTEKICAgIGl0eG5fZmllbGQgQW1vdW50CiAgICBpdHhuX2ZpZWxkIFJlY2VpdmVyCiAgICBpbnRjXzAgLy8gcGF5CiAgICBpdHhuX2ZpZWxkIFR5cGVFbnVtCiAgICBpbnRjXzEgLy8gMAogICAgaXR4bl9maWVsZCBGZWUKICAgIGl0eG5fc3VibWl0CiAgICAvLyBzbWFydF9jb250cmFjdHMvYmFuay9jb250cmFjdC5weTozOAogICAgLy8gcmVtYWluaW5nID0gY3VycmVudCAtIGFtb3VudAogICAgZnJhbWVfZGlnIC0xCiAgICAtCiAgICBkdXAKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9iYW5rL2NvbnRyYWN0LnB5OjM5CiAgICAvLyBpZiByZW1haW5pbmcgPT0gVUludDY0KDApOgogICAgYm56IHdpdGhkcmF3X2Vsc2VfYm9keUAzCiAgICAvLyBzbWFydF9jb250cmFjdHMvYmFuay9jb250cmFjdC5weTo0MAogICAgLy8gZGVsIHNlbGYuZGVwb3NpdHNbVHhuLnNlbmRlcl0KICAgIHR4biBTZW5kZXIKICAgIGJveF9kZWwKICAgIHBvcAoKd2l0aGRyYXdfYWZ0ZXJfaWZfZWxzZUA0OgogICAgLy8gc21hcnRfY29udHJhY3RzL2JhbmsvY29udHJhY3QucHk6NDQKICAgIC8vIHJldHVybiByZW1haW5pbmcKICAgIGZyYW1lX2RpZyAwCiAgICBzd2FwCiAgICByZXRzdWIKCndpdGhkcmF3X2Vsc2VfYm9keUAzOgogICAgLy8gc21hcnRfY29udHJhY3RzL2JhbmsvY29udHJhY3QucHk6NDIKICAgIC8vIHNlbGYuZGVwb3NpdHNbVHhuLnNlbmRlcl0gPSByZW1haW5pbmcKICAgIHR4biBTZW5kZXIKICAgIGZyYW1lX2RpZyAwCiAgICBpdG9iCiAgICBib3hfcHV0CiAgICBiIHdpdGhkcmF3X2FmdGVyX2lmX2Vsc2VANAo=", "clear": "I3ByYWdtYSB2ZXJzaW9uIDEwCiNwcmFnbWEgdHlwZXRyYWNrIGZhbHNlCgovLyBhbGdvcHkuYXJjNC5BUkM0Q29udHJhY3QuY2xlYXJfc3RhdGVfcHJvZ3JhbSgpIC0+IHVpbnQ2NDoKbWFpbjoKICAgIHB1c2hpbnQgMSAvLyAxCiAgICByZXR1cm4K"}, "sourceInfo": {"approval": {"pcOffsetMethod": "none", "sourceInfo": [{"pc": [143], "errorMessage": "Deposit amount must be greater than zero"}, {"pc": [205], "errorMessage": "No deposits found for this account"}, {"pc": [65, 86], "errorMessage": "OnCompletion is not NoOp"}, {"pc": [137], "errorMessage": "Receiver must be the contract address"}, {"pc": [214], "errorMessage": "Withdrawal amount exceeds balance"}, {"pc": [208], "errorMessage": "Withdrawal amount must be greater than zero"}, {"pc": [124], "errorMessage": "can only call when creating"}, {"pc": [68, 89], "errorMessage": "can only call when not creating"}, {"pc": [182], "errorMessage": "check self.deposits entry exists"}, {"pc": [169], "errorMessage": "check self.total_deposit exists"}, {"pc": [105], "errorMessage": "transaction type is pay"}]}, "clear": {"pcOffsetMethod": "none", "sourceInfo": []}}, "templateVariables": {}}"""
-APP_SPEC = algokit_utils.Arc56Contract.from_json(_APP_SPEC_JSON)
-
-def _parse_abi_args(args: object | None = None) -> list[object] | None:
-    """Helper to parse ABI args into the format expected by underlying client"""
-    if args is None:
-        return None
-
-    def convert_dataclass(value: object) -> object:
-        if dataclasses.is_dataclass(value):
-            return tuple(convert_dataclass(getattr(value, field.name)) for field in dataclasses.fields(value))
-        elif isinstance(value, (list, tuple)):
-            return type(value)(convert_dataclass(item) for item in value)
-        return value
-
-    match args:
-        case tuple():
-            method_args = list(args)
-        case _ if dataclasses.is_dataclass(args):
-            method_args = [getattr(args, field.name) for field in dataclasses.fields(args)]
-        case _:
-            raise ValueError("Invalid 'args' type. Expected 'tuple' or 'TypedDict' for respective typed arguments.")
-
-    return [
-        convert_dataclass(arg) if not isinstance(arg, algokit_utils.AppMethodCallTransactionArgument) else arg
-        for arg in method_args
-    ] if method_args else None
-
-def _init_dataclass(cls: type, data: dict) -> object:
-    """
-    Recursively instantiate a dataclass of type `cls` from `data`.
-
-    For each field on the dataclass, if the field type is also a dataclass
-    and the corresponding data is a dict, instantiate that field recursively.
-    """
-    field_values = {}
-    for field in dataclasses.fields(cls):
-        field_value = data.get(field.name)
-        # Check if the field expects another dataclass and the value is a dict.
-        if dataclasses.is_dataclass(field.type) and isinstance(field_value, dict):
-            field_values[field.name] = _init_dataclass(typing.cast(type, field.type), field_value)
-        else:
-            field_values[field.name] = field_value
-    return cls(**field_values)
+_APP_SPEC_JSON = r"""{"arcs": [22, 28], "bareActions": {"call": [], "create": ["NoOp"]}, "methods": [{"actions": {"call": ["NoOp"], "create": []}, "args": [{"type": "string", "name": "memo"}, {"type": "pay", "name": "pay_txn"}], "name": "deposit", "returns": {"type": "uint64"}, "desc": "Accepts a payment into the app escrow and records sender's deposited balance", "events": [], "readonly": false, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [{"type": "uint64", "name": "amount"}], "name": "withdraw", "returns": {"type": "uint64"}, "desc": "Sends ALGO back to the caller from their recorded balance", "events": [], "readonly": false, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [{"type": "address", "name": "account"}], "name": "balance_of", "returns": {"type": "uint64"}, "desc": "Returns the recorded deposit balance for an account, or zero if it has none", "events": [], "readonly": true, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [{"type": "bool", "name": "paused"}], "name": "set_paused", "returns": {"type": "void"}, "desc": "Stops or resumes deposits; withdrawals are always open (creator only)", "events": [], "readonly": false, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [{"type": "byte[]", "name": "program_hash"}], "name": "approve_successor", "returns": {"type": "uint64"}, "desc": "Names the program deposits may be exported to, after a notice period (creator only)", "events": [], "readonly": false, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [{"type": "(address,uint64)[]", "name": "entries"}, {"type": "application", "name": "destination"}], "name": "export_deposits", "returns": {"type": "uint64"}, "desc": "Moves the listed balances and their ALGO to the approved successor (creator only)", "events": [], "readonly": false, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [{"type": "(address,uint64)[]", "name": "entries"}], "name": "import_deposits", "returns": {"type": "uint64"}, "desc": "Credits the balances the export just before it moved here (creator only)", "events": [], "readonly": false, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [], "name": "opup", "returns": {"type": "void"}, "desc": "Does nothing; each call adds to the group's pooled opcode budget", "events": [], "readonly": false, "recommendations": {}}], "name": "Bank", "state": {"keys": {"box": {}, "global": {"total_deposit": {"key": "dG90YWxfZGVwb3NpdA==", "keyType": "AVMString", "valueType": "AVMUint64"}, "paused": {"key": "cGF1c2Vk", "keyType": "AVMString", "valueType": "AVMUint64"}, "successor_hash": {"key": "c3VjY2Vzc29yX2hhc2g=", "keyType": "AVMString", "valueType": "AVMBytes"}, "successor_round": {"key": "c3VjY2Vzc29yX3JvdW5k", "keyType": "AVMString", "valueType": "AVMUint64"}}, "local": {}}, "maps": {"box": {"deposits": {"keyType": "address", "valueType": "uint64", "prefix": ""}}, "global": {}, "local": {}}, "schema": {"global": {"bytes": 1, "ints": 3}, "local": {"bytes": 0, "ints": 0}}}, "structs": {}, "byteCode": {"approval": "CiAEAAEoICYGDXRvdGFsX2RlcG9zaXQEFR98dQZwYXVzZWQPc3VjY2Vzc29yX3JvdW5kDnN1Y2Nlc3Nvcl9oYXNoBOOp0SYxGEAADigiZyoiZycEgABnKyJnMRtBAOmCBQSfWXwyBDEhQXYEind4OQTsCFD9BAZzE18nBYICBC2kO/YETGvqcjYaAI4IAIoAdQBhAFAAOQAfAAsAAiJDMRkURDEYRCNDMRkURDEYRDYaAYgCCRYpTFCwI0MxGRREMRhENhoBNhoCF8AyiAFJFilMULAjQzEZFEQxGEQ2GgFXAgCIAQ8WKUxQsCNDMRkURDEYRDYaASJTiADrI0MxGRREMRhENhoBiADOFilMULAjQzEZFEQxGEQ2GgEXiAB+FilMULAjQzEZFEQxGEQ2GgFXAgAxFiMJSTgQIxJEiAASFilMULAjQzEZQP9QMRgURCNDigIBIiplRBREi/84BzIKEkSL/zgISUSL/zgASb5MF0xBAB6LAosACBaLAUy/IihlRIsACChMZ4sBvkwXTESMAImLABaLAUy/Qv/iigEBMQC+TBdMRIv/RIv/SwEORLExAIv/sgiyByOyECKyAbOL/wlJQAAIMQC8SIsATIkxAIsAFr9C//OKAQGL/75MFyJMTwJNiYoBADEAMgkSRCqL/2eJigEBMQAyCRJEi/8VJRJEJwSL/2cyBoGw6gEIK0xnIitlRImKAgEiSYAAMQAyCRJEIiplRESL/3IHRDIJEkSL/3IARAMiJwRlRBJEMgYiK2VED0Qii/4iWSKLBYsEDEEAQIv+VwIAiwUkCyRYSYwBVwAgSYwAvkwXjAJBACCLASVbiwISQQAWI0SLA4sCCIwDiwC8SIsFIwiMBUL/vCJC/+eLA0EAHiIoZUSLA0lOAgkoTGexi/9yCESyB7III7IQIrIBs4sDjACJigEBMQAyCRJEMRZEMRYjCUk4EIEGEkRJIsIaJwUSREkjwhqL/xJESYECwhoXSwFMwjIyCBJEOBhyB0QyCRJEIov/IlkiiwKLAQxBADSL/1cCAIsCSU4CJAskWElXACBJvkwXIkxPAk1PAiVbTEsBCBZPAky/iwAIjAAjCIwCQv/EIihlRIsASU4CCChMZzIKSXMARExzAUQiKGVECA9EjACJ", "clear": "CoEBQw=="}, "compilerInfo": {"compiler": "puya", "compilerVersion": {"major": 4, "minor": 7, "patch": 0}}, "events": [], "networks": {}, "source": {"approval": "I3ByYWdtYSB2ZXJzaW9uIDEwCiNwcmFnbWEgdHlwZXRyYWNrIGZhbHNlCgovLyBzbWFydF9jb250cmFjdHMuYmFuay5jb250cmFjdC5CYW5rLl9fYWxnb3B5X2VudHJ5cG9pbnRfd2l0aF9pbml0KCkgLT4gdWludDY0OgptYWluOgogICAgaW50Y2Jsb2NrIDAgMSA0MCAzMgogICAgYnl0ZWNibG9jayAidG90YWxfZGVwb3NpdCIgMHgxNTFmN2M3NSAicGF1c2VkIiAic3VjY2Vzc29yX3JvdW5kIiAic3VjY2Vzc29yX2hhc2giIDB4ZTNhOWQxMjYKICAgIHR4biBBcHBsaWNhdGlvbklECiAgICBibnogbWFpbl9hZnRlcl9pZl9lbHNlQDIKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9iYW5rL2NvbnRyYWN0LnB5OjIyCiAgICAvLyBzZWxmLnRvdGFsX2RlcG9zaXQgPSBVSW50NjQoMCkKICAgIGJ5dGVjXzAgLy8gInRvdGFsX2RlcG9zaXQiCiAgICBpbnRjXzAgLy8gMAogICAgYXBwX2dsb2JhbF9wdXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9iYW5rL2NvbnRyYWN0LnB5OjIzCiAgICAvLyBzZWxmLnBhdXNlZCA9IEZhbHNlCiAgICBieXRlY18yIC8vICJwYXVzZWQiCiAgICBpbnRjXzAgLy8gMAogICAgYXBwX2dsb2JhbF9wdXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9iYW5rL2NvbnRyYWN0LnB5OjI0CiAgICAvLyBzZWxmLnN1Y2Nlc3Nvcl9oYXNoID0gQnl0ZXMoKQogICAgYnl0ZWMgNCAvLyAic3VjY2Vzc29yX2hhc2giCiAgICBwdXNoYnl0ZXMgMHgKICAgIGFwcF9nbG9iYWxfcHV0CiAgICAvLyBzbWFydF9jb250cmFjdHMvYmFuay9jb250cmFjdC5weToyNQogICAgLy8gc2VsZi5zdWNjZXNzb3Jfcm91bmQgPSBVSW50NjQoMCkKICAgIGJ5dGVjXzMgLy8gInN1Y2Nlc3Nvcl9yb3VuZCIKICAgIGludGNfMCAvLyAwCiAgICBhcHBfZ2xvYmFsX3B1dAoKbWFpbl9hZnRlcl9pZl9lbHNlQDI6CiAgICAvLyBzbWFydF9jb250cmFjdHMvYmFuay9jb250cmFjdC5weToxMwogICAgLy8gY2xhc3MgQmFuayhBUkM0Q29udHJhY3QpOgogICAgdHhuIE51bUFwcEFyZ3MKICAgIGJ6IG1haW5fYmFyZV9yb3V0aW5nQDEzCiAgICBwdXNoYnl0ZXNzIDB4OWY1OTdjMzIgMHgzMTIxNDE3NiAweDhhNzc3ODM5IDB4ZWMwODUwZmQgMHgwNjczMTM1ZiAvLyBtZXRob2QgImRlcG9zaXQoc3RyaW5nLHBheSl1aW50NjQiLCBtZXRob2QgIndpdGhkcmF3KHVpbnQ2NCl1aW50NjQiLCBtZXRob2QgImJhbGFuY2Vfb2YoYWRkcmVzcyl1aW50NjQiLCBtZXRob2QgInNldF9wYXVzZWQoYm9vbCl2b2lkIiwgbWV0aG9kICJhcHByb3ZlX3N1Y2Nlc3NvcihieXRlW10pdWludDY0IgogICAgYnl0ZWMgNSAvLyBtZXRob2QgImV4cG9ydF9kZXBvc2l0cygoYWRkcmVzcyx1aW50NjQpW10sYXBwbGljYXRpb24pdWludDY0IgogICAgcHVzaGJ5dGVzcyAweDJkYTQzYmY2IDB4NGM2YmVhNzIgLy8gbWV0aG9kICJpbXBvcnRfZGVwb3NpdHMoKGFkZHJlc3MsdWludDY0KVtdKXVpbnQ2NCIsIG1ldGhvZCAib3B1cCgpdm9pZCIKICAgIHR4bmEgQXBwbGljYXRpb25BcmdzIDAKICAgIG1hdGNoIG1haW5fZGVwb3NpdF9yb3V0ZUA1IG1haW5fd2l0aGRyYXdfcm91dGVANiBtYWluX2JhbGFuY2Vfb2Zfcm91dGVANyBtYWluX3NldF9wYXVzZWRfcm91dGVAOCBtYWluX2FwcHJvdmVfc3VjY2Vzc29yX3JvdXRlQDkgbWFpbl9leHBvcnRfZGVwb3NpdHNfcm91dGVAMTAgbWFpbl9pbXBvcnRfZGVwb3NpdHNfcm91dGVAMTEgbWFpbl9vcHVwX3JvdXRlQDEyCgptYWluX2FmdGVyX2lmX2Vsc2VAMTU6CiAgICAvLyBzbWFydF9jb250cmFjdHMvYmFuay9jb250cmFjdC5weToxMwogICAgLy8gY2xhc3MgQmFuayhBUkM0Q29udHJhY3QpOgogICAgaW50Y18wIC8vIDAKICAgIHJldHVybgoKbWFpbl9vcHVwX3JvdXRlQDEyOgogICAgLy8gc21hcnRfY29udHJhY3RzL2JhbmsvY29udHJhY3QucHk6MTI4CiAgICAvLyBAYWJpbWV0aG9kKCkKICAgIHR4biBPbkNvbXBsZXRpb24KICAgICEKICAgIGFzc2VydCAvLyBPbkNvbXBsZXRpb24gaXMgbm90IE5vT3AKICAgIHR4biBBcHBsaWNhdGlvbklECiAgICBhc3NlcnQgLy8gY2FuIG9ubHkgY2FsbCB3aGVuIG5vdCBjcmVhdGluZwogICAgaW50Y18xIC8vIDEKICAgIHJldHVybgoKbWFpbl9pbXBvcnRfZGVwb3NpdHNfcm91dGVAMTE6CiAgICAvLyBzbWFydF9jb250cmFjdHMvYmFuay9jb250cmFjdC5weToxMDMKICAgIC8vIEBhYmltZXRob2QoKQogICAgdHhuIE9uQ29tcGxldGlvbgogICAgIQogICAgYXNzZXJ0IC8vIE9uQ29tcGxldGlvbiBpcyBub3QgTm9PcAogICAgdHhuIEFwcGxpY2F0aW9uSUQKICAgIGFzc2VydCAvLyBjYW4gb25seSBjYWxsIHdoZW4gbm90IGNyZWF0aW5nCiAgICAvLyBzbWFydF9jb250cmFjdHMvYmFuay9jb250cmFjdC5weToxMwogICAgLy8gY2xhc3MgQmFuayhBUkM0Q29udHJhY3QpOgogICAgdHhuYSBBcHBsaWNhdGlvbkFyZ3MgMQogICAgLy8gc21hcnRfY29udHJhY3RzL2JhbmsvY29udHJhY3QucHk6MTAzCiAgICAvLyBAYWJpbWV0aG9kKCkKICAgIGNhbGxzdWIgaW1wb3J0X2RlcG9zaXRzCiAgICBpdG9iCiAgICBieXRlY18xIC8vIDB4MTUxZjdjNzUKICAgIHN3YXAKICAgIGNvbmNhdAogICAgbG9nCiAgICBpbnRjXzEgLy8gMQogICAgcmV0dXJuCgptYWluX2V4cG9ydF9kZXBvc2l0c19yb3V0ZUAxMDoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9iYW5rL2NvbnRyYWN0LnB5OjgxCiAgICAvLyBAYWJpbWV0aG9kKCkKICAgIHR4biBPbkNvbXBsZXRpb24KICAgICEKICAgIGFzc2VydCAvLyBPbkNvbXBsZXRpb24gaXMgbm90IE5vT3AKICAgIHR4biBBcHBsaWNhdGlvbklECiAgICBhc3NlcnQgLy8gY2FuIG9ubHkgY2FsbCB3aGVuIG5vdCBjcmVhdGluZwogICAgLy8gc21hcnRfY29udHJhY3RzL2JhbmsvY29udHJhY3QucHk6MTMKICAgIC8vIGNsYXNzIEJhbmsoQVJDNENvbnRyYWN0KToKICAgIHR4bmEgQXBwbGljYXRpb25BcmdzIDEKICAgIHR4bmEgQXBwbGljYXRpb25BcmdzIDIKICAgIGJ0b2kKICAgIHR4bmFzIEFwcGxpY2F0aW9ucwogICAgLy8gc21hcnRfY29udHJhY3RzL2JhbmsvY29udHJhY3QucHk6ODEKICAgIC8vIEBhYmltZXRob2QoKQogICAgY2FsbHN1YiBleHBvcnRfZGVwb3NpdHMKICAgIGl0b2IKICAgIGJ5dGVjXzEgLy8gMHgxNTFmN2M3NQogICAgc3dhcAogICAgY29uY2F0CiAgICBsb2cKICAgIGludGNfMSAvLyAxCiAgICByZXR1cm4KCm1haW5fYXBwcm92ZV9zdWNjZXNzb3Jfcm91dGVAOToKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9iYW5rL2NvbnRyYWN0LnB5OjcyCiAgICAvLyBAYWJpbWV0aG9kKCkKICAgIHR4biBPbkNvbXBsZXRpb24KICAgICEKICAgIGFzc2VydCAvLyBPbkNvbXBsZXRpb24gaXMgbm90IE5vT3AKICAgIHR4biBBcHBsaWNhdGlvbklECiAgICBhc3NlcnQgLy8gY2FuIG9ubHkgY2FsbCB3aGVuIG5vdCBjcmVhdGluZwogICAgLy8gc21hcnRfY29udHJhY3RzL2JhbmsvY29udHJhY3QucHk6MTMKICAgIC8vIGNsYXNzIEJhbmsoQVJDNENvbnRyYWN0KToKICAgIHR4bmEgQXBwbGljYXRpb25BcmdzIDEKICAgIGV4dHJhY3QgMiAwCiAgICAvLyBzbWFydF9jb250cmFjdHMvYmFuay9jb250cmFjdC5weTo3MgogICAgLy8gQGFiaW1ldGhvZCgpCiAgICBjYWxsc3ViIGFwcHJvdmVfc3VjY2Vzc29yCiAgICBpdG9iCiAgICBieXRlY18xIC8vIDB4MTUxZjdjNzUKICAgIHN3YXAKICAgIGNvbmNhdAogICAgbG9nCiAgICBpbnRjXzEgLy8gMQogICAgcmV0dXJuCgptYWluX3NldF9wYXVzZWRfcm91dGVAODoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9iYW5rL2NvbnRyYWN0LnB5OjY2CiAgICAvLyBAYWJpbWV0aG9kKCkKICAgIHR4biBPbkNvbXBsZXRpb24KICAgICEKICAgIGFzc2VydCAvLyBPbkNvbXBsZXRpb24gaXMgbm90IE5vT3AKICAgIHR4biBBcHBsaWNhdGlvbklECiAgICBhc3NlcnQgLy8gY2FuIG9ubHkgY2FsbCB3aGVuIG5vdCBjcmVhdGluZwogICAgLy8gc21hcnRfY29udHJhY3RzL2JhbmsvY29udHJhY3QucHk6MTMKICAgIC8vIGNsYXNzIEJhbmsoQVJDNENvbnRyYWN0KToKICAgIHR4bmEgQXBwbGljYXRpb25BcmdzIDEKICAgIGludGNfMCAvLyAwCiAgICBnZXRiaXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9iYW5rL2NvbnRyYWN0LnB5OjY2CiAgICAvLyBAYWJpbWV0aG9kKCkKICAgIGNhbGxzdWIgc2V0X3BhdXNlZAogICAgaW50Y18xIC8vIDEKICAgIHJldHVybgoKbWFpbl9iYWxhbmNlX29mX3JvdXRlQDc6CiAgICAvLyBzbWFydF9jb250cmFjdHMvYmFuay9jb250cmFjdC5weTo2MQogICAgLy8gQGFiaW1ldGhvZChyZWFkb25seT1UcnVlKQogICAgdHhuIE9uQ29tcGxldGlvbgogICAgIQogICAgYXNzZXJ0IC8vIE9uQ29tcGxldGlvbiBpcyBub3QgTm9PcAogICAgdHhuIEFwcGxpY2F0aW9uSUQKICAgIGFzc2VydCAvLyBjYW4gb25seSBjYWxsIHdoZW4gbm90IGNyZWF0aW5nCiAgICAvLyBzbWFydF9jb250cmFjdHMvYmFuay9jb250cmFjdC5weToxMwogICAgLy8gY2xhc3MgQmFuayhBUkM0Q29udHJhY3QpOgogICAgdHhuYSBBcHBsaWNhdGlvbkFyZ3MgMQogICAgLy8gc21hcnRfY29udHJhY3RzL2JhbmsvY29udHJhY3QucHk6NjEKICAgIC8vIEBhYmltZXRob2QocmVhZG9ubHk9VHJ1ZSkKICAgIGNhbGxzdWIgYmFsYW5jZV9vZgogICAgaXRvYgogICAgYnl0ZWNfMSAvLyAweDE1MWY3Yzc1CiAgICBzd2FwCiAgICBjb25jYXQKICAgIGxvZwogICAgaW50Y18xIC8vIDEKICAgIHJldHVybgoKbWFpbl93aXRoZHJhd19yb3V0ZUA2OgogICAgLy8gc21hcnRfY29udHJhY3RzL2JhbmsvY29udHJhY3QucHk6NDMKICAgIC8vIEBhYmltZXRob2QoKQogICAgdHhuIE9uQ29tcGxldGlvbgogICAgIQogICAgYXNzZXJ0IC8vIE9uQ29tcGxldGlvbiBpcyBub3QgTm9PcAogICAgdHhuIEFwcGxpY2F0aW9uSUQKICAgIGFzc2VydCAvLyBjYW4gb25seSBjYWxsIHdoZW4gbm90IGNyZWF0aW5nCiAgICAvLyBzbWFydF9jb250cmFjdHMvYmFuay9jb250cmFjdC5weToxMwogICAgLy8gY2xhc3MgQmFuayhBUkM0Q29udHJhY3QpOgogICAgdHhuYSBBcHBsaWNhdGlvbkFyZ3MgMQogICAgYnRvaQogICAgLy8gc21hcnRfY29udHJhY3RzL2JhbmsvY29udHJhY3QucHk6NDMKICAgIC8vIEBhYmltZXRob2QoKQogICAgY2FsbHN1YiB3aXRoZHJhdwogICAgaXRvYgogICAgYnl0ZWNfMSAvLyAweDE1MWY3Yzc1CiAgICBzd2FwCiAgICBjb25jYXQKICAgIGxvZwogICAgaW50Y18xIC8vIDEKICAgIHJldHVybgoKbWFpbl9kZXBvc2l0X3JvdXRlQDU6CiAgICAvLyBzbWFydF9jb250cmFjdHMvYmFuay9jb250cmFjdC5weToyNwogICAgLy8gQGFiaW1ldGhvZCgpCiAgICB0eG4gT25Db21wbGV0aW9uCiAgICAhCiAgICBhc3NlcnQgLy8gT25Db21wbGV0aW9uIGlzIG5vdCBOb09wCiAgICB0eG4gQXBwbGljYXRpb25JRAogICAgYXNzZXJ0IC8vIGNhbiBvbmx5IGNhbGwgd2hlbiBub3QgY3JlYXRpbmcKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9iYW5rL2NvbnRyYWN0LnB5OjEzCiAgICAvLyBjbGFzcyBCYW5rKEFSQzRDb250cmFjdCk6CiAgICB0eG5hIEFwcGxpY2F0aW9uQXJncyAxCiAgICBleHRyYWN0IDIgMAogICAgdHhuIEdyb3VwSW5kZXgKICAgIGludGNfMSAvLyAxCiAgICAtCiAgICBkdXAKICAgIGd0eG5zIFR5cGVFbnVtCiAgICBpbnRjXzEgLy8gcGF5CiAgICA9PQogICAgYXNzZXJ0IC8vIHRyYW5zYWN0aW9uIHR5cGUgaXMgcGF5CiAgICAvLyBzbWFydF9jb250cmFjdHMvYmFuay9jb250cmFjdC5weToyNwogICAgLy8gQGFiaW1ldGhvZCgpCiAgICBjYWxsc3ViIGRlcG9zaXQKICAgIGl0b2IKICAgIGJ5dGVjXzEgLy8gMHgxNTFmN2M3NQogICAgc3dhcAogICAgY29uY2F0CiAgICBsb2cKICAgIGludGNfMSAvLyAxCiAgICByZXR1cm4KCm1haW5fYmFyZV9yb3V0aW5nQDEzOgogICAgLy8gc21hcnRfY29udHJhY3RzL2JhbmsvY29udHJhY3QucHk6MTMKICAgIC8vIGNsYXNzIEJhbmsoQVJDNENvbnRyYWN0KToKICAgIHR4biBPbkNvbXBsZXRpb24KICAgIGJueiBtYWluX2FmdGVyX2lmX2Vsc2VAMTUKICAgIHR4biBBcHBsaWNhdGlvbklECiAgICAhCiAgICBhc3NlcnQgLy8gY2FuIG9ubHkgY2FsbCB3aGVuIGNyZWF0aW5nCiAgICBpbnRjXzEgLy8gMQogICAgcmV0dXJuCgoKLy8gc21hcnRfY29udHJhY3RzLmJhbmsuY29udHJhY3QuQmFuay5kZXBvc2l0KG1lbW86IGJ5dGVzLCBwYXlfdHhuOiB1aW50NjQpIC0+IHVpbnQ2NDoKZGVwb3NpdDoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9iYW5rL2NvbnRyYWN0LnB5OjI3LTI4CiAgICAvLyBAYWJpbWV0aG9kKCkKICAgIC8vIGRlZiBkZXBvc2l0KHNlbGYsIG1lbW86IFN0cmluZywgcGF5X3R4bjogZ3R4bi5QYXltZW50VHJhbnNhY3Rpb24pIC0+IFVJbnQ2NDoKICAgIHByb3RvIDIgMQogICAgLy8gc21hcnRfY29udHJhY3RzL2JhbmsvY29udHJhY3QucHk6MzAKICAgIC8vIGFzc2VydCBub3Qgc2VsZi5wYXVzZWQsICJEZXBvc2l0cyBhcmUgcGF1c2VkIgogICAgaW50Y18wIC8vIDAKICAgIGJ5dGVjXzIgLy8gInBhdXNlZCIKICAgIGFwcF9nbG9iYWxfZ2V0X2V4CiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi5wYXVzZWQgZXhpc3RzCiAgICAhCiAgICBhc3NlcnQgLy8gRGVwb3NpdHMgYXJlIHBhdXNlZAogICAgLy8gc21hcnRfY29udHJhY3RzL2JhbmsvY29udHJhY3QucHk6MzEKICAgIC8vIGFzc2VydCBwYXlfdHhuLnJlY2VpdmVyID09IEdsb2JhbC5jdXJyZW50X2FwcGxpY2F0aW9uX2FkZHJlc3MsICJSZWNlaXZlciBtdXN0IGJlIHRoZSBjb250cmFjdCBhZGRyZXNzIgogICAgZnJhbWVfZGlnIC0xCiAgICBndHhucyBSZWNlaXZlcgogICAgZ2xvYmFsIEN1cnJlbnRBcHBsaWNhdGlvbkFkZHJlc3MKICAgID09CiAgICBhc3NlcnQgLy8gUmVjZWl2ZXIgbXVzdCBiZSB0aGUgY29udHJhY3QgYWRkcmVzcwogICAgLy8gc21hcnRfY29udHJhY3RzL2JhbmsvY29udHJhY3QucHk6MzIKICAgIC8vIGFzc2VydCBwYXlfdHhuLmFtb3VudCA+IDAsICJEZXBvc2l0IGFtb3VudCBtdXN0IGJlIGdyZWF0ZXIgdGhhbiB6ZXJvIgogICAgZnJhbWVfZGlnIC0xCiAgICBndHhucyBBbW91bnQKICAgIGR1cAogICAgYXNzZXJ0IC8vIERlcG9zaXQgYW1vdW50IG11c3QgYmUgZ3JlYXRlciB0aGFuIHplcm8KICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9iYW5rL2NvbnRyYWN0LnB5OjM0CiAgICAvLyBhbW91bnQsIGV4aXN0cyA9IHNlbGYuZGVwb3NpdHMubWF5YmUocGF5X3R4bi5zZW5kZXIpCiAgICBmcmFtZV9kaWcgLTEKICAgIGd0eG5zIFNlbmRlcgogICAgZHVwCiAgICBib3hfZ2V0CiAgICBzd2FwCiAgICBidG9pCiAgICBzd2FwCiAgICAvLyBzbWFydF9jb250cmFjdHMvYmFuay9jb250cmFjdC5weTozNQogICAgLy8gaWYgZXhpc3RzOgogICAgYnogZGVwb3NpdF9lbHNlX2JvZHlAMgogICAgLy8gc21hcnRfY29udHJhY3RzL2JhbmsvY29udHJhY3QucHk6MzYKICAgIC8vIHNlbGYuZGVwb3NpdHNbcGF5X3R4bi5zZW5kZXJdID0gYW1vdW50ICsgcGF5X3R4bi5hbW91bnQKICAgIGZyYW1lX2RpZyAyCiAgICBmcmFtZV9kaWcgMAogICAgKwogICAgaXRvYgogICAgZnJhbWVfZGlnIDEKICAgIHN3YXAKICAgIGJveF9wdXQKCmRlcG9zaXRfYWZ0ZXJfaWZfZWxzZUAzOgogICAgLy8gc21hcnRfY29udHJhY3RzL2JhbmsvY29udHJhY3QucHk6NDAKICAgIC8vIHNlbGYudG90YWxfZGVwb3NpdCArPSBwYXlfdHhuLmFtb3VudAogICAgaW50Y18wIC8vIDAKICAgIGJ5dGVjXzAgLy8gInRvdGFsX2RlcG9zaXQiCiAgICBhcHBfZ2xvYmFsX2dldF9leAogICAgYXNzZXJ0IC8vIGNoZWNrIHNlbGYudG90YWxfZGVwb3NpdCBleGlzdHMKICAgIGZyYW1lX2RpZyAwCiAgICArCiAgICBieXRlY18wIC8vICJ0b3RhbF9kZXBvc2l0IgogICAgc3dhcAogICAgYXBwX2dsb2JhbF9wdXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9iYW5rL2NvbnRyYWN0LnB5OjQxCiAgICAvLyByZXR1cm4gc2VsZi5kZXBvc2l0c1twYXlfdHhuLnNlbmRlcl0KICAgIGZyYW1lX2RpZyAxCiAgICBib3hfZ2V0CiAgICBzd2FwCiAgICBidG9pCiAgICBzd2FwCiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi5kZXBvc2l0cyBlbnRyeSBleGlzdHMKICAgIGZyYW1lX2J1cnkgMAogICAgcmV0c3ViCgpkZXBvc2l0X2Vsc2VfYm9keUAyOgogICAgLy8gc21hcnRfY29udHJhY3RzL2JhbmsvY29udHJhY3QucHk6MzgKICAgIC8vIHNlbGYuZGVwb3NpdHNbcGF5X3R4bi5zZW5kZXJdID0gcGF5X3R4bi5hbW91bnQKICAgIGZyYW1lX2RpZyAwCiAgICBpdG9iCiAgICBmcmFtZV9kaWcgMQogICAgc3dhcAogICAgYm94X3B1dAogICAgYiBkZXBvc2l0X2FmdGVyX2lmX2Vsc2VAMwoKCi8vIHNtYXJ0X2NvbnRyYWN0cy5iYW5rLmNvbnRyYWN0LkJhbmsud2l0aGRyYXcoYW1vdW50OiB1aW50NjQpIC0+IHVpbnQ2NDoKd2l0aGRyYXc6CiAgICAvLyBzbWFydF9jb250cmFjdHMvYmFuay9jb250cmFjdC5weTo0My00NAogICAgLy8gQGFiaW1ldGhvZCgpCiAgICAvLyBkZWYgd2l0aGRyYXcoc2VsZiwgYW1vdW50OiBVSW50NjQpIC0+IFVJbnQ2NDoKICAgIHByb3RvIDEgMQogICAgLy8gc21hcnRfY29udHJhY3RzL2JhbmsvY29udHJhY3QucHk6NDYKICAgIC8vIGN1cnJlbnQsIGV4aXN0cyA9IHNlbGYuZGVwb3NpdHMubWF5YmUoVHhuLnNlbmRlcikKICAgIHR4biBTZW5kZXIKICAgIGJveF9nZXQKICAgIHN3YXAKICAgIGJ0b2kKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9iYW5rL2NvbnRyYWN0LnB5OjQ3CiAgICAvLyBhc3NlcnQgZXhpc3RzLCAiTm8gZGVwb3NpdHMgZm91bmQgZm9yIHRoaXMgYWNjb3VudCIKICAgIHN3YXAKICAgIGFzc2VydCAvLyBObyBkZXBvc2l0cyBmb3VuZCBmb3IgdGhpcyBhY2NvdW50CiAgICAvLyBzbWFydF9jb250cmFjdHMvYmFuay9jb250cmFjdC5weTo0OAogICAgLy8gYXNzZXJ0IGFtb3VudCA+IDAsICJXaXRoZHJhd2FsIGFtb3VudCBtdXN0IGJlIGdyZWF0ZXIgdGhhbiB6ZXJvIgogICAgZnJhbWVfZGlnIC0xCiAgICBhc3NlcnQgLy8gV2l0aGRyYXdhbCBhbW91bnQgbXVzdCBiZSBncmVhdGVyIHRoYW4gemVybwogICAgLy8gc21hcnRfY29udHJhY3RzL2JhbmsvY29udHJhY3QucHk6NDkKICAgIC8vIGFzc2VydCBhbW91bnQgPD0gY3VycmVudCwgIldpdGhkcmF3YWwgYW1vdW50IGV4Y2VlZHMgYmFsYW5jZSIKICAgIGZyYW1lX2RpZyAtMQogICAgZGlnIDEKICAgIDw9CiAgICBhc3NlcnQgLy8gV2l0aGRyYXdhbCBhbW91bnQgZXhjZWVkcyBiYWxhbmNlCiAgICAvLyBzbWFydF9jb250cmFjdHMvYmFuay9jb250cmFjdC5weTo1MQogICAgLy8gaXR4bi5QYXltZW50KHJlY2VpdmVyPVR4bi5zZW5kZXIsIGFtb3VudD1hbW91bnQsIGZlZT0wKS5zdWJtaXQoKQogICAgaXR4bl9iZWdpbgogICAgdHhuIFNlbmRlcgogICAgZnJhbWVfZGlnIC0xCiAgICBpdHhuX2ZpZWxkIEFtb3VudAogICAgaXR4bl9maWVsZCBSZWNlaXZlcgogICAgaW50Y18xIC8vIHBheQogICAgaXR4bl9maWVsZCBUeXBlRW51bQogICAgaW50Y18wIC8vIDAKICAgIGl0eG5fZmllbGQgRmVlCiAgICBpdHhuX3N1Ym1pdAogICAgLy8gc21hcnRfY29udHJhY3RzL2JhbmsvY29udHJhY3QucHk6NTMKICAgIC8vIHJlbWFpbmluZyA9IGN1cnJlbnQgLSBhbW91bnQKICAgIGZyYW1lX2RpZyAtMQogICAgLQogICAgZHVwCiAgICAvLyBzbWFydF9jb250cmFjdHMvYmFuay9jb250cmFjdC5weTo1NAogICAgLy8gaWYgcmVtYWluaW5nID09IFVJbnQ2NCgwKToKICAgIGJueiB3aXRoZHJhd19lbHNlX2JvZHlAMwogICAgLy8gc21hcnRfY29udHJhY3RzL2JhbmsvY29udHJhY3QucHk6NTUKICAgIC8vIGRlbCBzZWxmLmRlcG9zaXRzW1R4bi5zZW5kZXJdCiAgICB0eG4gU2VuZGVyCiAgICBib3hfZGVsCiAgICBwb3AKCndpdGhkcmF3X2FmdGVyX2lmX2Vsc2VANDoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9iYW5rL2NvbnRyYWN0LnB5OjU5CiAgICAvLyByZXR1cm4gcmVtYWluaW5nCiAgICBmcmFtZV9kaWcgMAogICAgc3dhcAogICAgcmV0c3ViCgp3aXRoZHJhd19lbHNlX2JvZHlAMzoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9iYW5rL2NvbnRyYWN0LnB5OjU3CiAgICAvLyBzZWxmLmRlcG9zaXRzW1R4bi5zZW5kZXJdID0gcmVtYWluaW5nCiAgICB0eG4gU2VuZGVyCiAgICBmcmFtZV9kaWcgMAogICAgaXRvYgogICAgYm94X3B1dAogICAgYiB3aXRoZHJhd19hZnRlcl9pZl9lbHNlQDQKCgovLyBzbWFydF9jb250cmFjdHMuYmFuay5jb250cmFjdC5CYW5rLmJhbGFuY2Vfb2YoYWNjb3VudDogYnl0ZXMpIC0+IHVpbnQ2NDoKYmFsYW5jZV9vZjoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9iYW5rL2NvbnRyYWN0LnB5OjYxLTYyCiAgICAvLyBAYWJpbWV0aG9kKHJlYWRvbmx5PVRydWUpCiAgICAvLyBkZWYgYmFsYW5jZV9vZihzZWxmLCBhY2NvdW50OiBBZGRyZXNzKSAtPiBVSW50NjQ6CiAgICBwcm90byAxIDEKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9iYW5rL2NvbnRyYWN0LnB5OjY0CiAgICAvLyByZXR1cm4gc2VsZi5kZXBvc2l0cy5nZXQoYWNjb3VudC5uYXRpdmUsIGRlZmF1bHQ9VUludDY0KDApKQogICAgZnJhbWVfZGlnIC0xCiAgICBib3hfZ2V0CiAgICBzd2FwCiAgICBidG9pCiAgICBpbnRjXzAgLy8gMAogICAgc3dhcAogICAgdW5jb3ZlciAyCiAgICBzZWxlY3QKICAgIHJldHN1YgoKCi8vIHNtYXJ0X2NvbnRyYWN0cy5iYW5rLmNvbnRyYWN0LkJhbmsuc2V0X3BhdXNlZChwYXVzZWQ6IHVpbnQ2NCkgLT4gdm9pZDoKc2V0X3BhdXNlZDoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9iYW5rL2NvbnRyYWN0LnB5OjY2LTY3CiAgICAvLyBAYWJpbWV0aG9kKCkKICAgIC8vIGRlZiBzZXRfcGF1c2VkKHNlbGYsIHBhdXNlZDogYm9vbCkgLT4gTm9uZTogICMgbm9xYTogRkJUMDAxIC0gQUJJIGFyZ3MgYXJlIHBvc2l0aW9uYWwKICAgIHByb3RvIDEgMAogICAgLy8gc21hcnRfY29udHJhY3RzL2JhbmsvY29udHJhY3QucHk6NjkKICAgIC8vIGFzc2VydCBUeG4uc2VuZGVyID09IEdsb2JhbC5jcmVhdG9yX2FkZHJlc3MsICJPbmx5IHRoZSBjcmVhdG9yIGNhbiBwYXVzZSBkZXBvc2l0cyIKICAgIHR4biBTZW5kZXIKICAgIGdsb2JhbCBDcmVhdG9yQWRkcmVzcwogICAgPT0KICAgIGFzc2VydCAvLyBPbmx5IHRoZSBjcmVhdG9yIGNhbiBwYXVzZSBkZXBvc2l0cwogICAgLy8gc21hcnRfY29udHJhY3RzL2JhbmsvY29udHJhY3QucHk6NzAKICAgIC8vIHNlbGYucGF1c2VkID0gcGF1c2VkCiAgICBieXRlY18yIC8vICJwYXVzZWQiCiAgICBmcmFtZV9kaWcgLTEKICAgIGFwcF9nbG9iYWxfcHV0CiAgICByZXRzdWIKCgovLyBzbWFydF9jb250cmFjdHMuYmFuay5jb250cmFjdC5CYW5rLmFwcHJvdmVfc3VjY2Vzc29yKHByb2dyYW1faGFzaDogYnl0ZXMpIC0+IHVpbnQ2NDoKYXBwcm92ZV9zdWNjZXNzb3I6CiAgICAvLyBzbWFydF9jb250cmFjdHMvYmFuay9jb250cmFjdC5weTo3Mi03MwogICAgLy8gQGFiaW1ldGhvZCgpCiAgICAvLyBkZWYgYXBwcm92ZV9zdWNjZXNzb3Ioc2VsZiwgcHJvZ3JhbV9oYXNoOiBCeXRlcykgLT4gVUludDY0OgogICAgcHJvdG8gMSAxCiAgICAvLyBzbWFydF9jb250cmFjdHMvYmFuay9jb250cmFjdC5weTo3NQogICAgLy8gYXNzZXJ0IFR4bi5zZW5kZXIgPT0gR2xvYmFsLmNyZWF0b3JfYWRkcmVzcywgIk9ubHkgdGhlIGNyZWF0b3IgY2FuIGFwcHJvdmUgYSBzdWNjZXNzb3IiCiAgICB0eG4gU2VuZGVyCiAgICBnbG9iYWwgQ3JlYXRvckFkZHJlc3MKICAgID09CiAgICBhc3NlcnQgLy8gT25seSB0aGUgY3JlYXRvciBjYW4gYXBwcm92ZSBhIHN1Y2Nlc3NvcgogICAgLy8gc21hcnRfY29udHJhY3RzL2JhbmsvY29udHJhY3QucHk6NzYKICAgIC8vIGFzc2VydCBwcm9ncmFtX2hhc2gubGVuZ3RoID09IDMyLCAiUHJvZ3JhbSBoYXNoIG11c3QgYmUgMzIgYnl0ZXMiCiAgICBmcmFtZV9kaWcgLTEKICAgIGxlbgogICAgaW50Y18zIC8vIDMyCiAgICA9PQogICAgYXNzZXJ0IC8vIFByb2dyYW0gaGFzaCBtdXN0IGJlIDMyIGJ5dGVzCiAgICAvLyBzbWFydF9jb250cmFjdHMvYmFuay9jb250cmFjdC5weTo3NwogICAgLy8gc2VsZi5zdWNjZXNzb3JfaGFzaCA9IHByb2dyYW1faGFzaAogICAgYnl0ZWMgNCAvLyAic3VjY2Vzc29yX2hhc2giCiAgICBmcmFtZV9kaWcgLTEKICAgIGFwcF9nbG9iYWxfcHV0CiAgICAvLyBzbWFydF9jb250cmFjdHMvYmFuay9jb250cmFjdC5weTo3OAogICAgLy8gc2VsZi5zdWNjZXNzb3Jfcm91bmQgPSBHbG9iYWwucm91bmQgKyBNSUdSQVRJT05fTk9USUNFX1JPVU5EUwogICAgZ2xvYmFsIFJvdW5kCiAgICBwdXNoaW50IDMwMDAwIC8vIDMwMDAwCiAgICArCiAgICBieXRlY18zIC8vICJzdWNjZXNzb3Jfcm91bmQiCiAgICBzd2FwCiAgICBhcHBfZ2xvYmFsX3B1dAogICAgLy8gc21hcnRfY29udHJhY3RzL2JhbmsvY29udHJhY3QucHk6NzkKICAgIC8vIHJldHVybiBzZWxmLnN1Y2Nlc3Nvcl9yb3VuZAogICAgaW50Y18wIC8vIDAKICAgIGJ5dGVjXzMgLy8gInN1Y2Nlc3Nvcl9yb3VuZCIKICAgIGFwcF9nbG9iYWxfZ2V0X2V4CiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi5zdWNjZXNzb3Jfcm91bmQgZXhpc3RzCiAgICByZXRzdWIKCgovLyBzbWFydF9jb250cmFjdHMuYmFuay5jb250cmFjdC5CYW5rLmV4cG9ydF9kZXBvc2l0cyhlbnRyaWVzOiBieXRlcywgZGVzdGluYXRpb246IHVpbnQ2NCkgLT4gdWludDY0OgpleHBvcnRfZGVwb3NpdHM6CiAgICAvLyBzbWFydF9jb250cmFjdHMvYmFuay9jb250cmFjdC5weTo4MS04MgogICAgLy8gQGFiaW1ldGhvZCgpCiAgICAvLyBkZWYgZXhwb3J0X2RlcG9zaXRzKHNlbGYsIGVudHJpZXM6IER5bmFtaWNBcnJheVtEZXBvc2l0RW50cnldLCBkZXN0aW5hdGlvbjogQXBwbGljYXRpb24pIC0+IFVJbnQ2NDoKICAgIHByb3RvIDIgMQogICAgaW50Y18wIC8vIDAKICAgIGR1cAogICAgcHVzaGJ5dGVzICIiCiAgICAvLyBzbWFydF9jb250cmFjdHMvYmFuay9jb250cmFjdC5weTo4NAogICAgLy8gYXNzZXJ0IFR4bi5zZW5kZXIgPT0gR2xvYmFsLmNyZWF0b3JfYWRkcmVzcywgIk9ubHkgdGhlIGNyZWF0b3IgY2FuIGV4cG9ydCBkZXBvc2l0cyIKICAgIHR4biBTZW5kZXIKICAgIGdsb2JhbCBDcmVhdG9yQWRkcmVzcwogICAgPT0KICAgIGFzc2VydCAvLyBPbmx5IHRoZSBjcmVhdG9yIGNhbiBleHBvcnQgZGVwb3NpdHMKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9iYW5rL2NvbnRyYWN0LnB5Ojg1CiAgICAvLyBhc3NlcnQgc2VsZi5wYXVzZWQsICJEZXBvc2l0cyBtdXN0IGJlIHBhdXNlZCBiZWZvcmUgZXhwb3J0aW5nIgogICAgaW50Y18wIC8vIDAKICAgIGJ5dGVjXzIgLy8gInBhdXNlZCIKICAgIGFwcF9nbG9iYWxfZ2V0X2V4CiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi5wYXVzZWQgZXhpc3RzCiAgICBhc3NlcnQgLy8gRGVwb3NpdHMgbXVzdCBiZSBwYXVzZWQgYmVmb3JlIGV4cG9ydGluZwogICAgLy8gc21hcnRfY29udHJhY3RzL2JhbmsvY29udHJhY3QucHk6ODYKICAgIC8vIGFzc2VydCBkZXN0aW5hdGlvbi5jcmVhdG9yID09IEdsb2JhbC5jcmVhdG9yX2FkZHJlc3MsICJEZXN0aW5hdGlvbiBtdXN0IGhhdmUgdGhlIHNhbWUgY3JlYXRvciIKICAgIGZyYW1lX2RpZyAtMQogICAgYXBwX3BhcmFtc19nZXQgQXBwQ3JlYXRvcgogICAgYXNzZXJ0IC8vIGFwcGxpY2F0aW9uIGV4aXN0cwogICAgZ2xvYmFsIENyZWF0b3JBZGRyZXNzCiAgICA9PQogICAgYXNzZXJ0IC8vIERlc3RpbmF0aW9uIG11c3QgaGF2ZSB0aGUgc2FtZSBjcmVhdG9yCiAgICAvLyBzbWFydF9jb250cmFjdHMvYmFuay9jb250cmFjdC5weTo4NwogICAgLy8gYXNzZXJ0IG9wLnNoYTUxMl8yNTYoZGVzdGluYXRpb24uYXBwcm92YWxfcHJvZ3JhbSkgPT0gc2VsZi5zdWNjZXNzb3JfaGFzaCwgIkRlc3RpbmF0aW9uIGlzIG5vdCBhcHByb3ZlZCIKICAgIGZyYW1lX2RpZyAtMQogICAgYXBwX3BhcmFtc19nZXQgQXBwQXBwcm92YWxQcm9ncmFtCiAgICBhc3NlcnQgLy8gYXBwbGljYXRpb24gZXhpc3RzCiAgICBzaGE1MTJfMjU2CiAgICBpbnRjXzAgLy8gMAogICAgYnl0ZWMgNCAvLyAic3VjY2Vzc29yX2hhc2giCiAgICBhcHBfZ2xvYmFsX2dldF9leAogICAgYXNzZXJ0IC8vIGNoZWNrIHNlbGYuc3VjY2Vzc29yX2hhc2ggZXhpc3RzCiAgICA9PQogICAgYXNzZXJ0IC8vIERlc3RpbmF0aW9uIGlzIG5vdCBhcHByb3ZlZAogICAgLy8gc21hcnRfY29udHJhY3RzL2JhbmsvY29udHJhY3QucHk6ODgKICAgIC8vIGFzc2VydCBHbG9iYWwucm91bmQgPj0gc2VsZi5zdWNjZXNzb3Jfcm91bmQsICJUaGUgc3VjY2Vzc29yJ3Mgbm90aWNlIHBlcmlvZCBoYXMgbm90IHBhc3NlZCIKICAgIGdsb2JhbCBSb3VuZAogICAgaW50Y18wIC8vIDAKICAgIGJ5dGVjXzMgLy8gInN1Y2Nlc3Nvcl9yb3VuZCIKICAgIGFwcF9nbG9iYWxfZ2V0X2V4CiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi5zdWNjZXNzb3Jfcm91bmQgZXhpc3RzCiAgICA+PQogICAgYXNzZXJ0IC8vIFRoZSBzdWNjZXNzb3IncyBub3RpY2UgcGVyaW9kIGhhcyBub3QgcGFzc2VkCiAgICAvLyBzbWFydF9jb250cmFjdHMvYmFuay9jb250cmFjdC5weTo5MAogICAgLy8gZXhwb3J0ZWQgPSBVSW50NjQoMCkKICAgIGludGNfMCAvLyAwCiAgICAvLyBzbWFydF9jb250cmFjdHMvYmFuay9jb250cmFjdC5weTo5MQogICAgLy8gZm9yIGluZGV4IGluIHVyYW5nZShlbnRyaWVzLmxlbmd0aCk6CiAgICBmcmFtZV9kaWcgLTIKICAgIGludGNfMCAvLyAwCiAgICBleHRyYWN0X3VpbnQxNgogICAgaW50Y18wIC8vIDAKCmV4cG9ydF9kZXBvc2l0c19mb3JfaGVhZGVyQDE6CiAgICAvLyBzbWFydF9jb250cmFjdHMvYmFuay9jb250cmFjdC5weTo5MQogICAgLy8gZm9yIGluZGV4IGluIHVyYW5nZShlbnRyaWVzLmxlbmd0aCk6CiAgICBmcmFtZV9kaWcgNQogICAgZnJhbWVfZGlnIDQKICAgIDwKICAgIGJ6IGV4cG9ydF9kZXBvc2l0c19hZnRlcl9mb3JAOAogICAgLy8gc21hcnRfY29udHJhY3RzL2JhbmsvY29udHJhY3QucHk6OTIKICAgIC8vIGFjY291bnQsIGV4cGVjdGVkID0gZW50cmllc1tpbmRleF0ubmF0aXZlCiAgICBmcmFtZV9kaWcgLTIKICAgIGV4dHJhY3QgMiAwCiAgICBmcmFtZV9kaWcgNQogICAgaW50Y18yIC8vIDQwCiAgICAqCiAgICBpbnRjXzIgLy8gNDAKICAgIGV4dHJhY3QzIC8vIG9uIGVycm9yOiBJbmRleCBhY2Nlc3MgaXMgb3V0IG9mIGJvdW5kcwogICAgZHVwCiAgICBmcmFtZV9idXJ5IDEKICAgIGV4dHJhY3QgMCAzMiAvLyBvbiBlcnJvcjogSW5kZXggYWNjZXNzIGlzIG91dCBvZiBib3VuZHMKICAgIGR1cAogICAgZnJhbWVfYnVyeSAwCiAgICAvLyBzbWFydF9jb250cmFjdHMvYmFuay9jb250cmFjdC5weTo5MwogICAgLy8gYW1vdW50LCBleGlzdHMgPSBzZWxmLmRlcG9zaXRzLm1heWJlKGFjY291bnQubmF0aXZlKQogICAgYm94X2dldAogICAgc3dhcAogICAgYnRvaQogICAgZnJhbWVfYnVyeSAyCiAgICAvLyBzbWFydF9jb250cmFjdHMvYmFuay9jb250cmFjdC5weTo5NAogICAgLy8gYXNzZXJ0IGV4aXN0cyBhbmQgYW1vdW50ID09IGV4cGVjdGVkLm5hdGl2ZSwgIkV4cG9ydHMgbXVzdCBtb3ZlIHdob2xlIGJhbGFuY2VzIgogICAgYnogZXhwb3J0X2RlcG9zaXRzX2Jvb2xfZmFsc2VANQogICAgZnJhbWVfZGlnIDEKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9iYW5rL2NvbnRyYWN0LnB5OjkyCiAgICAvLyBhY2NvdW50LCBleHBlY3RlZCA9IGVudHJpZXNbaW5kZXhdLm5hdGl2ZQogICAgaW50Y18zIC8vIDMyCiAgICAvLyBzbWFydF9jb250cmFjdHMvYmFuay9jb250cmFjdC5weTo5NAogICAgLy8gYXNzZXJ0IGV4aXN0cyBhbmQgYW1vdW50ID09IGV4cGVjdGVkLm5hdGl2ZSwgIkV4cG9ydHMgbXVzdCBtb3ZlIHdob2xlIGJhbGFuY2VzIgogICAgZXh0cmFjdF91aW50NjQKICAgIGZyYW1lX2RpZyAyCiAgICA9PQogICAgYnogZXhwb3J0X2RlcG9zaXRzX2Jvb2xfZmFsc2VANQogICAgaW50Y18xIC8vIDEKCmV4cG9ydF9kZXBvc2l0c19ib29sX21lcmdlQDY6CiAgICAvLyBzbWFydF9jb250cmFjdHMvYmFuay9jb250cmFjdC5weTo5NAogICAgLy8gYXNzZXJ0IGV4aXN0cyBhbmQgYW1vdW50ID09IGV4cGVjdGVkLm5hdGl2ZSwgIkV4cG9ydHMgbXVzdCBtb3ZlIHdob2xlIGJhbGFuY2VzIgogICAgYXNzZXJ0IC8vIEV4cG9ydHMgbXVzdCBtb3ZlIHdob2xlIGJhbGFuY2VzCiAgICAvLyBzbWFydF9jb250cmFjdHMvYmFuay9jb250cmFjdC5weTo5NQogICAgLy8gZXhwb3J0ZWQgKz0gYW1vdW50CiAgICBmcmFtZV9kaWcgMwogICAgZnJhbWVfZGlnIDIKICAgICsKICAgIGZyYW1lX2J1cnkgMwogICAgLy8gc21hcnRfY29udHJhY3RzL2JhbmsvY29udHJhY3QucHk6OTYKICAgIC8vIGRlbCBzZWxmLmRlcG9zaXRzW2FjY291bnQubmF0aXZlXQogICAgZnJhbWVfZGlnIDAKICAgIGJveF9kZWwKICAgIHBvcAogICAgLy8gc21hcnRfY29udHJhY3RzL2JhbmsvY29udHJhY3QucHk6OTEKICAgIC8vIGZvciBpbmRleCBpbiB1cmFuZ2UoZW50cmllcy5sZW5ndGgpOgogICAgZnJhbWVfZGlnIDUKICAgIGludGNfMSAvLyAxCiAgICArCiAgICBmcmFtZV9idXJ5IDUKICAgIGIgZXhwb3J0X2RlcG9zaXRzX2Zvcl9oZWFkZXJAMQoKZXhwb3J0X2RlcG9zaXRzX2Jvb2xfZmFsc2VANToKICAgIGludGNfMCAvLyAwCiAgICBiIGV4cG9ydF9kZXBvc2l0c19ib29sX21lcmdlQDYKCmV4cG9ydF9kZXBvc2l0c19hZnRlcl9mb3JAODoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9iYW5rL2NvbnRyYWN0LnB5Ojk4CiAgICAvLyBpZiBleHBvcnRlZCA+IDA6CiAgICBmcmFtZV9kaWcgMwogICAgYnogZXhwb3J0X2RlcG9zaXRzX2FmdGVyX2lmX2Vsc2VAMTEKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9iYW5rL2NvbnRyYWN0LnB5Ojk5CiAgICAvLyBzZWxmLnRvdGFsX2RlcG9zaXQgLT0gZXhwb3J0ZWQKICAgIGludGNfMCAvLyAwCiAgICBieXRlY18wIC8vICJ0b3RhbF9kZXBvc2l0IgogICAgYXBwX2dsb2JhbF9nZXRfZXgKICAgIGFzc2VydCAvLyBjaGVjayBzZWxmLnRvdGFsX2RlcG9zaXQgZXhpc3RzCiAgICBmcmFtZV9kaWcgMwogICAgZHVwCiAgICBjb3ZlciAyCiAgICAtCiAgICBieXRlY18wIC8vICJ0b3RhbF9kZXBvc2l0IgogICAgc3dhcAogICAgYXBwX2dsb2JhbF9wdXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9iYW5rL2NvbnRyYWN0LnB5OjEwMAogICAgLy8gaXR4bi5QYXltZW50KHJlY2VpdmVyPWRlc3RpbmF0aW9uLmFkZHJlc3MsIGFtb3VudD1leHBvcnRlZCwgZmVlPTApLnN1Ym1pdCgpCiAgICBpdHhuX2JlZ2luCiAgICBmcmFtZV9kaWcgLTEKICAgIGFwcF9wYXJhbXNfZ2V0IEFwcEFkZHJlc3MKICAgIGFzc2VydCAvLyBhcHBsaWNhdGlvbiBleGlzdHMKICAgIGl0eG5fZmllbGQgUmVjZWl2ZXIKICAgIGl0eG5fZmllbGQgQW1vdW50CiAgICBpbnRjXzEgLy8gcGF5CiAgICBpdHhuX2ZpZWxkIFR5cGVFbnVtCiAgICBpbnRjXzAgLy8gMAogICAgaXR4bl9maWVsZCBGZWUKICAgIGl0eG5fc3VibWl0CgpleHBvcnRfZGVwb3NpdHNfYWZ0ZXJfaWZfZWxzZUAxMToKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9iYW5rL2NvbnRyYWN0LnB5OjEwMQogICAgLy8gcmV0dXJuIGV4cG9ydGVkCiAgICBmcmFtZV9kaWcgMwogICAgZnJhbWVfYnVyeSAwCiAgICByZXRzdWIKCgovLyBzbWFydF9jb250cmFjdHMuYmFuay5jb250cmFjdC5CYW5rLmltcG9ydF9kZXBvc2l0cyhlbnRyaWVzOiBieXRlcykgLT4gdWludDY0OgppbXBvcnRfZGVwb3NpdHM6CiAgICAvLyBzbWFydF9jb250cmFjdHMvYmFuay9jb250cmFjdC5weToxMDMtMTA0CiAgICAvLyBAYWJpbWV0aG9kKCkKICAgIC8vIGRlZiBpbXBvcnRfZGVwb3NpdHMoc2VsZiwgZW50cmllczogRHluYW1pY0FycmF5W0RlcG9zaXRFbnRyeV0pIC0+IFVJbnQ2NDoKICAgIHByb3RvIDEgMQogICAgLy8gc21hcnRfY29udHJhY3RzL2JhbmsvY29udHJhY3QucHk6MTA2CiAgICAvLyBhc3NlcnQgVHhuLnNlbmRlciA9PSBHbG9iYWwuY3JlYXRvcl9hZGRyZXNzLCAiT25seSB0aGUgY3JlYXRvciBjYW4gaW1wb3J0IGRlcG9zaXRzIgogICAgdHhuIFNlbmRlcgogICAgZ2xvYmFsIENyZWF0b3JBZGRyZXNzCiAgICA9PQogICAgYXNzZXJ0IC8vIE9ubHkgdGhlIGNyZWF0b3IgY2FuIGltcG9ydCBkZXBvc2l0cwogICAgLy8gc21hcnRfY29udHJhY3RzL2JhbmsvY29udHJhY3QucHk6MTA3CiAgICAvLyBhc3NlcnQgVHhuLmdyb3VwX2luZGV4ID4gMCwgIkltcG9ydHMgbXVzdCBmb2xsb3cgdGhlaXIgZXhwb3J0IgogICAgdHhuIEdyb3VwSW5kZXgKICAgIGFzc2VydCAvLyBJbXBvcnRzIG11c3QgZm9sbG93IHRoZWlyIGV4cG9ydAogICAgLy8gc21hcnRfY29udHJhY3RzL2JhbmsvY29udHJhY3QucHk6MTA4CiAgICAvLyBleHBvcnQgPSBndHhuLkFwcGxpY2F0aW9uQ2FsbFRyYW5zYWN0aW9uKFR4bi5ncm91cF9pbmRleCAtIDEpCiAgICB0eG4gR3JvdXBJbmRleAogICAgaW50Y18xIC8vIDEKICAgIC0KICAgIGR1cAogICAgZ3R4bnMgVHlwZUVudW0KICAgIHB1c2hpbnQgNiAvLyBhcHBsCiAgICA9PQogICAgYXNzZXJ0IC8vIHRyYW5zYWN0aW9uIHR5cGUgaXMgYXBwbAogICAgLy8gc21hcnRfY29udHJhY3RzL2JhbmsvY29udHJhY3QucHk6MTEwCiAgICAvLyBleHBvcnQuYXBwX2FyZ3MoMCkgPT0gYXJjNC5hcmM0X3NpZ25hdHVyZSgiZXhwb3J0X2RlcG9zaXRzKChhZGRyZXNzLHVpbnQ2NClbXSxhcHBsaWNhdGlvbil1aW50NjQiKQogICAgZHVwCiAgICBpbnRjXzAgLy8gMAogICAgZ3R4bnNhcyBBcHBsaWNhdGlvbkFyZ3MKICAgIGJ5dGVjIDUgLy8gbWV0aG9kICJleHBvcnRfZGVwb3NpdHMoKGFkZHJlc3MsdWludDY0KVtdLGFwcGxpY2F0aW9uKXVpbnQ2NCIKICAgID09CiAgICAvLyBzbWFydF9jb250cmFjdHMvYmFuay9jb250cmFjdC5weToxMDktMTExCiAgICAvLyBhc3NlcnQgKAogICAgLy8gICAgIGV4cG9ydC5hcHBfYXJncygwKSA9PSBhcmM0LmFyYzRfc2lnbmF0dXJlKCJleHBvcnRfZGVwb3NpdHMoKGFkZHJlc3MsdWludDY0KVtdLGFwcGxpY2F0aW9uKXVpbnQ2NCIpCiAgICAvLyApLCAiSW1wb3J0cyBtdXN0IGZvbGxvdyB0aGVpciBleHBvcnQiCiAgICBhc3NlcnQgLy8gSW1wb3J0cyBtdXN0IGZvbGxvdyB0aGVpciBleHBvcnQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9iYW5rL2NvbnRyYWN0LnB5OjExMgogICAgLy8gYXNzZXJ0IGV4cG9ydC5hcHBfYXJncygxKSA9PSBlbnRyaWVzLmJ5dGVzLCAiSW1wb3J0ZWQgZW50cmllcyBtdXN0IG1hdGNoIHRoZSBleHBvcnQiCiAgICBkdXAKICAgIGludGNfMSAvLyAxCiAgICBndHhuc2FzIEFwcGxpY2F0aW9uQXJncwogICAgZnJhbWVfZGlnIC0xCiAgICA9PQogICAgYXNzZXJ0IC8vIEltcG9ydGVkIGVudHJpZXMgbXVzdCBtYXRjaCB0aGUgZXhwb3J0CiAgICAvLyBzbWFydF9jb250cmFjdHMvYmFuay9jb250cmFjdC5weToxMTMKICAgIC8vIGFzc2VydCBleHBvcnQuYXBwcyhvcC5idG9pKGV4cG9ydC5hcHBfYXJncygyKSkpID09IEdsb2JhbC5jdXJyZW50X2FwcGxpY2F0aW9uX2lkLCAiVGhlIGV4cG9ydCBtdXN0IHBheSB0aGlzIGFwcCIKICAgIGR1cAogICAgcHVzaGludCAyIC8vIDIKICAgIGd0eG5zYXMgQXBwbGljYXRpb25BcmdzCiAgICBidG9pCiAgICBkaWcgMQogICAgc3dhcAogICAgZ3R4bnNhcyBBcHBsaWNhdGlvbnMKICAgIGdsb2JhbCBDdXJyZW50QXBwbGljYXRpb25JRAogICAgPT0KICAgIGFzc2VydCAvLyBUaGUgZXhwb3J0IG11c3QgcGF5IHRoaXMgYXBwCiAgICAvLyBzbWFydF9jb250cmFjdHMvYmFuay9jb250cmFjdC5weToxMTQKICAgIC8vIGFzc2VydCBleHBvcnQuYXBwX2lkLmNyZWF0b3IgPT0gR2xvYmFsLmNyZWF0b3JfYWRkcmVzcywgIlRoZSBleHBvcnQgbXVzdCBjb21lIGZyb20gdGhlIHNhbWUgY3JlYXRvciIKICAgIGd0eG5zIEFwcGxpY2F0aW9uSUQKICAgIGFwcF9wYXJhbXNfZ2V0IEFwcENyZWF0b3IKICAgIGFzc2VydCAvLyBhcHBsaWNhdGlvbiBleGlzdHMKICAgIGdsb2JhbCBDcmVhdG9yQWRkcmVzcwogICAgPT0KICAgIGFzc2VydCAvLyBUaGUgZXhwb3J0IG11c3QgY29tZSBmcm9tIHRoZSBzYW1lIGNyZWF0b3IKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9iYW5rL2NvbnRyYWN0LnB5OjExNgogICAgLy8gaW1wb3J0ZWQgPSBVSW50NjQoMCkKICAgIGludGNfMCAvLyAwCiAgICAvLyBzbWFydF9jb250cmFjdHMvYmFuay9jb250cmFjdC5weToxMTcKICAgIC8vIGZvciBpbmRleCBpbiB1cmFuZ2UoZW50cmllcy5sZW5ndGgpOgogICAgZnJhbWVfZGlnIC0xCiAgICBpbnRjXzAgLy8gMAogICAgZXh0cmFjdF91aW50MTYKICAgIGludGNfMCAvLyAwCgppbXBvcnRfZGVwb3NpdHNfZm9yX2hlYWRlckAxOgogICAgLy8gc21hcnRfY29udHJhY3RzL2JhbmsvY29udHJhY3QucHk6MTE3CiAgICAvLyBmb3IgaW5kZXggaW4gdXJhbmdlKGVudHJpZXMubGVuZ3RoKToKICAgIGZyYW1lX2RpZyAyCiAgICBmcmFtZV9kaWcgMQogICAgPAogICAgYnogaW1wb3J0X2RlcG9zaXRzX2FmdGVyX2ZvckA0CiAgICAvLyBzbWFydF9jb250cmFjdHMvYmFuay9jb250cmFjdC5weToxMTgKICAgIC8vIGFkZHJlc3MsIGFtb3VudCA9IGVudHJpZXNbaW5kZXhdLm5hdGl2ZQogICAgZnJhbWVfZGlnIC0xCiAgICBleHRyYWN0IDIgMAogICAgZnJhbWVfZGlnIDIKICAgIGR1cAogICAgY292ZXIgMgogICAgaW50Y18yIC8vIDQwCiAgICAqCiAgICBpbnRjXzIgLy8gNDAKICAgIGV4dHJhY3QzIC8vIG9uIGVycm9yOiBJbmRleCBhY2Nlc3MgaXMgb3V0IG9mIGJvdW5kcwogICAgZHVwCiAgICBleHRyYWN0IDAgMzIgLy8gb24gZXJyb3I6IEluZGV4IGFjY2VzcyBpcyBvdXQgb2YgYm91bmRzCiAgICAvLyBzbWFydF9jb250cmFjdHMvYmFuay9jb250cmFjdC5weToxMjAKICAgIC8vIHNlbGYuZGVwb3NpdHNbYWNjb3VudF0gPSBzZWxmLmRlcG9zaXRzLmdldChhY2NvdW50LCBkZWZhdWx0PVVJbnQ2NCgwKSkgKyBhbW91bnQubmF0aXZlCiAgICBkdXAKICAgIGJveF9nZXQKICAgIHN3YXAKICAgIGJ0b2kKICAgIGludGNfMCAvLyAwCiAgICBzd2FwCiAgICB1bmNvdmVyIDIKICAgIHNlbGVjdAogICAgdW5jb3ZlciAyCiAgICAvLyBzbWFydF9jb250cmFjdHMvYmFuay9jb250cmFjdC5weToxMTgKICAgIC8vIGFkZHJlc3MsIGFtb3VudCA9IGVudHJpZXNbaW5kZXhdLm5hdGl2ZQogICAgaW50Y18zIC8vIDMyCiAgICAvLyBzbWFydF9jb250cmFjdHMvYmFuay9jb250cmFjdC5weToxMjAKICAgIC8vIHNlbGYuZGVwb3NpdHNbYWNjb3VudF0gPSBzZWxmLmRlcG9zaXRzLmdldChhY2NvdW50LCBkZWZhdWx0PVVJbnQ2NCgwKSkgKyBhbW91bnQubmF0aXZlCiAgICBleHRyYWN0X3VpbnQ2NAogICAgc3dhcAogICAgZGlnIDEKICAgICsKICAgIGl0b2IKICAgIHVuY292ZXIgMgogICAgc3dhcAogICAgYm94X3B1dAogICAgLy8gc21hcnRfY29udHJhY3RzL2JhbmsvY29udHJhY3QucHk6MTIxCiAgICAvLyBpbXBvcnRlZCArPSBhbW91bnQubmF0aXZlCiAgICBmcmFtZV9kaWcgMAogICAgKwogICAgZnJhbWVfYnVyeSAwCiAgICAvLyBzbWFydF9jb250cmFjdHMvYmFuay9jb250cmFjdC5weToxMTcKICAgIC8vIGZvciBpbmRleCBpbiB1cmFuZ2UoZW50cmllcy5sZW5ndGgpOgogICAgaW50Y18xIC8vIDEKICAgICsKICAgIGZyYW1lX2J1cnkgMgogICAgYiBpbXBvcnRfZGVwb3NpdHNfZm9yX2hlYWRlckAxCgppbXBvcnRfZGVwb3NpdHNfYWZ0ZXJfZm9yQDQ6CiAgICAvLyBzbWFydF9jb250cmFjdHMvYmFuay9jb250cmFjdC5weToxMjMKICAgIC8vIHNlbGYudG90YWxfZGVwb3NpdCArPSBpbXBvcnRlZAogICAgaW50Y18wIC8vIDAKICAgIGJ5dGVjXzAgLy8gInRvdGFsX2RlcG9zaXQiCiAgICBhcHBfZ2xvYmFsX2dldF9leAogICAgYXNzZXJ0IC8vIGNoZWNrIHNlbGYudG90YWxfZGVwb3NpdCBleGlzdHMKICAgIGZyYW1lX2RpZyAwCiAgICBkdXAKICAgIGNvdmVyIDIKICAgICsKICAgIGJ5dGVjXzAgLy8gInRvdGFsX2RlcG9zaXQiCiAgICBzd2FwCiAgICBhcHBfZ2xvYmFsX3B1dAogICAgLy8gc21hcnRfY29udHJhY3RzL2JhbmsvY29udHJhY3QucHk6MTI0CiAgICAvLyBhcHBfYWNjb3VudCA9IEdsb2JhbC5jdXJyZW50X2FwcGxpY2F0aW9uX2FkZHJlc3MKICAgIGdsb2JhbCBDdXJyZW50QXBwbGljYXRpb25BZGRyZXNzCiAgICAvLyBzbWFydF9jb250cmFjdHMvYmFuay9jb250cmFjdC5weToxMjUKICAgIC8vIGFzc2VydCBhcHBfYWNjb3VudC5iYWxhbmNlID49IGFwcF9hY2NvdW50Lm1pbl9iYWxhbmNlICsgc2VsZi50b3RhbF9kZXBvc2l0LCAiSW1wb3J0ZWQgZGVwb3NpdHMgYXJlIG5vdCBiYWNrZWQiCiAgICBkdXAKICAgIGFjY3RfcGFyYW1zX2dldCBBY2N0QmFsYW5jZQogICAgYXNzZXJ0IC8vIGFjY291bnQgZnVuZGVkCiAgICBzd2FwCiAgICBhY2N0X3BhcmFtc19nZXQgQWNjdE1pbkJhbGFuY2UKICAgIGFzc2VydCAvLyBhY2NvdW50IGZ1bmRlZAogICAgaW50Y18wIC8vIDAKICAgIGJ5dGVjXzAgLy8gInRvdGFsX2RlcG9zaXQiCiAgICBhcHBfZ2xvYmFsX2dldF9leAogICAgYXNzZXJ0IC8vIGNoZWNrIHNlbGYudG90YWxfZGVwb3NpdCBleGlzdHMKICAgICsKICAgID49CiAgICBhc3NlcnQgLy8gSW1wb3J0ZWQgZGVwb3NpdHMgYXJlIG5vdCBiYWNrZWQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9iYW5rL2NvbnRyYWN0LnB5OjEyNgogICAgLy8gcmV0dXJuIGltcG9ydGVkCiAgICBmcmFtZV9idXJ5IDAKICAgIHJldHN1Ygo=", "clear": "I3ByYWdtYSB2ZXJzaW9uIDEwCiNwcmFnbWEgdHlwZXRyYWNrIGZhbHNlCgovLyBhbGdvcHkuYXJjNC5BUkM0Q29udHJhY3QuY2xlYXJfc3RhdGVfcHJvZ3JhbSgpIC0+IHVpbnQ2NDoKbWFpbjoKICAgIHB1c2hpbnQgMSAvLyAxCiAgICByZXR1cm4K"}, "sourceInfo": {"approval": {"pcOffsetMethod": "none", "sourceInfo": [{"pc": [361], "errorMessage": "Deposit amount must be greater than zero"}, {"pc": [347], "errorMessage": "Deposits are paused"}, {"pc": [553], "errorMessage": "Deposits must be paused before exporting"}, {"pc": [575], "errorMessage": "Destination is not approved"}, {"pc": [562], "errorMessage": "Destination must have the same creator"}, {"pc": [637], "errorMessage": "Exports must move whole balances"}, {"pc": [860], "errorMessage": "Imported deposits are not backed"}, {"pc": [740], "errorMessage": "Imported entries must match the export"}, {"pc": [713, 732], "errorMessage": "Imports must follow their export"}, {"pc": [608, 612, 792, 794], "errorMessage": "Index access is out of bounds"}, {"pc": [423], "errorMessage": "No deposits found for this account"}, {"pc": [162, 171, 191, 217, 240, 257, 277, 298], "errorMessage": "OnCompletion is not NoOp"}, {"pc": [509], "errorMessage": "Only the creator can approve a successor"}, {"pc": [548], "errorMessage": "Only the creator can export deposits"}, {"pc": [710], "errorMessage": "Only the creator can import deposits"}, {"pc": [495], "errorMessage": "Only the creator can pause deposits"}, {"pc": [515], "errorMessage": "Program hash must be 32 bytes"}, {"pc": [355], "errorMessage": "Receiver must be the contract address"}, {"pc": [764], "errorMessage": "The export must come from the same creator"}, {"pc": [755], "errorMessage": "The export must pay this app"}, {"pc": [583], "errorMessage": "The successor's notice period has not passed"}, {"pc": [432], "errorMessage": "Withdrawal amount exceeds balance"}, {"pc": [426], "errorMessage": "Withdrawal amount must be greater than zero"}, {"pc": [849, 853], "errorMessage": "account funded"}, {"pc": [558, 567, 685, 760], "errorMessage": "application exists"}, {"pc": [336], "errorMessage": "can only call when creating"}, {"pc": [165, 174, 194, 220, 243, 260, 280, 301], "errorMessage": "can only call when not creating"}, {"pc": [400], "errorMessage": "check self.deposits entry exists"}, {"pc": [345, 552], "errorMessage": "check self.paused exists"}, {"pc": [573], "errorMessage": "check self.successor_hash exists"}, {"pc": [534, 581], "errorMessage": "check self.successor_round exists"}, {"pc": [387, 670, 834, 857], "errorMessage": "check self.total_deposit exists"}, {"pc": [724], "errorMessage": "transaction type is appl"}, {"pc": [317], "errorMessage": "transaction type is pay"}]}, "clear": {"pcOffsetMethod": "none", "sourceInfo": []}}, "templateVariables": {}}"""
+from smart_contracts._helpers.lazy_spec import LazyAppSpec
+_APP_SPEC = LazyAppSpec(_APP_SPEC_JSON)
+
+
+def __getattr__(name: str) -> typing.Any:
+    # Keeps `APP_SPEC` importable while only parsing it on first use
+    if name == "APP_SPEC":
+        return _APP_SPEC.get()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+from smart_contracts._helpers.client_runtime import parse_abi_args as _parse_abi_args, init_dataclass as _init_dataclass, MapState as _MapState
+
+
+from smart_contracts._helpers.client_runtime import AppClientBase as _AppClientBase, AppFactoryBase as _AppFactoryBase, ComposerBase as _ComposerBase, CreateTransactionParamsBase as _CreateTransactionParamsBase, FactoryCreateParamsBase as _FactoryCreateParamsBase, FactoryCreateTransactionCreateBase as _FactoryCreateTransactionCreateBase, FactoryDeleteParamsBase as _FactoryDeleteParamsBase, FactorySendCreateBase as _FactorySendCreateBase, FactoryUpdateParamsBase as _FactoryUpdateParamsBase, ParamsBase as _ParamsBase, SendBase as _SendBase, client_part as _client_part, factory_part as _factory_part
+
+from smart_contracts._helpers.client_runtime import CachedAccessor as _CachedAccessor
 
 @dataclasses.dataclass(frozen=True, kw_only=True)
 class DepositArgs:
@@ -83,92 +56,173 @@ class WithdrawArgs:
     def abi_method_signature(self) -> str:
         return "withdraw(uint64)uint64"
 
+@dataclasses.dataclass(frozen=True, kw_only=True)
+class BalanceOfArgs:
+    """Dataclass for balance_of arguments"""
+    account: str
 
-class BankParams:
-    def __init__(self, app_client: algokit_utils.AppClient):
-        self.app_client = app_client
+    @property
+    def abi_method_signature(self) -> str:
+        return "balance_of(address)uint64"
+
+@dataclasses.dataclass(frozen=True, kw_only=True)
+class SetPausedArgs:
+    """Dataclass for set_paused arguments"""
+    paused: bool
+
+    @property
+    def abi_method_signature(self) -> str:
+        return "set_paused(bool)void"
+
+@dataclasses.dataclass(frozen=True, kw_only=True)
+class ApproveSuccessorArgs:
+    """Dataclass for approve_successor arguments"""
+    program_hash: bytes | str
+
+    @property
+    def abi_method_signature(self) -> str:
+        return "approve_successor(byte[])uint64"
+
+@dataclasses.dataclass(frozen=True, kw_only=True)
+class ExportDepositsArgs:
+    """Dataclass for export_deposits arguments"""
+    entries: list[tuple[str, int]]
+    destination: int
+
+    @property
+    def abi_method_signature(self) -> str:
+        return "export_deposits((address,uint64)[],application)uint64"
+
+@dataclasses.dataclass(frozen=True, kw_only=True)
+class ImportDepositsArgs:
+    """Dataclass for import_deposits arguments"""
+    entries: list[tuple[str, int]]
+
+    @property
+    def abi_method_signature(self) -> str:
+        return "import_deposits((address,uint64)[])uint64"
+
+
+class BankParams(_ParamsBase):
+    __slots__ = ()
 
     def deposit(
         self,
         args: tuple[str, algokit_utils.AppMethodCallTransactionArgument] | DepositArgs,
         params: algokit_utils.CommonAppCallParams | None = None
     ) -> algokit_utils.AppCallMethodCallParams:
-        method_args = _parse_abi_args(args)
-        params = params or algokit_utils.CommonAppCallParams()
-        return self.app_client.params.call(algokit_utils.AppClientMethodCallParams(**{
-            **dataclasses.asdict(params),
-            "method": "deposit(string,pay)uint64",
-            "args": method_args,
-        }))
+        return self._call("deposit(string,pay)uint64", args, params)
 
     def withdraw(
         self,
         args: tuple[int] | WithdrawArgs,
         params: algokit_utils.CommonAppCallParams | None = None
     ) -> algokit_utils.AppCallMethodCallParams:
-        method_args = _parse_abi_args(args)
-        params = params or algokit_utils.CommonAppCallParams()
-        return self.app_client.params.call(algokit_utils.AppClientMethodCallParams(**{
-            **dataclasses.asdict(params),
-            "method": "withdraw(uint64)uint64",
-            "args": method_args,
-        }))
+        return self._call("withdraw(uint64)uint64", args, params)
 
-    def clear_state(
+    def balance_of(
         self,
-        params: algokit_utils.AppClientBareCallParams | None = None,
-        
-    ) -> algokit_utils.AppCallParams:
-        return self.app_client.params.bare.clear_state(
-            params,
-            
-        )
+        args: tuple[str] | BalanceOfArgs,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> algokit_utils.AppCallMethodCallParams:
+        return self._call("balance_of(address)uint64", args, params)
 
+    def set_paused(
+        self,
+        args: tuple[bool] | SetPausedArgs,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> algokit_utils.AppCallMethodCallParams:
+        return self._call("set_paused(bool)void", args, params)
+
+    def approve_successor(
+        self,
+        args: tuple[bytes | str] | ApproveSuccessorArgs,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> algokit_utils.AppCallMethodCallParams:
+        return self._call("approve_successor(byte[])uint64", args, params)
+
+    def export_deposits(
+        self,
+        args: tuple[list[tuple[str, int]], int] | ExportDepositsArgs,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> algokit_utils.AppCallMethodCallParams:
+        return self._call("export_deposits((address,uint64)[],application)uint64", args, params)
+
+    def import_deposits(
+        self,
+        args: tuple[list[tuple[str, int]]] | ImportDepositsArgs,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> algokit_utils.AppCallMethodCallParams:
+        return self._call("import_deposits((address,uint64)[])uint64", args, params)
+
+    def opup(
+        self,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> algokit_utils.AppCallMethodCallParams:
+        return self._call("opup()void", None, params)
 
-class BankCreateTransactionParams:
-    def __init__(self, app_client: algokit_utils.AppClient):
-        self.app_client = app_client
+
+class BankCreateTransactionParams(_CreateTransactionParamsBase):
+    __slots__ = ()
 
     def deposit(
         self,
         args: tuple[str, algokit_utils.AppMethodCallTransactionArgument] | DepositArgs,
         params: algokit_utils.CommonAppCallParams | None = None
     ) -> algokit_utils.BuiltTransactions:
-        method_args = _parse_abi_args(args)
-        params = params or algokit_utils.CommonAppCallParams()
-        return self.app_client.create_transaction.call(algokit_utils.AppClientMethodCallParams(**{
-            **dataclasses.asdict(params),
-            "method": "deposit(string,pay)uint64",
-            "args": method_args,
-        }))
+        return self._call("deposit(string,pay)uint64", args, params)
 
     def withdraw(
         self,
         args: tuple[int] | WithdrawArgs,
         params: algokit_utils.CommonAppCallParams | None = None
     ) -> algokit_utils.BuiltTransactions:
-        method_args = _parse_abi_args(args)
-        params = params or algokit_utils.CommonAppCallParams()
-        return self.app_client.create_transaction.call(algokit_utils.AppClientMethodCallParams(**{
-            **dataclasses.asdict(params),
-            "method": "withdraw(uint64)uint64",
-            "args": method_args,
-        }))
+        return self._call("withdraw(uint64)uint64", args, params)
 
-    def clear_state(
+    def balance_of(
         self,
-        params: algokit_utils.AppClientBareCallParams | None = None,
-        
-    ) -> Transaction:
-        return self.app_client.create_transaction.bare.clear_state(
-            params,
-            
-        )
+        args: tuple[str] | BalanceOfArgs,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> algokit_utils.BuiltTransactions:
+        return self._call("balance_of(address)uint64", args, params)
 
+    def set_paused(
+        self,
+        args: tuple[bool] | SetPausedArgs,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> algokit_utils.BuiltTransactions:
+        return self._call("set_paused(bool)void", args, params)
 
-class BankSend:
-    def __init__(self, app_client: algokit_utils.AppClient):
-        self.app_client = app_client
+    def approve_successor(
+        self,
+        args: tuple[bytes | str] | ApproveSuccessorArgs,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> algokit_utils.BuiltTransactions:
+        return self._call("approve_successor(byte[])uint64", args, params)
+
+    def export_deposits(
+        self,
+        args: tuple[list[tuple[str, int]], int] | ExportDepositsArgs,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> algokit_utils.BuiltTransactions:
+        return self._call("export_deposits((address,uint64)[],application)uint64", args, params)
+
+    def import_deposits(
+        self,
+        args: tuple[list[tuple[str, int]]] | ImportDepositsArgs,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> algokit_utils.BuiltTransactions:
+        return self._call("import_deposits((address,uint64)[])uint64", args, params)
+
+    def opup(
+        self,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> algokit_utils.BuiltTransactions:
+        return self._call("opup()void", None, params)
+
+
+class BankSend(_SendBase):
+    __slots__ = ()
 
     def deposit(
         self,
@@ -176,15 +230,7 @@ class BankSend:
         params: algokit_utils.CommonAppCallParams | None = None,
         send_params: algokit_utils.SendParams | None = None
     ) -> algokit_utils.SendAppTransactionResult[int]:
-        method_args = _parse_abi_args(args)
-        params = params or algokit_utils.CommonAppCallParams()
-        response = self.app_client.send.call(algokit_utils.AppClientMethodCallParams(**{
-            **dataclasses.asdict(params),
-            "method": "deposit(string,pay)uint64",
-            "args": method_args,
-        }), send_params=send_params)
-        parsed_response = response
-        return typing.cast(algokit_utils.SendAppTransactionResult[int], parsed_response)
+        return self._call("deposit(string,pay)uint64", args, params, send_params)
 
     def withdraw(
         self,
@@ -192,45 +238,79 @@ class BankSend:
         params: algokit_utils.CommonAppCallParams | None = None,
         send_params: algokit_utils.SendParams | None = None
     ) -> algokit_utils.SendAppTransactionResult[int]:
-        method_args = _parse_abi_args(args)
-        params = params or algokit_utils.CommonAppCallParams()
-        response = self.app_client.send.call(algokit_utils.AppClientMethodCallParams(**{
-            **dataclasses.asdict(params),
-            "method": "withdraw(uint64)uint64",
-            "args": method_args,
-        }), send_params=send_params)
-        parsed_response = response
-        return typing.cast(algokit_utils.SendAppTransactionResult[int], parsed_response)
-
-    def clear_state(
-        self,
-        params: algokit_utils.AppClientBareCallParams | None = None,
+        return self._call("withdraw(uint64)uint64", args, params, send_params)
+
+    def balance_of(
+        self,
+        args: tuple[str] | BalanceOfArgs,
+        params: algokit_utils.CommonAppCallParams | None = None,
         send_params: algokit_utils.SendParams | None = None
-    ) -> algokit_utils.SendAppTransactionResult[algokit_utils.ABIReturn]:
-        return self.app_client.send.bare.clear_state(
-            params,
-            send_params=send_params,
-        )
+    ) -> algokit_utils.SendAppTransactionResult[int]:
+        return self._call("balance_of(address)uint64", args, params, send_params)
+
+    def set_paused(
+        self,
+        args: tuple[bool] | SetPausedArgs,
+        params: algokit_utils.CommonAppCallParams | None = None,
+        send_params: algokit_utils.SendParams | None = None
+    ) -> algokit_utils.SendAppTransactionResult[None]:
+        return self._call("set_paused(bool)void", args, params, send_params)
+
+    def approve_successor(
+        self,
+        args: tuple[bytes | str] | ApproveSuccessorArgs,
+        params: algokit_utils.CommonAppCallParams | None = None,
+        send_params: algokit_utils.SendParams | None = None
+    ) -> algokit_utils.SendAppTransactionResult[int]:
+        return self._call("approve_successor(byte[])uint64", args, params, send_params)
+
+    def export_deposits(
+        self,
+        args: tuple[list[tuple[str, int]], int] | ExportDepositsArgs,
+        params: algokit_utils.CommonAppCallParams | None = None,
+        send_params: algokit_utils.SendParams | None = None
+    ) -> algokit_utils.SendAppTransactionResult[int]:
+        return self._call("export_deposits((address,uint64)[],application)uint64", args, params, send_params)
+
+    def import_deposits(
+        self,
+        args: tuple[list[tuple[str, int]]] | ImportDepositsArgs,
+        params: algokit_utils.CommonAppCallParams | None = None,
+        send_params: algokit_utils.SendParams | None = None
+    ) -> algokit_utils.SendAppTransactionResult[int]:
+        return self._call("import_deposits((address,uint64)[])uint64", args, params, send_params)
+
+    def opup(
+        self,
+        params: algokit_utils.CommonAppCallParams | None = None,
+        send_params: algokit_utils.SendParams | None = None
+    ) -> algokit_utils.SendAppTransactionResult[None]:
+        return self._call("opup()void", None, params, send_params)
 
 
 class GlobalStateValue(typing.TypedDict):
     """Shape of global_state state key values"""
     total_deposit: int
+    paused: int
+    successor_hash: bytes
+    successor_round: int
 
 class BankState:
     """Methods to access state for the current Bank app"""
 
+    __slots__ = ('app_client', '_cached_global_state', '_cached_box',)
+
     def __init__(self, app_client: algokit_utils.AppClient):
         self.app_client = app_client
 
-    @property
+    @_CachedAccessor
     def global_state(
         self
     ) -> "_GlobalState":
             """Methods to access global_state for the current app"""
             return _GlobalState(self.app_client)
 
-    @property
+    @_CachedAccessor
     def box(
         self
     ) -> "_BoxState":
@@ -238,6 +318,8 @@ class BankState:
             return _BoxState(self.app_client)
 
 class _GlobalState:
+    __slots__ = ('app_client', '_struct_classes',)
+
     def __init__(self, app_client: algokit_utils.AppClient):
         self.app_client = app_client
         
@@ -268,7 +350,33 @@ class _GlobalState:
             return _init_dataclass(self._struct_classes["AVMUint64"], value)  # type: ignore
         return typing.cast(int, value)
 
+    @property
+    def paused(self) -> int:
+        """Get the current value of the paused key in global_state state"""
+        value = self.app_client.state.global_state.get_value("paused")
+        if isinstance(value, dict) and "AVMUint64" in self._struct_classes:
+            return _init_dataclass(self._struct_classes["AVMUint64"], value)  # type: ignore
+        return typing.cast(int, value)
+
+    @property
+    def successor_hash(self) -> bytes:
+        """Get the current value of the successor_hash key in global_state state"""
+        value = self.app_client.state.global_state.get_value("successor_hash")
+        if isinstance(value, dict) and "AVMBytes" in self._struct_classes:
+            return _init_dataclass(self._struct_classes["AVMBytes"], value)  # type: ignore
+        return typing.cast(bytes, value)
+
+    @property
+    def successor_round(self) -> int:
+        """Get the current value of the successor_round key in global_state state"""
+        value = self.app_client.state.global_state.get_value("successor_round")
+        if isinstance(value, dict) and "AVMUint64" in self._struct_classes:
+            return _init_dataclass(self._struct_classes["AVMUint64"], value)  # type: ignore
+        return typing.cast(int, value)
+
 class _BoxState:
+    __slots__ = ('app_client', '_struct_classes', '_cached_deposits',)
+
     def __init__(self, app_client: algokit_utils.AppClient):
         self.app_client = app_client
         
@@ -291,189 +399,24 @@ class _BoxState:
             )
         return converted
 
-    @property
+    @_CachedAccessor
     def deposits(self) -> "_MapState[str, int]":
         """Get values from the deposits map in box state"""
         return _MapState(
             self.app_client.state.box,
             "deposits",
-            None
+            None, app_client=self.app_client
         )
 
-_KeyType = typing.TypeVar("_KeyType")
-_ValueType = typing.TypeVar("_ValueType")
-
-class _AppClientStateMethodsProtocol(typing.Protocol):
-    def get_map(self, map_name: str) -> dict[typing.Any, typing.Any]:
-        ...
-    def get_map_value(self, map_name: str, key: typing.Any) -> typing.Any | None:
-        ...
-
-class _MapState(typing.Generic[_KeyType, _ValueType]):
-    """Generic class for accessing state maps with strongly typed keys and values"""
-
-    def __init__(self, state_accessor: _AppClientStateMethodsProtocol, map_name: str,
-                struct_class: typing.Type[_ValueType] | None = None):
-        self._state_accessor = state_accessor
-        self._map_name = map_name
-        self._struct_class = struct_class
-
-    def get_map(self) -> dict[_KeyType, _ValueType]:
-        """Get all current values in the map"""
-        result = self._state_accessor.get_map(self._map_name)
-        if self._struct_class and result:
-            return {k: _init_dataclass(self._struct_class, v) if isinstance(v, dict) else v
-                    for k, v in result.items()}  # type: ignore
-        return typing.cast(dict[_KeyType, _ValueType], result or {})
-
-    def get_value(self, key: _KeyType) -> _ValueType | None:
-        """Get a value from the map by key"""
-        key_value = dataclasses.asdict(key) if dataclasses.is_dataclass(key) else key  # type: ignore
-        value = self._state_accessor.get_map_value(self._map_name, key_value)
-        if value is not None and self._struct_class and isinstance(value, dict):
-            return _init_dataclass(self._struct_class, value)  # type: ignore
-        return typing.cast(_ValueType | None, value)
-
-
-class BankClient:
-    """Client for interacting with Bank smart contract"""
-
-    @typing.overload
-    def __init__(self, app_client: algokit_utils.AppClient) -> None: ...
-    
-    @typing.overload
-    def __init__(
-        self,
-        *,
-        algorand: _AlgoKitAlgorandClient,
-        app_id: int,
-        app_name: str | None = None,
-        default_sender: str | None = None,
-        default_signer: TransactionSigner | None = None,
-        approval_source_map: SourceMap | None = None,
-        clear_source_map: SourceMap | None = None,
-    ) -> None: ...
 
-    def __init__(
-        self,
-        app_client: algokit_utils.AppClient | None = None,
-        *,
-        algorand: _AlgoKitAlgorandClient | None = None,
-        app_id: int | None = None,
-        app_name: str | None = None,
-        default_sender: str | None = None,
-        default_signer: TransactionSigner | None = None,
-        approval_source_map: SourceMap | None = None,
-        clear_source_map: SourceMap | None = None,
-    ) -> None:
-        if app_client:
-            self.app_client = app_client
-        elif algorand and app_id:
-            self.app_client = algokit_utils.AppClient(
-                algokit_utils.AppClientParams(
-                    algorand=algorand,
-                    app_spec=APP_SPEC,
-                    app_id=app_id,
-                    app_name=app_name,
-                    default_sender=default_sender,
-                    default_signer=default_signer,
-                    approval_source_map=approval_source_map,
-                    clear_source_map=clear_source_map,
-                )
-            )
-        else:
-            raise ValueError("Either app_client or algorand and app_id must be provided")
-    
-        self.params = BankParams(self.app_client)
-        self.create_transaction = BankCreateTransactionParams(self.app_client)
-        self.send = BankSend(self.app_client)
-        self.state = BankState(self.app_client)
-
-    @staticmethod
-    def from_creator_and_name(
-        creator_address: str,
-        app_name: str,
-        algorand: _AlgoKitAlgorandClient,
-        default_sender: str | None = None,
-        default_signer: TransactionSigner | None = None,
-        approval_source_map: SourceMap | None = None,
-        clear_source_map: SourceMap | None = None,
-        ignore_cache: bool | None = None,
-        app_lookup_cache: algokit_utils.ApplicationLookup | None = None,
-    ) -> "BankClient":
-        return BankClient(
-            algokit_utils.AppClient.from_creator_and_name(
-                creator_address=creator_address,
-                app_name=app_name,
-                app_spec=APP_SPEC,
-                algorand=algorand,
-                default_sender=default_sender,
-                default_signer=default_signer,
-                approval_source_map=approval_source_map,
-                clear_source_map=clear_source_map,
-                ignore_cache=ignore_cache,
-                app_lookup_cache=app_lookup_cache,
-            )
-        )
-    
-    @staticmethod
-    def from_network(
-        algorand: _AlgoKitAlgorandClient,
-        app_name: str | None = None,
-        default_sender: str | None = None,
-        default_signer: TransactionSigner | None = None,
-        approval_source_map: SourceMap | None = None,
-        clear_source_map: SourceMap | None = None,
-    ) -> "BankClient":
-        return BankClient(
-            algokit_utils.AppClient.from_network(
-                app_spec=APP_SPEC,
-                algorand=algorand,
-                app_name=app_name,
-                default_sender=default_sender,
-                default_signer=default_signer,
-                approval_source_map=approval_source_map,
-                clear_source_map=clear_source_map,
-            )
-        )
+class BankClient(_AppClientBase):
+    """Client for interacting with Bank smart contract"""
 
-    @property
-    def app_id(self) -> int:
-        return self.app_client.app_id
-    
-    @property
-    def app_address(self) -> str:
-        return self.app_client.app_address
-    
-    @property
-    def app_name(self) -> str:
-        return self.app_client.app_name
-    
-    @property
-    def app_spec(self) -> algokit_utils.Arc56Contract:
-        return self.app_client.app_spec
-    
-    @property
-    def algorand(self) -> _AlgoKitAlgorandClient:
-        return self.app_client.algorand
-
-    def clone(
-        self,
-        app_name: str | None = None,
-        default_sender: str | None = None,
-        default_signer: TransactionSigner | None = None,
-        approval_source_map: SourceMap | None = None,
-        clear_source_map: SourceMap | None = None,
-    ) -> "BankClient":
-        return BankClient(
-            self.app_client.clone(
-                app_name=app_name,
-                default_sender=default_sender,
-                default_signer=default_signer,
-                approval_source_map=approval_source_map,
-                clear_source_map=clear_source_map,
-            )
-        )
+    _app_spec = _APP_SPEC
+    params = _client_part(BankParams)
+    create_transaction = _client_part(BankCreateTransactionParams)
+    send = _client_part(BankSend)
+    state = _client_part(BankState)
 
     def new_group(self) -> "BankComposer":
         return BankComposer(self)
@@ -491,6 +434,42 @@ class BankClient:
         return_value: algokit_utils.ABIReturn | None
     ) -> int | None: ...
     @typing.overload
+    def decode_return_value(
+        self,
+        method: typing.Literal["balance_of(address)uint64"],
+        return_value: algokit_utils.ABIReturn | None
+    ) -> int | None: ...
+    @typing.overload
+    def decode_return_value(
+        self,
+        method: typing.Literal["set_paused(bool)void"],
+        return_value: algokit_utils.ABIReturn | None
+    ) -> None: ...
+    @typing.overload
+    def decode_return_value(
+        self,
+        method: typing.Literal["approve_successor(byte[])uint64"],
+        return_value: algokit_utils.ABIReturn | None
+    ) -> int | None: ...
+    @typing.overload
+    def decode_return_value(
+        self,
+        method: typing.Literal["export_deposits((address,uint64)[],application)uint64"],
+        return_value: algokit_utils.ABIReturn | None
+    ) -> int | None: ...
+    @typing.overload
+    def decode_return_value(
+        self,
+        method: typing.Literal["import_deposits((address,uint64)[])uint64"],
+        return_value: algokit_utils.ABIReturn | None
+    ) -> int | None: ...
+    @typing.overload
+    def decode_return_value(
+        self,
+        method: typing.Literal["opup()void"],
+        return_value: algokit_utils.ABIReturn | None
+    ) -> None: ...
+    @typing.overload
     def decode_return_value(
         self,
         method: str,
@@ -503,21 +482,7 @@ class BankClient:
         return_value: algokit_utils.ABIReturn | None
     ) -> algokit_utils.ABIValue | algokit_utils.ABIStruct | None | int:
         """Decode ABI return value for the given method."""
-        if return_value is None:
-            return None
-    
-        arc56_method = self.app_spec.get_arc56_method(method)
-        decoded = return_value.get_arc56_value(arc56_method, self.app_spec.structs)
-    
-        # If method returns a struct, convert the dict to appropriate dataclass
-        if (arc56_method and
-            arc56_method.returns and
-            arc56_method.returns.struct and
-            isinstance(decoded, dict)):
-            struct_class = globals().get(arc56_method.returns.struct)
-            if struct_class:
-                return struct_class(**typing.cast(dict, decoded))
-        return decoded
+        return super().decode_return_value(method, return_value)
 
 
 @dataclasses.dataclass(frozen=True)
@@ -528,149 +493,22 @@ class BankBareCallCreateParams(algokit_utils.AppClientBareCallCreateParams):
     def to_algokit_utils_params(self) -> algokit_utils.AppClientBareCallCreateParams:
         return algokit_utils.AppClientBareCallCreateParams(**self.__dict__)
 
-class BankFactory(algokit_utils.TypedAppFactoryProtocol[BankBareCallCreateParams, None, None]):
-    """Factory for deploying and managing BankClient smart contracts"""
-
-    def __init__(
-        self,
-        algorand: _AlgoKitAlgorandClient,
-        *,
-        app_name: str | None = None,
-        default_sender: str | None = None,
-        default_signer: TransactionSigner | None = None,
-        version: str | None = None,
-        compilation_params: algokit_utils.AppClientCompilationParams | None = None,
-    ):
-        self.app_factory = algokit_utils.AppFactory(
-            params=algokit_utils.AppFactoryParams(
-                algorand=algorand,
-                app_spec=APP_SPEC,
-                app_name=app_name,
-                default_sender=default_sender,
-                default_signer=default_signer,
-                version=version,
-                compilation_params=compilation_params,
-            )
-        )
-        self.params = BankFactoryParams(self.app_factory)
-        self.create_transaction = BankFactoryCreateTransaction(self.app_factory)
-        self.send = BankFactorySend(self.app_factory)
-
-    @property
-    def app_name(self) -> str:
-        return self.app_factory.app_name
-    
-    @property
-    def app_spec(self) -> algokit_utils.Arc56Contract:
-        return self.app_factory.app_spec
-    
-    @property
-    def algorand(self) -> _AlgoKitAlgorandClient:
-        return self.app_factory.algorand
-
-    def deploy(
-        self,
-        *,
-        on_update: algokit_utils.OnUpdate | None = None,
-        on_schema_break: algokit_utils.OnSchemaBreak | None = None,
-        create_params: BankBareCallCreateParams | None = None,
-        update_params: None = None,
-        delete_params: None = None,
-        existing_deployments: algokit_utils.ApplicationLookup | None = None,
-        ignore_cache: bool = False,
-        app_name: str | None = None,
-        compilation_params: algokit_utils.AppClientCompilationParams | None = None,
-        send_params: algokit_utils.SendParams | None = None,
-    ) -> tuple[BankClient, algokit_utils.AppFactoryDeployResult]:
-        """Deploy the application"""
-        deploy_response = self.app_factory.deploy(
-            on_update=on_update,
-            on_schema_break=on_schema_break,
-            create_params=create_params.to_algokit_utils_params() if create_params else None,
-            update_params=update_params,
-            delete_params=delete_params,
-            existing_deployments=existing_deployments,
-            ignore_cache=ignore_cache,
-            app_name=app_name,
-            compilation_params=compilation_params,
-            send_params=send_params,
-        )
-
-        return BankClient(deploy_response[0]), deploy_response[1]
-
-    def get_app_client_by_creator_and_name(
-        self,
-        creator_address: str,
-        app_name: str,
-        default_sender: str | None = None,
-        default_signer: TransactionSigner | None = None,
-        ignore_cache: bool | None = None,
-        app_lookup_cache: algokit_utils.ApplicationLookup | None = None,
-        approval_source_map: SourceMap | None = None,
-        clear_source_map: SourceMap | None = None,
-    ) -> BankClient:
-        """Get an app client by creator address and name"""
-        return BankClient(
-            self.app_factory.get_app_client_by_creator_and_name(
-                creator_address,
-                app_name,
-                default_sender,
-                default_signer,
-                ignore_cache,
-                app_lookup_cache,
-                approval_source_map,
-                clear_source_map,
-            )
-        )
-
-    def get_app_client_by_id(
-        self,
-        app_id: int,
-        app_name: str | None = None,
-        default_sender: str | None = None,
-        default_signer: TransactionSigner | None = None,
-        approval_source_map: SourceMap | None = None,
-        clear_source_map: SourceMap | None = None,
-    ) -> BankClient:
-        """Get an app client by app ID"""
-        return BankClient(
-            self.app_factory.get_app_client_by_id(
-                app_id,
-                app_name,
-                default_sender,
-                default_signer,
-                approval_source_map,
-                clear_source_map,
-            )
-        )
-
 
 class BankFactoryParams:
     """Parameters for creating transactions for Bank contract"""
 
+    __slots__ = ('app_factory', 'create', 'update', 'delete',)
+
     def __init__(self, app_factory: algokit_utils.AppFactory):
         self.app_factory = app_factory
         self.create = BankFactoryCreateParams(app_factory)
         self.update = BankFactoryUpdateParams(app_factory)
         self.delete = BankFactoryDeleteParams(app_factory)
 
-class BankFactoryCreateParams:
+class BankFactoryCreateParams(_FactoryCreateParamsBase):
     """Parameters for 'create' operations of Bank contract"""
 
-    def __init__(self, app_factory: algokit_utils.AppFactory):
-        self.app_factory = app_factory
-
-    def bare(
-        self,
-        *,
-        params: algokit_utils.CommonAppCallCreateParams | None = None,
-        compilation_params: algokit_utils.AppClientCompilationParams | None = None
-    ) -> algokit_utils.AppCreateParams:
-        """Creates an instance using a bare call"""
-        params = params or algokit_utils.CommonAppCallCreateParams()
-        return self.app_factory.params.bare.create(
-            algokit_utils.AppFactoryCreateParams(**dataclasses.asdict(params)),
-            compilation_params=compilation_params)
+    __slots__ = ()
 
     def deposit(
         self,
@@ -680,17 +518,7 @@ class BankFactoryCreateParams:
         compilation_params: algokit_utils.AppClientCompilationParams | None = None
     ) -> algokit_utils.AppCreateMethodCallParams:
         """Creates a new instance using the deposit(string,pay)uint64 ABI method"""
-        params = params or algokit_utils.CommonAppCallCreateParams()
-        return self.app_factory.params.create(
-            algokit_utils.AppFactoryCreateMethodCallParams(
-                **{
-                **dataclasses.asdict(params),
-                "method": "deposit(string,pay)uint64",
-                "args": _parse_abi_args(args),
-                }
-            ),
-            compilation_params=compilation_params
-        )
+        return self._create("deposit(string,pay)uint64", args, params, compilation_params)
 
     def withdraw(
         self,
@@ -700,205 +528,178 @@ class BankFactoryCreateParams:
         compilation_params: algokit_utils.AppClientCompilationParams | None = None
     ) -> algokit_utils.AppCreateMethodCallParams:
         """Creates a new instance using the withdraw(uint64)uint64 ABI method"""
-        params = params or algokit_utils.CommonAppCallCreateParams()
-        return self.app_factory.params.create(
-            algokit_utils.AppFactoryCreateMethodCallParams(
-                **{
-                **dataclasses.asdict(params),
-                "method": "withdraw(uint64)uint64",
-                "args": _parse_abi_args(args),
-                }
-            ),
-            compilation_params=compilation_params
-        )
+        return self._create("withdraw(uint64)uint64", args, params, compilation_params)
 
-class BankFactoryUpdateParams:
-    """Parameters for 'update' operations of Bank contract"""
+    def balance_of(
+        self,
+        args: tuple[str] | BalanceOfArgs,
+        *,
+        params: algokit_utils.CommonAppCallCreateParams | None = None,
+        compilation_params: algokit_utils.AppClientCompilationParams | None = None
+    ) -> algokit_utils.AppCreateMethodCallParams:
+        """Creates a new instance using the balance_of(address)uint64 ABI method"""
+        return self._create("balance_of(address)uint64", args, params, compilation_params)
 
-    def __init__(self, app_factory: algokit_utils.AppFactory):
-        self.app_factory = app_factory
+    def set_paused(
+        self,
+        args: tuple[bool] | SetPausedArgs,
+        *,
+        params: algokit_utils.CommonAppCallCreateParams | None = None,
+        compilation_params: algokit_utils.AppClientCompilationParams | None = None
+    ) -> algokit_utils.AppCreateMethodCallParams:
+        """Creates a new instance using the set_paused(bool)void ABI method"""
+        return self._create("set_paused(bool)void", args, params, compilation_params)
 
-    def bare(
+    def approve_successor(
         self,
+        args: tuple[bytes | str] | ApproveSuccessorArgs,
         *,
         params: algokit_utils.CommonAppCallCreateParams | None = None,
-        
-    ) -> algokit_utils.AppUpdateParams:
-        """Updates an instance using a bare call"""
-        params = params or algokit_utils.CommonAppCallCreateParams()
-        return self.app_factory.params.bare.deploy_update(
-            algokit_utils.AppClientBareCallParams(**dataclasses.asdict(params)),
-            )
+        compilation_params: algokit_utils.AppClientCompilationParams | None = None
+    ) -> algokit_utils.AppCreateMethodCallParams:
+        """Creates a new instance using the approve_successor(byte[])uint64 ABI method"""
+        return self._create("approve_successor(byte[])uint64", args, params, compilation_params)
 
-class BankFactoryDeleteParams:
-    """Parameters for 'delete' operations of Bank contract"""
+    def export_deposits(
+        self,
+        args: tuple[list[tuple[str, int]], int] | ExportDepositsArgs,
+        *,
+        params: algokit_utils.CommonAppCallCreateParams | None = None,
+        compilation_params: algokit_utils.AppClientCompilationParams | None = None
+    ) -> algokit_utils.AppCreateMethodCallParams:
+        """Creates a new instance using the export_deposits((address,uint64)[],application)uint64 ABI method"""
+        return self._create("export_deposits((address,uint64)[],application)uint64", args, params, compilation_params)
 
-    def __init__(self, app_factory: algokit_utils.AppFactory):
-        self.app_factory = app_factory
+    def import_deposits(
+        self,
+        args: tuple[list[tuple[str, int]]] | ImportDepositsArgs,
+        *,
+        params: algokit_utils.CommonAppCallCreateParams | None = None,
+        compilation_params: algokit_utils.AppClientCompilationParams | None = None
+    ) -> algokit_utils.AppCreateMethodCallParams:
+        """Creates a new instance using the import_deposits((address,uint64)[])uint64 ABI method"""
+        return self._create("import_deposits((address,uint64)[])uint64", args, params, compilation_params)
 
-    def bare(
+    def opup(
         self,
         *,
         params: algokit_utils.CommonAppCallCreateParams | None = None,
-        
-    ) -> algokit_utils.AppDeleteParams:
-        """Deletes an instance using a bare call"""
-        params = params or algokit_utils.CommonAppCallCreateParams()
-        return self.app_factory.params.bare.deploy_delete(
-            algokit_utils.AppClientBareCallParams(**dataclasses.asdict(params)),
-            )
+        compilation_params: algokit_utils.AppClientCompilationParams | None = None
+    ) -> algokit_utils.AppCreateMethodCallParams:
+        """Creates a new instance using the opup()void ABI method"""
+        return self._create("opup()void", None, params, compilation_params)
+
+class BankFactoryUpdateParams(_FactoryUpdateParamsBase):
+    """Parameters for 'update' operations of Bank contract"""
+
+    __slots__ = ()
+
+
+class BankFactoryDeleteParams(_FactoryDeleteParamsBase):
+    """Parameters for 'delete' operations of Bank contract"""
+
+    __slots__ = ()
 
 
 class BankFactoryCreateTransaction:
     """Create transactions for Bank contract"""
 
+    __slots__ = ('app_factory', 'create',)
+
     def __init__(self, app_factory: algokit_utils.AppFactory):
         self.app_factory = app_factory
         self.create = BankFactoryCreateTransactionCreate(app_factory)
 
 
-class BankFactoryCreateTransactionCreate:
+class BankFactoryCreateTransactionCreate(_FactoryCreateTransactionCreateBase):
     """Create new instances of Bank contract"""
 
-    def __init__(self, app_factory: algokit_utils.AppFactory):
-        self.app_factory = app_factory
-
-    def bare(
-        self,
-        params: algokit_utils.CommonAppCallCreateParams | None = None,
-    ) -> Transaction:
-        """Creates a new instance using a bare call"""
-        params = params or algokit_utils.CommonAppCallCreateParams()
-        return self.app_factory.create_transaction.bare.create(
-            algokit_utils.AppFactoryCreateParams(**dataclasses.asdict(params)),
-        )
+    __slots__ = ()
 
 
 class BankFactorySend:
     """Send calls to Bank contract"""
 
+    __slots__ = ('app_factory', 'create',)
+
     def __init__(self, app_factory: algokit_utils.AppFactory):
         self.app_factory = app_factory
         self.create = BankFactorySendCreate(app_factory)
 
 
-class BankFactorySendCreate:
+class BankFactorySendCreate(_FactorySendCreateBase[BankClient]):
     """Send create calls to Bank contract"""
 
-    def __init__(self, app_factory: algokit_utils.AppFactory):
-        self.app_factory = app_factory
+    __slots__ = ()
+    _client = BankClient
 
-    def bare(
-        self,
-        *,
-        params: algokit_utils.CommonAppCallCreateParams | None = None,
-        send_params: algokit_utils.SendParams | None = None,
-        compilation_params: algokit_utils.AppClientCompilationParams | None = None,
-    ) -> tuple[BankClient, algokit_utils.SendAppCreateTransactionResult]:
-        """Creates a new instance using a bare call"""
-        params = params or algokit_utils.CommonAppCallCreateParams()
-        result = self.app_factory.send.bare.create(
-            algokit_utils.AppFactoryCreateParams(**dataclasses.asdict(params)),
-            send_params=send_params,
-            compilation_params=compilation_params
-        )
-        return BankClient(result[0]), result[1]
+
+class BankFactory(_AppFactoryBase[BankClient], algokit_utils.TypedAppFactoryProtocol[BankBareCallCreateParams, None, None]):
+    """Factory for deploying and managing BankClient smart contracts"""
+
+    _app_spec = _APP_SPEC
+    _client = BankClient
+    params = _factory_part(BankFactoryParams)
+    create_transaction = _factory_part(BankFactoryCreateTransaction)
+    send = _factory_part(BankFactorySend)
 
 
-class BankComposer:
+class BankComposer(_ComposerBase[BankClient]):
     """Composer for creating transaction groups for Bank contract calls"""
 
-    def __init__(self, client: "BankClient"):
-        self.client = client
-        self._composer = client.algorand.new_group()
-        self._result_mappers: list[typing.Callable[[algokit_utils.ABIReturn | None], object] | None] = []
+    __slots__ = ()
 
     def deposit(
         self,
         args: tuple[str, algokit_utils.AppMethodCallTransactionArgument] | DepositArgs,
         params: algokit_utils.CommonAppCallParams | None = None
     ) -> "BankComposer":
-        self._composer.add_app_call_method_call(
-            self.client.params.deposit(
-                args=args,
-                params=params,
-            )
-        )
-        self._result_mappers.append(
-            lambda v: self.client.decode_return_value(
-                "deposit(string,pay)uint64", v
-            )
-        )
-        return self
+        return self._call("deposit(string,pay)uint64", args, params)
 
     def withdraw(
         self,
         args: tuple[int] | WithdrawArgs,
         params: algokit_utils.CommonAppCallParams | None = None
     ) -> "BankComposer":
-        self._composer.add_app_call_method_call(
-            self.client.params.withdraw(
-                args=args,
-                params=params,
-            )
-        )
-        self._result_mappers.append(
-            lambda v: self.client.decode_return_value(
-                "withdraw(uint64)uint64", v
-            )
-        )
-        return self
+        return self._call("withdraw(uint64)uint64", args, params)
 
-    def clear_state(
+    def balance_of(
         self,
-        *,
-        args: list[bytes] | None = None,
-        params: algokit_utils.CommonAppCallParams | None = None,
+        args: tuple[str] | BalanceOfArgs,
+        params: algokit_utils.CommonAppCallParams | None = None
     ) -> "BankComposer":
-        params=params or algokit_utils.CommonAppCallParams()
-        self._composer.add_app_call(
-            self.client.params.clear_state(
-                algokit_utils.AppClientBareCallParams(
-                    **{
-                        **dataclasses.asdict(params),
-                        "args": args
-                    }
-                )
-            )
-        )
-        return self
-    
-    def add_transaction(
-        self, txn: Transaction, signer: TransactionSigner | None = None
+        return self._call("balance_of(address)uint64", args, params)
+
+    def set_paused(
+        self,
+        args: tuple[bool] | SetPausedArgs,
+        params: algokit_utils.CommonAppCallParams | None = None
     ) -> "BankComposer":
-        self._composer.add_transaction(txn, signer)
-        return self
-    
-    def composer(self) -> algokit_utils.TransactionComposer:
-        return self._composer
-    
-    def simulate(
-        self,
-        allow_more_logs: bool | None = None,
-        allow_empty_signatures: bool | None = None,
-        allow_unnamed_resources: bool | None = None,
-        extra_opcode_budget: int | None = None,
-        exec_trace_config: SimulateTraceConfig | None = None,
-        simulation_round: int | None = None,
-        skip_signatures: bool | None = None,
-    ) -> algokit_utils.SendAtomicTransactionComposerResults:
-        return self._composer.simulate(
-            allow_more_logs=allow_more_logs,
-            allow_empty_signatures=allow_empty_signatures,
-            allow_unnamed_resources=allow_unnamed_resources,
-            extra_opcode_budget=extra_opcode_budget,
-            exec_trace_config=exec_trace_config,
-            simulation_round=simulation_round,
-            skip_signatures=skip_signatures,
-        )
-    
-    def send(
+        return self._call("set_paused(bool)void", args, params)
+
+    def approve_successor(
         self,
-        send_params: algokit_utils.SendParams | None = None
-    ) -> algokit_utils.SendAtomicTransactionComposerResults:
-        return self._composer.send(send_params)
+        args: tuple[bytes | str] | ApproveSuccessorArgs,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> "BankComposer":
+        return self._call("approve_successor(byte[])uint64", args, params)
+
+    def export_deposits(
+        self,
+        args: tuple[list[tuple[str, int]], int] | ExportDepositsArgs,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> "BankComposer":
+        return self._call("export_deposits((address,uint64)[],application)uint64", args, params)
+
+    def import_deposits(
+        self,
+        args: tuple[list[tuple[str, int]]] | ImportDepositsArgs,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> "BankComposer":
+        return self._call("import_deposits((address,uint64)[])uint64", args, params)
+
+    def opup(
+        self,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> "BankComposer":
+        return self._call("opup()void", None, params)
@@ -19,130 +19,91 @@ from algosdk.v2client.models import SimulateTraceConfig
 import algokit_utils
 from algokit_utils import AlgorandClient as _AlgoKitAlgorandClient
 
-_APP_SPEC_JSON = r"""{"arcs": [22, 28], "bareActions": {"call": [], "create": ["NoOp"]}, "methods": [{"actions": {"call": ["NoOp"], "create": []}, "args": [], "name": "incr_counter", "returns": {"type": "uint64"}, "events": [], "readonly": false, "recommendations": {}}], "name": "Counter", "state": {"keys": {"box": {}, "global": {"count": {"key": "Y291bnQ=", "keyType": "AVMString", "valueType": "AVMUint64"}}, "local": {}}, "maps": {"box": {}, "global": {}, "local": {}}, "schema": {"global": {"bytes": 0, "ints": 1}, "local": {"bytes": 0, "ints": 0}}}, "structs": {}, "byteCode": {"approval": "CiACAAEmAQVjb3VudDEYQAADKCJnMRtBACWABDbnKSQ2GgCOAQACIkMxGRREMRhEiAAXFoAEFR98dUxQsCNDMRlA/+MxGBREI0MiKGVEIwgoTGciKGVEiQ==", "clear": "CoEBQw=="}, "compilerInfo": {"compiler": "puya", "compilerVersion": {"major": 4, "minor": 7, "patch": 0}}, "events": [], "networks": {}, "source": {"approval": "I3ByYWdtYSB2ZXJzaW9uIDEwCiNwcmFnbWEgdHlwZXRyYWNrIGZhbHNlCgovLyBzbWFydF9jb250cmFjdHMuY291bnRlci5jb250cmFjdC5Db3VudGVyLl9fYWxnb3B5X2VudHJ5cG9pbnRfd2l0aF9pbml0KCkgLT4gdWludDY0OgptYWluOgogICAgaW50Y2Jsb2NrIDAgMQogICAgYnl0ZWNibG9jayAiY291bnQiCiAgICB0eG4gQXBwbGljYXRpb25JRAogICAgYm56IG1haW5fYWZ0ZXJfaWZfZWxzZUAyCiAgICAvLyBzbWFydF9jb250cmFjdHMvY291bnRlci9jb250cmFjdC5weToxMAogICAgLy8gc2VsZi5jb3VudCA9IFVJbnQ2NCgwKQogICAgYnl0ZWNfMCAvLyAiY291bnQiCiAgICBpbnRjXzAgLy8gMAogICAgYXBwX2dsb2JhbF9wdXQKCm1haW5fYWZ0ZXJfaWZfZWxzZUAyOgogICAgLy8gc21hcnRfY29udHJhY3RzL2NvdW50ZXIvY29udHJhY3QucHk6NQogICAgLy8gY2xhc3MgQ291bnRlcihBUkM0Q29udHJhY3QpOgogICAgdHhuIE51bUFwcEFyZ3MKICAgIGJ6IG1haW5fYmFyZV9yb3V0aW5nQDYKICAgIHB1c2hieXRlcyAweDM2ZTcyOTI0IC8vIG1ldGhvZCAiaW5jcl9jb3VudGVyKCl1aW50NjQiCiAgICB0eG5hIEFwcGxpY2F0aW9uQXJncyAwCiAgICBtYXRjaCBtYWluX2luY3JfY291bnRlcl9yb3V0ZUA1CgptYWluX2FmdGVyX2lmX2Vsc2VAODoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9jb3VudGVyL2NvbnRyYWN0LnB5OjUKICAgIC8vIGNsYXNzIENvdW50ZXIoQVJDNENvbnRyYWN0KToKICAgIGludGNfMCAvLyAwCiAgICByZXR1cm4KCm1haW5faW5jcl9jb3VudGVyX3JvdXRlQDU6CiAgICAvLyBzbWFydF9jb250cmFjdHMvY291bnRlci9jb250cmFjdC5weToxNgogICAgLy8gQGFiaW1ldGhvZCgpCiAgICB0eG4gT25Db21wbGV0aW9uCiAgICAhCiAgICBhc3NlcnQgLy8gT25Db21wbGV0aW9uIGlzIG5vdCBOb09wCiAgICB0eG4gQXBwbGljYXRpb25JRAogICAgYXNzZXJ0IC8vIGNhbiBvbmx5IGNhbGwgd2hlbiBub3QgY3JlYXRpbmcKICAgIGNhbGxzdWIgaW5jcl9jb3VudGVyCiAgICBpdG9iCiAgICBwdXNoYnl0ZXMgMHgxNTFmN2M3NQogICAgc3dhcAogICAgY29uY2F0CiAgICBsb2cKICAgIGludGNfMSAvLyAxCiAgICByZXR1cm4KCm1haW5fYmFyZV9yb3V0aW5nQDY6CiAgICAvLyBzbWFydF9jb250cmFjdHMvY291bnRlci9jb250cmFjdC5weTo1CiAgICAvLyBjbGFzcyBDb3VudGVyKEFSQzRDb250cmFjdCk6CiAgICB0eG4gT25Db21wbGV0aW9uCiAgICBibnogbWFpbl9hZnRlcl9pZl9lbHNlQDgKICAgIHR4biBBcHBsaWNhdGlvbklECiAgICAhCiAgICBhc3NlcnQgLy8gY2FuIG9ubHkgY2FsbCB3aGVuIGNyZWF0aW5nCiAgICBpbnRjXzEgLy8gMQogICAgcmV0dXJuCgoKLy8gc21hcnRfY29udHJhY3RzLmNvdW50ZXIuY29udHJhY3QuQ291bnRlci5pbmNyX2NvdW50ZXIoKSAtPiB1aW50NjQ6CmluY3JfY291bnRlcjoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9jb3VudGVyL2NvbnRyYWN0LnB5OjE4CiAgICAvLyBzZWxmLmNvdW50ICs9IFVJbnQ2NCgxKQogICAgaW50Y18wIC8vIDAKICAgIGJ5dGVjXzAgLy8gImNvdW50IgogICAgYXBwX2dsb2JhbF9nZXRfZXgKICAgIGFzc2VydCAvLyBjaGVjayBzZWxmLmNvdW50IGV4aXN0cwogICAgaW50Y18xIC8vIDEKICAgICsKICAgIGJ5dGVjXzAgLy8gImNvdW50IgogICAgc3dhcAogICAgYXBwX2dsb2JhbF9wdXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9jb3VudGVyL2NvbnRyYWN0LnB5OjE5CiAgICAvLyByZXR1cm4gc2VsZi5jb3VudAogICAgaW50Y18wIC8vIDAKICAgIGJ5dGVjXzAgLy8gImNvdW50IgogICAgYXBwX2dsb2JhbF9nZXRfZXgKICAgIGFzc2VydCAvLyBjaGVjayBzZWxmLmNvdW50IGV4aXN0cwogICAgcmV0c3ViCg==", "clear": "I3ByYWdtYSB2ZXJzaW9uIDEwCiNwcmFnbWEgdHlwZXRyYWNrIGZhbHNlCgovLyBhbGdvcHkuYXJjNC5BUkM0Q29udHJhY3QuY2xlYXJfc3RhdGVfcHJvZ3JhbSgpIC0+IHVpbnQ2NDoKbWFpbjoKICAgIHB1c2hpbnQgMSAvLyAxCiAgICByZXR1cm4K"}, "sourceInfo": {"approval": {"pcOffsetMethod": "none", "sourceInfo": [{"pc": [44], "errorMessage": "OnCompletion is not NoOp"}, {"pc": [71], "errorMessage": "can only call when creating"}, {"pc": [47], "errorMessage": "can only call when not creating"}, {"pc": [77, 86], "errorMessage": "check self.count exists"}]}, "clear": {"pcOffsetMethod": "none", "sourceInfo": []}}, "templateVariables": {}}"""
-APP_SPEC = algokit_utils.Arc56Contract.from_json(_APP_SPEC_JSON)
-
-def _parse_abi_args(args: object | None = None) -> list[object] | None:
-    """Helper to parse ABI args into the format expected by underlying client"""
-    if args is None:
-        return None
-
-    def convert_dataclass(value: object) -> object:
-        if dataclasses.is_dataclass(value):
-            return tuple(convert_dataclass(getattr(value, field.name)) for field in dataclasses.fields(value))
-        elif isinstance(value, (list, tuple)):
-            return type(value)(convert_dataclass(item) for item in value)
-        return value
-
-    match args:
-        case tuple():
-            method_args = list(args)
-        case _ if dataclasses.is_dataclass(args):
-            method_args = [getattr(args, field.name) for field in dataclasses.fields(args)]
-        case _:
-            raise ValueError("Invalid 'args' type. Expected 'tuple' or 'TypedDict' for respective typed arguments.")
-
-    return [
-        convert_dataclass(arg) if not isinstance(arg, algokit_utils.AppMethodCallTransactionArgument) else arg
-        for arg in method_args
-    ] if method_args else None
-
-def _init_dataclass(cls: type, data: dict) -> object:
-    """
-    Recursively instantiate a dataclass of type `cls` from `data`.
-
-    For each field on the dataclass, if the field type is also a dataclass
-    and the corresponding data is a dict, instantiate that field recursively.
-    """
-    field_values = {}
-    for field in dataclasses.fields(cls):
-        field_value = data.get(field.name)
-        # Check if the field expects another dataclass and the value is a dict.
-        if dataclasses.is_dataclass(field.type) and isinstance(field_value, dict):
-            field_values[field.name] = _init_dataclass(typing.cast(type, field.type), field_value)
-        else:
-            field_values[field.name] = field_value
-    return cls(**field_values)
-
-class CounterParams:
-    def __init__(self, app_client: algokit_utils.AppClient):
-        self.app_client = app_client
+_APP_SPEC_JSON = r"""{"arcs": [22, 28], "bareActions": {"call": [], "create": ["NoOp"]}, "methods": [{"actions": {"call": ["NoOp"], "create": []}, "args": [], "name": "incr_counter", "returns": {"type": "uint64"}, "events": [], "readonly": false, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [], "name": "get_count", "returns": {"type": "uint64"}, "events": [], "readonly": true, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [], "name": "opup", "returns": {"type": "void"}, "desc": "Does nothing; each call adds to the group's pooled opcode budget", "events": [], "readonly": false, "recommendations": {}}], "name": "Counter", "state": {"keys": {"box": {}, "global": {"count": {"key": "Y291bnQ=", "keyType": "AVMString", "valueType": "AVMUint64"}}, "local": {}}, "maps": {"box": {}, "global": {}, "local": {}}, "schema": {"global": {"bytes": 0, "ints": 1}, "local": {"bytes": 0, "ints": 0}}}, "structs": {}, "byteCode": {"approval": "CiACAAEmAgVjb3VudAQVH3x1MRhAAAMoImcxG0EASYIDBDbnKSQEdV+ViQRMa+pyNhoAjgMAHAALAAIiQzEZFEQxGEQjQzEZFEQxGESIADEWKUxQsCNDMRkURDEYRIgAEhYpTFCwI0MxGUD/zjEYFEQjQyIoZUQjCChMZyIoZUSJIihlRIk=", "clear": "CoEBQw=="}, "compilerInfo": {"compiler": "puya", "compilerVersion": {"major": 4, "minor": 7, "patch": 0}}, "events": [], "networks": {}, "source": {"approval": "I3ByYWdtYSB2ZXJzaW9uIDEwCiNwcmFnbWEgdHlwZXRyYWNrIGZhbHNlCgovLyBzbWFydF9jb250cmFjdHMuY291bnRlci5jb250cmFjdC5Db3VudGVyLl9fYWxnb3B5X2VudHJ5cG9pbnRfd2l0aF9pbml0KCkgLT4gdWludDY0OgptYWluOgogICAgaW50Y2Jsb2NrIDAgMQogICAgYnl0ZWNibG9jayAiY291bnQiIDB4MTUxZjdjNzUKICAgIHR4biBBcHBsaWNhdGlvbklECiAgICBibnogbWFpbl9hZnRlcl9pZl9lbHNlQDIKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9jb3VudGVyL2NvbnRyYWN0LnB5OjEwCiAgICAvLyBzZWxmLmNvdW50ID0gVUludDY0KDApCiAgICBieXRlY18wIC8vICJjb3VudCIKICAgIGludGNfMCAvLyAwCiAgICBhcHBfZ2xvYmFsX3B1dAoKbWFpbl9hZnRlcl9pZl9lbHNlQDI6CiAgICAvLyBzbWFydF9jb250cmFjdHMvY291bnRlci9jb250cmFjdC5weTo1CiAgICAvLyBjbGFzcyBDb3VudGVyKEFSQzRDb250cmFjdCk6CiAgICB0eG4gTnVtQXBwQXJncwogICAgYnogbWFpbl9iYXJlX3JvdXRpbmdAOAogICAgcHVzaGJ5dGVzcyAweDM2ZTcyOTI0IDB4NzU1Zjk1ODkgMHg0YzZiZWE3MiAvLyBtZXRob2QgImluY3JfY291bnRlcigpdWludDY0IiwgbWV0aG9kICJnZXRfY291bnQoKXVpbnQ2NCIsIG1ldGhvZCAib3B1cCgpdm9pZCIKICAgIHR4bmEgQXBwbGljYXRpb25BcmdzIDAKICAgIG1hdGNoIG1haW5faW5jcl9jb3VudGVyX3JvdXRlQDUgbWFpbl9nZXRfY291bnRfcm91dGVANiBtYWluX29wdXBfcm91dGVANwoKbWFpbl9hZnRlcl9pZl9lbHNlQDEwOgogICAgLy8gc21hcnRfY29udHJhY3RzL2NvdW50ZXIvY29udHJhY3QucHk6NQogICAgLy8gY2xhc3MgQ291bnRlcihBUkM0Q29udHJhY3QpOgogICAgaW50Y18wIC8vIDAKICAgIHJldHVybgoKbWFpbl9vcHVwX3JvdXRlQDc6CiAgICAvLyBzbWFydF9jb250cmFjdHMvY291bnRlci9jb250cmFjdC5weToyNQogICAgLy8gQGFiaW1ldGhvZCgpCiAgICB0eG4gT25Db21wbGV0aW9uCiAgICAhCiAgICBhc3NlcnQgLy8gT25Db21wbGV0aW9uIGlzIG5vdCBOb09wCiAgICB0eG4gQXBwbGljYXRpb25JRAogICAgYXNzZXJ0IC8vIGNhbiBvbmx5IGNhbGwgd2hlbiBub3QgY3JlYXRpbmcKICAgIGludGNfMSAvLyAxCiAgICByZXR1cm4KCm1haW5fZ2V0X2NvdW50X3JvdXRlQDY6CiAgICAvLyBzbWFydF9jb250cmFjdHMvY291bnRlci9jb250cmFjdC5weToyMQogICAgLy8gQGFiaW1ldGhvZChyZWFkb25seT1UcnVlKQogICAgdHhuIE9uQ29tcGxldGlvbgogICAgIQogICAgYXNzZXJ0IC8vIE9uQ29tcGxldGlvbiBpcyBub3QgTm9PcAogICAgdHhuIEFwcGxpY2F0aW9uSUQKICAgIGFzc2VydCAvLyBjYW4gb25seSBjYWxsIHdoZW4gbm90IGNyZWF0aW5nCiAgICBjYWxsc3ViIGdldF9jb3VudAogICAgaXRvYgogICAgYnl0ZWNfMSAvLyAweDE1MWY3Yzc1CiAgICBzd2FwCiAgICBjb25jYXQKICAgIGxvZwogICAgaW50Y18xIC8vIDEKICAgIHJldHVybgoKbWFpbl9pbmNyX2NvdW50ZXJfcm91dGVANToKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9jb3VudGVyL2NvbnRyYWN0LnB5OjE2CiAgICAvLyBAYWJpbWV0aG9kKCkKICAgIHR4biBPbkNvbXBsZXRpb24KICAgICEKICAgIGFzc2VydCAvLyBPbkNvbXBsZXRpb24gaXMgbm90IE5vT3AKICAgIHR4biBBcHBsaWNhdGlvbklECiAgICBhc3NlcnQgLy8gY2FuIG9ubHkgY2FsbCB3aGVuIG5vdCBjcmVhdGluZwogICAgY2FsbHN1YiBpbmNyX2NvdW50ZXIKICAgIGl0b2IKICAgIGJ5dGVjXzEgLy8gMHgxNTFmN2M3NQogICAgc3dhcAogICAgY29uY2F0CiAgICBsb2cKICAgIGludGNfMSAvLyAxCiAgICByZXR1cm4KCm1haW5fYmFyZV9yb3V0aW5nQDg6CiAgICAvLyBzbWFydF9jb250cmFjdHMvY291bnRlci9jb250cmFjdC5weTo1CiAgICAvLyBjbGFzcyBDb3VudGVyKEFSQzRDb250cmFjdCk6CiAgICB0eG4gT25Db21wbGV0aW9uCiAgICBibnogbWFpbl9hZnRlcl9pZl9lbHNlQDEwCiAgICB0eG4gQXBwbGljYXRpb25JRAogICAgIQogICAgYXNzZXJ0IC8vIGNhbiBvbmx5IGNhbGwgd2hlbiBjcmVhdGluZwogICAgaW50Y18xIC8vIDEKICAgIHJldHVybgoKCi8vIHNtYXJ0X2NvbnRyYWN0cy5jb3VudGVyLmNvbnRyYWN0LkNvdW50ZXIuaW5jcl9jb3VudGVyKCkgLT4gdWludDY0OgppbmNyX2NvdW50ZXI6CiAgICAvLyBzbWFydF9jb250cmFjdHMvY291bnRlci9jb250cmFjdC5weToxOAogICAgLy8gc2VsZi5jb3VudCArPSBVSW50NjQoMSkKICAgIGludGNfMCAvLyAwCiAgICBieXRlY18wIC8vICJjb3VudCIKICAgIGFwcF9nbG9iYWxfZ2V0X2V4CiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi5jb3VudCBleGlzdHMKICAgIGludGNfMSAvLyAxCiAgICArCiAgICBieXRlY18wIC8vICJjb3VudCIKICAgIHN3YXAKICAgIGFwcF9nbG9iYWxfcHV0CiAgICAvLyBzbWFydF9jb250cmFjdHMvY291bnRlci9jb250cmFjdC5weToxOQogICAgLy8gcmV0dXJuIHNlbGYuY291bnQKICAgIGludGNfMCAvLyAwCiAgICBieXRlY18wIC8vICJjb3VudCIKICAgIGFwcF9nbG9iYWxfZ2V0X2V4CiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi5jb3VudCBleGlzdHMKICAgIHJldHN1YgoKCi8vIHNtYXJ0X2NvbnRyYWN0cy5jb3VudGVyLmNvbnRyYWN0LkNvdW50ZXIuZ2V0X2NvdW50KCkgLT4gdWludDY0OgpnZXRfY291bnQ6CiAgICAvLyBzbWFydF9jb250cmFjdHMvY291bnRlci9jb250cmFjdC5weToyMwogICAgLy8gcmV0dXJuIHNlbGYuY291bnQKICAgIGludGNfMCAvLyAwCiAgICBieXRlY18wIC8vICJjb3VudCIKICAgIGFwcF9nbG9iYWxfZ2V0X2V4CiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi5jb3VudCBleGlzdHMKICAgIHJldHN1Ygo=", "clear": "I3ByYWdtYSB2ZXJzaW9uIDEwCiNwcmFnbWEgdHlwZXRyYWNrIGZhbHNlCgovLyBhbGdvcHkuYXJjNC5BUkM0Q29udHJhY3QuY2xlYXJfc3RhdGVfcHJvZ3JhbSgpIC0+IHVpbnQ2NDoKbWFpbjoKICAgIHB1c2hpbnQgMSAvLyAxCiAgICByZXR1cm4K"}, "sourceInfo": {"approval": {"pcOffsetMethod": "none", "sourceInfo": [{"pc": [64, 73, 90], "errorMessage": "OnCompletion is not NoOp"}, {"pc": [112], "errorMessage": "can only call when creating"}, {"pc": [67, 76, 93], "errorMessage": "can only call when not creating"}, {"pc": [118, 127, 132], "errorMessage": "check self.count exists"}]}, "clear": {"pcOffsetMethod": "none", "sourceInfo": []}}, "templateVariables": {}}"""
+from smart_contracts._helpers.lazy_spec import LazyAppSpec
+_APP_SPEC = LazyAppSpec(_APP_SPEC_JSON)
+
+
+def __getattr__(name: str) -> typing.Any:
+    # Keeps `APP_SPEC` importable while only parsing it on first use
+    if name == "APP_SPEC":
+        return _APP_SPEC.get()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+from smart_contracts._helpers.client_runtime import init_dataclass as _init_dataclass
+
+
+from smart_contracts._helpers.client_runtime import AppClientBase as _AppClientBase, AppFactoryBase as _AppFactoryBase, ComposerBase as _ComposerBase, CreateTransactionParamsBase as _CreateTransactionParamsBase, FactoryCreateParamsBase as _FactoryCreateParamsBase, FactoryCreateTransactionCreateBase as _FactoryCreateTransactionCreateBase, FactoryDeleteParamsBase as _FactoryDeleteParamsBase, FactorySendCreateBase as _FactorySendCreateBase, FactoryUpdateParamsBase as _FactoryUpdateParamsBase, ParamsBase as _ParamsBase, SendBase as _SendBase, client_part as _client_part, factory_part as _factory_part
+
+from smart_contracts._helpers.client_runtime import CachedAccessor as _CachedAccessor
+
+class CounterParams(_ParamsBase):
+    __slots__ = ()
 
     def incr_counter(
         self,
         params: algokit_utils.CommonAppCallParams | None = None
     ) -> algokit_utils.AppCallMethodCallParams:
-    
-        params = params or algokit_utils.CommonAppCallParams()
-        return self.app_client.params.call(algokit_utils.AppClientMethodCallParams(**{
-            **dataclasses.asdict(params),
-            "method": "incr_counter()uint64",
-        }))
-
-    def clear_state(
+        return self._call("incr_counter()uint64", None, params)
+
+    def get_count(
         self,
-        params: algokit_utils.AppClientBareCallParams | None = None,
-        
-    ) -> algokit_utils.AppCallParams:
-        return self.app_client.params.bare.clear_state(
-            params,
-            
-        )
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> algokit_utils.AppCallMethodCallParams:
+        return self._call("get_count()uint64", None, params)
 
+    def opup(
+        self,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> algokit_utils.AppCallMethodCallParams:
+        return self._call("opup()void", None, params)
 
-class CounterCreateTransactionParams:
-    def __init__(self, app_client: algokit_utils.AppClient):
-        self.app_client = app_client
+
+class CounterCreateTransactionParams(_CreateTransactionParamsBase):
+    __slots__ = ()
 
     def incr_counter(
         self,
         params: algokit_utils.CommonAppCallParams | None = None
     ) -> algokit_utils.BuiltTransactions:
-    
-        params = params or algokit_utils.CommonAppCallParams()
-        return self.app_client.create_transaction.call(algokit_utils.AppClientMethodCallParams(**{
-            **dataclasses.asdict(params),
-            "method": "incr_counter()uint64",
-        }))
-
-    def clear_state(
+        return self._call("incr_counter()uint64", None, params)
+
+    def get_count(
         self,
-        params: algokit_utils.AppClientBareCallParams | None = None,
-        
-    ) -> Transaction:
-        return self.app_client.create_transaction.bare.clear_state(
-            params,
-            
-        )
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> algokit_utils.BuiltTransactions:
+        return self._call("get_count()uint64", None, params)
 
+    def opup(
+        self,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> algokit_utils.BuiltTransactions:
+        return self._call("opup()void", None, params)
 
-class CounterSend:
-    def __init__(self, app_client: algokit_utils.AppClient):
-        self.app_client = app_client
+
+class CounterSend(_SendBase):
+    __slots__ = ()
 
     def incr_counter(
         self,
         params: algokit_utils.CommonAppCallParams | None = None,
         send_params: algokit_utils.SendParams | None = None
     ) -> algokit_utils.SendAppTransactionResult[int]:
-    
-        params = params or algokit_utils.CommonAppCallParams()
-        response = self.app_client.send.call(algokit_utils.AppClientMethodCallParams(**{
-            **dataclasses.asdict(params),
-            "method": "incr_counter()uint64",
-        }), send_params=send_params)
-        parsed_response = response
-        return typing.cast(algokit_utils.SendAppTransactionResult[int], parsed_response)
-
-    def clear_state(
+        return self._call("incr_counter()uint64", None, params, send_params)
+
+    def get_count(
         self,
-        params: algokit_utils.AppClientBareCallParams | None = None,
+        params: algokit_utils.CommonAppCallParams | None = None,
+        send_params: algokit_utils.SendParams | None = None
+    ) -> algokit_utils.SendAppTransactionResult[int]:
+        return self._call("get_count()uint64", None, params, send_params)
+
+    def opup(
+        self,
+        params: algokit_utils.CommonAppCallParams | None = None,
         send_params: algokit_utils.SendParams | None = None
-    ) -> algokit_utils.SendAppTransactionResult[algokit_utils.ABIReturn]:
-        return self.app_client.send.bare.clear_state(
-            params,
-            send_params=send_params,
-        )
+    ) -> algokit_utils.SendAppTransactionResult[None]:
+        return self._call("opup()void", None, params, send_params)
 
 
 class GlobalStateValue(typing.TypedDict):
@@ -152,10 +113,12 @@ class GlobalStateValue(typing.TypedDict):
 class CounterState:
     """Methods to access state for the current Counter app"""
 
+    __slots__ = ('app_client', '_cached_global_state',)
+
     def __init__(self, app_client: algokit_utils.AppClient):
         self.app_client = app_client
 
-    @property
+    @_CachedAccessor
     def global_state(
         self
     ) -> "_GlobalState":
@@ -163,6 +126,8 @@ class CounterState:
             return _GlobalState(self.app_client)
 
 class _GlobalState:
+    __slots__ = ('app_client', '_struct_classes',)
+
     def __init__(self, app_client: algokit_utils.AppClient):
         self.app_client = app_client
         
@@ -193,145 +158,14 @@ class _GlobalState:
             return _init_dataclass(self._struct_classes["AVMUint64"], value)  # type: ignore
         return typing.cast(int, value)
 
-class CounterClient:
+class CounterClient(_AppClientBase):
     """Client for interacting with Counter smart contract"""
 
-    @typing.overload
-    def __init__(self, app_client: algokit_utils.AppClient) -> None: ...
-    
-    @typing.overload
-    def __init__(
-        self,
-        *,
-        algorand: _AlgoKitAlgorandClient,
-        app_id: int,
-        app_name: str | None = None,
-        default_sender: str | None = None,
-        default_signer: TransactionSigner | None = None,
-        approval_source_map: SourceMap | None = None,
-        clear_source_map: SourceMap | None = None,
-    ) -> None: ...
-
-    def __init__(
-        self,
-        app_client: algokit_utils.AppClient | None = None,
-        *,
-        algorand: _AlgoKitAlgorandClient | None = None,
-        app_id: int | None = None,
-        app_name: str | None = None,
-        default_sender: str | None = None,
-        default_signer: TransactionSigner | None = None,
-        approval_source_map: SourceMap | None = None,
-        clear_source_map: SourceMap | None = None,
-    ) -> None:
-        if app_client:
-            self.app_client = app_client
-        elif algorand and app_id:
-            self.app_client = algokit_utils.AppClient(
-                algokit_utils.AppClientParams(
-                    algorand=algorand,
-                    app_spec=APP_SPEC,
-                    app_id=app_id,
-                    app_name=app_name,
-                    default_sender=default_sender,
-                    default_signer=default_signer,
-                    approval_source_map=approval_source_map,
-                    clear_source_map=clear_source_map,
-                )
-            )
-        else:
-            raise ValueError("Either app_client or algorand and app_id must be provided")
-    
-        self.params = CounterParams(self.app_client)
-        self.create_transaction = CounterCreateTransactionParams(self.app_client)
-        self.send = CounterSend(self.app_client)
-        self.state = CounterState(self.app_client)
-
-    @staticmethod
-    def from_creator_and_name(
-        creator_address: str,
-        app_name: str,
-        algorand: _AlgoKitAlgorandClient,
-        default_sender: str | None = None,
-        default_signer: TransactionSigner | None = None,
-        approval_source_map: SourceMap | None = None,
-        clear_source_map: SourceMap | None = None,
-        ignore_cache: bool | None = None,
-        app_lookup_cache: algokit_utils.ApplicationLookup | None = None,
-    ) -> "CounterClient":
-        return CounterClient(
-            algokit_utils.AppClient.from_creator_and_name(
-                creator_address=creator_address,
-                app_name=app_name,
-                app_spec=APP_SPEC,
-                algorand=algorand,
-                default_sender=default_sender,
-                default_signer=default_signer,
-                approval_source_map=approval_source_map,
-                clear_source_map=clear_source_map,
-                ignore_cache=ignore_cache,
-                app_lookup_cache=app_lookup_cache,
-            )
-        )
-    
-    @staticmethod
-    def from_network(
-        algorand: _AlgoKitAlgorandClient,
-        app_name: str | None = None,
-        default_sender: str | None = None,
-        default_signer: TransactionSigner | None = None,
-        approval_source_map: SourceMap | None = None,
-        clear_source_map: SourceMap | None = None,
-    ) -> "CounterClient":
-        return CounterClient(
-            algokit_utils.AppClient.from_network(
-                app_spec=APP_SPEC,
-                algorand=algorand,
-                app_name=app_name,
-                default_sender=default_sender,
-                default_signer=default_signer,
-                approval_source_map=approval_source_map,
-                clear_source_map=clear_source_map,
-            )
-        )
-
-    @property
-    def app_id(self) -> int:
-        return self.app_client.app_id
-    
-    @property
-    def app_address(self) -> str:
-        return self.app_client.app_address
-    
-    @property
-    def app_name(self) -> str:
-        return self.app_client.app_name
-    
-    @property
-    def app_spec(self) -> algokit_utils.Arc56Contract:
-        return self.app_client.app_spec
-    
-    @property
-    def algorand(self) -> _AlgoKitAlgorandClient:
-        return self.app_client.algorand
-
-    def clone(
-        self,
-        app_name: str | None = None,
-        default_sender: str | None = None,
-        default_signer: TransactionSigner | None = None,
-        approval_source_map: SourceMap | None = None,
-        clear_source_map: SourceMap | None = None,
-    ) -> "CounterClient":
-        return CounterClient(
-            self.app_client.clone(
-                app_name=app_name,
-                default_sender=default_sender,
-                default_signer=default_signer,
-                approval_source_map=approval_source_map,
-                clear_source_map=clear_source_map,
-            )
-        )
+    _app_spec = _APP_SPEC
+    params = _client_part(CounterParams)
+    create_transaction = _client_part(CounterCreateTransactionParams)
+    send = _client_part(CounterSend)
+    state = _client_part(CounterState)
 
     def new_group(self) -> "CounterComposer":
         return CounterComposer(self)
@@ -343,6 +177,18 @@ class CounterClient:
         return_value: algokit_utils.ABIReturn | None
     ) -> int | None: ...
     @typing.overload
+    def decode_return_value(
+        self,
+        method: typing.Literal["get_count()uint64"],
+        return_value: algokit_utils.ABIReturn | None
+    ) -> int | None: ...
+    @typing.overload
+    def decode_return_value(
+        self,
+        method: typing.Literal["opup()void"],
+        return_value: algokit_utils.ABIReturn | None
+    ) -> None: ...
+    @typing.overload
     def decode_return_value(
         self,
         method: str,
@@ -355,21 +201,7 @@ class CounterClient:
         return_value: algokit_utils.ABIReturn | None
     ) -> algokit_utils.ABIValue | algokit_utils.ABIStruct | None | int:
         """Decode ABI return value for the given method."""
-        if return_value is None:
-            return None
-    
-        arc56_method = self.app_spec.get_arc56_method(method)
-        decoded = return_value.get_arc56_value(arc56_method, self.app_spec.structs)
-    
-        # If method returns a struct, convert the dict to appropriate dataclass
-        if (arc56_method and
-            arc56_method.returns and
-            arc56_method.returns.struct and
-            isinstance(decoded, dict)):
-            struct_class = globals().get(arc56_method.returns.struct)
-            if struct_class:
-                return struct_class(**typing.cast(dict, decoded))
-        return decoded
+        return super().decode_return_value(method, return_value)
 
 
 @dataclasses.dataclass(frozen=True)
@@ -380,337 +212,124 @@ class CounterBareCallCreateParams(algokit_utils.AppClientBareCallCreateParams):
     def to_algokit_utils_params(self) -> algokit_utils.AppClientBareCallCreateParams:
         return algokit_utils.AppClientBareCallCreateParams(**self.__dict__)
 
-class CounterFactory(algokit_utils.TypedAppFactoryProtocol[CounterBareCallCreateParams, None, None]):
-    """Factory for deploying and managing CounterClient smart contracts"""
-
-    def __init__(
-        self,
-        algorand: _AlgoKitAlgorandClient,
-        *,
-        app_name: str | None = None,
-        default_sender: str | None = None,
-        default_signer: TransactionSigner | None = None,
-        version: str | None = None,
-        compilation_params: algokit_utils.AppClientCompilationParams | None = None,
-    ):
-        self.app_factory = algokit_utils.AppFactory(
-            params=algokit_utils.AppFactoryParams(
-                algorand=algorand,
-                app_spec=APP_SPEC,
-                app_name=app_name,
-                default_sender=default_sender,
-                default_signer=default_signer,
-                version=version,
-                compilation_params=compilation_params,
-            )
-        )
-        self.params = CounterFactoryParams(self.app_factory)
-        self.create_transaction = CounterFactoryCreateTransaction(self.app_factory)
-        self.send = CounterFactorySend(self.app_factory)
-
-    @property
-    def app_name(self) -> str:
-        return self.app_factory.app_name
-    
-    @property
-    def app_spec(self) -> algokit_utils.Arc56Contract:
-        return self.app_factory.app_spec
-    
-    @property
-    def algorand(self) -> _AlgoKitAlgorandClient:
-        return self.app_factory.algorand
-
-    def deploy(
-        self,
-        *,
-        on_update: algokit_utils.OnUpdate | None = None,
-        on_schema_break: algokit_utils.OnSchemaBreak | None = None,
-        create_params: CounterBareCallCreateParams | None = None,
-        update_params: None = None,
-        delete_params: None = None,
-        existing_deployments: algokit_utils.ApplicationLookup | None = None,
-        ignore_cache: bool = False,
-        app_name: str | None = None,
-        compilation_params: algokit_utils.AppClientCompilationParams | None = None,
-        send_params: algokit_utils.SendParams | None = None,
-    ) -> tuple[CounterClient, algokit_utils.AppFactoryDeployResult]:
-        """Deploy the application"""
-        deploy_response = self.app_factory.deploy(
-            on_update=on_update,
-            on_schema_break=on_schema_break,
-            create_params=create_params.to_algokit_utils_params() if create_params else None,
-            update_params=update_params,
-            delete_params=delete_params,
-            existing_deployments=existing_deployments,
-            ignore_cache=ignore_cache,
-            app_name=app_name,
-            compilation_params=compilation_params,
-            send_params=send_params,
-        )
-
-        return CounterClient(deploy_response[0]), deploy_response[1]
-
-    def get_app_client_by_creator_and_name(
-        self,
-        creator_address: str,
-        app_name: str,
-        default_sender: str | None = None,
-        default_signer: TransactionSigner | None = None,
-        ignore_cache: bool | None = None,
-        app_lookup_cache: algokit_utils.ApplicationLookup | None = None,
-        approval_source_map: SourceMap | None = None,
-        clear_source_map: SourceMap | None = None,
-    ) -> CounterClient:
-        """Get an app client by creator address and name"""
-        return CounterClient(
-            self.app_factory.get_app_client_by_creator_and_name(
-                creator_address,
-                app_name,
-                default_sender,
-                default_signer,
-                ignore_cache,
-                app_lookup_cache,
-                approval_source_map,
-                clear_source_map,
-            )
-        )
-
-    def get_app_client_by_id(
-        self,
-        app_id: int,
-        app_name: str | None = None,
-        default_sender: str | None = None,
-        default_signer: TransactionSigner | None = None,
-        approval_source_map: SourceMap | None = None,
-        clear_source_map: SourceMap | None = None,
-    ) -> CounterClient:
-        """Get an app client by app ID"""
-        return CounterClient(
-            self.app_factory.get_app_client_by_id(
-                app_id,
-                app_name,
-                default_sender,
-                default_signer,
-                approval_source_map,
-                clear_source_map,
-            )
-        )
-
 
 class CounterFactoryParams:
     """Parameters for creating transactions for Counter contract"""
 
+    __slots__ = ('app_factory', 'create', 'update', 'delete',)
+
     def __init__(self, app_factory: algokit_utils.AppFactory):
         self.app_factory = app_factory
         self.create = CounterFactoryCreateParams(app_factory)
         self.update = CounterFactoryUpdateParams(app_factory)
         self.delete = CounterFactoryDeleteParams(app_factory)
 
-class CounterFactoryCreateParams:
+class CounterFactoryCreateParams(_FactoryCreateParamsBase):
     """Parameters for 'create' operations of Counter contract"""
 
-    def __init__(self, app_factory: algokit_utils.AppFactory):
-        self.app_factory = app_factory
+    __slots__ = ()
 
-    def bare(
+    def incr_counter(
         self,
         *,
         params: algokit_utils.CommonAppCallCreateParams | None = None,
         compilation_params: algokit_utils.AppClientCompilationParams | None = None
-    ) -> algokit_utils.AppCreateParams:
-        """Creates an instance using a bare call"""
-        params = params or algokit_utils.CommonAppCallCreateParams()
-        return self.app_factory.params.bare.create(
-            algokit_utils.AppFactoryCreateParams(**dataclasses.asdict(params)),
-            compilation_params=compilation_params)
+    ) -> algokit_utils.AppCreateMethodCallParams:
+        """Creates a new instance using the incr_counter()uint64 ABI method"""
+        return self._create("incr_counter()uint64", None, params, compilation_params)
 
-    def incr_counter(
+    def get_count(
         self,
         *,
         params: algokit_utils.CommonAppCallCreateParams | None = None,
         compilation_params: algokit_utils.AppClientCompilationParams | None = None
     ) -> algokit_utils.AppCreateMethodCallParams:
-        """Creates a new instance using the incr_counter()uint64 ABI method"""
-        params = params or algokit_utils.CommonAppCallCreateParams()
-        return self.app_factory.params.create(
-            algokit_utils.AppFactoryCreateMethodCallParams(
-                **{
-                **dataclasses.asdict(params),
-                "method": "incr_counter()uint64",
-                "args": None,
-                }
-            ),
-            compilation_params=compilation_params
-        )
-
-class CounterFactoryUpdateParams:
-    """Parameters for 'update' operations of Counter contract"""
-
-    def __init__(self, app_factory: algokit_utils.AppFactory):
-        self.app_factory = app_factory
+        """Creates a new instance using the get_count()uint64 ABI method"""
+        return self._create("get_count()uint64", None, params, compilation_params)
 
-    def bare(
+    def opup(
         self,
         *,
         params: algokit_utils.CommonAppCallCreateParams | None = None,
-        
-    ) -> algokit_utils.AppUpdateParams:
-        """Updates an instance using a bare call"""
-        params = params or algokit_utils.CommonAppCallCreateParams()
-        return self.app_factory.params.bare.deploy_update(
-            algokit_utils.AppClientBareCallParams(**dataclasses.asdict(params)),
-            )
+        compilation_params: algokit_utils.AppClientCompilationParams | None = None
+    ) -> algokit_utils.AppCreateMethodCallParams:
+        """Creates a new instance using the opup()void ABI method"""
+        return self._create("opup()void", None, params, compilation_params)
 
-class CounterFactoryDeleteParams:
-    """Parameters for 'delete' operations of Counter contract"""
+class CounterFactoryUpdateParams(_FactoryUpdateParamsBase):
+    """Parameters for 'update' operations of Counter contract"""
 
-    def __init__(self, app_factory: algokit_utils.AppFactory):
-        self.app_factory = app_factory
+    __slots__ = ()
 
-    def bare(
-        self,
-        *,
-        params: algokit_utils.CommonAppCallCreateParams | None = None,
-        
-    ) -> algokit_utils.AppDeleteParams:
-        """Deletes an instance using a bare call"""
-        params = params or algokit_utils.CommonAppCallCreateParams()
-        return self.app_factory.params.bare.deploy_delete(
-            algokit_utils.AppClientBareCallParams(**dataclasses.asdict(params)),
-            )
+
+class CounterFactoryDeleteParams(_FactoryDeleteParamsBase):
+    """Parameters for 'delete' operations of Counter contract"""
+
+    __slots__ = ()
 
 
 class CounterFactoryCreateTransaction:
     """Create transactions for Counter contract"""
 
+    __slots__ = ('app_factory', 'create',)
+
     def __init__(self, app_factory: algokit_utils.AppFactory):
         self.app_factory = app_factory
         self.create = CounterFactoryCreateTransactionCreate(app_factory)
 
 
-class CounterFactoryCreateTransactionCreate:
+class CounterFactoryCreateTransactionCreate(_FactoryCreateTransactionCreateBase):
     """Create new instances of Counter contract"""
 
-    def __init__(self, app_factory: algokit_utils.AppFactory):
-        self.app_factory = app_factory
-
-    def bare(
-        self,
-        params: algokit_utils.CommonAppCallCreateParams | None = None,
-    ) -> Transaction:
-        """Creates a new instance using a bare call"""
-        params = params or algokit_utils.CommonAppCallCreateParams()
-        return self.app_factory.create_transaction.bare.create(
-            algokit_utils.AppFactoryCreateParams(**dataclasses.asdict(params)),
-        )
+    __slots__ = ()
 
 
 class CounterFactorySend:
     """Send calls to Counter contract"""
 
+    __slots__ = ('app_factory', 'create',)
+
     def __init__(self, app_factory: algokit_utils.AppFactory):
         self.app_factory = app_factory
         self.create = CounterFactorySendCreate(app_factory)
 
 
-class CounterFactorySendCreate:
+class CounterFactorySendCreate(_FactorySendCreateBase[CounterClient]):
     """Send create calls to Counter contract"""
 
-    def __init__(self, app_factory: algokit_utils.AppFactory):
-        self.app_factory = app_factory
+    __slots__ = ()
+    _client = CounterClient
 
-    def bare(
-        self,
-        *,
-        params: algokit_utils.CommonAppCallCreateParams | None = None,
-        send_params: algokit_utils.SendParams | None = None,
-        compilation_params: algokit_utils.AppClientCompilationParams | None = None,
-    ) -> tuple[CounterClient, algokit_utils.SendAppCreateTransactionResult]:
-        """Creates a new instance using a bare call"""
-        params = params or algokit_utils.CommonAppCallCreateParams()
-        result = self.app_factory.send.bare.create(
-            algokit_utils.AppFactoryCreateParams(**dataclasses.asdict(params)),
-            send_params=send_params,
-            compilation_params=compilation_params
-        )
-        return CounterClient(result[0]), result[1]
-
-
-class CounterComposer:
+
+class CounterFactory(_AppFactoryBase[CounterClient], algokit_utils.TypedAppFactoryProtocol[CounterBareCallCreateParams, None, None]):
+    """Factory for deploying and managing CounterClient smart contracts"""
+
+    _app_spec = _APP_SPEC
+    _client = CounterClient
+    params = _factory_part(CounterFactoryParams)
+    create_transaction = _factory_part(CounterFactoryCreateTransaction)
+    send = _factory_part(CounterFactorySend)
+
+
+class CounterComposer(_ComposerBase[CounterClient]):
     """Composer for creating transaction groups for Counter contract calls"""
 
-    def __init__(self, client: "CounterClient"):
-        self.client = client
-        self._composer = client.algorand.new_group()
-        self._result_mappers: list[typing.Callable[[algokit_utils.ABIReturn | None], object] | None] = []
+    __slots__ = ()
 
     def incr_counter(
         self,
         params: algokit_utils.CommonAppCallParams | None = None
     ) -> "CounterComposer":
-        self._composer.add_app_call_method_call(
-            self.client.params.incr_counter(
-                
-                params=params,
-            )
-        )
-        self._result_mappers.append(
-            lambda v: self.client.decode_return_value(
-                "incr_counter()uint64", v
-            )
-        )
-        return self
+        return self._call("incr_counter()uint64", None, params)
 
-    def clear_state(
+    def get_count(
         self,
-        *,
-        args: list[bytes] | None = None,
-        params: algokit_utils.CommonAppCallParams | None = None,
-    ) -> "CounterComposer":
-        params=params or algokit_utils.CommonAppCallParams()
-        self._composer.add_app_call(
-            self.client.params.clear_state(
-                algokit_utils.AppClientBareCallParams(
-                    **{
-                        **dataclasses.asdict(params),
-                        "args": args
-                    }
-                )
-            )
-        )
-        return self
-    
-    def add_transaction(
-        self, txn: Transaction, signer: TransactionSigner | None = None
+        params: algokit_utils.CommonAppCallParams | None = None
     ) -> "CounterComposer":
-        self._composer.add_transaction(txn, signer)
-        return self
-    
-    def composer(self) -> algokit_utils.TransactionComposer:
-        return self._composer
-    
-    def simulate(
-        self,
-        allow_more_logs: bool | None = None,
-        allow_empty_signatures: bool | None = None,
-        allow_unnamed_resources: bool | None = None,
-        extra_opcode_budget: int | None = None,
-        exec_trace_config: SimulateTraceConfig | None = None,
-        simulation_round: int | None = None,
-        skip_signatures: bool | None = None,
-    ) -> algokit_utils.SendAtomicTransactionComposerResults:
-        return self._composer.simulate(
-            allow_more_logs=allow_more_logs,
-            allow_empty_signatures=allow_empty_signatures,
-            allow_unnamed_resources=allow_unnamed_resources,
-            extra_opcode_budget=extra_opcode_budget,
-            exec_trace_config=exec_trace_config,
-            simulation_round=simulation_round,
-            skip_signatures=skip_signatures,
-        )
-    
-    def send(
+        return self._call("get_count()uint64", None, params)
+
+    def opup(
         self,
-        send_params: algokit_utils.SendParams | None = None
-    ) -> algokit_utils.SendAtomicTransactionComposerResults:
-        return self._composer.send(send_params)
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> "CounterComposer":
+        return self._call("opup()void", None, params)
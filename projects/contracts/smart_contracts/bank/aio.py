@@ -0,0 +1,101 @@
+from types import TracebackType
+
+from algosdk import transaction
+
+from smart_contracts._helpers.aio import (
+    AsyncAlgod,
+    AsyncAppClient,
+    AsyncComposerBase,
+    AsyncGlobalState,
+    AsyncMapState,
+    AsyncSendBase,
+    async_compose,
+    async_send,
+)
+from smart_contracts.artifacts.bank.bank_client import (
+    BankClient,
+    BankComposer,
+    BankSend,
+    BankState,
+)
+
+
+class AsyncBankClient:
+    """
+    asyncio counterpart of `BankClient`, with the same `send`, `state` and `new_group` surface.
+
+    Calls are built by the wrapped `BankClient` and sent over a pooled `httpx.AsyncClient`,
+    so many of them can be in flight from one event loop. The payment for `deposit` has
+    to be passed as a built `Transaction`; `suggested_params` fetches what it needs.
+    """
+
+    def __init__(self, client: BankClient, algod: AsyncAlgod | None = None):
+        self.client = client
+        self.app = AsyncAppClient(client.app_client, algod)
+        self.send = AsyncBankSend(self.app)
+        self.state = AsyncBankState(self.app)
+
+    @property
+    def app_id(self) -> int:
+        return self.client.app_id
+
+    @property
+    def app_address(self) -> str:
+        return self.client.app_address
+
+    async def suggested_params(self) -> transaction.SuggestedParams:
+        return await self.app.algod.suggested_params()
+
+    def new_group(self) -> "AsyncBankComposer":
+        return AsyncBankComposer(self.app)
+
+    async def aclose(self) -> None:
+        await self.app.aclose()
+
+    async def __aenter__(self) -> "AsyncBankClient":
+        return self
+
+    async def __aexit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_value: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        await self.aclose()
+
+
+class AsyncBankSend(AsyncSendBase, mirrors=BankSend):
+    deposit = async_send(BankSend.deposit)
+    withdraw = async_send(BankSend.withdraw)
+    balance_of = async_send(BankSend.balance_of)
+    set_paused = async_send(BankSend.set_paused)
+    approve_successor = async_send(BankSend.approve_successor)
+    export_deposits = async_send(BankSend.export_deposits)
+    import_deposits = async_send(BankSend.import_deposits)
+    opup = async_send(BankSend.opup)
+
+
+class AsyncBankState:
+    def __init__(self, app: AsyncAppClient):
+        self.global_state = AsyncGlobalState(
+            app, lambda app_client: BankState(app_client).global_state
+        )
+        self.box = _AsyncBoxState(app)
+
+
+class _AsyncBoxState:
+    def __init__(self, app: AsyncAppClient):
+        self.deposits: AsyncMapState[str, int] = AsyncMapState(app, "deposits")
+
+
+class AsyncBankComposer(AsyncComposerBase, mirrors=BankComposer):
+    """asyncio counterpart of `BankComposer`."""
+
+    deposit = async_compose(BankComposer.deposit)
+    withdraw = async_compose(BankComposer.withdraw)
+    balance_of = async_compose(BankComposer.balance_of)
+    set_paused = async_compose(BankComposer.set_paused)
+    approve_successor = async_compose(BankComposer.approve_successor)
+    export_deposits = async_compose(BankComposer.export_deposits)
+    import_deposits = async_compose(BankComposer.import_deposits)
+    opup = async_compose(BankComposer.opup)
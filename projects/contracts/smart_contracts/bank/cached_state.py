@@ -0,0 +1,47 @@
+from smart_contracts._helpers.state_cache import (
+    CachedMapState,
+    CachedSend,
+    StateCache,
+    cached_reads,
+)
+from smart_contracts.artifacts.bank.bank_client import BankClient, BankSend, BankState
+
+
+class CachedBankClient:
+    """
+    `BankClient` whose state reads go through a shared `StateCache`.
+
+    Calls sent through `send` are recorded with the cache as they confirm, so reads
+    after them see their writes.
+    """
+
+    def __init__(self, client: BankClient, cache: StateCache):
+        self.client = client
+        self.send = CachedBankSend(client, cache)
+        self.state = CachedBankState(client, cache)
+
+
+class CachedBankSend(CachedSend, BankSend):
+    """`BankClient.send` counterpart that tells a `StateCache` about every write."""
+
+    __slots__ = ()
+
+
+class CachedBankState:
+    """`BankClient.state` with every read served through a shared `StateCache`."""
+
+    def __init__(self, client: BankClient, cache: StateCache):
+        # The generated accessors, one per global key, reading through the cache
+        self.global_state = BankState(cached_reads(cache, client)).global_state
+        self.box = _CachedBoxState(client, cache)
+
+
+class _CachedBoxState:
+    def __init__(self, client: BankClient, cache: StateCache):
+        self._client = client
+        self._cache = cache
+
+    @property
+    def deposits(self) -> CachedMapState[str, int]:
+        """Get values from the deposits map in box state"""
+        return CachedMapState(self._cache, self._client, "deposits")
@@ -0,0 +1,70 @@
+import algokit_utils
+
+from smart_contracts._helpers.chunking import (
+    MAX_GROUP_SIZE,
+    ChunkedComposer,
+    ChunkedSendResult,
+)
+from smart_contracts._helpers.client_runtime import result_mapper
+from smart_contracts.artifacts.bank.bank_client import (
+    BankClient,
+    DepositArgs,
+    WithdrawArgs,
+)
+from smart_contracts.bank.resources import BankResources
+
+
+class ChunkedBankComposer:
+    """
+    `BankComposer` counterpart that takes any number of calls and splits them into groups.
+
+    Each `deposit` stays in the same group as its `pay_txn`. `send` returns the decoded
+    return values in the order the calls were added; see `ChunkedComposer`. Unless
+    `plan_resources` is off, box references are worked out from the arguments and
+    spread over each group, so groups go out without a simulate round trip.
+    """
+
+    def __init__(
+        self,
+        client: BankClient,
+        *,
+        max_group_size: int = MAX_GROUP_SIZE,
+        max_workers: int = 4,
+        plan_resources: bool = True,
+    ):
+        self.client = client
+        self._resources = BankResources(client) if plan_resources else None
+        self.composer = ChunkedComposer(
+            client.algorand, max_group_size=max_group_size, max_workers=max_workers
+        )
+
+    def deposit(
+        self,
+        args: tuple[str, algokit_utils.AppMethodCallTransactionArgument] | DepositArgs,
+        params: algokit_utils.CommonAppCallParams | None = None,
+    ) -> "ChunkedBankComposer":
+        call = self.client.params.deposit(args, params)
+        self.composer.add_app_call_method_call(
+            call,
+            result_mapper(self.client, "deposit(string,pay)uint64"),
+            self._resources(call) if self._resources else None,
+        )
+        return self
+
+    def withdraw(
+        self,
+        args: tuple[int] | WithdrawArgs,
+        params: algokit_utils.CommonAppCallParams | None = None,
+    ) -> "ChunkedBankComposer":
+        call = self.client.params.withdraw(args, params)
+        self.composer.add_app_call_method_call(
+            call,
+            result_mapper(self.client, "withdraw(uint64)uint64"),
+            self._resources(call) if self._resources else None,
+        )
+        return self
+
+    def send(
+        self, send_params: algokit_utils.SendParams | None = None
+    ) -> ChunkedSendResult:
+        return self.composer.send(send_params)
@@ -1,18 +1,33 @@
 from algopy import *
-from algopy.arc4 import abimethod
+from algopy.arc4 import Address, DynamicArray, abimethod
+
+# Rounds between approving a successor and exporting to it, about a day, so depositors
+# who don't want to move can withdraw first
+MIGRATION_NOTICE_ROUNDS = 30_000
+
+
+# An account and its balance
+DepositEntry = arc4.Tuple[Address, arc4.UInt64]
 
 
 class Bank(ARC4Contract):
     total_deposit: UInt64
+    paused: bool
+    successor_hash: Bytes
+    successor_round: UInt64
 
     def __init__(self) -> None:
         """Initializes contract storages on deployment"""
         self.deposits = BoxMap(Account, UInt64, key_prefix="")
         self.total_deposit = UInt64(0)
+        self.paused = False
+        self.successor_hash = Bytes()
+        self.successor_round = UInt64(0)
 
     @abimethod()
     def deposit(self, memo: String, pay_txn: gtxn.PaymentTransaction) -> UInt64:
         """Accepts a payment into the app escrow and records sender's deposited balance"""
+        assert not self.paused, "Deposits are paused"
         assert pay_txn.receiver == Global.current_application_address, "Receiver must be the contract address"
         assert pay_txn.amount > 0, "Deposit amount must be greater than zero"
 
@@ -43,4 +58,73 @@ class Bank(ARC4Contract):
 
         return remaining
 
+    @abimethod(readonly=True)
+    def balance_of(self, account: Address) -> UInt64:
+        """Returns the recorded deposit balance for an account, or zero if it has none"""
+        return self.deposits.get(account.native, default=UInt64(0))
+
+    @abimethod()
+    def set_paused(self, paused: bool) -> None:  # noqa: FBT001 - ABI args are positional
+        """Stops or resumes deposits; withdrawals are always open (creator only)"""
+        assert Txn.sender == Global.creator_address, "Only the creator can pause deposits"
+        self.paused = paused
+
+    @abimethod()
+    def approve_successor(self, program_hash: Bytes) -> UInt64:
+        """Names the program deposits may be exported to, after a notice period (creator only)"""
+        assert Txn.sender == Global.creator_address, "Only the creator can approve a successor"
+        assert program_hash.length == 32, "Program hash must be 32 bytes"
+        self.successor_hash = program_hash
+        self.successor_round = Global.round + MIGRATION_NOTICE_ROUNDS
+        return self.successor_round
+
+    @abimethod()
+    def export_deposits(self, entries: DynamicArray[DepositEntry], destination: Application) -> UInt64:
+        """Moves the listed balances and their ALGO to the approved successor (creator only)"""
+        assert Txn.sender == Global.creator_address, "Only the creator can export deposits"
+        assert self.paused, "Deposits must be paused before exporting"
+        assert destination.creator == Global.creator_address, "Destination must have the same creator"
+        assert op.sha512_256(destination.approval_program) == self.successor_hash, "Destination is not approved"
+        assert Global.round >= self.successor_round, "The successor's notice period has not passed"
+
+        exported = UInt64(0)
+        for index in urange(entries.length):
+            account, expected = entries[index].native
+            amount, exists = self.deposits.maybe(account.native)
+            assert exists and amount == expected.native, "Exports must move whole balances"
+            exported += amount
+            del self.deposits[account.native]
+
+        if exported > 0:
+            self.total_deposit -= exported
+            itxn.Payment(receiver=destination.address, amount=exported, fee=0).submit()
+        return exported
+
+    @abimethod()
+    def import_deposits(self, entries: DynamicArray[DepositEntry]) -> UInt64:
+        """Credits the balances the export just before it moved here (creator only)"""
+        assert Txn.sender == Global.creator_address, "Only the creator can import deposits"
+        assert Txn.group_index > 0, "Imports must follow their export"
+        export = gtxn.ApplicationCallTransaction(Txn.group_index - 1)
+        assert (
+            export.app_args(0) == arc4.arc4_signature("export_deposits((address,uint64)[],application)uint64")
+        ), "Imports must follow their export"
+        assert export.app_args(1) == entries.bytes, "Imported entries must match the export"
+        assert export.apps(op.btoi(export.app_args(2))) == Global.current_application_id, "The export must pay this app"
+        assert export.app_id.creator == Global.creator_address, "The export must come from the same creator"
+
+        imported = UInt64(0)
+        for index in urange(entries.length):
+            address, amount = entries[index].native
+            account = address.native
+            self.deposits[account] = self.deposits.get(account, default=UInt64(0)) + amount.native
+            imported += amount.native
 
+        self.total_deposit += imported
+        app_account = Global.current_application_address
+        assert app_account.balance >= app_account.min_balance + self.total_deposit, "Imported deposits are not backed"
+        return imported
+
+    @abimethod()
+    def opup(self) -> None:
+        """Does nothing; each call adds to the group's pooled opcode budget"""
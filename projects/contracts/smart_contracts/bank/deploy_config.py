@@ -1,20 +1,36 @@
 import logging
+import os
 
 import algokit_utils
 
+from smart_contracts._helpers.endpoints import algorand_from_environment
+from smart_contracts._helpers.suggested_params import use_shared_params
+
 logger = logging.getLogger(__name__)
 
 
 def deploy() -> None:
     from smart_contracts.artifacts.bank.bank_client import BankFactory
 
-    algorand = algokit_utils.AlgorandClient.from_environment()
+    algorand = use_shared_params(algorand_from_environment())
     deployer_ = algorand.account.from_environment("DEPLOYER")
 
     factory = algorand.client.get_typed_app_factory(
         BankFactory, default_sender=deployer_.address
     )
 
+    # Set BANK_SHARDS to deploy K independent Bank instances for ShardedBankClient
+    shard_count = int(os.getenv("BANK_SHARDS", "1"))
+    if shard_count > 1:
+        from smart_contracts.bank.sharding import deploy_shards
+
+        for app_client, result in deploy_shards(factory, shard_count):
+            logger.info(
+                f"Bank shard {app_client.app_name} is app {app_client.app_id} "
+                f"({result.operation_performed.name})"
+            )
+        return
+
     app_client, result = factory.deploy(
         on_update=algokit_utils.OnUpdate.AppendApp,
         on_schema_break=algokit_utils.OnSchemaBreak.AppendApp,
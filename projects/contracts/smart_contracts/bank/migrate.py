@@ -0,0 +1,382 @@
+"""
+Moves `deposits` balances from one Bank app to another in resumable, packed batches.
+
+Usage: python -m smart_contracts.bank.migrate OLD_APP_ID NEW_APP_ID [--approve] [--checkpoint PATH] [--parallel N]
+
+Both apps must have been deployed by DEPLOYER, since only the creator may call
+`export_deposits`/`import_deposits`. The old app only exports to a program it has
+approved, and only once the approval's notice period has passed: run with
+`--approve` first, then again without it after the round it prints. The migration
+pauses deposits into the old app before moving anything.
+"""
+
+import argparse
+import json
+import logging
+import math
+import os
+import threading
+import typing
+from collections.abc import Iterator, Sequence
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from pathlib import Path
+
+import algokit_utils
+from algosdk import encoding
+from algosdk.atomic_transaction_composer import AccountTransactionSigner
+
+from smart_contracts._helpers.boxes import BoxMapReader
+from smart_contracts._helpers.endpoints import algorand_from_environment
+from smart_contracts._helpers.suggested_params import use_shared_params
+from smart_contracts.artifacts.bank.bank_client import BankClient
+
+logger = logging.getLogger(__name__)
+
+# Protocol limits that bound how much work fits in one atomic group.
+MAX_GROUP_SIZE = 16
+MAX_REFERENCES_PER_TXN = 8
+
+# Each export call spends one reference on the destination app, the rest on boxes.
+# Its import takes the same accounts, since it has to repeat the export's entries.
+EXPORT_ACCOUNTS_PER_CALL = MAX_REFERENCES_PER_TXN - 1
+
+# Minimum balance for a 32-byte address key holding a uint64.
+BOX_MBR = 2_500 + 400 * (32 + 8)
+
+# The exported ALGO is paid to the new app by an inner payment with fee=0.
+EXPORT_EXTRA_FEE = algokit_utils.AlgoAmount(micro_algo=1000)
+
+
+def _calls_for(accounts: int) -> int:
+    """App calls needed to move `accounts` balances in one group: an export and its import per batch."""
+    return 2 * math.ceil(accounts / EXPORT_ACCOUNTS_PER_CALL)
+
+
+def accounts_per_group() -> int:
+    """Largest batch that fits a group alongside the MBR top-up payment."""
+    accounts = 0
+    while 1 + _calls_for(accounts + 1) <= MAX_GROUP_SIZE:
+        accounts += 1
+    return accounts
+
+
+def _chunks(items: Sequence[str], size: int) -> Iterator[Sequence[str]]:
+    for start in range(0, len(items), size):
+        yield items[start : start + size]
+
+
+@dataclass(frozen=True)
+class MigrationState:
+    old_app_id: int
+    new_app_id: int
+    old_total: int
+    new_total: int
+    migrated_accounts: int = 0
+    migrated_amount: int = 0
+
+
+class MigrationCheckpoint:
+    """
+    Append-only JSON-lines log of committed groups.
+
+    The first line records both apps' `total_deposit` before any group was sent. Each
+    committed group appends one line with the amount it moved, and is fsync'ed, so a
+    crash loses at most the groups still in flight; those either committed on chain
+    (and their boxes are gone from the old app) or did not.
+    """
+
+    def __init__(self, path: Path):
+        self._path = path
+        self._lock = threading.Lock()
+
+    def load(self) -> MigrationState | None:
+        if not self._path.exists():
+            return None
+        with self._path.open() as f:
+            header, *groups = [
+                typing.cast(dict[str, int], json.loads(line))
+                for line in f
+                if line.strip()
+            ]
+        return MigrationState(
+            old_app_id=header["old_app_id"],
+            new_app_id=header["new_app_id"],
+            old_total=header["old_total"],
+            new_total=header["new_total"],
+            migrated_accounts=sum(g["accounts"] for g in groups),
+            migrated_amount=sum(g["amount"] for g in groups),
+        )
+
+    def start(self, state: MigrationState) -> None:
+        self._append(
+            {
+                "old_app_id": state.old_app_id,
+                "new_app_id": state.new_app_id,
+                "old_total": state.old_total,
+                "new_total": state.new_total,
+            }
+        )
+
+    def record(self, tx_id: str, accounts: int, amount: int) -> None:
+        self._append({"tx_id": tx_id, "accounts": accounts, "amount": amount})
+
+    def _append(self, entry: dict[str, int | str]) -> None:
+        with self._lock, self._path.open("a") as f:
+            f.write(json.dumps(entry) + "\n")
+            f.flush()
+            os.fsync(f.fileno())
+
+
+class BankMigration:
+    """Drains the old app's `deposits` map into the new app, group by group."""
+
+    def __init__(
+        self,
+        old: BankClient,
+        new: BankClient,
+        creator: str,
+        checkpoint: MigrationCheckpoint,
+        parallel: int = 4,
+    ):
+        self.old = old
+        self.new = new
+        self.creator = creator
+        self.checkpoint = checkpoint
+        self.parallel = parallel
+
+    def run(self) -> MigrationState:
+        # Paused first, so no deposit lands between the totals recorded below and the exports
+        self._ensure_exportable()
+        state = self.checkpoint.load()
+        if state is None:
+            state = MigrationState(
+                old_app_id=self.old.app_id,
+                new_app_id=self.new.app_id,
+                old_total=self.old.state.global_state.total_deposit,
+                new_total=self.new.state.global_state.total_deposit,
+            )
+            self.checkpoint.start(state)
+        elif (state.old_app_id, state.new_app_id) != (self.old.app_id, self.new.app_id):
+            raise ValueError("Checkpoint belongs to a different pair of apps")
+        else:
+            logger.info(
+                f"Resuming: {state.migrated_accounts} accounts already migrated"
+            )
+
+        self._ensure_backed()
+        # Exported boxes are deleted, so whatever is still on the old app is the remaining work
+        with BoxMapReader(self.old.app_client, "deposits") as reader:
+            remaining = typing.cast(dict[str, int], reader.get_map())
+        existing = {
+            box.name_raw for box in self.new.algorand.app.get_box_names(self.new.app_id)
+        }
+        batches = list(_chunks(sorted(remaining), accounts_per_group()))
+        logger.info(f"Migrating {len(remaining)} accounts in {len(batches)} groups")
+
+        with ThreadPoolExecutor(max_workers=self.parallel) as executor:
+            futures = [
+                executor.submit(self._send_group, batch, remaining, existing)
+                for batch in batches
+            ]
+            for future in futures:
+                future.result()
+
+        return self.verify()
+
+    def approve(self) -> int:
+        """Approves the new app's program as the old one's successor; returns the round exports may start."""
+        program = self.new.algorand.app.get_by_id(self.new.app_id).approval_program
+        program_hash = typing.cast(bytes, encoding.checksum(program))
+        result = self.old.send.approve_successor((program_hash,))
+        assert result.abi_return is not None
+        return result.abi_return
+
+    def _ensure_exportable(self) -> None:
+        """Checks the old app will export to the new one, and pauses its deposits."""
+        program = self.new.algorand.app.get_by_id(self.new.app_id).approval_program
+        state = self.old.state.global_state
+        if state.successor_hash != typing.cast(bytes, encoding.checksum(program)):
+            raise RuntimeError(
+                f"App {self.old.app_id} has not approved app {self.new.app_id}'s program; "
+                "run with --approve first"
+            )
+        status = typing.cast(dict[str, int], self.old.algorand.client.algod.status())
+        if status["last-round"] < state.successor_round:
+            raise RuntimeError(
+                f"App {self.new.app_id} may not be exported to before round "
+                f"{state.successor_round}; it is round {status['last-round']}"
+            )
+        if not state.paused:
+            self.old.send.set_paused((True,))
+            logger.info(f"Paused deposits into app {self.old.app_id}")
+
+    def _ensure_backed(self) -> None:
+        """Tops up the new app so its balance covers its own MBR plus its deposits."""
+        info = self.new.algorand.account.get_information(self.new.app_address)
+        shortfall = (
+            info.min_balance.micro_algo
+            + self.new.state.global_state.total_deposit
+            - info.amount.micro_algo
+        )
+        if shortfall > 0:
+            self._fund_new_app(self.new.algorand.new_group(), shortfall).send()
+
+    def _fund_new_app(
+        self, group: algokit_utils.TransactionComposer, amount: int
+    ) -> algokit_utils.TransactionComposer:
+        return group.add_payment(
+            algokit_utils.PaymentParams(
+                sender=self.creator,
+                receiver=self.new.app_address,
+                amount=algokit_utils.AlgoAmount(micro_algo=amount),
+            )
+        )
+
+    def _send_group(
+        self, accounts: Sequence[str], balances: dict[str, int], existing: set[bytes]
+    ) -> None:
+        entries = {address: balances[address] for address in accounts}
+        while True:
+            try:
+                result = self._group(entries, existing).send(
+                    algokit_utils.SendParams(populate_app_call_resources=False)
+                )
+                break
+            except Exception as e:
+                # Exports must move whole balances, so a withdrawal since they were read
+                # turns the group away; so does a box a crashed run already exported
+                current = self._deposits(list(entries))
+                if current == entries:
+                    raise
+                logger.info(f"Export rejected ({e}); retrying with re-read balances")
+                entries = current
+                if not entries:
+                    return
+
+        amount = sum(entries.values())
+        self.checkpoint.record(result.tx_ids[0], len(entries), amount)
+        logger.debug(f"Migrated {len(entries)} accounts ({amount} microALGO)")
+
+    def _group(
+        self, entries: dict[str, int], existing: set[bytes]
+    ) -> algokit_utils.TransactionComposer:
+        names = {
+            address: typing.cast(bytes, encoding.decode_address(address))
+            for address in entries
+        }
+        new_boxes = sum(1 for name in names.values() if name not in existing)
+        group = self.new.algorand.new_group()
+        if new_boxes:
+            self._fund_new_app(group, new_boxes * BOX_MBR)
+
+        # Each import directly follows its export, which pays in what it credits
+        for batch in _chunks(list(entries), EXPORT_ACCOUNTS_PER_CALL):
+            args = [(a, entries[a]) for a in batch]
+            boxes: list[
+                algokit_utils.BoxReference | str | bytes | AccountTransactionSigner
+            ] = [algokit_utils.BoxReference(0, names[a]) for a in batch]
+            group.add_app_call_method_call(
+                self.old.params.export_deposits(
+                    args=(args, self.new.app_id),
+                    params=algokit_utils.CommonAppCallParams(
+                        box_references=boxes, extra_fee=EXPORT_EXTRA_FEE
+                    ),
+                )
+            )
+            group.add_app_call_method_call(
+                self.new.params.import_deposits(
+                    args=(args,),
+                    params=algokit_utils.CommonAppCallParams(box_references=boxes),
+                )
+            )
+        return group
+
+    def _deposits(self, accounts: Sequence[str]) -> dict[str, int]:
+        """The old app's current balances for `accounts`, leaving out any without a box."""
+        deposits: dict[str, int] = {}
+        for address in accounts:
+            try:
+                balance = self.old.state.box.deposits.get_value(address)
+            except Exception as e:
+                if _status(e) == 404:
+                    continue
+                raise
+            if balance is not None:
+                deposits[address] = balance
+        return deposits
+
+    def verify(self) -> MigrationState:
+        """
+        Checks that every balance arrived and `total_deposit` moved with it.
+
+        Withdrawals stay open while deposits are paused, so the old app's total from
+        before the migration says nothing about what should have arrived; the amounts
+        the checkpoint recorded as moved do, and the old app's total must match what is
+        left in its boxes.
+        """
+        state = self.checkpoint.load()
+        assert state is not None
+        old_total = self.old.state.global_state.total_deposit
+        new_total = self.new.state.global_state.total_deposit
+        left = sum(self.old.state.box.deposits.get_map().values())
+        if old_total != left:
+            raise RuntimeError(
+                f"Old app total_deposit is {old_total}, but its boxes hold {left}"
+            )
+        if left:
+            raise RuntimeError(
+                f"Old app still holds {left} microALGO of deposits; re-run to resume"
+            )
+        expected = state.new_total + state.migrated_amount
+        if new_total != expected:
+            raise RuntimeError(
+                f"New app total_deposit is {new_total}, expected {expected}"
+            )
+        logger.info(
+            f"Migration verified: {state.migrated_accounts} accounts, "
+            f"{state.migrated_amount} microALGO"
+        )
+        return state
+
+
+def _status(e: Exception) -> object:
+    """The HTTP status of an `AlgodHTTPError`, None for anything else."""
+    return typing.cast(dict[str, object], vars(e)).get("code")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("old_app_id", type=int)
+    parser.add_argument("new_app_id", type=int)
+    parser.add_argument("--approve", action="store_true")
+    parser.add_argument("--checkpoint", type=Path, default=None)
+    parser.add_argument("--parallel", type=int, default=4)
+    args = parser.parse_args()
+    old_app_id = typing.cast(int, args.old_app_id)
+    new_app_id = typing.cast(int, args.new_app_id)
+    checkpoint_path = typing.cast(Path | None, args.checkpoint) or Path(
+        f"bank-migration-{old_app_id}-{new_app_id}.jsonl"
+    )
+
+    algorand = use_shared_params(algorand_from_environment())
+    deployer_ = algorand.account.from_environment("DEPLOYER")
+    old, new = (
+        BankClient(algorand=algorand, app_id=app_id, default_sender=deployer_.address)
+        for app_id in (old_app_id, new_app_id)
+    )
+    migration = BankMigration(
+        old,
+        new,
+        deployer_.address,
+        MigrationCheckpoint(checkpoint_path),
+        typing.cast(int, args.parallel),
+    )
+    if typing.cast(bool, args.approve):
+        print(f"App {new_app_id} may be migrated to from round {migration.approve()}")
+    else:
+        migration.run()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,52 @@
+import algokit_utils
+
+from smart_contracts._helpers.footprints import FootprintCache
+from smart_contracts.artifacts.bank.bank_client import (
+    BankClient,
+    DepositArgs,
+    WithdrawArgs,
+)
+
+
+class ReferencedBankSend:
+    """
+    `BankClient.send` counterpart whose calls carry their own box references.
+
+    References come from a `FootprintCache`, so after the first call of each shape
+    `deposit` and `withdraw` skip the simulate that resource population costs. Pass
+    one cache to every `ReferencedBankSend` for the same app to share what it learns.
+    """
+
+    def __init__(self, client: BankClient, footprints: FootprintCache | None = None):
+        self.client = client
+        self.footprints = footprints or FootprintCache(client)
+
+    def deposit(
+        self,
+        args: tuple[str, algokit_utils.AppMethodCallTransactionArgument] | DepositArgs,
+        params: algokit_utils.CommonAppCallParams | None = None,
+        send_params: algokit_utils.SendParams | None = None,
+    ) -> algokit_utils.SendAppTransactionResult[int]:
+        return self.footprints.send(
+            self.client.params.deposit(args, params),
+            params,
+            send_params,
+            lambda params, send_params: self.client.send.deposit(
+                args, params, send_params
+            ),
+        )
+
+    def withdraw(
+        self,
+        args: tuple[int] | WithdrawArgs,
+        params: algokit_utils.CommonAppCallParams | None = None,
+        send_params: algokit_utils.SendParams | None = None,
+    ) -> algokit_utils.SendAppTransactionResult[int]:
+        return self.footprints.send(
+            self.client.params.withdraw(args, params),
+            params,
+            send_params,
+            lambda params, send_params: self.client.send.withdraw(
+                args, params, send_params
+            ),
+        )
@@ -0,0 +1,285 @@
+import base64
+import logging
+import os
+import struct
+import tempfile
+import threading
+import typing
+from collections.abc import Iterable, Iterator, Mapping
+from types import TracebackType
+
+from algosdk import encoding
+
+from smart_contracts._helpers.address_table import AddressTable
+from smart_contracts._helpers.boxes import BoxMapReader
+from smart_contracts._helpers.deltas import box_deltas
+from smart_contracts.artifacts.bank.bank_client import BankClient
+
+logger = logging.getLogger(__name__)
+
+# Rounds applied between checkpoints, unless the follower is stopped first.
+DEFAULT_CHECKPOINT_EVERY = 100
+
+# A checkpoint of an in-memory replica: the round it's up to and its entry count,
+# followed by that many entries
+_SNAPSHOT_HEADER = struct.Struct("<QQ")
+_SNAPSHOT_ENTRY = struct.Struct("<32sQ")
+# Address characters as the digits `int` reads in base 32
+_BASE32_DIGITS = str.maketrans(
+    "ABCDEFGHIJKLMNOPQRSTUVWXYZ234567", "0123456789abcdefghijklmnopqrstuv"
+)
+
+
+def _status(e: Exception) -> object:
+    """The HTTP status of an `AlgodHTTPError`, None for anything else."""
+    return typing.cast(dict[str, object], vars(e)).get("code")
+
+
+def _public_key(address: str) -> bytes:
+    """`decode_address` without its checksum check, which takes most of its time."""
+    if len(address) != 58:
+        raise ValueError(f"Not an Algorand address: {address!r}")
+    # 290 bits: the key, a 4-byte checksum, then 2 bits of padding
+    return (int(address.translate(_BASE32_DIGITS), 32) >> 34).to_bytes(32, "big")
+
+
+class DepositReplica:
+    """
+    A local copy of Bank's `deposits` map, as of `round`.
+
+    Held in a dict, or with `mapped` in an `AddressTable` at `path`, which keeps
+    memory flat however many depositors there are at the cost of slower lookups.
+    Either way a lookup is O(1) and never goes to algod. `checkpoint` makes the copy
+    at `path` durable: a mapped replica syncs its table, a dict one rewrites `path`
+    whole. Reopening `path` picks up from the last checkpoint.
+
+    Kept up to date by a `DepositFollower`; safe to read from other threads while
+    it applies rounds.
+    """
+
+    def __init__(
+        self, path: str | os.PathLike[str] | None = None, *, mapped: bool = False
+    ):
+        if mapped and path is None:
+            raise ValueError("A mapped replica needs a path for its table")
+        self.path = None if path is None else os.fspath(path)
+        self._table = AddressTable(self.path) if mapped and self.path else None
+        self._deposits: dict[bytes, int] = {}
+        self._round = 0
+        if self._table is not None:
+            self._round = self._table.round
+        elif self.path is not None and os.path.exists(self.path):
+            self._round, self._deposits = _read_snapshot(self.path)
+
+    @property
+    def round(self) -> int:
+        """The last round applied, 0 before the first snapshot is loaded."""
+        return self._round
+
+    def balance_of(self, address: str) -> int:
+        """The account's deposited balance, 0 if it has none, like `Bank.balance_of`."""
+        key = _public_key(address)
+        if self._table is not None:
+            return self._table.get(key) or 0
+        return self._deposits.get(key, 0)
+
+    def __contains__(self, address: str) -> bool:
+        key = _public_key(address)
+        if self._table is not None:
+            return key in self._table
+        return key in self._deposits
+
+    def __len__(self) -> int:
+        return len(self._table if self._table is not None else self._deposits)
+
+    def items(self) -> Iterator[tuple[str, int]]:
+        """Every depositor and their balance, in no particular order."""
+        entries = (
+            self._table.items() if self._table is not None else self._deposits.items()
+        )
+        for key, amount in list(entries):
+            yield typing.cast(str, encoding.encode_address(key)), amount
+
+    def load(self, deposits: Iterable[tuple[str, int]], round_: int) -> None:
+        """Replaces the whole replica with `deposits`, a snapshot as of `round_`."""
+        entries = {_public_key(a): amount for a, amount in deposits}
+        if self._table is not None:
+            self._table.replace(entries.items(), round_)
+        else:
+            self._deposits = entries
+        self._round = round_
+
+    def apply(self, round_: int, changes: Mapping[bytes, int | None]) -> None:
+        """Applies `round_`'s changes: public key to new balance, None if deleted."""
+        for key, amount in changes.items():
+            if self._table is not None:
+                if amount is None:
+                    self._table.delete(key)
+                else:
+                    self._table.set(key, amount)
+            elif amount is None:
+                self._deposits.pop(key, None)
+            else:
+                self._deposits[key] = amount
+        self._round = round_
+
+    def checkpoint(self) -> None:
+        if self._table is not None:
+            self._table.flush(self._round)
+        elif self.path is not None:
+            _write_snapshot(self.path, self._round, self._deposits)
+
+    def close(self) -> None:
+        if self._table is not None:
+            self._table.close()
+
+    def __enter__(self) -> "DepositReplica":
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_value: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        self.close()
+
+
+def _read_snapshot(path: str) -> tuple[int, dict[bytes, int]]:
+    with open(path, "rb") as file:
+        data = file.read()
+    round_, count = typing.cast(tuple[int, int], _SNAPSHOT_HEADER.unpack_from(data))
+    end = _SNAPSHOT_HEADER.size + count * _SNAPSHOT_ENTRY.size
+    entries = typing.cast(
+        Iterator[tuple[bytes, int]],
+        _SNAPSHOT_ENTRY.iter_unpack(memoryview(data)[_SNAPSHOT_HEADER.size : end]),
+    )
+    return round_, dict(entries)
+
+
+def _write_snapshot(path: str, round_: int, deposits: dict[bytes, int]) -> None:
+    """Writes beside `path` and renames, so a crash leaves the previous checkpoint."""
+    directory = os.path.dirname(path) or "."
+    with tempfile.NamedTemporaryFile(
+        "wb", dir=directory, delete=False, suffix=".tmp"
+    ) as file:
+        entries = list(deposits.items())
+        file.write(_SNAPSHOT_HEADER.pack(round_, len(entries)))
+        for key, amount in entries:
+            file.write(_SNAPSHOT_ENTRY.pack(key, amount))
+        file.flush()
+        os.fsync(file.fileno())
+    os.replace(file.name, path)
+
+
+class DepositFollower:
+    """
+    Keeps a `DepositReplica` in step with a Bank app, a round at a time.
+
+    An empty replica is first loaded from a snapshot of the app's boxes, taken after
+    the round it's recorded as of. From then on, each round's changes to the app's
+    boxes are read from its ledger state delta (see `box_deltas`) and applied, so a
+    round costs one request however many depositors there are. Deltas carry new
+    values rather than differences, so rounds the snapshot already reflects, or that
+    were applied after the last checkpoint before a restart, are safe to apply
+    again. If algod no longer has a round's delta, the replica is reloaded from a
+    fresh snapshot instead; if it has none at all, not even the latest round's, it
+    doesn't serve deltas and `sync` raises rather than reload every round.
+
+    Run `follow` on a thread of its own; with `sync_rounds`, it also moves a follower
+    node's sync round along as rounds are applied, which such a node needs to keep
+    catching up.
+    """
+
+    def __init__(
+        self,
+        client: BankClient,
+        replica: DepositReplica,
+        *,
+        checkpoint_every: int = DEFAULT_CHECKPOINT_EVERY,
+        sync_rounds: bool = False,
+    ):
+        self._client = client
+        self._algod = client.algorand.client.algod
+        self.replica = replica
+        self.checkpoint_every = checkpoint_every
+        self.sync_rounds = sync_rounds
+        metadata = client.app_client.app_spec.state.maps.box["deposits"]
+        self._prefix = base64.b64decode(metadata.prefix or "")
+        self._checkpointed = replica.round
+
+    def sync(self) -> int:
+        """Applies every round committed since the replica's, returning how many."""
+        last_round = typing.cast(dict[str, int], self._algod.status())["last-round"]
+        if self.replica.round == 0:
+            # Not worth a snapshot that could never be kept up to date
+            self._ensure_deltas_served(last_round)
+            self.reload()
+            return 0
+        applied = 0
+        for round_ in range(self.replica.round + 1, last_round + 1):
+            try:
+                changes = box_deltas(self._algod, self._client.app_id, round_)
+            except Exception as e:
+                if _status(e) != 404:
+                    raise
+                self._ensure_deltas_served(last_round)
+                logger.warning(
+                    f"algod no longer has round {round_}'s changes; reloading deposits"
+                )
+                self.reload()
+                return applied
+            self.replica.apply(
+                round_,
+                {
+                    name[len(self._prefix) :]: (
+                        None if value is None else int.from_bytes(value, "big")
+                    )
+                    for name, value in changes.items()
+                    if name.startswith(self._prefix)
+                },
+            )
+            applied += 1
+            if self.sync_rounds:
+                self._algod.set_sync_round(round_ + 1)
+            if round_ - self._checkpointed >= self.checkpoint_every:
+                self.checkpoint()
+        return applied
+
+    def _ensure_deltas_served(self, last_round: int) -> None:
+        """Raises unless algod has the delta of `last_round`, which it always would if it served them."""
+        try:
+            box_deltas(self._algod, self._client.app_id, last_round)
+        except Exception as e:
+            if _status(e) != 404:
+                raise
+            raise RuntimeError(
+                f"algod at {self._algod.algod_address} doesn't serve ledger state "
+                f"deltas, not even for round {last_round}; enable them or follow a "
+                "node that does"
+            ) from e
+
+    def reload(self) -> None:
+        """Replaces the replica with a snapshot of the app's boxes, and checkpoints it."""
+        round_ = typing.cast(dict[str, int], self._algod.status())["last-round"]
+        with BoxMapReader(self._client.app_client, "deposits") as reader:
+            deposits = typing.cast(Iterator[tuple[str, int]], reader.iter())
+            self.replica.load(deposits, round_)
+        logger.info(f"Loaded {len(self.replica)} deposits as of round {round_}")
+        if self.sync_rounds:
+            self._algod.set_sync_round(round_ + 1)
+        self.checkpoint()
+
+    def checkpoint(self) -> None:
+        self.replica.checkpoint()
+        self._checkpointed = self.replica.round
+
+    def follow(self, stop: threading.Event) -> None:
+        """Syncs each new round as it's committed until `stop` is set, then checkpoints."""
+        try:
+            while not stop.is_set():
+                self.sync()
+                # Returns once there's a new round, or after about a minute without
+                self._algod.status_after_block(self.replica.round)
+        finally:
+            self.checkpoint()
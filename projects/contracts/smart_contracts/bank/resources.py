@@ -0,0 +1,63 @@
+import typing
+from collections.abc import Callable, Iterable
+
+import algokit_utils
+
+from smart_contracts._helpers.resources import (
+    NO_RESOURCES,
+    BoxMapKeys,
+    Resources,
+    transaction_sender,
+)
+from smart_contracts.artifacts.bank.bank_client import BankClient
+
+_Params: typing.TypeAlias = "algokit_utils.AppCallMethodCallParams"
+
+
+def _args(params: _Params) -> list[object]:
+    return typing.cast(list[object] | None, params.args) or []
+
+
+def _entry_accounts(params: _Params) -> list[str]:
+    return [
+        typing.cast(str, entry[0])
+        for entry in typing.cast(list[tuple[object, ...]], _args(params)[0])
+    ]
+
+
+# Whose `deposits` box each method reads or writes, mirroring the contract.
+_DEPOSIT_KEYS: dict[str, Callable[[_Params], Iterable[str]]] = {
+    "deposit": lambda params: [transaction_sender(_args(params)[1])],
+    "withdraw": lambda params: [params.sender],
+    "balance_of": lambda params: [typing.cast(str, _args(params)[0])],
+    "export_deposits": lambda params: _entry_accounts(params),
+    "import_deposits": lambda params: _entry_accounts(params),
+    "set_paused": lambda params: [],
+    "approve_successor": lambda params: [],
+    "opup": lambda params: [],
+}
+
+
+class BankResources:
+    """
+    Works out offline which references a Bank method call needs.
+
+    Box names come from the `deposits` map in the app spec, and which accounts' boxes a
+    method touches from `_DEPOSIT_KEYS`. Accounts whose boxes are touched don't need
+    referencing themselves, and the inner payments only go to the caller or to the app
+    being exported to, so `export_deposits`' destination is the only other reference.
+    """
+
+    def __init__(self, client: BankClient):
+        self._deposits = BoxMapKeys(client.app_spec, "deposits", client.app_id)
+
+    def __call__(self, params: _Params) -> Resources:
+        keys = _DEPOSIT_KEYS.get(params.method.name)
+        if keys is None:
+            raise ValueError(f"No resources known for Bank method {params.method.name}")
+        boxes = frozenset(self._deposits.ref(key) for key in keys(params))
+        if params.method.name == "export_deposits":
+            return Resources(
+                boxes, apps=frozenset({typing.cast(int, _args(params)[1])})
+            )
+        return Resources(boxes) if boxes else NO_RESOURCES
@@ -0,0 +1,351 @@
+import bisect
+import hashlib
+import logging
+import threading
+import typing
+from collections.abc import Iterable, Sequence
+from concurrent.futures import Future, ThreadPoolExecutor
+
+import algokit_utils
+from algosdk import encoding
+from algosdk.atomic_transaction_composer import TransactionSigner, TransactionWithSigner
+
+from smart_contracts.artifacts.bank.bank_client import BankClient, BankFactory
+
+logger = logging.getLogger(__name__)
+
+# Points each shard gets on the ring; more points give a more even spread of accounts.
+DEFAULT_VIRTUAL_NODES = 64
+
+# The inner refund payment in `withdraw` is sent with fee=0, so the caller covers it.
+WITHDRAW_EXTRA_FEE = algokit_utils.AlgoAmount(micro_algo=1000)
+
+
+def shard_app_name(index: int) -> str:
+    """Name each shard is deployed under, so shards can be looked up by creator and name."""
+    return f"Bank-shard-{index}"
+
+
+def _ring_point(data: bytes) -> int:
+    return int.from_bytes(hashlib.sha256(data).digest()[:8], "big")
+
+
+class HashRing:
+    """Consistent-hash ring mapping account addresses to Bank app IDs."""
+
+    def __init__(
+        self, app_ids: Iterable[int], virtual_nodes: int = DEFAULT_VIRTUAL_NODES
+    ):
+        self._virtual_nodes = virtual_nodes
+        self._points: list[int] = []
+        self._owners: list[int] = []
+        for app_id in app_ids:
+            self.add(app_id)
+
+    @property
+    def app_ids(self) -> set[int]:
+        return set(self._owners)
+
+    def add(self, app_id: int) -> None:
+        for vnode in range(self._virtual_nodes):
+            point = _ring_point(f"{app_id}#{vnode}".encode())
+            index = bisect.bisect(self._points, point)
+            self._points.insert(index, point)
+            self._owners.insert(index, app_id)
+
+    def owner(self, address: str) -> int:
+        """Returns the app ID of the shard that owns `address`."""
+        if not self._points:
+            raise ValueError("Hash ring has no shards")
+        point = _ring_point(typing.cast(bytes, encoding.decode_address(address)))
+        index = bisect.bisect(self._points, point) % len(self._points)
+        return self._owners[index]
+
+
+class RebalanceJob:
+    """Background move of balances onto the shard that owns them after a shard is added."""
+
+    def __init__(self, future: "Future[list[str]]"):
+        self._future = future
+
+    @property
+    def done(self) -> bool:
+        return self._future.done()
+
+    def result(self, timeout: float | None = None) -> list[str]:
+        """Blocks until the job finishes and returns the addresses that were moved."""
+        return self._future.result(timeout)
+
+
+class ShardedBankClient:
+    """
+    Routes Bank calls across several `Bank` app instances by consistent hashing.
+
+    Each account's deposits live in exactly one shard. Adding a shard only remaps the
+    accounts that now hash to it; `add_shard` returns a `RebalanceJob` that moves those
+    balances in the background. Until it completes, reads consult both the previous and
+    the current owner so no balance is ever missed. Balances a rebalance couldn't move
+    are remembered where they are, so reads and withdrawals still find them, until
+    `rebalance` moves them.
+    """
+
+    def __init__(
+        self,
+        shards: Sequence[BankClient],
+        virtual_nodes: int = DEFAULT_VIRTUAL_NODES,
+        max_workers: int | None = None,
+    ):
+        if not shards:
+            raise ValueError("At least one shard is required")
+        # Replaced rather than changed, under the lock, so readers can use a snapshot
+        self._shards = {shard.app_id: shard for shard in shards}
+        self._virtual_nodes = virtual_nodes
+        self._ring = HashRing(self._shards, virtual_nodes)
+        self._previous_ring: HashRing | None = None
+        # Accounts a rebalance left behind, and the shard holding their balance
+        self._stranded: dict[str, int] = {}
+        self._job: RebalanceJob | None = None
+        self._lock = threading.Lock()
+        self._executor = ThreadPoolExecutor(
+            max_workers=max_workers or len(shards) + 4,
+            thread_name_prefix="bank-shard",
+        )
+
+    @staticmethod
+    def from_creator(
+        algorand: algokit_utils.AlgorandClient,
+        creator_address: str,
+        shard_count: int,
+        default_sender: str | None = None,
+    ) -> "ShardedBankClient":
+        """Looks up shards deployed by `deploy_shards` for the given creator."""
+        return ShardedBankClient(
+            [
+                BankClient.from_creator_and_name(
+                    creator_address=creator_address,
+                    app_name=shard_app_name(index),
+                    algorand=algorand,
+                    default_sender=default_sender,
+                )
+                for index in range(shard_count)
+            ]
+        )
+
+    @property
+    def shards(self) -> list[BankClient]:
+        with self._lock:
+            return list(self._shards.values())
+
+    @property
+    def stranded(self) -> dict[str, int]:
+        """Accounts whose balance is still on a shard that no longer owns them."""
+        with self._lock:
+            return dict(self._stranded)
+
+    def shard_for(self, address: str) -> BankClient:
+        """Returns the client for the shard that owns `address`."""
+        with self._lock:
+            return self._shards[self._ring.owner(address)]
+
+    def _candidate_shards(self, address: str) -> list[BankClient]:
+        with self._lock:
+            owners = [self._ring.owner(address)]
+            others = [self._stranded.get(address)]
+            if self._previous_ring is not None:
+                others.append(self._previous_ring.owner(address))
+            for other in others:
+                if other is not None and other not in owners:
+                    owners.append(other)
+            return [self._shards[app_id] for app_id in owners]
+
+    def deposit(
+        self, sender: str, amount: int, memo: str = ""
+    ) -> algokit_utils.SendAppTransactionResult[int]:
+        """Deposits `amount` microALGO from `sender` into its owning shard."""
+        shard = self.shard_for(sender)
+        return shard.send.deposit(
+            args=(memo, _payment(shard, sender, amount)),
+            params=algokit_utils.CommonAppCallParams(sender=sender),
+        )
+
+    def withdraw(
+        self, sender: str, amount: int
+    ) -> algokit_utils.SendAppTransactionResult[int]:
+        """
+        Withdraws `amount` microALGO for `sender` from the shard holding its balance.
+
+        That's its owning shard, unless a rebalance hasn't moved the balance there yet
+        or left it stranded. Then each shard that could hold it is read, as `balance_of`
+        reads them, and the one holding at least `amount`, or else the most, is used.
+        """
+        candidates = self._candidate_shards(sender)
+        shard = candidates[0]
+        if len(candidates) > 1:
+            deposits = [_deposit_of(candidate, sender) for candidate in candidates]
+            covering = [d for d in deposits if d >= amount]
+            # The owner first, so a balance that's there wins
+            held = covering[0] if covering else max(deposits)
+            if held > 0:
+                shard = candidates[deposits.index(held)]
+        return shard.send.withdraw(
+            args=(amount,),
+            params=algokit_utils.CommonAppCallParams(
+                sender=sender, extra_fee=WITHDRAW_EXTRA_FEE
+            ),
+        )
+
+    def balance_of(self, address: str) -> int:
+        """Returns the deposited balance of `address`, including any not yet rebalanced."""
+        return sum(
+            _deposit_of(shard, address) for shard in self._candidate_shards(address)
+        )
+
+    def total_deposit(self) -> int:
+        """Sums `total_deposit` across all shards, reading them in parallel."""
+        return sum(self._executor.map(_total_deposit, self.shards))
+
+    def add_shard(
+        self,
+        shard: BankClient,
+        signers: dict[str, TransactionSigner] | None = None,
+    ) -> RebalanceJob:
+        """
+        Adds a shard to the ring and starts moving balances onto it in the background.
+
+        The contract only lets an account withdraw its own deposit, so balances are moved
+        with a withdraw from the old shard and a deposit into the new one, in one group
+        signed by the account. Accounts without a signer in `signers` (or registered with
+        the AlgorandClient), or whose move fails, are left in place and listed in
+        `stranded`.
+        """
+        with self._lock:
+            self._check_idle()
+            if self._previous_ring is not None:
+                raise RuntimeError(
+                    "The last rebalance stopped part way; finish it with rebalance()"
+                )
+            self._previous_ring = self._ring
+            self._shards = {**self._shards, shard.app_id: shard}
+            self._ring = HashRing(self._shards, self._virtual_nodes)
+            return self._start(signers)
+
+    def rebalance(
+        self, signers: dict[str, TransactionSigner] | None = None
+    ) -> RebalanceJob:
+        """
+        Moves every balance that isn't on its owning shard, e.g. stranded ones.
+
+        Also finishes a rebalance that stopped part way, e.g. when a shard couldn't be
+        read.
+        """
+        with self._lock:
+            self._check_idle()
+            return self._start(signers)
+
+    def _check_idle(self) -> None:
+        if self._job is not None and not self._job.done:
+            raise RuntimeError("A rebalance is already in progress")
+
+    def _start(self, signers: dict[str, TransactionSigner] | None) -> RebalanceJob:
+        self._job = RebalanceJob(self._executor.submit(self._rebalance, signers or {}))
+        return self._job
+
+    def _rebalance(self, signers: dict[str, TransactionSigner]) -> list[str]:
+        moved: list[str] = []
+        stranded: dict[str, int] = {}
+        for source in self.shards:
+            for address, balance in source.state.box.deposits.get_map().items():
+                target = self.shard_for(address)
+                if target.app_id == source.app_id:
+                    continue
+                try:
+                    self._move(source, target, address, balance, signers.get(address))
+                    moved.append(address)
+                except Exception:
+                    stranded[address] = source.app_id
+                    logger.exception(
+                        f"Could not move {address} to shard {target.app_id}"
+                    )
+        # Every shard was read, so whatever is misplaced is now in `stranded`. Had one
+        # failed, the previous ring would have kept its accounts readable instead.
+        with self._lock:
+            self._previous_ring = None
+            self._stranded = stranded
+        logger.info(
+            f"Rebalanced {len(moved)} accounts, {len(stranded)} left on previous shards"
+        )
+        return moved
+
+    @staticmethod
+    def _move(
+        source: BankClient,
+        target: BankClient,
+        address: str,
+        balance: int,
+        signer: TransactionSigner | None,
+    ) -> None:
+        # One group, so the balance is never off both shards' books
+        source.algorand.new_group().add_app_call_method_call(
+            source.params.withdraw(
+                args=(balance,),
+                params=algokit_utils.CommonAppCallParams(
+                    sender=address, signer=signer, extra_fee=WITHDRAW_EXTRA_FEE
+                ),
+            )
+        ).add_app_call_method_call(
+            target.params.deposit(
+                args=("rebalance", _payment(target, address, balance, signer)),
+                params=algokit_utils.CommonAppCallParams(sender=address, signer=signer),
+            )
+        ).send()
+
+
+def _status(e: Exception) -> object:
+    """The HTTP status of an `AlgodHTTPError`, None for anything else."""
+    return typing.cast(dict[str, object], vars(e)).get("code")
+
+
+def _deposit_of(shard: BankClient, address: str) -> int:
+    try:
+        return shard.state.box.deposits.get_value(address) or 0
+    except Exception as e:
+        # Shards without a box for the account answer 404
+        if _status(e) == 404:
+            return 0
+        raise
+
+
+def _total_deposit(shard: BankClient) -> int:
+    return shard.state.global_state.total_deposit
+
+
+def _payment(
+    shard: BankClient,
+    sender: str,
+    amount: int,
+    signer: TransactionSigner | None = None,
+) -> algokit_utils.AppMethodCallTransactionArgument:
+    txn = shard.algorand.create_transaction.payment(
+        algokit_utils.PaymentParams(
+            sender=sender,
+            receiver=shard.app_address,
+            amount=algokit_utils.AlgoAmount(micro_algo=amount),
+        )
+    )
+    if signer is None:
+        return txn
+    return TransactionWithSigner(txn=txn, signer=signer)
+
+
+def deploy_shards(
+    factory: BankFactory, shard_count: int
+) -> list[tuple[BankClient, algokit_utils.AppFactoryDeployResult]]:
+    """Deploys (or finds) `shard_count` Bank instances named by `shard_app_name`."""
+    return [
+        factory.deploy(
+            app_name=shard_app_name(index),
+            on_update=algokit_utils.OnUpdate.AppendApp,
+            on_schema_break=algokit_utils.OnSchemaBreak.AppendApp,
+        )
+        for index in range(shard_count)
+    ]
@@ -0,0 +1,548 @@
+"""
+Indexes a Bank app's deposits and withdrawals into SQLite, by account and round.
+
+Usage: python -m smart_contracts.bank.statements {ingest,backfill,show} APP_ID [ACCOUNT]
+    [--db PATH] [--workers N] [--limit N] [--cursor C]
+
+`ingest` reads the app's calls in every round the database hasn't seen yet from the
+indexer, so running it on a schedule keeps the database current. `backfill` does the
+same on `--workers` processes, for a first run over a long history; run again, it
+reuses what it had fetched before it was stopped. `show` prints a page of an
+account's statement, newest first, from the database alone, and the cursor for the
+next page.
+"""
+
+import argparse
+import base64
+import functools
+import logging
+import os
+import sqlite3
+import typing
+from collections.abc import Iterable, Iterator
+from dataclasses import dataclass, replace
+from pathlib import Path
+from types import TracebackType
+
+from algosdk import abi
+from algosdk.v2client.indexer import IndexerClient
+
+from smart_contracts._helpers.backfill import Backfill, BackfillResult, Segment
+from smart_contracts._helpers.endpoints import algorand_from_environment
+from smart_contracts.artifacts.bank.bank_client import BankClient
+
+logger = logging.getLogger(__name__)
+
+# Rounds read from the indexer, and committed to the database, at a time.
+DEFAULT_WINDOW = 10_000
+# Statements per page.
+DEFAULT_PAGE_SIZE = 50
+
+# Transactions per indexer response, its maximum
+_SEARCH_LIMIT = 1000
+# Prefix of the log line carrying an ABI method's return value
+_RETURN_PREFIX = bytes.fromhex("151f7c75")
+_UINT64 = abi.UintType(64)
+_ENTRIES = abi.ABIType.from_string("(address,uint64)[]")
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS statements (
+    tx_id TEXT NOT NULL,
+    account TEXT NOT NULL,
+    round INTEGER NOT NULL,
+    -- The top-level transaction's place in its round
+    position INTEGER NOT NULL,
+    kind TEXT NOT NULL,
+    amount INTEGER,
+    balance INTEGER,
+    timestamp INTEGER NOT NULL,
+    PRIMARY KEY (tx_id, account)
+);
+CREATE INDEX IF NOT EXISTS statements_by_account
+    ON statements (account, round, position, tx_id);
+CREATE TABLE IF NOT EXISTS progress (
+    app_id INTEGER NOT NULL,
+    round INTEGER NOT NULL
+);
+"""
+
+
+class _Payment(typing.TypedDict):
+    amount: int
+    receiver: str
+
+
+_AppCall = typing.TypedDict(
+    "_AppCall",
+    {"application-id": int, "application-args": list[str]},
+    total=False,
+)
+_Txn = typing.TypedDict(
+    "_Txn",
+    {
+        "id": str,
+        "sender": str,
+        "tx-type": str,
+        "group": str,
+        "confirmed-round": int,
+        "intra-round-offset": int,
+        "round-time": int,
+        "payment-transaction": _Payment,
+        "application-transaction": _AppCall,
+        "logs": list[str],
+        "inner-txns": list["_Txn"],
+    },
+    total=False,
+)
+
+
+@dataclass(frozen=True)
+class Statement:
+    tx_id: str
+    account: str
+    round: int
+    position: int
+    # "deposit", "withdrawal", or "export"/"import" when the creator moved the
+    # balance between apps
+    kind: str
+    # microALGO; None where the app's calls don't show it, e.g. a deposit whose
+    # payment isn't just before it
+    amount: int | None
+    # The account's deposited balance after the call, where it's known
+    balance: int | None
+    timestamp: int
+
+
+@dataclass(frozen=True)
+class StatementPage:
+    statements: list[Statement]
+    # Passed back as `cursor` for the next page; None on the last one
+    next_cursor: str | None
+
+
+class StatementIndex:
+    """
+    An account's Bank statements, in a SQLite database indexed on (account, round).
+
+    Queries read the database alone, and page through a statement by keyset, so a page
+    costs the same however far back it is. The database holds one app's statements
+    and the last round ingested, which `StatementIngester` adds to as one transaction
+    per window of rounds; in WAL mode, so pages can be read while it does.
+    """
+
+    def __init__(self, path: str | os.PathLike[str], app_id: int):
+        self._db = sqlite3.connect(os.fspath(path), check_same_thread=False)
+        self._db.execute("PRAGMA journal_mode=WAL")
+        self._db.executescript(_SCHEMA)
+        row = typing.cast(
+            tuple[int, int] | None,
+            self._db.execute("SELECT app_id, round FROM progress").fetchone(),
+        )
+        if row is None:
+            with self._db:
+                self._db.execute("INSERT INTO progress VALUES (?, 0)", (app_id,))
+        elif row[0] != app_id:
+            raise ValueError(f"{path} indexes app {row[0]}, not app {app_id}")
+        self.app_id = app_id
+
+    @property
+    def round(self) -> int:
+        """The last round ingested."""
+        row = typing.cast(
+            tuple[int], self._db.execute("SELECT round FROM progress").fetchone()
+        )
+        return row[0]
+
+    def add(self, statements: Iterable[Statement], round_: int) -> None:
+        """Adds `statements`, all from rounds up to `round_`, and records `round_`."""
+        with self._db:
+            # Statements already in from an interrupted run are left as they were
+            self._db.executemany(
+                "INSERT OR IGNORE INTO statements VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                (
+                    (
+                        s.tx_id,
+                        s.account,
+                        s.round,
+                        s.position,
+                        s.kind,
+                        s.amount,
+                        s.balance,
+                        s.timestamp,
+                    )
+                    for s in statements
+                ),
+            )
+            self._db.execute("UPDATE progress SET round = ?", (round_,))
+
+    def balance(self, account: str) -> int | None:
+        """
+        The account's balance after its latest statement, None if that isn't known.
+
+        The index starts at the app's first round, so an account without statements
+        has never deposited.
+        """
+        row = typing.cast(
+            tuple[int | None] | None,
+            self._db.execute(
+                "SELECT balance FROM statements WHERE account = ?"
+                " ORDER BY round DESC, position DESC, tx_id DESC LIMIT 1",
+                (account,),
+            ).fetchone(),
+        )
+        return 0 if row is None else row[0]
+
+    def statements(
+        self,
+        account: str,
+        *,
+        limit: int = DEFAULT_PAGE_SIZE,
+        cursor: str | None = None,
+    ) -> StatementPage:
+        """A page of the account's statements, newest first, after `cursor` if given."""
+        query = "SELECT * FROM statements WHERE account = ?"
+        params: list[str | int] = [account]
+        if cursor is not None:
+            round_, position, tx_id = cursor.split(":", 2)
+            query += " AND (round, position, tx_id) < (?, ?, ?)"
+            params += [int(round_), int(position), tx_id]
+        query += " ORDER BY round DESC, position DESC, tx_id DESC LIMIT ?"
+        # One more than asked for, to know whether there's another page
+        params.append(limit + 1)
+        rows = typing.cast(
+            list[tuple[str, str, int, int, str, int | None, int | None, int]],
+            self._db.execute(query, params).fetchall(),
+        )
+        statements = [Statement(*row) for row in rows[:limit]]
+        next_cursor = None
+        if len(rows) > limit:
+            last = statements[-1]
+            next_cursor = f"{last.round}:{last.position}:{last.tx_id}"
+        return StatementPage(statements, next_cursor)
+
+    def close(self) -> None:
+        self._db.close()
+
+    def __enter__(self) -> "StatementIndex":
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_value: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        self.close()
+
+
+def _return_value(txn: _Txn) -> int | None:
+    for log in reversed(txn.get("logs", [])):
+        data = base64.b64decode(log)
+        if data.startswith(_RETURN_PREFIX):
+            return int.from_bytes(data[len(_RETURN_PREFIX) :], "big")
+    return None
+
+
+@dataclass(frozen=True)
+class _StatementSource:
+    """
+    Reads one Bank app's statements for a range of rounds from the indexer.
+
+    Only what's needed to reconnect is kept, so it can be sent to worker processes.
+    Balances that depend on earlier rounds, imports' balances after, are left for
+    `StatementIngester` to fill in.
+    """
+
+    app_id: int
+    app_address: str
+    methods: dict[bytes, str]
+    indexer_token: str
+    indexer_address: str
+    indexer_headers: dict[str, str] | None
+
+    def statements(self, start: int, end: int) -> list[Statement]:
+        indexer = IndexerClient(
+            self.indexer_token, self.indexer_address, self.indexer_headers
+        )
+        payments = {
+            (txn["confirmed-round"], txn["intra-round-offset"]): txn
+            for txn in _search(
+                indexer,
+                start,
+                end,
+                txn_type="pay",
+                address=self.app_address,
+                address_role="receiver",
+            )
+        }
+        calls = sorted(
+            _search(indexer, start, end, application_id=self.app_id), key=_position
+        )
+        statements: list[Statement] = []
+        for root in calls:
+            round_, position = root["confirmed-round"], root["intra-round-offset"]
+            payment = payments.get((round_, position - 1))
+            if payment is not None and payment.get("group") != root.get("group"):
+                payment = None
+            for tx_id, txn, preceding in _app_calls(root, payment):
+                app_call = txn.get("application-transaction", {})
+                if app_call.get("application-id") == self.app_id:
+                    statements += self._statements(
+                        tx_id, txn, preceding, round_, position, root["round-time"]
+                    )
+        return statements
+
+    def _statements(
+        self,
+        tx_id: str,
+        txn: _Txn,
+        preceding: _Txn | None,
+        round_: int,
+        position: int,
+        timestamp: int,
+    ) -> list[Statement]:
+        app_call = txn.get("application-transaction", {})
+        args = [base64.b64decode(a) for a in app_call.get("application-args", [])]
+        method = self.methods.get(args[0]) if args else None
+        returned = _return_value(txn)
+        # account, kind, amount, balance after
+        entries: list[tuple[str, str, int | None, int | None]] = []
+        if method == "deposit":
+            pay = preceding.get("payment-transaction") if preceding else None
+            if preceding is not None and pay is not None:
+                entries.append(
+                    (preceding["sender"], "deposit", pay["amount"], returned)
+                )
+            else:
+                entries.append((txn["sender"], "deposit", None, returned))
+        elif method == "withdraw":
+            amount = _UINT64.decode(args[1])
+            entries.append((txn["sender"], "withdrawal", amount, returned))
+        elif method == "export_deposits":
+            # Exports move whole balances, and name them
+            for account, amount in typing.cast(
+                list[tuple[str, int]], _ENTRIES.decode(args[1])
+            ):
+                entries.append((account, "export", amount, 0))
+        elif method == "import_deposits":
+            imported: dict[str, int] = {}
+            for account, amount in typing.cast(
+                list[tuple[str, int]], _ENTRIES.decode(args[1])
+            ):
+                imported[account] = imported.get(account, 0) + amount
+            for account, amount in imported.items():
+                entries.append((account, "import", amount, None))
+        return [
+            Statement(
+                tx_id, account, round_, position, kind, amount, balance, timestamp
+            )
+            for account, kind, amount, balance in entries
+        ]
+
+
+def _fetch_segment(source: _StatementSource, segment: Segment) -> list[Statement]:
+    return source.statements(segment.start, segment.end)
+
+
+class StatementIngester:
+    """
+    Adds a Bank app's calls to a `StatementIndex`, reading new rounds from the indexer.
+
+    Each window of rounds takes two paged searches: the app's calls, inner ones
+    included, and payments to the app, which is where a deposit's amount is. Calls
+    are turned into statements by method, from their arguments and returns.
+
+    `ingest` reads one window at a time; `backfill` reads many at once, on a pool of
+    worker processes, for catching up on an app's history.
+    """
+
+    def __init__(
+        self,
+        client: BankClient,
+        index: StatementIndex,
+        indexer: IndexerClient | None = None,
+        *,
+        window: int = DEFAULT_WINDOW,
+    ):
+        self._indexer = indexer or client.algorand.client.indexer
+        self._source = _StatementSource(
+            app_id=client.app_id,
+            app_address=client.app_address,
+            methods={
+                method.to_abi_method().get_selector(): method.name
+                for method in client.app_spec.methods
+            },
+            indexer_token=typing.cast(str, self._indexer.indexer_token),
+            indexer_address=typing.cast(str, self._indexer.indexer_address),
+            indexer_headers=typing.cast(dict[str, str] | None, self._indexer.headers),
+        )
+        self.index = index
+        self.window = window
+
+    def ingest(self, to: int | None = None) -> int:
+        """Ingests the rounds after the index's, up to `to` or the indexer's latest."""
+        if to is None:
+            to = self._latest()
+        added = 0
+        start = self.index.round + 1
+        while start <= to:
+            end = min(start + self.window - 1, to)
+            statements = self._resolve(self._source.statements(start, end))
+            self.index.add(statements, end)
+            added += len(statements)
+            logger.debug(f"Indexed {len(statements)} statements in {start}-{end}")
+            start = end + 1
+        return added
+
+    def backfill(
+        self,
+        directory: str | os.PathLike[str],
+        to: int | None = None,
+        *,
+        workers: int | None = None,
+        threads: bool = False,
+    ) -> BackfillResult:
+        """
+        Ingests like `ingest`, fetching windows in parallel, checkpointed to `directory`.
+
+        Windows are committed in round order as they come in, so an interrupted
+        backfill resumes from the index's round, reusing the windows it had fetched.
+        """
+        if to is None:
+            to = self._latest()
+        with Backfill(
+            functools.partial(_fetch_segment, self._source),
+            self._add,
+            directory,
+            segment_size=self.window,
+            workers=workers,
+            threads=threads,
+        ) as backfill:
+            return backfill.run(self.index.round + 1, to)
+
+    def _latest(self) -> int:
+        return typing.cast(dict[str, int], self._indexer.health())["round"]
+
+    def _add(self, segment: Segment, statements: list[Statement]) -> None:
+        self.index.add(self._resolve(statements), segment.end)
+
+    def _resolve(self, statements: list[Statement]) -> list[Statement]:
+        """Fills in the balances `_StatementSource` leaves out, in round order."""
+        # Balances in these statements, ahead of what the database has committed
+        balances: dict[str, int | None] = {}
+        resolved = []
+        for s in statements:
+            if s.account in balances:
+                before = balances[s.account]
+            else:
+                before = self.index.balance(s.account)
+            if s.kind == "import":
+                after = (
+                    None if before is None or s.amount is None else before + s.amount
+                )
+                s = replace(s, balance=after)
+            balances[s.account] = s.balance
+            resolved.append(s)
+        return resolved
+
+
+def _search(
+    indexer: IndexerClient, start: int, end: int, **filters: str | int
+) -> Iterator[_Txn]:
+    next_page: str | None = None
+    while True:
+        page = typing.cast(
+            dict[str, list[_Txn] | str],
+            indexer.search_transactions(
+                limit=_SEARCH_LIMIT,
+                next_page=next_page,
+                min_round=start,
+                max_round=end,
+                **filters,
+            ),
+        )
+        transactions = typing.cast(list[_Txn], page["transactions"])
+        yield from transactions
+        next_page = typing.cast(str | None, page.get("next-token"))
+        if not transactions or next_page is None:
+            return
+
+
+def _position(txn: _Txn) -> tuple[int, int]:
+    return txn["confirmed-round"], txn["intra-round-offset"]
+
+
+def _app_calls(
+    root: _Txn, payment: _Txn | None
+) -> Iterator[tuple[str, _Txn, _Txn | None]]:
+    """
+    Each app call in `root`'s tree: its ID, the call, and the transaction before it.
+
+    Inner transactions have no ID of their own, so they're numbered depth first
+    after their top-level transaction's, as explorers show them.
+    """
+    yield root["id"], root, payment
+    counter = 0
+
+    def walk(txn: _Txn) -> Iterator[tuple[str, _Txn, _Txn | None]]:
+        nonlocal counter
+        inner = txn.get("inner-txns", [])
+        for i, child in enumerate(inner):
+            counter += 1
+            if child.get("tx-type") == "appl":
+                yield f"{root['id']}/inner/{counter}", child, (
+                    inner[i - 1] if i else None
+                )
+            yield from walk(child)
+
+    yield from walk(root)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("command", choices=("ingest", "backfill", "show"))
+    parser.add_argument("app_id", type=int)
+    parser.add_argument("account", nargs="?")
+    parser.add_argument("--db", type=Path, default=None)
+    parser.add_argument("--workers", type=int, default=None)
+    parser.add_argument("--limit", type=int, default=DEFAULT_PAGE_SIZE)
+    parser.add_argument("--cursor")
+    args = parser.parse_args()
+    app_id = typing.cast(int, args.app_id)
+    path = typing.cast(Path | None, args.db) or Path(f"bank-statements-{app_id}.sqlite")
+
+    with StatementIndex(path, app_id) as index:
+        command = typing.cast(str, args.command)
+        if command in ("ingest", "backfill"):
+            algorand = algorand_from_environment()
+            client = BankClient(algorand=algorand, app_id=app_id)
+            ingester = StatementIngester(client, index)
+            if command == "backfill":
+                result = ingester.backfill(
+                    path.with_suffix(".segments"),
+                    workers=typing.cast(int | None, args.workers),
+                )
+                added = result.items
+            else:
+                added = ingester.ingest()
+            print(f"Indexed {added} statements, up to round {index.round}")
+            return
+        account = typing.cast(str | None, args.account)
+        if account is None:
+            parser.error("show needs an ACCOUNT")
+        page = index.statements(
+            account,
+            limit=typing.cast(int, args.limit),
+            cursor=typing.cast(str | None, args.cursor),
+        )
+        print(f"{'round':>10}  {'kind':<10}{'amount':>16}{'balance':>16}  tx")
+        for s in page.statements:
+            amount = "?" if s.amount is None else f"{s.amount / 1e6:.6f}"
+            balance = "?" if s.balance is None else f"{s.balance / 1e6:.6f}"
+            print(f"{s.round:>10}  {s.kind:<10}{amount:>16}{balance:>16}  {s.tx_id}")
+        if page.next_cursor is not None:
+            print(f"More with --cursor {page.next_cursor}")
+
+
+if __name__ == "__main__":
+    main()
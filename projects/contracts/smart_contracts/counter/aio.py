@@ -0,0 +1,69 @@
+from types import TracebackType
+
+from smart_contracts._helpers.aio import (
+    AsyncAlgod,
+    AsyncAppClient,
+    AsyncComposerBase,
+    AsyncGlobalState,
+    AsyncSendBase,
+    async_compose,
+    async_send,
+)
+from smart_contracts.artifacts.counter.counter_client import (
+    CounterClient,
+    CounterComposer,
+    CounterSend,
+    CounterState,
+)
+
+
+class AsyncCounterClient:
+    """asyncio counterpart of `CounterClient`; see `AsyncBankClient`."""
+
+    def __init__(self, client: CounterClient, algod: AsyncAlgod | None = None):
+        self.client = client
+        self.app = AsyncAppClient(client.app_client, algod)
+        self.send = AsyncCounterSend(self.app)
+        self.state = AsyncCounterState(self.app)
+
+    @property
+    def app_id(self) -> int:
+        return self.client.app_id
+
+    def new_group(self) -> "AsyncCounterComposer":
+        return AsyncCounterComposer(self.app)
+
+    async def aclose(self) -> None:
+        await self.app.aclose()
+
+    async def __aenter__(self) -> "AsyncCounterClient":
+        return self
+
+    async def __aexit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_value: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        await self.aclose()
+
+
+class AsyncCounterSend(AsyncSendBase, mirrors=CounterSend):
+    incr_counter = async_send(CounterSend.incr_counter)
+    get_count = async_send(CounterSend.get_count)
+    opup = async_send(CounterSend.opup)
+
+
+class AsyncCounterState:
+    def __init__(self, app: AsyncAppClient):
+        self.global_state = AsyncGlobalState(
+            app, lambda app_client: CounterState(app_client).global_state
+        )
+
+
+class AsyncCounterComposer(AsyncComposerBase, mirrors=CounterComposer):
+    """asyncio counterpart of `CounterComposer`."""
+
+    incr_counter = async_compose(CounterComposer.incr_counter)
+    get_count = async_compose(CounterComposer.get_count)
+    opup = async_compose(CounterComposer.opup)
@@ -0,0 +1,28 @@
+from smart_contracts._helpers.state_cache import CachedSend, StateCache, cached_reads
+from smart_contracts.artifacts.counter.counter_client import (
+    CounterClient,
+    CounterSend,
+    CounterState,
+)
+
+
+class CachedCounterClient:
+    """`CounterClient` whose state reads go through a shared `StateCache`; see `CachedBankClient`."""
+
+    def __init__(self, client: CounterClient, cache: StateCache):
+        self.client = client
+        self.send = CachedCounterSend(client, cache)
+        self.state = CachedCounterState(client, cache)
+
+
+class CachedCounterSend(CachedSend, CounterSend):
+    """`CounterClient.send` counterpart that tells a `StateCache` about every write."""
+
+    __slots__ = ()
+
+
+class CachedCounterState:
+    """`CounterClient.state` with every read served through a shared `StateCache`."""
+
+    def __init__(self, client: CounterClient, cache: StateCache):
+        self.global_state = CounterState(cached_reads(cache, client)).global_state
@@ -0,0 +1,49 @@
+import algokit_utils
+
+from smart_contracts._helpers.chunking import (
+    MAX_GROUP_SIZE,
+    ChunkedComposer,
+    ChunkedSendResult,
+)
+from smart_contracts._helpers.client_runtime import result_mapper
+from smart_contracts._helpers.resources import NO_RESOURCES
+from smart_contracts.artifacts.counter.counter_client import CounterClient
+
+
+class ChunkedCounterComposer:
+    """
+    `CounterComposer` counterpart that takes any number of calls and splits them into groups.
+
+    `send` returns the decoded return values in the order the calls were added; see
+    `ChunkedComposer`. Counter methods only touch the app's own global state, so unless
+    `plan_resources` is off groups are sent without simulating for references.
+    """
+
+    def __init__(
+        self,
+        client: CounterClient,
+        *,
+        max_group_size: int = MAX_GROUP_SIZE,
+        max_workers: int = 4,
+        plan_resources: bool = True,
+    ):
+        self.client = client
+        self._resources = NO_RESOURCES if plan_resources else None
+        self.composer = ChunkedComposer(
+            client.algorand, max_group_size=max_group_size, max_workers=max_workers
+        )
+
+    def incr_counter(
+        self, params: algokit_utils.CommonAppCallParams | None = None
+    ) -> "ChunkedCounterComposer":
+        self.composer.add_app_call_method_call(
+            self.client.params.incr_counter(params),
+            result_mapper(self.client, "incr_counter()uint64"),
+            self._resources,
+        )
+        return self
+
+    def send(
+        self, send_params: algokit_utils.SendParams | None = None
+    ) -> ChunkedSendResult:
+        return self.composer.send(send_params)
@@ -17,3 +17,11 @@ class Counter(ARC4Contract):
     def incr_counter(self) -> UInt64:
         self.count += UInt64(1)
         return self.count
+
+    @abimethod(readonly=True)
+    def get_count(self) -> UInt64:
+        return self.count
+
+    @abimethod()
+    def opup(self) -> None:
+        """Does nothing; each call adds to the group's pooled opcode budget"""
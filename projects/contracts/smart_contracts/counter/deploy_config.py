@@ -2,6 +2,9 @@ import logging
 
 import algokit_utils
 
+from smart_contracts._helpers.endpoints import algorand_from_environment
+from smart_contracts._helpers.suggested_params import use_shared_params
+
 logger = logging.getLogger(__name__)
 
 
@@ -11,7 +14,7 @@ def deploy() -> None:
         CounterFactory,
     )
 
-    algorand = algokit_utils.AlgorandClient.from_environment()
+    algorand = use_shared_params(algorand_from_environment())
     deployer_ = algorand.account.from_environment("DEPLOYER")
 
     factory = algorand.client.get_typed_app_factory(
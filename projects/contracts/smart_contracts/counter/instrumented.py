@@ -0,0 +1,13 @@
+from smart_contracts._helpers.instrumentation import InstrumentedSend
+from smart_contracts.artifacts.counter.counter_client import CounterSend
+
+
+class InstrumentedCounterSend(InstrumentedSend, CounterSend):
+    """
+    `CounterClient.send` counterpart whose calls are timed stage by stage.
+
+    See `InstrumentedSend`; `client` has to send through an
+    `Instrumentation.algod` client for requests to be told apart by stage.
+    """
+
+    __slots__ = ()
@@ -0,0 +1,210 @@
+import asyncio
+import typing
+from collections.abc import Iterator
+
+import algokit_utils
+import pytest
+from algosdk import abi, account, encoding, transaction
+
+from smart_contracts._helpers.aio import AsyncAlgod, AsyncSendBase, async_send
+from smart_contracts._helpers.budget import OPUP_METHOD
+from smart_contracts.artifacts.bank.bank_client import BankClient, BankSend
+from smart_contracts.artifacts.counter.counter_client import CounterClient
+from smart_contracts.bank.aio import AsyncBankClient
+from smart_contracts.counter.aio import AsyncCounterClient
+from tests.algod_stub import AlgodStub
+
+APP_ID = 1234
+IMPORT = "import_deposits((address,uint64)[])uint64"
+
+
+def _selector(signature: str) -> bytes:
+    return abi.Method.from_signature(signature).get_selector()
+
+
+@pytest.fixture()
+def stub() -> Iterator[AlgodStub]:
+    with AlgodStub() as stub:
+        yield stub
+
+
+@pytest.fixture()
+def algorand() -> algokit_utils.AlgorandClient:
+    return algokit_utils.AlgorandClient.default_localnet()
+
+
+@pytest.fixture()
+def sender(algorand: algokit_utils.AlgorandClient) -> str:
+    return algorand.account.random().address
+
+
+def test_deposit_is_sent_and_confirmed(
+    stub: AlgodStub, algorand: algokit_utils.AlgorandClient, sender: str
+) -> None:
+    stub.returns[_selector("deposit(string,pay)uint64")] = (7).to_bytes(8, "big")
+    bank = BankClient(algorand=algorand, app_id=APP_ID, default_sender=sender)
+
+    async def deposit() -> int | None:
+        async with AsyncBankClient(bank, AsyncAlgod(stub.url)) as client:
+            sp = await client.suggested_params()
+            pay = transaction.PaymentTxn(sender, sp, client.app_address, 7)
+            result = await client.send.deposit(
+                args=("memo", pay), send_params={"populate_app_call_resources": False}
+            )
+            return result.abi_return
+
+    assert asyncio.run(deposit()) == 7
+    assert [stxn.transaction.type for stxn in stub.sent] == ["pay", "appl"]
+    assert stub.sent[0].transaction.group == stub.sent[1].transaction.group
+    assert stub.simulations == 0
+
+
+def test_populates_resources_from_an_async_simulate(
+    stub: AlgodStub, algorand: algokit_utils.AlgorandClient, sender: str
+) -> None:
+    account_ref = account.generate_account()[1]
+    stub.returns[_selector("withdraw(uint64)uint64")] = (0).to_bytes(8, "big")
+    stub.unnamed_resources = {"accounts": [account_ref]}
+    bank = BankClient(algorand=algorand, app_id=APP_ID, default_sender=sender)
+
+    async def withdraw() -> None:
+        async with AsyncBankClient(bank, AsyncAlgod(stub.url)) as client:
+            await client.send.withdraw(args=(5,))
+
+    asyncio.run(withdraw())
+
+    assert stub.simulations == 1
+    (call,) = stub.sent
+    assert call.transaction.accounts == [account_ref]
+
+
+def test_readonly_calls_and_groups_are_simulated(
+    stub: AlgodStub, algorand: algokit_utils.AlgorandClient, sender: str
+) -> None:
+    stub.returns[_selector("balance_of(address)uint64")] = (3).to_bytes(8, "big")
+    bank = BankClient(algorand=algorand, app_id=APP_ID, default_sender=sender)
+
+    async def read() -> tuple[int | None, list[object]]:
+        async with AsyncBankClient(bank, AsyncAlgod(stub.url)) as client:
+            single = await client.send.balance_of(args=(sender,))
+            group = (
+                await client.new_group().balance_of(args=(sender,)).opup().simulate()
+            )
+            return single.abi_return, [r.value for r in group.returns]
+
+    assert asyncio.run(read()) == (3, [3, None])
+    assert stub.sent == []
+    assert stub.simulations == 2
+
+
+def test_reads_state_and_boxes(
+    stub: AlgodStub, algorand: algokit_utils.AlgorandClient
+) -> None:
+    depositor = account.generate_account()[1]
+    stub.global_state[APP_ID] = {
+        b"total_deposit": 12,
+        b"paused": 1,
+        b"successor_hash": b"h" * 32,
+        b"successor_round": 40,
+    }
+    stub.boxes[APP_ID] = {encoding.decode_address(depositor): (12).to_bytes(8, "big")}
+    bank = BankClient(algorand=algorand, app_id=APP_ID)
+
+    async def read() -> tuple[int, int | None, dict[str, int]]:
+        async with AsyncBankClient(bank, AsyncAlgod(stub.url)) as client:
+            global_state, balance, deposits = await asyncio.gather(
+                client.state.global_state.get(),
+                client.state.box.deposits.get_value(depositor),
+                client.state.box.deposits.get_map(),
+            )
+            # One reader per map, reading through the client's own async transport
+            assert await client.state.box.deposits.get_map() == deposits
+            assert client.app.box_map("deposits") is client.app.box_map("deposits")
+            # Every key, typed as the generated client has it
+            assert (global_state.paused, global_state.successor_round) == (1, 40)
+            assert global_state.successor_hash == b"h" * 32
+            assert (await client.state.global_state.get_all())["paused"] == 1
+            return global_state.total_deposit, balance, deposits
+
+    assert asyncio.run(read()) == (12, 12, {depositor: 12})
+
+
+def test_counter_calls_run_concurrently(
+    stub: AlgodStub, algorand: algokit_utils.AlgorandClient, sender: str
+) -> None:
+    stub.returns[_selector("incr_counter()uint64")] = (1).to_bytes(8, "big")
+    counter = CounterClient(algorand=algorand, app_id=APP_ID, default_sender=sender)
+
+    async def incr() -> list[int | None]:
+        async with AsyncCounterClient(counter, AsyncAlgod(stub.url)) as client:
+            results = await asyncio.gather(
+                *(
+                    client.send.incr_counter(
+                        params=algokit_utils.CommonAppCallParams(note=str(i).encode()),
+                        send_params={"populate_app_call_resources": False},
+                    )
+                    for i in range(5)
+                )
+            )
+            return [r.abi_return for r in results]
+
+    assert asyncio.run(incr()) == [1] * 5
+    assert len(stub.sent) == 5
+
+
+def test_every_generated_method_has_a_counterpart(
+    stub: AlgodStub, algorand: algokit_utils.AlgorandClient, sender: str
+) -> None:
+    stub.returns[_selector("approve_successor(byte[])uint64")] = (40).to_bytes(8, "big")
+    bank = BankClient(algorand=algorand, app_id=APP_ID, default_sender=sender)
+    no_simulate: algokit_utils.SendParams = {"populate_app_call_resources": False}
+
+    async def admin() -> int | None:
+        async with AsyncBankClient(bank, AsyncAlgod(stub.url)) as client:
+            await client.send.set_paused(args=(True,), send_params=no_simulate)
+            result = await client.send.approve_successor(
+                args=(bytes(32),), send_params=no_simulate
+            )
+            await client.new_group().set_paused(args=(False,)).send(no_simulate)
+            return result.abi_return
+
+    assert asyncio.run(admin()) == 40
+    assert [_app_selector(stxn) for stxn in stub.sent] == [
+        _selector("set_paused(bool)void"),
+        _selector("approve_successor(byte[])uint64"),
+        _selector("set_paused(bool)void"),
+    ]
+
+    with pytest.raises(TypeError, match="set_paused"):
+
+        class _Partial(AsyncSendBase, mirrors=BankSend):
+            deposit = async_send(BankSend.deposit)
+
+
+def test_calls_over_one_app_calls_budget_are_padded(
+    stub: AlgodStub, algorand: algokit_utils.AlgorandClient, sender: str
+) -> None:
+    stub.returns[_selector(IMPORT)] = (16).to_bytes(8, "big")
+    bank = BankClient(algorand=algorand, app_id=APP_ID, default_sender=sender)
+    entries = [(account.generate_account()[1], 5) for _ in range(16)]
+    no_simulate: algokit_utils.SendParams = {"populate_app_call_resources": False}
+
+    async def import_deposits() -> int | None:
+        async with AsyncBankClient(bank, AsyncAlgod(stub.url)) as client:
+            result = await client.send.import_deposits(
+                args=(entries,), send_params=no_simulate
+            )
+            await client.new_group().import_deposits(args=(entries,)).send(no_simulate)
+            return result.abi_return
+
+    # The call's own return, not the padding's
+    assert asyncio.run(import_deposits()) == 16
+    assert [_app_selector(stxn) for stxn in stub.sent] == [
+        _selector(IMPORT),
+        _selector(OPUP_METHOD),
+    ] * 2
+
+
+def _app_selector(stxn: transaction.SignedTransaction) -> bytes:
+    txn = typing.cast(transaction.ApplicationCallTxn, stxn.transaction)
+    return typing.cast(list[bytes], txn.app_args)[0]
@@ -0,0 +1,443 @@
+import base64
+import io
+import json
+import threading
+import time
+from collections.abc import Callable
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from types import TracebackType
+from urllib.parse import parse_qs, urlparse
+
+import msgpack
+from algosdk import encoding, transaction
+
+# Prefix algod expects on the log line carrying an ABI method's return value.
+RETURN_PREFIX = bytes.fromhex("151f7c75")
+
+
+class AlgodStub:
+    """
+    In-process stand-in for the algod REST endpoints the off-chain helpers use.
+
+    Serves boxes from `boxes[app_id][name]` over keep-alive HTTP/1.1, with an optional
+    per-request `latency` and `failures[name]` 503 responses before a box is served.
+    `/boxes` pages by `max`/`next`/`prefix`/`values` unless `paging` is False, in which
+    case it behaves like older nodes and always returns every name.
+
+    Submitted groups are confirmed in the next round, and simulated without running any
+    TEAL: app calls whose selector is in `returns` log that value as their ABI return.
+    Every submitted transaction is kept in `sent`; the next `dropped` groups are accepted
+    but never confirmed, as if they fell out of the pool, the next `pool_errors` are
+    accepted and then evicted with those messages, and the next `rejections`
+    are turned away with those messages, as are the next `simulate_failures` simulates.
+    With `deduplicate`, a group that already
+    confirmed is turned away as already in the ledger, like algod does for identical
+    transactions. `/blocks/{round}/txids` lists those confirmed in a round.
+    `record` confirms a group without a request, to build up a long history quickly.
+    `on_confirm`, if set, is called with each confirmed group to stand in for what its
+    TEAL would have done to `boxes` and `global_state`. Accounts hold `balances`, on
+    top of a 0.1 ALGO minimum balance.
+    `write_box` changes a box in a round of its own, which `/deltas/{round}` then
+    reports in msgpack like algod, for rounds from `deltas_from` on.
+
+    It also stands in for the indexer: `/health` and a `/v2/transactions` search of
+    the confirmed transactions, by round, type, app and receiver. Round times are the
+    round numbers.
+    `/status/wait-for-block-after` waits up to `block_wait` seconds for a new round,
+    like algod does for a minute.
+    """
+
+    def __init__(self, latency: float = 0.0, *, paging: bool = True):
+        self.latency = latency
+        self.paging = paging
+        self.round = 1
+        self.boxes: dict[int, dict[bytes, bytes]] = {}
+        self.failures: dict[bytes, int] = {}
+        self.global_state: dict[int, dict[bytes, int | bytes]] = {}
+        self.returns: dict[bytes, bytes] = {}
+        self.balances: dict[str, int] = {}
+        self.on_confirm: Callable[[list[transaction.Transaction]], None] | None = None
+        self.unnamed_resources: dict[str, object] | None = None
+        self.sent: list[transaction.SignedTransaction] = []
+        self.pending: dict[str, dict[str, object]] = {}
+        self.blocks: dict[int, list[str]] = {}
+        self._confirmed: dict[str, transaction.SignedTransaction] = {}
+        self.deduplicate = False
+        self.deltas: dict[int, dict[bytes, bytes | None]] = {}
+        self.deltas_from = 1
+        self.serves_deltas = True
+        self.sync_round = 0
+        self.dropped = 0
+        self.pool_errors: list[str] = []
+        self.rejections: list[str] = []
+        self.simulate_failures: list[str] = []
+        self.block_wait = 0.05
+        self.simulations = 0
+        self.requests = 0
+        self.params_requests = 0
+        self.connections = 0
+        self._lock = threading.Lock()
+        self._new_round = threading.Condition(self._lock)
+        self._server = ThreadingHTTPServer(("127.0.0.1", 0), _handler_for(self))
+        self._server.daemon_threads = True
+        self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+
+    @property
+    def url(self) -> str:
+        host, port = self._server.server_address[:2]
+        return f"http://{host!s}:{port}"
+
+    def __enter__(self) -> "AlgodStub":
+        self._thread.start()
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_value: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        self._server.shutdown()
+        self._server.server_close()
+
+    def write_box(self, app_id: int, name: bytes, value: bytes | None) -> int:
+        """Writes, or with None deletes, a box in a new round, which it returns."""
+        with self._lock:
+            self.round += 1
+            boxes = self.boxes.setdefault(app_id, {})
+            if value is None:
+                boxes.pop(name, None)
+            else:
+                boxes[name] = value
+            key = b"bx:" + app_id.to_bytes(8, "big") + name
+            self.deltas.setdefault(self.round, {})[key] = value
+            self._new_round.notify_all()
+            return self.round
+
+    def record(self, group: list[transaction.Transaction]) -> int:
+        """Confirms `group`, unsigned, in a new round, which it returns."""
+        self._send([transaction.SignedTransaction(txn, None) for txn in group])
+        return self.round
+
+    def respond(self, path: str, query: dict[str, list[str]]) -> tuple[int, object]:
+        with self._lock:
+            self.requests += 1
+        if self.latency:
+            time.sleep(self.latency)
+        parts = path.strip("/").split("/")
+        if parts[:3] == ["v2", "status", "wait-for-block-after"]:
+            with self._new_round:
+                self._new_round.wait_for(
+                    lambda: self.round > int(parts[3]), self.block_wait
+                )
+        if parts[:2] == ["v2", "status"]:
+            return 200, {"last-round": self.round}
+        if parts == ["v2", "transactions", "params"]:
+            with self._lock:
+                self.params_requests += 1
+            return 200, {
+                "fee": 0,
+                "min-fee": 1000,
+                "last-round": self.round,
+                "genesis-id": "stub-v1",
+                "genesis-hash": _b64(bytes(32)),
+                "consensus-version": "future",
+            }
+        if parts == ["health"]:
+            return 200, {"round": self.round}
+        if parts == ["v2", "transactions"]:
+            return 200, self._search(query)
+        if parts[:2] == ["v2", "deltas"] and len(parts) == 3:
+            if not self.serves_deltas:
+                # What algod's router answers for a route it doesn't have
+                return 404, {"message": "Not Found"}
+            if not self.deltas_from <= int(parts[2]) <= self.round:
+                return 404, {
+                    "message": "failed to retrieve information from the ledger"
+                }
+            mods = self.deltas.get(int(parts[2]), {})
+            # A deleted box's delta has no Data at all
+            return 200, msgpack.packb(
+                {
+                    "KvMods": {
+                        key: {} if value is None else {"Data": value}
+                        for key, value in mods.items()
+                    }
+                },
+                use_bin_type=True,
+            )
+        if parts[:2] == ["v2", "blocks"] and parts[3:] == ["txids"]:
+            return 200, {"blockTxids": self.blocks.get(int(parts[2]), [])}
+        if parts[:3] == ["v2", "transactions", "pending"]:
+            if parts[3] not in self.pending:
+                return 404, {"message": "txn not found"}
+            return 200, self.pending[parts[3]]
+        if parts[:2] == ["v2", "accounts"] and len(parts) == 3:
+            amount = 100_000 + self.balances.get(parts[2], 0)
+            return 200, {
+                "address": parts[2],
+                "amount": amount,
+                "amount-without-pending-rewards": amount,
+                "min-balance": 100_000,
+                "pending-rewards": 0,
+                "rewards": 0,
+                "round": self.round,
+                "status": "Offline",
+            }
+        if parts[:2] == ["v2", "applications"] and len(parts) == 3:
+            state = self.global_state.get(int(parts[2]), {})
+            return 200, {
+                "id": int(parts[2]),
+                "params": {
+                    "approval-program": "",
+                    "clear-state-program": "",
+                    "creator": encoding.encode_address(bytes(32)),
+                    "local-state-schema": {"num-uint": 0, "num-byte-slice": 0},
+                    "global-state-schema": {
+                        "num-uint": len(state),
+                        "num-byte-slice": 0,
+                    },
+                    "global-state": [_teal_kv(k, v) for k, v in state.items()],
+                },
+            }
+        if parts[:2] == ["v2", "applications"] and len(parts) == 4:
+            boxes = self.boxes.get(int(parts[2]), {})
+            if parts[3] == "boxes":
+                return 200, self._box_page(boxes, query)
+            if parts[3] == "box":
+                name = _unb64(query["name"][0])
+                with self._lock:
+                    if self.failures.get(name):
+                        self.failures[name] -= 1
+                        return 503, {"message": "overloaded"}
+                if name not in boxes:
+                    return 404, {"message": "box not found"}
+                return 200, {
+                    "name": _b64(name),
+                    "round": self.round,
+                    "value": _b64(boxes[name]),
+                }
+        return 404, {"message": f"unknown path {path}"}
+
+    def submit(self, path: str, body: bytes) -> tuple[int, object]:
+        with self._lock:
+            self.requests += 1
+        if path == "/v2/transactions":
+            with self._lock:
+                if self.rejections:
+                    return 400, {"message": self.rejections.pop(0)}
+            return self._send(_signed_txns(body))
+        if path == "/v2/transactions/simulate":
+            with self._lock:
+                if self.simulate_failures:
+                    return 500, {"message": self.simulate_failures.pop(0)}
+            return 200, self._simulate(body)
+        if path.startswith("/v2/ledger/sync/"):
+            self.sync_round = int(path.rsplit("/", 1)[1])
+            return 200, {}
+        return 404, {"message": f"unknown path {path}"}
+
+    def _send(
+        self, group: list[transaction.SignedTransaction]
+    ) -> tuple[int, dict[str, object]]:
+        with self._lock:
+            tx_id = group[0].get_txid()
+            if self.deduplicate and tx_id in self.pending:
+                return 400, {
+                    "message": f"TransactionPool.Remember: transaction already in "
+                    f"ledger: {tx_id}"
+                }
+            self.round += 1
+            self._new_round.notify_all()
+            self.sent.extend(group)
+            if self.dropped:
+                self.dropped -= 1
+                return 200, {"txId": tx_id}
+            if self.pool_errors:
+                error = self.pool_errors.pop(0)
+                for stxn in group:
+                    self.pending[stxn.get_txid()] = {"pool-error": error}
+                return 200, {"txId": tx_id}
+            for stxn in group:
+                self.pending[stxn.get_txid()] = {
+                    "confirmed-round": self.round,
+                    "pool-error": "",
+                    **self._result(stxn),
+                }
+                self.blocks.setdefault(self.round, []).append(stxn.get_txid())
+                self._confirmed[stxn.get_txid()] = stxn
+        if self.on_confirm is not None:
+            self.on_confirm([stxn.transaction for stxn in group])
+        return 200, {"txId": tx_id}
+
+    def _simulate(self, body: bytes) -> dict[str, object]:
+        request = msgpack.unpackb(body, raw=False, strict_map_key=False)
+        group = [_signed_txn(stxn) for stxn in request["txn-groups"][0]["txns"]]
+        with self._lock:
+            self.simulations += 1
+        result: dict[str, object] = {
+            "txn-results": [
+                {"txn-result": self._result(stxn), "app-budget-consumed": 50}
+                for stxn in group
+            ]
+        }
+        if self.unnamed_resources is not None:
+            result["unnamed-resources-accessed"] = self.unnamed_resources
+        return {"version": 2, "last-round": self.round, "txn-groups": [result]}
+
+    def _result(self, stxn: transaction.SignedTransaction) -> dict[str, object]:
+        txn = stxn.transaction
+        result: dict[str, object] = {"txn": {"txn": txn.dictify()}}
+        if isinstance(txn, transaction.ApplicationCallTxn) and txn.app_args:
+            value = self.returns.get(txn.app_args[0][:4])
+            if value is not None:
+                result["logs"] = [_b64(RETURN_PREFIX + value)]
+        return result
+
+    def _search(self, query: dict[str, list[str]]) -> dict[str, object]:
+        def wanted(stxn: transaction.SignedTransaction) -> bool:
+            txn = stxn.transaction
+            if query.get("tx-type", [txn.type])[0] != txn.type:
+                return False
+            if "application-id" in query and not (
+                isinstance(txn, transaction.ApplicationCallTxn)
+                and txn.index == int(query["application-id"][0])
+            ):
+                return False
+            # Only ever searched by receiver
+            return "address" not in query or (
+                isinstance(txn, transaction.PaymentTxn)
+                and txn.receiver == query["address"][0]
+            )
+
+        with self._lock:
+            first = int(query.get("min-round", ["0"])[0])
+            last = int(query.get("max-round", [str(self.round)])[0])
+            found = [
+                self._indexed(self._confirmed[tx_id], round_, offset)
+                for round_ in range(first, last + 1)
+                for offset, tx_id in enumerate(self.blocks.get(round_, []))
+                if wanted(self._confirmed[tx_id])
+            ]
+        start = int(query.get("next", ["0"])[0])
+        end = start + int(query.get("limit", ["1000"])[0])
+        body: dict[str, object] = {
+            "current-round": self.round,
+            "transactions": found[start:end],
+        }
+        if end < len(found):
+            body["next-token"] = str(end)
+        return body
+
+    def _indexed(
+        self, stxn: transaction.SignedTransaction, round_: int, offset: int
+    ) -> dict[str, object]:
+        txn = stxn.transaction
+        indexed: dict[str, object] = {
+            "id": txn.get_txid(),
+            "sender": txn.sender,
+            "tx-type": txn.type,
+            "confirmed-round": round_,
+            "intra-round-offset": offset,
+            "round-time": round_,
+        }
+        if txn.group:
+            indexed["group"] = _b64(txn.group)
+        if isinstance(txn, transaction.PaymentTxn):
+            indexed["payment-transaction"] = {
+                "amount": txn.amt,
+                "receiver": txn.receiver,
+            }
+        if isinstance(txn, transaction.ApplicationCallTxn):
+            indexed["application-transaction"] = {
+                "application-id": txn.index,
+                "application-args": [_b64(arg) for arg in txn.app_args or []],
+            }
+            # As logged when it was sent
+            indexed["logs"] = self.pending[txn.get_txid()].get("logs", [])
+        return indexed
+
+    def _box_page(
+        self, boxes: dict[bytes, bytes], query: dict[str, list[str]]
+    ) -> dict[str, object]:
+        if not self.paging or "max" not in query:
+            return {"boxes": [{"name": _b64(name)} for name in boxes]}
+        prefix = _unb64(query.get("prefix", ["b64:"])[0])
+        start = _unb64(query["next"][0]) if "next" in query else b""
+        names = sorted(n for n in boxes if n.startswith(prefix) and n >= start)
+        page, rest = names[: int(query["max"][0])], names[int(query["max"][0]) :]
+        values = query.get("values") == ["true"]
+        body: dict[str, object] = {
+            "round": self.round,
+            "boxes": [
+                {"name": _b64(n), **({"value": _b64(boxes[n])} if values else {})}
+                for n in page
+            ],
+        }
+        if rest:
+            body["next-token"] = "b64:" + _b64(rest[0])
+        return body
+
+
+def _signed_txns(body: bytes) -> list[transaction.SignedTransaction]:
+    unpacker = msgpack.Unpacker(io.BytesIO(body), raw=False, strict_map_key=False)
+    return [_signed_txn(obj) for obj in unpacker]
+
+
+def _signed_txn(obj: object) -> transaction.SignedTransaction:
+    packed = msgpack.packb(obj, use_bin_type=True)
+    decoded = encoding.msgpack_decode(base64.b64encode(packed).decode())
+    # Simulate requests carry unsigned transactions, which decode without the wrapper
+    if isinstance(decoded, transaction.Transaction):
+        return transaction.SignedTransaction(decoded, None)
+    return decoded
+
+
+def _teal_kv(key: bytes, value: int | bytes) -> dict[str, object]:
+    if isinstance(value, int):
+        return {"key": _b64(key), "value": {"type": 2, "uint": value, "bytes": ""}}
+    return {"key": _b64(key), "value": {"type": 1, "uint": 0, "bytes": _b64(value)}}
+
+
+def _unb64(value: str) -> bytes:
+    return base64.b64decode(value.removeprefix("b64:"))
+
+
+def _b64(data: bytes) -> str:
+    return base64.b64encode(data).decode()
+
+
+def _handler_for(stub: AlgodStub) -> type[BaseHTTPRequestHandler]:
+    class Handler(BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"
+        disable_nagle_algorithm = True
+
+        def setup(self) -> None:
+            super().setup()
+            with stub._lock:
+                stub.connections += 1
+
+        def do_GET(self) -> None:  # noqa: N802
+            url = urlparse(self.path)
+            self._reply(*stub.respond(url.path, parse_qs(url.query)))
+
+        def do_POST(self) -> None:  # noqa: N802
+            length = int(self.headers.get("Content-Length", 0))
+            self._reply(*stub.submit(urlparse(self.path).path, self.rfile.read(length)))
+
+        def _reply(self, status: int, body: object) -> None:
+            if isinstance(body, bytes):
+                payload, content_type = body, "application/msgpack"
+            else:
+                payload = json.dumps(body, default=_b64).encode()
+                content_type = "application/json"
+            self.send_response(status)
+            self.send_header("Content-Type", content_type)
+            self.send_header("Content-Length", str(len(payload)))
+            self.end_headers()
+            self.wfile.write(payload)
+
+        def log_message(self, format: str, *args: object) -> None:  # noqa: A002
+            pass
+
+    return Handler
@@ -0,0 +1,195 @@
+import pathlib
+import random
+import time
+from collections.abc import Iterator
+
+import algokit_utils
+import pytest
+from algosdk import abi, transaction
+from algosdk.v2client.algod import AlgodClient
+from algosdk.v2client.indexer import IndexerClient
+
+from smart_contracts._helpers.backfill import Backfill, Segment, segments
+from smart_contracts.artifacts.bank.bank_client import BankClient
+from smart_contracts.bank.statements import StatementIndex, StatementIngester
+from tests.algod_stub import AlgodStub
+
+APP_ID = 1234
+
+
+@pytest.fixture()
+def stub() -> Iterator[AlgodStub]:
+    with AlgodStub() as stub:
+        yield stub
+
+
+@pytest.fixture()
+def bank(stub: AlgodStub) -> BankClient:
+    algorand = algokit_utils.AlgorandClient.from_clients(
+        algod=AlgodClient("", stub.url)
+    )
+    return BankClient(
+        algorand=algorand,
+        app_id=APP_ID,
+        default_sender=algorand.account.random().address,
+    )
+
+
+def test_segments_are_aligned_so_a_resumed_range_splits_the_same_way() -> None:
+    assert segments(5, 32, 10) == [
+        Segment(5, 9),
+        Segment(10, 19),
+        Segment(20, 29),
+        Segment(30, 32),
+    ]
+    assert segments(20, 32, 10) == segments(5, 32, 10)[2:]
+    assert segments(33, 32, 10) == []
+
+
+def test_backfill_merges_in_round_order_and_resumes_from_checkpoints(
+    tmp_path: pathlib.Path,
+) -> None:
+    merged: list[int] = []
+    fetched: list[int] = []
+    failures = [RuntimeError("indexer unavailable")]
+
+    def fetch(segment: Segment) -> list[int]:
+        fetched.append(segment.start)
+        if segment.start == 20 and failures:
+            # Fails once the segments after it are fetched and checkpointed
+            deadline = time.monotonic() + 10
+            while len(list(tmp_path.glob("*.pickle"))) < 3:
+                assert time.monotonic() < deadline
+                time.sleep(0.01)
+            raise failures.pop()
+        return list(range(segment.start, segment.end + 1))
+
+    def sink(segment: Segment, rounds: list[int]) -> None:
+        assert rounds[0] == segment.start
+        merged.extend(rounds)
+
+    with Backfill(fetch, sink, tmp_path, segment_size=10, workers=2, threads=True) as b:
+        with pytest.raises(RuntimeError, match="indexer unavailable"):
+            b.run(5, 55)
+    assert merged == list(range(5, 20))
+    assert sorted(p.name for p in tmp_path.iterdir()) == [
+        "30-39.pickle",
+        "40-49.pickle",
+        "50-55.pickle",
+    ]
+
+    fetched.clear()
+    with Backfill(fetch, sink, tmp_path, segment_size=10, workers=2, threads=True) as b:
+        result = b.run(merged[-1] + 1, 55)
+    assert merged == list(range(5, 56))
+    assert fetched == [20]
+    assert (result.segments, result.resumed, result.items) == (4, 3, 36)
+    assert list(tmp_path.iterdir()) == []
+
+
+def _record(
+    stub: AlgodStub,
+    bank: BankClient,
+    sender: str,
+    signature: str,
+    args: list[bytes],
+    *,
+    returned: int | None = None,
+    pay: int | None = None,
+) -> None:
+    method = abi.Method.from_signature(signature)
+    if returned is not None:
+        stub.returns[method.get_selector()] = returned.to_bytes(8, "big")
+    params = bank.algorand.get_suggested_params()
+    # Unique, like a real ledger's transactions
+    note = stub.round.to_bytes(8, "big")
+    group: list[transaction.Transaction] = []
+    if pay is not None:
+        group.append(
+            transaction.PaymentTxn(sender, params, bank.app_address, pay, note=note)
+        )
+    group.append(
+        transaction.ApplicationCallTxn(
+            sender,
+            params,
+            APP_ID,
+            transaction.OnComplete.NoOpOC,
+            app_args=[method.get_selector(), *args],
+            note=note,
+        )
+    )
+    stub.record(transaction.assign_group_id(group) if pay is not None else group)
+
+
+def test_parallel_backfill_indexes_the_same_statements_as_ingest(
+    stub: AlgodStub, bank: BankClient, tmp_path: pathlib.Path
+) -> None:
+    accounts = [bank.algorand.account.random().address for _ in range(5)]
+    balances = dict.fromkeys(accounts, 0)
+    memo = abi.StringType().encode("memo")
+    rng = random.Random(7)
+    for _ in range(60):
+        account = rng.choice(accounts)
+        if balances[account] and rng.random() < 0.3:
+            amount = rng.randint(1, balances[account])
+            balances[account] -= amount
+            _record(
+                stub,
+                bank,
+                account,
+                "withdraw(uint64)uint64",
+                [abi.UintType(64).encode(amount)],
+                returned=balances[account],
+            )
+        else:
+            amount = rng.randint(1, 100)
+            balances[account] += amount
+            _record(
+                stub,
+                bank,
+                account,
+                "deposit(string,pay)uint64",
+                [memo],
+                returned=balances[account],
+                pay=amount,
+            )
+        if len(stub.blocks) == 30:
+            _record(
+                stub,
+                bank,
+                bank.app_address,
+                "export_deposits((address,uint64)[],application)uint64",
+                [
+                    abi.ABIType.from_string("(address,uint64)[]").encode(
+                        [(a, balances[a]) for a in accounts[:2]]
+                    ),
+                    b"\x01",
+                ],
+            )
+            _record(
+                stub,
+                bank,
+                bank.app_address,
+                "import_deposits((address,uint64)[])uint64",
+                [
+                    abi.ABIType.from_string("(address,uint64)[]").encode(
+                        [(accounts[0], 9)]
+                    )
+                ],
+            )
+            balances[accounts[0]], balances[accounts[1]] = 9, 0
+    indexer = IndexerClient("", stub.url)
+
+    with StatementIndex(tmp_path / "ingested.sqlite", APP_ID) as index:
+        StatementIngester(bank, index, indexer, window=8).ingest()
+        expected = {a: index.statements(a, limit=100).statements for a in accounts}
+    with StatementIndex(tmp_path / "backfilled.sqlite", APP_ID) as index:
+        result = StatementIngester(bank, index, indexer, window=8).backfill(
+            tmp_path / "segments", workers=2
+        )
+        assert (index.round, result.segments) == (stub.round, 8)
+        assert {
+            a: index.statements(a, limit=100).statements for a in accounts
+        } == expected
+        assert {a: index.balance(a) for a in accounts} == balances
+    assert sum(map(len, expected.values())) == result.items == 63
@@ -0,0 +1,303 @@
+import json
+import typing
+from collections.abc import Callable, Iterator
+from pathlib import Path
+
+import algokit_utils
+import pytest
+from algosdk import abi, encoding, logic, transaction
+from algosdk.atomic_transaction_composer import TransactionSigner
+from algosdk.v2client.algod import AlgodClient
+
+from smart_contracts.artifacts.bank.bank_client import BankClient
+from smart_contracts.bank.migrate import (
+    MAX_GROUP_SIZE,
+    BankMigration,
+    MigrationCheckpoint,
+    MigrationState,
+    _calls_for,
+    accounts_per_group,
+)
+from tests.algod_stub import AlgodStub
+
+OLD, NEW = 1001, 1002
+EXPORT = abi.Method.from_signature(
+    "export_deposits((address,uint64)[],application)uint64"
+).get_selector()
+IMPORT = abi.Method.from_signature("import_deposits((address,uint64)[])uint64")
+SET_PAUSED = abi.Method.from_signature("set_paused(bool)void").get_selector()
+ENTRIES = abi.ABIType.from_string("(address,uint64)[]")
+
+
+def test_accounts_per_group_fills_but_does_not_overflow_a_group() -> None:
+    accounts = accounts_per_group()
+    assert 1 + _calls_for(accounts) <= MAX_GROUP_SIZE
+    assert 1 + _calls_for(accounts + 1) > MAX_GROUP_SIZE
+
+
+def test_checkpoint_resumes_with_recorded_progress(tmp_path: Path) -> None:
+    checkpoint = MigrationCheckpoint(tmp_path / "migration.jsonl")
+    assert checkpoint.load() is None
+
+    checkpoint.start(
+        MigrationState(old_app_id=1, new_app_id=2, old_total=500, new_total=0)
+    )
+    checkpoint.record("TX1", accounts=3, amount=300)
+    checkpoint.record("TX2", accounts=1, amount=50)
+
+    resumed = MigrationCheckpoint(tmp_path / "migration.jsonl").load()
+    assert resumed == MigrationState(
+        old_app_id=1,
+        new_app_id=2,
+        old_total=500,
+        new_total=0,
+        migrated_accounts=4,
+        migrated_amount=350,
+    )
+
+
+@pytest.fixture()
+def stub() -> Iterator[AlgodStub]:
+    with AlgodStub() as stub:
+        yield stub
+
+
+@pytest.fixture()
+def algorand(stub: AlgodStub) -> algokit_utils.AlgorandClient:
+    return algokit_utils.AlgorandClient.from_clients(algod=AlgodClient("", stub.url))
+
+
+@pytest.fixture()
+def creator(algorand: algokit_utils.AlgorandClient) -> str:
+    return algorand.account.random().address
+
+
+def _migration(
+    algorand: algokit_utils.AlgorandClient, creator: str, tmp_path: Path
+) -> BankMigration:
+    old, new = (
+        BankClient(algorand=algorand, app_id=app_id, default_sender=creator)
+        for app_id in (OLD, NEW)
+    )
+    return BankMigration(
+        old, new, creator, MigrationCheckpoint(tmp_path / "migration.jsonl")
+    )
+
+
+def _deposit(stub: AlgodStub, app_id: int, address: str, amount: int) -> None:
+    """Credits `address` in `app_id`'s deposits, as a deposit or import would."""
+    boxes = stub.boxes.setdefault(app_id, {})
+    name = encoding.decode_address(address)
+    balance = int.from_bytes(boxes.get(name, bytes(8)), "big") + amount
+    if balance:
+        boxes[name] = balance.to_bytes(8, "big")
+    else:
+        boxes.pop(name, None)
+    state = stub.global_state.setdefault(app_id, {})
+    state[b"total_deposit"] = typing.cast(int, state.get(b"total_deposit", 0)) + amount
+
+
+def _ledger(stub: AlgodStub) -> None:
+    """Has confirmed exports, imports and pauses change the stub's state like the app."""
+
+    def confirmed(group: list[transaction.Transaction]) -> None:
+        for txn in group:
+            if not isinstance(txn, transaction.ApplicationCallTxn):
+                continue
+            selector, *args = txn.app_args
+            if selector == SET_PAUSED:
+                stub.global_state[txn.index][b"paused"] = int(args[0] != bytes(1))
+            elif selector in (EXPORT, IMPORT.get_selector()):
+                sign = -1 if selector == EXPORT else 1
+                entries = typing.cast(list[list[object]], ENTRIES.decode(args[0]))
+                for address, amount in entries:
+                    _deposit(
+                        stub, txn.index, str(address), sign * typing.cast(int, amount)
+                    )
+
+    stub.on_confirm = confirmed
+
+
+def _exportable(stub: AlgodStub, *, paused: bool) -> None:
+    """Has the old app approve the new one's program, which the stub serves empty."""
+    stub.global_state.setdefault(OLD, {}).update(
+        {
+            b"paused": int(paused),
+            b"successor_hash": encoding.checksum(b""),
+            b"successor_round": 0,
+        }
+    )
+    stub.global_state.setdefault(NEW, {b"total_deposit": 0})
+    # Enough that the new app needs no top-up
+    stub.balances[logic.get_application_address(NEW)] = 10**9
+
+
+def _exports(stub: AlgodStub) -> list[list[tuple[str, int]]]:
+    return [
+        [
+            (str(address), typing.cast(int, amount))
+            for address, amount in typing.cast(
+                list[list[object]], ENTRIES.decode(txn.app_args[1])
+            )
+        ]
+        for txn in (stxn.transaction for stxn in stub.sent)
+        if isinstance(txn, transaction.ApplicationCallTxn) and txn.app_args[0] == EXPORT
+    ]
+
+
+def _records(tmp_path: Path) -> list[dict[str, int | str]]:
+    with (tmp_path / "migration.jsonl").open() as f:
+        lines = [typing.cast(dict[str, int | str], json.loads(line)) for line in f]
+    return [line for line in lines if "tx_id" in line]
+
+
+def test_rejected_exports_are_resent_with_re_read_balances(
+    stub: AlgodStub,
+    algorand: algokit_utils.AlgorandClient,
+    creator: str,
+    tmp_path: Path,
+) -> None:
+    migration = _migration(algorand, creator, tmp_path)
+    withdrawn, emptied, kept = (algorand.account.random().address for _ in range(3))
+    read = {withdrawn: 500, emptied: 200, kept: 100}
+    # Since they were read, one withdrew part of their balance and one all of it
+    _deposit(stub, OLD, withdrawn, 300)
+    _deposit(stub, OLD, kept, 100)
+    stub.rejections = ["logic eval error: Exports must move whole balances"]
+
+    migration._send_group(sorted(read), read, set())
+
+    assert _exports(stub) == [sorted({withdrawn: 300, kept: 100}.items())]
+    assert [(r["accounts"], r["amount"]) for r in _records(tmp_path)] == [(2, 400)]
+
+
+def test_rejected_exports_fail_if_the_balances_did_not_change(
+    stub: AlgodStub,
+    algorand: algokit_utils.AlgorandClient,
+    creator: str,
+    tmp_path: Path,
+) -> None:
+    migration = _migration(algorand, creator, tmp_path)
+    address = algorand.account.random().address
+    _deposit(stub, OLD, address, 500)
+    stub.rejections = ["logic eval error: Destination is not approved"]
+
+    with pytest.raises(Exception, match="Destination is not approved"):
+        migration._send_group([address], {address: 500}, set())
+
+    assert not _exports(stub)
+    assert not (tmp_path / "migration.jsonl").exists()
+
+
+class _WithdrawingSigner(TransactionSigner):
+    """Has `address` withdraw `amount` just before the first export is sent."""
+
+    def __init__(
+        self, inner: TransactionSigner, stub: AlgodStub, address: str, amount: int
+    ):
+        super().__init__()
+        self.inner = inner
+        self.stub = stub
+        self.address = address
+        self.amount = amount
+
+    def __deepcopy__(self, memo: dict[int, object]) -> "_WithdrawingSigner":
+        # Call params are deep-copied, signer and all; the stub has to be shared
+        return self
+
+    def sign_transactions(
+        self, txn_group: list[transaction.Transaction], indexes: list[int]
+    ) -> list[transaction.GenericSignedTransaction]:
+        if self.amount and any(
+            isinstance(txn, transaction.ApplicationCallTxn)
+            and txn.app_args[0] == EXPORT
+            for txn in txn_group
+        ):
+            _deposit(self.stub, OLD, self.address, -self.amount)
+            self.amount = 0
+            self.stub.rejections = [
+                "logic eval error: Exports must move whole balances"
+            ]
+        return self.inner.sign_transactions(txn_group, indexes)
+
+
+def test_run_pauses_before_recording_totals_and_survives_withdrawals(
+    stub: AlgodStub,
+    algorand: algokit_utils.AlgorandClient,
+    creator: str,
+    tmp_path: Path,
+) -> None:
+    migration = _migration(algorand, creator, tmp_path)
+    _exportable(stub, paused=False)
+    _ledger(stub)
+    late, withdrawer, other = (algorand.account.random().address for _ in range(3))
+    for depositor in (late, withdrawer, other):
+        _deposit(stub, OLD, depositor, 100)
+    algorand.account.set_signer(
+        creator,
+        _WithdrawingSigner(algorand.account.get_signer(creator), stub, withdrawer, 40),
+    )
+    ledger = typing.cast(
+        Callable[[list[transaction.Transaction]], None], stub.on_confirm
+    )
+
+    def pausing(group: list[transaction.Transaction]) -> None:
+        ledger(group)
+        if any(
+            isinstance(txn, transaction.ApplicationCallTxn)
+            and txn.app_args[0] == SET_PAUSED
+            for txn in group
+        ):
+            # A deposit that landed just before the pause
+            _deposit(stub, OLD, late, 50)
+
+    stub.on_confirm = pausing
+
+    state = migration.run()
+
+    # The totals are recorded once deposits are paused
+    assert state.old_total == 350
+    assert (state.migrated_accounts, state.migrated_amount) == (3, 310)
+    assert not stub.boxes[OLD]
+    assert stub.global_state[NEW][b"total_deposit"] == 310
+
+
+def test_verify_compares_against_the_moved_amounts(
+    stub: AlgodStub,
+    algorand: algokit_utils.AlgorandClient,
+    creator: str,
+    tmp_path: Path,
+) -> None:
+    migration = _migration(algorand, creator, tmp_path)
+    migration.checkpoint.start(
+        MigrationState(old_app_id=OLD, new_app_id=NEW, old_total=800, new_total=50)
+    )
+    # 100 was withdrawn from the old app while it was being drained
+    migration.checkpoint.record("TX1", accounts=4, amount=700)
+    stub.global_state = {OLD: {b"total_deposit": 0}, NEW: {b"total_deposit": 750}}
+
+    assert migration.verify().migrated_amount == 700
+
+    stub.global_state[NEW][b"total_deposit"] = 850
+    with pytest.raises(RuntimeError, match="expected 750"):
+        migration.verify()
+
+
+def test_verify_reports_what_is_left_on_the_old_app(
+    stub: AlgodStub,
+    algorand: algokit_utils.AlgorandClient,
+    creator: str,
+    tmp_path: Path,
+) -> None:
+    migration = _migration(algorand, creator, tmp_path)
+    migration.checkpoint.start(
+        MigrationState(old_app_id=OLD, new_app_id=NEW, old_total=800, new_total=0)
+    )
+    _deposit(stub, OLD, algorand.account.random().address, 60)
+
+    with pytest.raises(RuntimeError, match="still holds 60 microALGO"):
+        migration.verify()
+
+    stub.global_state[OLD][b"total_deposit"] = 80
+    with pytest.raises(RuntimeError, match="its boxes hold 60"):
+        migration.verify()
@@ -0,0 +1,176 @@
+import threading
+from collections.abc import Iterator
+
+import algokit_utils
+import algosdk
+import pytest
+from algosdk import encoding, transaction
+from algosdk.atomic_transaction_composer import TransactionSigner
+from algosdk.v2client.algod import AlgodClient
+
+from smart_contracts.artifacts.bank.bank_client import BankClient
+from smart_contracts.bank.sharding import HashRing, ShardedBankClient
+from tests.algod_stub import AlgodStub
+
+SHARDS = (1001, 1002)
+
+
+def _addresses(count: int) -> list[str]:
+    return [algosdk.account.generate_account()[1] for _ in range(count)]
+
+
+def test_every_shard_receives_accounts() -> None:
+    ring = HashRing([1001, 1002, 1003, 1004])
+    owners = {ring.owner(address) for address in _addresses(400)}
+    assert owners == {1001, 1002, 1003, 1004}
+
+
+def test_adding_a_shard_only_moves_accounts_onto_it() -> None:
+    addresses = _addresses(400)
+    before = HashRing([1001, 1002, 1003])
+    after = HashRing([1001, 1002, 1003, 1004])
+
+    moved = [a for a in addresses if before.owner(a) != after.owner(a)]
+
+    assert moved
+    assert all(after.owner(a) == 1004 for a in moved)
+    assert len(moved) < len(addresses) / 2
+
+
+@pytest.fixture()
+def stub() -> Iterator[AlgodStub]:
+    with AlgodStub() as stub:
+        yield stub
+
+
+@pytest.fixture()
+def algorand(stub: AlgodStub) -> algokit_utils.AlgorandClient:
+    return algokit_utils.AlgorandClient.from_clients(algod=AlgodClient("", stub.url))
+
+
+def _shard(algorand: algokit_utils.AlgorandClient, app_id: int) -> BankClient:
+    return BankClient(algorand=algorand, app_id=app_id)
+
+
+def _deposited(stub: AlgodStub, app_id: int, address: str, amount: int) -> None:
+    name = encoding.decode_address(address)
+    stub.boxes.setdefault(app_id, {})[name] = amount.to_bytes(8, "big")
+
+
+def _app_calls(stub: AlgodStub) -> list[transaction.ApplicationCallTxn]:
+    return [
+        stxn.transaction
+        for stxn in stub.sent
+        if isinstance(stxn.transaction, transaction.ApplicationCallTxn)
+    ]
+
+
+def test_calls_are_routed_to_the_owning_shard_and_totals_summed(
+    stub: AlgodStub, algorand: algokit_utils.AlgorandClient
+) -> None:
+    sharded = ShardedBankClient([_shard(algorand, app_id) for app_id in SHARDS])
+    senders = [algorand.account.random().address for _ in range(8)]
+    for sender in senders:
+        sharded.deposit(sender, 5)
+
+    calls = _app_calls(stub)
+    assert [call.index for call in calls] == [
+        sharded.shard_for(sender).app_id for sender in senders
+    ]
+    assert {call.sender for call in calls} == set(senders)
+
+    stub.global_state = {1001: {b"total_deposit": 5}, 1002: {b"total_deposit": 7}}
+    assert sharded.total_deposit() == 12
+
+
+def test_rebalance_moves_balances_atomically_and_retries_stranded_ones(
+    stub: AlgodStub, algorand: algokit_utils.AlgorandClient
+) -> None:
+    sharded = ShardedBankClient([_shard(algorand, app_id) for app_id in SHARDS])
+    depositors = [algorand.account.random().address for _ in range(40)]
+    for depositor in depositors:
+        _deposited(stub, sharded.shard_for(depositor).app_id, depositor, 10)
+    # The first move is turned away, as if the depositor had spent the fees
+    stub.rejections = ["overspend"]
+
+    job = sharded.add_shard(_shard(algorand, 1003))
+    moved = job.result(timeout=30)
+
+    assert moved
+    assert all(sharded.shard_for(address).app_id == 1003 for address in moved)
+    stranded = sharded.stranded
+    assert len(stranded) == 1
+    [(address, source)] = stranded.items()
+    assert sharded.shard_for(address).app_id == 1003
+    assert encoding.decode_address(address) in stub.boxes[source]
+    # Each move is one group: withdraw from the old shard, pay and deposit the new one
+    groups: dict[bytes, list[transaction.Transaction]] = {}
+    for stxn in stub.sent:
+        groups.setdefault(stxn.transaction.group or b"", []).append(stxn.transaction)
+    assert len(groups) == len(moved)
+    for group in groups.values():
+        withdraw, pay, deposit = group
+        assert isinstance(withdraw, transaction.ApplicationCallTxn)
+        assert isinstance(pay, transaction.PaymentTxn)
+        assert isinstance(deposit, transaction.ApplicationCallTxn)
+        assert (withdraw.index in SHARDS, deposit.index) == (True, 1003)
+        assert pay.receiver == sharded.shard_for(withdraw.sender).app_address
+
+    # The stranded balance is still read, and withdrawn, where it is
+    assert sharded.balance_of(address) == 10
+    sharded.withdraw(address, 10)
+    assert _app_calls(stub)[-1].index == source
+
+    # Once the moved boxes are on the new shard, only the stranded one moves again
+    for name in [encoding.decode_address(a) for a in moved]:
+        for app_id in SHARDS:
+            if name in stub.boxes.get(app_id, {}):
+                stub.boxes.setdefault(1003, {})[name] = stub.boxes[app_id].pop(name)
+    assert sharded.rebalance().result(timeout=30) == [address]
+    assert sharded.stranded == {}
+
+
+class _HeldSigner(TransactionSigner):
+    """Holds up the rebalance that signs with it until `release` is set."""
+
+    def __init__(self, signer: TransactionSigner):
+        super().__init__()
+        self.signer = signer
+        self.signing = threading.Event()
+        self.release = threading.Event()
+
+    def __deepcopy__(self, memo: dict[int, object]) -> "_HeldSigner":
+        # Call params are deep-copied, signer and all; the events have to be shared
+        return self
+
+    def sign_transactions(
+        self, txn_group: list[transaction.Transaction], indexes: list[int]
+    ) -> list[transaction.GenericSignedTransaction]:
+        self.signing.set()
+        self.release.wait(30)
+        return self.signer.sign_transactions(txn_group, indexes)
+
+
+def test_withdrawals_mid_rebalance_go_to_the_shard_holding_the_balance(
+    stub: AlgodStub, algorand: algokit_utils.AlgorandClient
+) -> None:
+    sharded = ShardedBankClient([_shard(algorand, app_id) for app_id in SHARDS])
+    grown = HashRing([*SHARDS, 1003])
+    depositor = next(
+        address
+        for address in (algorand.account.random().address for _ in range(200))
+        if grown.owner(address) == 1003
+    )
+    source = sharded.shard_for(depositor).app_id
+    _deposited(stub, source, depositor, 10)
+    held = _HeldSigner(algorand.account.get_signer(depositor))
+
+    job = sharded.add_shard(_shard(algorand, 1003), signers={depositor: held})
+    assert held.signing.wait(30)
+    try:
+        assert sharded.shard_for(depositor).app_id == 1003
+        sharded.withdraw(depositor, 4)
+        assert _app_calls(stub)[-1].index == source
+    finally:
+        held.release.set()
+    assert job.result(timeout=30) == [depositor]
@@ -0,0 +1,146 @@
+from collections.abc import Iterator
+
+import pytest
+from algopy import Account, Application, Bytes, UInt64, arc4, gtxn, op
+from algopy_testing import AlgopyTestContext, algopy_testing_context
+
+from smart_contracts.bank.contract import (
+    MIGRATION_NOTICE_ROUNDS,
+    Bank,
+    DepositEntry,
+)
+
+EXPORT = "export_deposits((address,uint64)[],application)uint64"
+
+
+@pytest.fixture()
+def context() -> Iterator[AlgopyTestContext]:
+    with algopy_testing_context() as ctx:
+        yield ctx
+
+
+def test_balance_of_defaults_to_zero(context: AlgopyTestContext) -> None:
+    # Arrange
+    contract = Bank()
+    account = context.any.account()
+
+    # Act
+    output = contract.balance_of(arc4.Address(account))
+
+    # Assert
+    assert output == 0
+
+
+def test_export_deposits_requires_creator(context: AlgopyTestContext) -> None:
+    # Arrange
+    contract = Bank()
+    destination = context.any.application()
+    entries = _entries((context.any.account(), 5))
+
+    # Act / Assert
+    with context.txn.create_group(
+        active_txn_overrides={"sender": context.any.account()}
+    ), pytest.raises(AssertionError, match="Only the creator"):
+        contract.export_deposits(entries, destination)
+
+
+def _entries(*entries: tuple[Account, int]) -> arc4.DynamicArray[DepositEntry]:
+    return arc4.DynamicArray[DepositEntry](
+        *(
+            DepositEntry((arc4.Address(account), arc4.UInt64(amount)))
+            for account, amount in entries
+        )
+    )
+
+
+def test_deposits_are_refused_while_paused(context: AlgopyTestContext) -> None:
+    # Arrange
+    contract = Bank()
+    contract.set_paused(True)
+    app = context.ledger.get_app(contract)
+    pay = context.any.txn.payment(receiver=app.address, amount=UInt64(5))
+
+    # Act / Assert
+    with pytest.raises(AssertionError, match="Deposits are paused"):
+        contract.deposit(arc4.String("memo").native, pay)
+
+
+def test_export_only_pays_an_approved_successor_after_its_notice(
+    context: AlgopyTestContext,
+) -> None:
+    # Arrange
+    contract = Bank()
+    depositor = context.any.account()
+    contract.deposits[depositor] = UInt64(5)
+    contract.total_deposit = UInt64(5)
+    successor = context.any.application(
+        approval_program=Bytes(b"successor"), creator=context.default_sender
+    )
+    impostor = context.any.application(
+        approval_program=Bytes(b"impostor"), creator=context.default_sender
+    )
+    entries = _entries((depositor, 5))
+
+    # Act / Assert
+    with pytest.raises(AssertionError, match="must be paused"):
+        contract.export_deposits(entries, successor)
+    contract.set_paused(True)
+    with pytest.raises(AssertionError, match="not approved"):
+        contract.export_deposits(entries, successor)
+
+    context.ledger.patch_global_fields(round=UInt64(100))
+    ready = contract.approve_successor(op.sha512_256(Bytes(b"successor")))
+    assert ready == 100 + MIGRATION_NOTICE_ROUNDS
+    with pytest.raises(AssertionError, match="notice period"):
+        contract.export_deposits(entries, successor)
+
+    context.ledger.patch_global_fields(round=ready)
+    with pytest.raises(AssertionError, match="not approved"):
+        contract.export_deposits(entries, impostor)
+    with pytest.raises(AssertionError, match="whole balances"):
+        contract.export_deposits(_entries((depositor, 4)), successor)
+    assert contract.export_deposits(entries, successor) == 5
+    assert depositor not in contract.deposits
+    assert contract.total_deposit == 0
+
+
+def test_import_must_match_the_export_before_it(context: AlgopyTestContext) -> None:
+    # Arrange
+    contract = Bank()
+    app = context.ledger.get_app(contract)
+    context.ledger.update_account(app.address, balance=UInt64(1_000_000))
+    source = context.any.application(creator=context.default_sender)
+    depositor = context.any.account()
+    entries = _entries((depositor, 5))
+
+    def export(
+        exported: arc4.DynamicArray[DepositEntry],
+        destination: Application,
+        exporter: Application = source,
+    ) -> gtxn.ApplicationCallTransaction:
+        return context.any.txn.application_call(
+            app_id=exporter,
+            app_args=[arc4.arc4_signature(EXPORT), exported.bytes, Bytes(b"\x01")],
+            apps=[exporter, destination],
+        )
+
+    # Act / Assert
+    for txn, error in [
+        (export(_entries((depositor, 6)), app), "must match the export"),
+        (export(entries, context.any.application()), "must pay this app"),
+        (
+            export(
+                entries, app, context.any.application(creator=context.any.account())
+            ),
+            "same creator",
+        ),
+    ]:
+        call = context.txn.defer_app_call(contract.import_deposits, entries)
+        with context.txn.create_group([txn, call]):
+            with pytest.raises(AssertionError, match=error):
+                call.submit()
+
+    call = context.txn.defer_app_call(contract.import_deposits, entries)
+    with context.txn.create_group([export(entries, app), call]):
+        assert call.submit() == 5
+    assert contract.deposits[depositor] == 5
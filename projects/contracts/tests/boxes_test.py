@@ -0,0 +1,173 @@
+import asyncio
+from collections.abc import Iterator
+
+import algokit_utils
+import httpx
+import pytest
+from algosdk import account, encoding
+from algosdk.v2client.algod import AlgodClient
+
+from smart_contracts._helpers import boxes
+from smart_contracts._helpers.boxes import AlgodHttp, AsyncAlgodHttp, BoxMapReader
+from smart_contracts.artifacts.bank.bank_client import BankClient
+from tests.algod_stub import AlgodStub
+
+APP_ID = 1234
+
+
+@pytest.fixture(autouse=True)
+def _no_backoff(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(boxes, "RETRY_BACKOFF", 0)
+
+
+@pytest.fixture()
+def stub() -> Iterator[AlgodStub]:
+    with AlgodStub() as stub:
+        yield stub
+
+
+@pytest.fixture()
+def bank() -> BankClient:
+    algorand = algokit_utils.AlgorandClient.default_localnet()
+    return BankClient(algorand=algorand, app_id=APP_ID)
+
+
+def _deposits(stub: AlgodStub, count: int) -> dict[str, int]:
+    balances = {account.generate_account()[1]: amount for amount in range(1, count + 1)}
+    stub.boxes[APP_ID] = {
+        encoding.decode_address(address): amount.to_bytes(8, "big")
+        for address, amount in balances.items()
+    }
+    return balances
+
+
+def test_reads_whole_map_over_pooled_connections(
+    stub: AlgodStub, bank: BankClient
+) -> None:
+    balances = _deposits(stub, 200)
+
+    with AlgodHttp(stub.url, max_connections=4) as http:
+        result = BoxMapReader(
+            bank.app_client, "deposits", http, max_workers=4
+        ).get_map()
+
+    assert result == balances
+    assert stub.requests == 201
+    assert stub.connections <= 4
+
+
+def test_retries_each_box_independently(stub: AlgodStub, bank: BankClient) -> None:
+    balances = _deposits(stub, 10)
+    stub.failures = {name: 2 for name in list(stub.boxes[APP_ID])[:3]}
+
+    with AlgodHttp(stub.url) as http:
+        result = BoxMapReader(bank.app_client, "deposits", http, retries=2).get_map()
+
+    assert result == balances
+
+
+def test_gives_up_after_retries(stub: AlgodStub, bank: BankClient) -> None:
+    _deposits(stub, 3)
+    stub.failures = {next(iter(stub.boxes[APP_ID])): 5}
+
+    with AlgodHttp(stub.url) as http, pytest.raises(httpx.HTTPStatusError):
+        BoxMapReader(bank.app_client, "deposits", http, retries=1).get_map()
+
+
+def test_closes_only_the_connections_it_opened(
+    stub: AlgodStub, bank: BankClient
+) -> None:
+    balances = _deposits(stub, 3)
+
+    with AlgodHttp(stub.url) as http:
+        with BoxMapReader(bank.app_client, "deposits", http) as reader:
+            assert reader.get_map() == balances
+        assert BoxMapReader(bank.app_client, "deposits", http).get_map() == balances
+
+    on_stub = BankClient(
+        algorand=algokit_utils.AlgorandClient.from_clients(AlgodClient("", stub.url)),
+        app_id=APP_ID,
+    )
+    with BoxMapReader(on_stub.app_client, "deposits") as reader:
+        assert reader.get_map() == balances
+    connections = stub.connections
+    # Closed, it opens new connections rather than reusing the closed ones
+    assert reader.get_map() == balances
+    assert stub.connections > connections
+    reader.close()
+
+
+def test_typed_client_box_maps_read_with_the_reader(stub: AlgodStub) -> None:
+    balances = _deposits(stub, 25)
+    on_stub = BankClient(
+        algorand=algokit_utils.AlgorandClient.from_clients(AlgodClient("", stub.url)),
+        app_id=APP_ID,
+    )
+    deposits = on_stub.state.box.deposits
+
+    async def collect() -> dict[str, int]:
+        return {key: value async for key, value in deposits.aiter(page_size=10)}
+
+    try:
+        assert deposits.get_map() == balances
+        stub.requests = 0
+        assert dict(deposits.iter(page_size=10)) == balances
+        assert stub.requests == 3
+        assert asyncio.run(collect()) == balances
+    finally:
+        deposits.close()
+
+
+def test_iter_streams_pages_with_inline_values(
+    stub: AlgodStub, bank: BankClient
+) -> None:
+    balances = _deposits(stub, 25)
+
+    with AlgodHttp(stub.url) as http:
+        reader = BoxMapReader(bank.app_client, "deposits", http)
+        pages = [len(page) for page in reader.pages(page_size=10)]
+        assert stub.requests == 3
+        assert dict(reader.iter(page_size=10)) == balances
+
+    assert pages == [10, 10, 5]
+
+
+def test_iter_stops_fetching_when_consumer_stops(
+    stub: AlgodStub, bank: BankClient
+) -> None:
+    _deposits(stub, 50)
+
+    with AlgodHttp(stub.url) as http:
+        entries = BoxMapReader(bank.app_client, "deposits", http).iter(page_size=10)
+        first = [next(entries) for _ in range(5)]
+        entries.close()
+
+    assert len(first) == 5
+    assert stub.requests == 1
+
+
+def test_iter_falls_back_to_per_box_reads_on_nodes_without_paging(
+    bank: BankClient,
+) -> None:
+    with AlgodStub(paging=False) as stub:
+        balances = _deposits(stub, 25)
+        with AlgodHttp(stub.url) as http:
+            reader = BoxMapReader(bank.app_client, "deposits", http)
+            pages = list(reader.pages(page_size=10))
+
+    assert [len(page) for page in pages] == [10, 10, 5]
+    assert dict(entry for page in pages for entry in page) == balances
+    assert stub.requests == 26
+
+
+def test_aiter_streams_the_whole_map(stub: AlgodStub, bank: BankClient) -> None:
+    balances = _deposits(stub, 25)
+    # Opens no connections of its own when given an async transport
+    reader = BoxMapReader(bank.app_client, "deposits")
+
+    async def collect() -> dict[str, object]:
+        async with AsyncAlgodHttp(stub.url) as http:
+            return {key: value async for key, value in reader.aiter(10, http)}
+
+    assert asyncio.run(collect()) == balances
+    assert stub.requests == 3
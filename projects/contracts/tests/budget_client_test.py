@@ -0,0 +1,104 @@
+import algokit_utils
+import pytest
+from algokit_utils import (
+    AlgoAmount,
+    AlgorandClient,
+    SigningAccount,
+)
+
+from smart_contracts._helpers.budget import COST_PROFILES, OPUP_METHOD, OpcodeBudget
+from smart_contracts._helpers.client_runtime import ComposerBase
+from smart_contracts.artifacts.bank.bank_client import (
+    BankClient,
+    BankFactory,
+    DepositArgs,
+)
+from smart_contracts.artifacts.counter.counter_client import (
+    CounterClient,
+    CounterFactory,
+)
+
+# Their 30,000 round notice period keeps these from running on a fresh app
+UNMEASURED = {
+    "export_deposits((address,uint64)[],application)uint64",
+    "import_deposits((address,uint64)[])uint64",
+}
+
+
+@pytest.fixture()
+def deployer(algorand_client: AlgorandClient) -> SigningAccount:
+    account = algorand_client.account.from_environment("DEPLOYER")
+    algorand_client.account.ensure_funded_from_environment(
+        account_to_fund=account.address, min_spending_balance=AlgoAmount.from_algo(10)
+    )
+    return account
+
+
+@pytest.fixture()
+def bank_client(
+    algorand_client: AlgorandClient, deployer: SigningAccount
+) -> BankClient:
+    factory = algorand_client.client.get_typed_app_factory(
+        BankFactory, default_sender=deployer.address
+    )
+    client, _ = factory.send.create.bare()
+    algorand_client.send.payment(
+        algokit_utils.PaymentParams(
+            sender=deployer.address,
+            receiver=client.app_address,
+            amount=AlgoAmount.from_algo(1),
+        )
+    )
+    return client
+
+
+@pytest.fixture()
+def counter_client(
+    algorand_client: AlgorandClient, deployer: SigningAccount
+) -> CounterClient:
+    factory = algorand_client.client.get_typed_app_factory(
+        CounterFactory, default_sender=deployer.address
+    )
+    client, _ = factory.send.create.bare()
+    return client
+
+
+def _deposit(bank_client: BankClient, deployer: SigningAccount) -> DepositArgs:
+    pay = bank_client.algorand.create_transaction.payment(
+        algokit_utils.PaymentParams(
+            sender=deployer.address,
+            receiver=bank_client.app_address,
+            amount=AlgoAmount.from_micro_algo(1_000),
+        )
+    )
+    return DepositArgs(memo="memo", pay_txn=pay)
+
+
+def test_cost_profiles_cover_what_simulate_measures(
+    bank_client: BankClient, counter_client: CounterClient, deployer: SigningAccount
+) -> None:
+    bank_client.send.deposit(args=_deposit(bank_client, deployer))
+    groups: dict[str, ComposerBase[BankClient] | ComposerBase[CounterClient]] = {
+        "deposit(string,pay)uint64": bank_client.new_group().deposit(
+            args=_deposit(bank_client, deployer)
+        ),
+        "withdraw(uint64)uint64": bank_client.new_group().withdraw(args=(1,)),
+        "balance_of(address)uint64": bank_client.new_group().balance_of(
+            args=(deployer.address,)
+        ),
+        "set_paused(bool)void": bank_client.new_group().set_paused(args=(False,)),
+        "approve_successor(byte[])uint64": bank_client.new_group().approve_successor(
+            args=(bytes(32),)
+        ),
+        "incr_counter()uint64": counter_client.new_group().incr_counter(),
+        "get_count()uint64": counter_client.new_group().get_count(),
+        OPUP_METHOD: bank_client.new_group().opup(),
+    }
+    assert set(COST_PROFILES) - set(groups) == UNMEASURED
+
+    for signature, group in groups.items():
+        # Without profiles, every call is simulated
+        measured = OpcodeBudget({}).required(group.composer())
+        estimate = COST_PROFILES[signature].estimate(())
+        # Too low and calls fail, too high and they're padded for nothing
+        assert measured <= estimate <= 2 * measured, signature
@@ -0,0 +1,164 @@
+import time
+import typing
+from collections.abc import Iterator
+
+import algokit_utils
+import pytest
+from algosdk import abi, account, transaction
+from algosdk.v2client.algod import AlgodClient
+
+from smart_contracts._helpers.budget import (
+    COST_PROFILES,
+    OPUP_METHOD,
+    CostProfile,
+    OpcodeBudget,
+)
+from smart_contracts._helpers.client_runtime import SendBase
+from smart_contracts.artifacts.bank.bank_client import BankClient
+from tests.algod_stub import AlgodStub
+
+DEPOSIT = "deposit(string,pay)uint64"
+IMPORT = "import_deposits((address,uint64)[])uint64"
+
+
+class MeasuringBudget(OpcodeBudget):
+    """Stands in for the simulate fallback with a fixed cost per transaction."""
+
+    def __init__(self, cost: int):
+        super().__init__({})
+        self._cost = cost
+
+    def _simulate(self, composer: algokit_utils.TransactionComposer) -> list[int]:
+        self.simulations += 1
+        count = len(composer.build_transactions().transactions)
+        return [self._cost] * count
+
+
+@pytest.fixture()
+def bank() -> BankClient:
+    # Suggested params are pinned so groups can be built without a running algod
+    algorand = algokit_utils.AlgorandClient.default_localnet()
+    algorand.set_suggested_params_cache(
+        transaction.SuggestedParams(
+            fee=0, first=1, last=1001, gh=b"\0" * 32, gen="test", min_fee=1000
+        ),
+        time.time() + 3600,
+    )
+    _, address = account.generate_account()
+    return BankClient(algorand=algorand, app_id=1234, default_sender=address)
+
+
+@pytest.fixture()
+def stub() -> Iterator[AlgodStub]:
+    with AlgodStub() as stub:
+        yield stub
+
+
+@pytest.fixture()
+def sending_bank(stub: AlgodStub) -> BankClient:
+    algorand = algokit_utils.AlgorandClient.from_clients(
+        algod=AlgodClient("", stub.url)
+    )
+    return BankClient(
+        algorand=algorand,
+        app_id=1234,
+        default_sender=algorand.account.random().address,
+    )
+
+
+def _selectors(stub: AlgodStub) -> list[bytes]:
+    return [
+        typing.cast(list[bytes], stxn.transaction.app_args)[0]
+        for stxn in stub.sent
+        if isinstance(stxn.transaction, transaction.ApplicationCallTxn)
+    ]
+
+
+def _selector(signature: str) -> bytes:
+    return abi.Method.from_signature(signature).get_selector()
+
+
+def _entries(count: int) -> list[tuple[str, int]]:
+    return [(account.generate_account()[1], 5) for _ in range(count)]
+
+
+def test_pads_exactly_enough_for_profiled_cost(bank: BankClient) -> None:
+    budget = OpcodeBudget({**COST_PROFILES, IMPORT: CostProfile(100, 150)})
+    group = bank.new_group()
+    group.import_deposits(args=(_entries(8),)).import_deposits(args=(_entries(8),))
+
+    # 2 * (100 + 8 * 150) = 2600 against 2 * 700, so 1200 short
+    assert budget.required(group.composer()) == 2600
+    assert budget.ensure(group, bank) == 2
+    assert len(group.composer().build_transactions().transactions) == 4
+
+
+def test_no_padding_within_budget(bank: BankClient) -> None:
+    group = bank.new_group().import_deposits(args=(_entries(8),))
+
+    assert OpcodeBudget().ensure(group, bank) == 0
+
+
+def test_unprofiled_methods_are_simulated_once_per_shape(bank: BankClient) -> None:
+    budget = MeasuringBudget(cost=300)
+
+    for _ in range(3):
+        budget.ensure(bank.new_group().import_deposits(args=(_entries(4),)), bank)
+    budget.ensure(bank.new_group().import_deposits(args=(_entries(5),)), bank)
+
+    assert budget.simulations == 2
+
+
+def test_rejects_groups_that_cannot_fit_padding(bank: BankClient) -> None:
+    budget = OpcodeBudget({IMPORT: CostProfile(20_000)})
+    group = bank.new_group().import_deposits(args=(_entries(1),))
+
+    with pytest.raises(ValueError, match="does not fit"):
+        budget.ensure(group, bank)
+
+
+def test_typed_send_pads_calls_over_one_app_calls_budget(
+    stub: AlgodStub, sending_bank: BankClient
+) -> None:
+    stub.returns[_selector(IMPORT)] = (80).to_bytes(8, "big")
+
+    # 80 + 16 * 48 = 848 opcodes, more than one app call has
+    result = sending_bank.send.import_deposits(args=(_entries(16),))
+
+    assert _selectors(stub) == [_selector(IMPORT), _selector(OPUP_METHOD)]
+    assert result.abi_return == 80
+    assert result.tx_id == stub.sent[0].get_txid()
+
+    stub.sent.clear()
+    sending_bank.send.import_deposits(args=(_entries(8),))
+    assert _selectors(stub) == [_selector(IMPORT)]
+
+
+def test_padded_send_returns_the_call_after_its_transaction_args(
+    stub: AlgodStub, sending_bank: BankClient, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    monkeypatch.setattr(SendBase, "budget", OpcodeBudget({DEPOSIT: CostProfile(1000)}))
+    stub.returns[_selector(DEPOSIT)] = (7).to_bytes(8, "big")
+    pay = sending_bank.algorand.create_transaction.payment(
+        algokit_utils.PaymentParams(
+            sender=sending_bank.algorand.account.random().address,
+            receiver=sending_bank.app_address,
+            amount=algokit_utils.AlgoAmount.from_micro_algo(7),
+        )
+    )
+
+    result = sending_bank.send.deposit(args=("memo", pay))
+
+    assert len(stub.sent) == 3
+    assert result.tx_id == stub.sent[1].get_txid()
+    assert result.abi_return == 7
+
+
+def test_typed_composer_pads_before_sending(
+    stub: AlgodStub, sending_bank: BankClient
+) -> None:
+    group = sending_bank.new_group().import_deposits(args=(_entries(16),))
+
+    group.send()
+
+    assert _selectors(stub) == [_selector(IMPORT), _selector(OPUP_METHOD)]
@@ -0,0 +1,108 @@
+from collections.abc import Iterator
+
+import algokit_utils
+import pytest
+from algosdk import abi, account, transaction
+from algosdk.v2client.algod import AlgodClient
+
+from smart_contracts._helpers.chunking import ChunkedSendError
+from smart_contracts.artifacts.bank.bank_client import BankClient
+from smart_contracts.artifacts.counter.counter_client import CounterClient
+from smart_contracts.bank.chunked import ChunkedBankComposer
+from smart_contracts.counter.chunked import ChunkedCounterComposer
+from tests.algod_stub import AlgodStub
+
+APP_ID = 1234
+NO_POPULATE = algokit_utils.SendParams(populate_app_call_resources=False)
+
+
+def _selector(signature: str) -> bytes:
+    return abi.Method.from_signature(signature).get_selector()
+
+
+@pytest.fixture()
+def stub() -> Iterator[AlgodStub]:
+    with AlgodStub() as stub:
+        stub.returns[_selector("deposit(string,pay)uint64")] = (7).to_bytes(8, "big")
+        stub.returns[_selector("withdraw(uint64)uint64")] = (3).to_bytes(8, "big")
+        stub.returns[_selector("incr_counter()uint64")] = (1).to_bytes(8, "big")
+        yield stub
+
+
+@pytest.fixture()
+def algorand(stub: AlgodStub) -> algokit_utils.AlgorandClient:
+    return algokit_utils.AlgorandClient.from_clients(algod=AlgodClient("", stub.url))
+
+
+def test_calls_are_packed_in_order_with_their_payments(
+    stub: AlgodStub, algorand: algokit_utils.AlgorandClient
+) -> None:
+    sender = algorand.account.random().address
+    bank = BankClient(algorand=algorand, app_id=APP_ID, default_sender=sender)
+    sp = algorand.get_suggested_params()
+    chunked = ChunkedBankComposer(bank)
+    for amount in range(1, 21):
+        if amount % 4 == 0:
+            chunked.withdraw((amount,))
+        else:
+            pay = transaction.PaymentTxn(sender, sp, bank.app_address, amount)
+            chunked.deposit((f"deposit {amount}", pay))
+
+    result = chunked.send(NO_POPULATE)
+
+    # 15 deposits of 2 transactions and 5 withdrawals don't fit in fewer than 3 groups
+    assert [len(group.tx_ids) for group in result.groups] == [16, 16, 3]
+    assert result.returns == [3 if n % 4 == 0 else 7 for n in range(1, 21)]
+    sent = {stxn.get_txid(): stxn.transaction for stxn in stub.sent}
+    for amount, tx_id in enumerate(result.tx_ids, start=1):
+        call = sent[tx_id]
+        assert isinstance(call, transaction.ApplicationCallTxn)
+        if amount % 4 == 0:
+            assert int.from_bytes(call.app_args[1], "big") == amount
+        else:
+            assert call.app_args[1][2:] == f"deposit {amount}".encode()
+    for index, txn in enumerate(stub.sent):
+        if isinstance(txn.transaction, transaction.PaymentTxn):
+            assert txn.transaction.group == stub.sent[index + 1].transaction.group
+
+
+def test_failed_groups_leave_the_others_sent(
+    algorand: algokit_utils.AlgorandClient,
+) -> None:
+    sender = algorand.account.random().address
+    counter = CounterClient(algorand=algorand, app_id=APP_ID, default_sender=sender)
+    chunked = ChunkedCounterComposer(counter, max_group_size=2)
+    for _ in range(3):
+        chunked.incr_counter()
+    chunked.composer.add_payment(
+        algokit_utils.PaymentParams(
+            sender=account.generate_account()[1],
+            receiver=sender,
+            amount=algokit_utils.AlgoAmount.from_micro_algo(1),
+            signer=None,
+        )
+    )
+
+    with pytest.raises(ChunkedSendError) as raised:
+        chunked.send(NO_POPULATE)
+
+    # The last group holds the third call and a payment nobody can sign for
+    assert list(raised.value.failures) == [1]
+    assert raised.value.tx_ids[:2] != [None, None]
+    assert raised.value.tx_ids[2:] == [None, None]
+
+
+def test_calls_larger_than_a_group_are_rejected(
+    algorand: algokit_utils.AlgorandClient,
+) -> None:
+    bank = BankClient(
+        algorand=algorand,
+        app_id=APP_ID,
+        default_sender=algorand.account.random().address,
+    )
+    pay = transaction.PaymentTxn(
+        bank.app_address, algorand.get_suggested_params(), bank.app_address, 1
+    )
+
+    with pytest.raises(ValueError, match="can't fit"):
+        ChunkedBankComposer(bank, max_group_size=1).deposit(("memo", pay))
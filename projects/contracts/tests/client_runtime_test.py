@@ -0,0 +1,282 @@
+import dataclasses
+from pathlib import Path
+
+import algokit_utils
+import pytest
+from algosdk.atomic_transaction_composer import TransactionWithSigner
+
+from smart_contracts._helpers.client_runtime import (
+    AppClientBase,
+    AppFactoryBase,
+    ComposerBase,
+    MapState,
+    ParamsBase,
+    SendBase,
+    init_dataclass,
+    parse_abi_args,
+    share_client_runtime,
+    slim_client,
+)
+from smart_contracts.artifacts.bank import bank_client
+from smart_contracts.artifacts.bank.bank_client import BankClient, BankFactory
+from smart_contracts.artifacts.counter import counter_client
+
+GENERATED_HELPERS = """\
+import typing
+
+def _parse_abi_args(args: object | None = None) -> list[object] | None:
+    return None
+
+def _init_dataclass(cls: type, data: dict) -> object:
+    return cls(**data)
+
+_KeyType = typing.TypeVar("_KeyType")
+
+class _MapState(typing.Generic[_KeyType]):
+    def get(self) -> object:
+        return _init_dataclass(object, {})
+
+class Client:
+    def call(self) -> object:
+        return _MapState()
+"""
+
+GENERATED_STATE = '''\
+class State:
+    """Methods to access state"""
+
+    def __init__(self, app_client: object):
+        self.app_client = app_client
+
+    @property
+    def box(self) -> "_Box":
+        """Box state"""
+        return _Box(self.app_client)
+
+    def send(self, params: object = None) -> object:
+        params = params or algokit_utils.CommonAppCallParams()
+        self._result_mappers.append(
+            lambda v: self.client.decode_return_value(
+                "opup()void", v
+            )
+        )
+        return {**dataclasses.asdict(params)}
+
+class _Box:
+    def __init__(self, app_client: object):
+        self.app_client = app_client
+        self.reads = 0
+        print(app_client)
+'''
+
+GENERATED_CLIENT = '''\
+import algokit_utils
+
+_APP_SPEC = object()
+
+class CounterParams:
+    def __init__(self, app_client: algokit_utils.AppClient):
+        self.app_client = app_client
+
+    def incr(
+        self,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> algokit_utils.AppCallMethodCallParams:
+        params = params or algokit_utils.CommonAppCallParams()
+        return self.app_client.params.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "incr(uint64)uint64",
+            "args": _parse_abi_args(args),
+        }))
+
+    def clear_state(self, params=None):
+        return self.app_client.params.bare.clear_state(params)
+
+class CounterSend:
+    def __init__(self, app_client: algokit_utils.AppClient):
+        self.app_client = app_client
+
+    def get(
+        self,
+        params: algokit_utils.CommonAppCallParams | None = None,
+        send_params: algokit_utils.SendParams | None = None
+    ) -> algokit_utils.SendAppTransactionResult[Point]:
+        response = self.app_client.send.call(algokit_utils.AppClientMethodCallParams(**{
+            "method": "get()(uint64,uint64)",
+        }), send_params=send_params)
+        parsed_response = dataclasses.replace(response, abi_return=Point(*response.abi_return))
+        return parsed_response
+
+class CounterClient:
+    """Client for Counter"""
+
+    def __init__(self, app_client: algokit_utils.AppClient):
+        self.app_client = app_client
+        self.params = CounterParams(self.app_client)
+        self.send = CounterSend(self.app_client)
+
+    @property
+    def app_id(self) -> int:
+        return self.app_client.app_id
+
+    def new_group(self) -> "CounterComposer":
+        return CounterComposer(self)
+
+class CounterComposer:
+    def __init__(self, client: "CounterClient"):
+        self.client = client
+'''
+
+
+@dataclasses.dataclass
+class Inner:
+    amount: int
+
+
+@dataclasses.dataclass
+class Outer:
+    account: str
+    inner: Inner
+
+
+class FakeBoxState:
+    def get_map(self, map_name: str) -> dict[str, object]:
+        return {"A": {"account": "A", "inner": {"amount": 5}}}
+
+    def get_map_value(self, map_name: str, key: object) -> object | None:
+        return self.get_map(map_name).get(str(key))
+
+
+def test_parse_abi_args_flattens_structs() -> None:
+    payment = TransactionWithSigner(None, None)  # type: ignore[arg-type]
+
+    assert parse_abi_args(None) is None
+    assert parse_abi_args(()) is None
+    assert parse_abi_args(([Outer("A", Inner(5))], payment)) == [
+        [("A", (5,))],
+        payment,
+    ]
+    assert parse_abi_args(Outer("A", Inner(5))) == ["A", (5,)]
+    with pytest.raises(ValueError, match="Invalid 'args' type"):
+        parse_abi_args([1])
+
+
+def test_map_state_builds_nested_structs() -> None:
+    state: MapState[str, Outer] = MapState(FakeBoxState(), "deposits", Outer)
+
+    assert state.get_value("A") == Outer("A", Inner(5))
+    assert state.get_map() == {"A": Outer("A", Inner(5))}
+    assert state.get_value("B") is None
+    assert init_dataclass(Outer, {"account": "A"}) == Outer("A", None)  # type: ignore[arg-type]
+
+
+def test_generated_clients_use_the_shared_runtime() -> None:
+    assert bank_client._MapState is MapState
+    assert bank_client._parse_abi_args is parse_abi_args
+    assert counter_client._init_dataclass is init_dataclass
+    assert not hasattr(counter_client, "_parse_abi_args")
+
+
+def test_rewrite_drops_unused_helpers(tmp_path: Path) -> None:
+    client = tmp_path / "client.py"
+    client.write_text(GENERATED_HELPERS)
+
+    assert share_client_runtime(client)
+    rewritten = client.read_text()
+    assert "def _init_dataclass" not in rewritten
+    assert "_parse_abi_args" not in rewritten
+    assert "_KeyType" not in rewritten
+    assert "import MapState as _MapState\n" in rewritten
+    assert not share_client_runtime(client)
+
+
+def test_generated_clients_derive_from_the_runtime_bases() -> None:
+    assert issubclass(BankClient, AppClientBase)
+    assert issubclass(BankFactory, AppFactoryBase)
+    assert issubclass(bank_client.BankParams, ParamsBase)
+    assert issubclass(counter_client.CounterSend, SendBase)
+    assert issubclass(counter_client.CounterComposer, ComposerBase)
+    assert "__init__" not in vars(BankClient)
+
+
+def test_method_shims_build_the_generated_calls() -> None:
+    algorand = algokit_utils.AlgorandClient.default_localnet()
+    sender = algorand.account.random().address
+    bank = BankClient(algorand=algorand, app_id=1234, default_sender=sender)
+
+    call = bank.params.withdraw((5,), algokit_utils.CommonAppCallParams(note=b"n"))
+    assert call.method.get_signature() == "withdraw(uint64)uint64"
+    assert (call.args, call.app_id, call.sender, call.note) == ([5], 1234, sender, b"n")
+    assert len(bank.new_group().withdraw((5,)).opup()._result_mappers) == 2
+    assert bank.clone(app_name="other").send.app_client.app_name == "other"
+
+
+def test_rewrite_derives_classes_from_the_runtime_bases(tmp_path: Path) -> None:
+    client = tmp_path / "client.py"
+    client.write_text(GENERATED_CLIENT)
+
+    assert share_client_runtime(client)
+    rewritten = client.read_text()
+    assert "class CounterParams(_ParamsBase):\n    __slots__ = ()\n" in rewritten
+    assert 'return self._call("incr(uint64)uint64", None, params)\n' in rewritten
+    assert "clear_state" not in rewritten
+    # Converts its struct return, so it stays as generated
+    assert "parsed_response = dataclasses.replace" in rewritten
+    assert (
+        '"""Client for Counter"""\n\n'
+        "    _app_spec = _APP_SPEC\n"
+        "    params = _client_part(CounterParams)\n"
+        "    send = _client_part(CounterSend)\n\n"
+        "    def new_group"
+    ) in rewritten
+    assert "app_id" not in rewritten
+    assert "class CounterComposer(_ComposerBase[CounterClient]):" in rewritten
+    compile(rewritten, str(client), "exec")
+    assert not share_client_runtime(client)
+    assert client.read_text() == rewritten
+
+
+def test_rewrite_hands_box_maps_their_app_client(tmp_path: Path) -> None:
+    client = tmp_path / "client.py"
+    client.write_text(GENERATED_HELPERS + """
+class _BoxState:
+    def deposits(self) -> object:
+        return _MapState(
+            self.app_client.state.box,
+            "deposits",
+            None
+        )
+""")
+
+    assert share_client_runtime(client)
+    rewritten = client.read_text()
+    assert '"deposits",\n            None, app_client=self.app_client\n' in rewritten
+    assert not share_client_runtime(client)
+
+
+def test_slim_client_slots_classes_and_caches_accessors(tmp_path: Path) -> None:
+    client = tmp_path / "client.py"
+    client.write_text(GENERATED_STATE)
+
+    assert slim_client(client)
+    rewritten = client.read_text()
+    assert "__slots__ = ('app_client', '_cached_box',)" in rewritten
+    assert "    @_CachedAccessor\n    def box" in rewritten
+    assert '_result_mapper(self.client, "opup()void")' in rewritten
+    assert "params or _NO_PARAMS" in rewritten
+    assert "**vars(params)" in rewritten
+    assert rewritten.count("__slots__") == 1
+    assert not slim_client(client)
+
+
+def test_generated_clients_reuse_accessors_and_mappers() -> None:
+    algorand = algokit_utils.AlgorandClient.default_localnet()
+    bank = BankClient(
+        algorand=algorand, app_id=1234, default_sender=algorand.account.random().address
+    )
+
+    assert bank.state.box.deposits is bank.state.box.deposits
+    assert bank.state.global_state is bank.state.global_state
+    assert not hasattr(bank.send, "__dict__")
+    mappers = [bank.new_group().withdraw((5,))._result_mappers[0] for _ in range(2)]
+    assert mappers[0] is mappers[1]
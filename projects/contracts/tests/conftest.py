@@ -2,6 +2,8 @@ import pytest
 from algokit_utils import AlgorandClient
 from algokit_utils.config import config
 
+from smart_contracts._helpers.endpoints import algorand_from_environment
+
 # Uncomment if you want to load network specific or generic .env file
 # @pytest.fixture(autouse=True, scope="session")
 # def environment_fixture() -> None:
@@ -17,4 +19,4 @@ config.configure(
 @pytest.fixture(scope="session")
 def algorand_client() -> AlgorandClient:
     # by default we are using localnet algod
-    return AlgorandClient.from_environment()
+    return algorand_from_environment()
@@ -53,3 +53,9 @@ def test_simulate_says_hello_with_correct_budget_consumed(
     assert result.returns[0].value == "Hello, World"
     assert result.returns[1].value == "Hello, Jane"
     assert result.simulate_response["txn-groups"][0]["app-budget-consumed"] < 100
+
+
+def test_get_count_does_not_increment(counter_client: CounterClient) -> None:
+    before = counter_client.send.get_count().abi_return
+    after = counter_client.send.get_count().abi_return
+    assert before == after == counter_client.state.global_state.count
@@ -22,3 +22,16 @@ def test_hello(context: AlgopyTestContext) -> None:
 
     # Assert
     assert output == f"Hello, {dummy_input}"
+
+
+def test_get_count(context: AlgopyTestContext) -> None:
+    # Arrange
+    contract = Counter()
+    contract.incr_counter()
+    contract.incr_counter()
+
+    # Act
+    output = contract.get_count()
+
+    # Assert
+    assert output == 2
@@ -0,0 +1,86 @@
+import time
+from collections.abc import Iterator
+
+import algokit_utils
+import pytest
+from algosdk import abi
+from algosdk.error import AlgodHTTPError
+from algosdk.v2client.algod import AlgodClient
+
+from smart_contracts._helpers.endpoints import HedgedAlgodClient
+from smart_contracts.artifacts.bank.bank_client import BankClient
+from tests.algod_stub import AlgodStub
+
+APP_ID = 1234
+# Nothing listens on port 1, so connecting fails straight away
+UNREACHABLE = "http://127.0.0.1:1"
+
+
+@pytest.fixture()
+def slow() -> Iterator[AlgodStub]:
+    with AlgodStub(latency=0.5) as stub:
+        yield stub
+
+
+@pytest.fixture()
+def fast() -> Iterator[AlgodStub]:
+    with AlgodStub() as stub:
+        selector = abi.Method.from_signature("withdraw(uint64)uint64").get_selector()
+        stub.returns[selector] = (3).to_bytes(8, "big")
+        yield stub
+
+
+def test_slow_reads_are_hedged_to_another_node(
+    slow: AlgodStub, fast: AlgodStub
+) -> None:
+    algod = HedgedAlgodClient(
+        [AlgodClient("", slow.url), AlgodClient("", fast.url)], hedge_delay=0.02
+    )
+
+    started = time.perf_counter()
+    algod.status()
+    assert time.perf_counter() - started < 0.4
+
+    for _ in range(5):
+        algod.status()
+    slow_stats, fast_stats = algod.stats
+    assert slow_stats.hedged == 1
+    # Once measured, the fast node is asked first and nothing more is hedged
+    assert fast_stats.requests == 6
+    assert fast_stats.p99 >= fast_stats.p95 >= fast_stats.p50 > 0
+    assert slow_stats.p50 > fast_stats.p50
+    algod.close()
+
+
+def test_submissions_fail_over_to_a_healthy_node(fast: AlgodStub) -> None:
+    algod = HedgedAlgodClient([AlgodClient("", UNREACHABLE), AlgodClient("", fast.url)])
+    algorand = algokit_utils.AlgorandClient.from_clients(algod=algod)
+    bank = BankClient(
+        algorand=algorand,
+        app_id=APP_ID,
+        default_sender=algorand.account.random().address,
+    )
+    send_params = algokit_utils.SendParams(populate_app_call_resources=False)
+
+    for _ in range(3):
+        assert bank.send.withdraw((1,), send_params=send_params).abi_return == 3
+
+    down, up = algod.stats
+    assert len(fast.sent) == 3
+    # The unreachable node sits out after its first failure
+    assert (down.failures, down.healthy) == (1, False)
+    assert up.healthy
+    algod.close()
+
+
+def test_answers_from_a_reachable_node_are_not_retried(
+    fast: AlgodStub, slow: AlgodStub
+) -> None:
+    algod = HedgedAlgodClient([AlgodClient("", fast.url), AlgodClient("", slow.url)])
+
+    with pytest.raises(AlgodHTTPError, match="box not found"):
+        algod.application_box_by_name(APP_ID, b"missing")
+
+    assert slow.requests == 0
+    assert algod.stats[0].failures == 0
+    algod.close()
@@ -0,0 +1,87 @@
+import dataclasses
+from collections.abc import Iterator
+
+import algokit_utils
+import pytest
+from algosdk import abi, account
+from algosdk.v2client.algod import AlgodClient
+
+from smart_contracts._helpers.fastcall import FastCalls
+from smart_contracts.artifacts.bank.bank_client import BankClient, WithdrawArgs
+from tests.algod_stub import AlgodStub
+
+APP_ID = 1234
+WITHDRAW = "withdraw(uint64)uint64"
+IMPORT = "import_deposits((address,uint64)[])uint64"
+
+
+@dataclasses.dataclass
+class Entry:
+    account: str
+    amount: int
+
+
+@pytest.fixture()
+def stub() -> Iterator[AlgodStub]:
+    with AlgodStub() as stub:
+        yield stub
+
+
+@pytest.fixture()
+def bank(stub: AlgodStub) -> BankClient:
+    algorand = algokit_utils.AlgorandClient.from_clients(
+        algod=AlgodClient("", stub.url)
+    )
+    sender = algorand.account.random().address
+    return BankClient(algorand=algorand, app_id=APP_ID, default_sender=sender)
+
+
+def test_fast_params_match_the_generated_client(bank: BankClient) -> None:
+    fast = FastCalls(bank)
+    note = algokit_utils.CommonAppCallParams(note=b"n")
+
+    fast.params(WITHDRAW, (1,))
+    built = fast.params(WITHDRAW, WithdrawArgs(amount=5), note)
+    expected = bank.params.withdraw((5,), note)
+
+    assert built.method.get_signature() == expected.method.get_signature()
+    assert (built.app_id, built.sender, built.args, built.note) == (
+        expected.app_id,
+        expected.sender,
+        expected.args,
+        expected.note,
+    )
+    assert built.method is fast.codec(WITHDRAW).method
+
+
+def test_sender_override_takes_the_generic_path(bank: BankClient) -> None:
+    fast = FastCalls(bank)
+    other = bank.algorand.account.random().address
+
+    fast.params(WITHDRAW, (1,))
+    built = fast.params(WITHDRAW, (1,), algokit_utils.CommonAppCallParams(sender=other))
+
+    assert built.sender == other
+
+
+def test_struct_dataclasses_become_tuples(bank: BankClient) -> None:
+    address = account.generate_account()[1]
+    codec = FastCalls(bank).codec(IMPORT)
+
+    assert codec.args(([Entry(address, 5)],)) == [[(address, 5)]]
+    assert codec.selector == abi.Method.from_signature(IMPORT).get_selector()
+
+
+def test_send_decodes_the_return(stub: AlgodStub, bank: BankClient) -> None:
+    stub.returns[abi.Method.from_signature(WITHDRAW).get_selector()] = (95).to_bytes(
+        8, "big"
+    )
+    fast = FastCalls(bank)
+
+    results = [
+        fast.send(WITHDRAW, (5,), send_params={"populate_app_call_resources": False})
+        for _ in range(2)
+    ]
+
+    assert results == [95, 95]
+    assert len(stub.sent) == 2
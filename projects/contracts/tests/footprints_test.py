@@ -0,0 +1,135 @@
+import base64
+from collections.abc import Iterator
+
+import algokit_utils
+import pytest
+from algosdk import abi, encoding, transaction
+from algosdk.v2client.algod import AlgodClient
+
+from smart_contracts._helpers.footprints import FootprintCache
+from smart_contracts.artifacts.bank.bank_client import BankClient
+from smart_contracts.bank.referenced import ReferencedBankSend
+from tests.algod_stub import AlgodStub
+
+APP_ID = 1234
+
+
+def _touches(stub: AlgodStub, *owners: str) -> None:
+    stub.unnamed_resources = {
+        "boxes": [
+            {
+                "app": APP_ID,
+                "name": base64.b64encode(encoding.decode_address(owner)).decode(),
+            }
+            for owner in owners
+        ]
+    }
+
+
+def _boxes(stxn: transaction.SignedTransaction) -> list[bytes]:
+    return [box.name for box in stxn.transaction.boxes or []]
+
+
+@pytest.fixture()
+def stub() -> Iterator[AlgodStub]:
+    with AlgodStub() as stub:
+        for signature in ("deposit(string,pay)uint64", "withdraw(uint64)uint64"):
+            selector = abi.Method.from_signature(signature).get_selector()
+            stub.returns[selector] = (7).to_bytes(8, "big")
+        yield stub
+
+
+@pytest.fixture()
+def bank(stub: AlgodStub) -> BankClient:
+    algorand = algokit_utils.AlgorandClient.from_clients(
+        algod=AlgodClient("", stub.url)
+    )
+    return BankClient(algorand=algorand, app_id=APP_ID)
+
+
+def test_footprints_are_learned_once_per_method_and_shape(
+    stub: AlgodStub, bank: BankClient
+) -> None:
+    send = ReferencedBankSend(bank)
+    senders = [bank.algorand.account.random().address for _ in range(3)]
+    sp = bank.algorand.get_suggested_params()
+
+    # The stub reports the same box for every simulate: only the first call's is right
+    _touches(stub, senders[0])
+    for sender in senders:
+        pay = transaction.PaymentTxn(sender, sp, bank.app_address, 5)
+        result = send.deposit(
+            ("memo", pay), algokit_utils.CommonAppCallParams(sender=sender)
+        )
+        assert result.abi_return == 7
+
+    for sender in senders:
+        send.withdraw((1,), algokit_utils.CommonAppCallParams(sender=sender))
+
+    # One simulate per method: every later call carried its own reference
+    assert stub.simulations == 2
+    assert (send.footprints.hits, send.footprints.misses) == (4, 2)
+    calls = [
+        stxn
+        for stxn in stub.sent
+        if isinstance(stxn.transaction, transaction.ApplicationCallTxn)
+    ]
+    assert [_boxes(call) for call in calls] == [
+        [encoding.decode_address(sender)] for sender in senders * 2
+    ]
+
+
+def test_rejected_footprints_fall_back_to_simulate(
+    stub: AlgodStub, bank: BankClient
+) -> None:
+    footprints = FootprintCache(bank)
+    send = ReferencedBankSend(bank, footprints)
+    sender = bank.algorand.account.random().address
+    params = algokit_utils.CommonAppCallParams(sender=sender)
+
+    _touches(stub)
+    send.withdraw((1,), params)
+    assert _boxes(stub.sent[-1]) == []
+
+    stub.rejections.append("logic eval error: invalid Box reference 0x01")
+    _touches(stub, sender)
+    result = send.withdraw((1,), params)
+
+    assert result.abi_return == 7
+    assert footprints.fallbacks == 1
+    assert _boxes(stub.sent[-1]) == [encoding.decode_address(sender)]
+    # The footprint is relearned by the next call
+    send.withdraw((1,), params)
+    assert footprints.misses == 2
+    assert _boxes(stub.sent[-1]) == [encoding.decode_address(sender)]
+
+
+def test_footprints_outside_box_maps_are_not_cached(
+    stub: AlgodStub, bank: BankClient
+) -> None:
+    send = ReferencedBankSend(bank)
+    sender = bank.algorand.account.random().address
+    stub.unnamed_resources = {"boxes": [{"app": APP_ID, "name": "c3RhdGU="}]}
+
+    for _ in range(2):
+        send.withdraw((1,), algokit_utils.CommonAppCallParams(sender=sender))
+
+    # Both calls were populated by simulate, after the one that learned nothing
+    assert stub.simulations == 3
+
+
+def test_failed_simulates_are_not_cached(stub: AlgodStub, bank: BankClient) -> None:
+    send = ReferencedBankSend(bank)
+    sender = bank.algorand.account.random().address
+    params = algokit_utils.CommonAppCallParams(sender=sender)
+    _touches(stub, sender)
+
+    stub.simulate_failures.append("node is catching up")
+    assert send.withdraw((1,), params).abi_return == 7
+    # Learning failed, so resource population simulated the call instead
+    assert (stub.simulations, send.footprints.misses) == (1, 1)
+
+    send.withdraw((1,), params)
+    send.withdraw((1,), params)
+    assert (stub.simulations, send.footprints.misses, send.footprints.hits) == (2, 2, 1)
+    assert _boxes(stub.sent[-1]) == [encoding.decode_address(sender)]
@@ -0,0 +1,209 @@
+import json
+import pathlib
+import typing
+from collections.abc import Iterator
+
+import algokit_utils
+import pytest
+from algosdk import abi, account, transaction
+from algosdk.v2client.algod import AlgodClient
+
+from smart_contracts._helpers.budget import OPUP_METHOD
+from smart_contracts._helpers.instrumentation import (
+    HistogramCollector,
+    Instrumentation,
+    StageEvent,
+)
+from smart_contracts.artifacts.bank.bank_client import BankClient
+from smart_contracts.bank.instrumented import InstrumentedBankSend
+from tests.algod_stub import AlgodStub
+
+APP_ID = 1234
+IMPORT = "import_deposits((address,uint64)[])uint64"
+
+
+def _selector(signature: str) -> bytes:
+    return abi.Method.from_signature(signature).get_selector()
+
+
+class _Recorder:
+    def __init__(self) -> None:
+        self.started: list[tuple[str, str]] = []
+        self.events: list[StageEvent] = []
+
+    def before(self, method: str, stage: str) -> None:
+        self.started.append((method, stage))
+
+    def after(self, event: StageEvent) -> None:
+        self.events.append(event)
+
+    def stages(self, method: str) -> list[str]:
+        return [event.stage for event in self.events if event.method == method]
+
+
+@pytest.fixture()
+def stub() -> Iterator[AlgodStub]:
+    with AlgodStub() as stub:
+        for signature in (
+            "deposit(string,pay)uint64",
+            "withdraw(uint64)uint64",
+            "balance_of(address)uint64",
+            IMPORT,
+        ):
+            selector = abi.Method.from_signature(signature).get_selector()
+            stub.returns[selector] = (9).to_bytes(8, "big")
+        yield stub
+
+
+@pytest.fixture()
+def recorder() -> _Recorder:
+    return _Recorder()
+
+
+@pytest.fixture()
+def instrumentation(recorder: _Recorder) -> Instrumentation:
+    return Instrumentation([recorder])
+
+
+@pytest.fixture()
+def bank(stub: AlgodStub, instrumentation: Instrumentation) -> BankClient:
+    algorand = algokit_utils.AlgorandClient.from_clients(
+        algod=instrumentation.algod(AlgodClient("", stub.url))
+    )
+    return BankClient(
+        algorand=algorand,
+        app_id=APP_ID,
+        default_sender=algorand.account.random().address,
+    )
+
+
+def test_sent_calls_are_timed_stage_by_stage(
+    bank: BankClient, instrumentation: Instrumentation, recorder: _Recorder
+) -> None:
+    send = InstrumentedBankSend(bank, instrumentation)
+    depositor = bank.algorand.account.random().address
+    pay = transaction.PaymentTxn(
+        depositor, bank.algorand.get_suggested_params(), bank.app_address, 5
+    )
+
+    result = send.deposit(
+        ("memo", pay), algokit_utils.CommonAppCallParams(sender=depositor)
+    )
+
+    assert result.abi_return == 9
+    assert recorder.stages("deposit") == [
+        "build",
+        "simulate",
+        "sign",
+        "submit",
+        "confirm",
+    ]
+    assert recorder.started == [("deposit", e.stage) for e in recorder.events]
+    by_stage = {event.stage: event for event in recorder.events}
+    assert {event.group_size for event in recorder.events} == {2}
+    assert (by_stage["submit"].round_trips, by_stage["sign"].round_trips) == (1, 0)
+    assert by_stage["submit"].bytes_sent > by_stage["submit"].bytes_received > 0
+    assert by_stage["confirm"].round_trips >= 1
+    assert not any(event.failed for event in recorder.events)
+
+
+def test_readonly_calls_signers_and_groups(
+    stub: AlgodStub,
+    bank: BankClient,
+    instrumentation: Instrumentation,
+    recorder: _Recorder,
+) -> None:
+    send = InstrumentedBankSend(bank, instrumentation)
+    no_simulate = algokit_utils.SendParams(populate_app_call_resources=False)
+    sender = bank.algorand.account.random()
+    signer = instrumentation.signer(sender.signer)
+
+    assert send.balance_of((bank.app_address,)).abi_return == 9
+    send.withdraw(
+        (1,),
+        algokit_utils.CommonAppCallParams(sender=sender.address, signer=signer),
+        no_simulate,
+    )
+    group = bank.new_group().withdraw((2,)).withdraw((3,))
+    send.group(group, no_simulate)
+
+    assert recorder.stages("balance_of") == ["build", "simulate"]
+    # Without a simulate before it, signing shows only through a wrapped signer
+    assert recorder.stages("withdraw") == [
+        "build",
+        "sign",
+        "submit",
+        "confirm",
+        "build",
+        "submit",
+        "confirm",
+    ]
+    assert [e.group_size for e in recorder.events if e.method == "withdraw"][-1] == 2
+    assert len(stub.sent) == 3
+
+
+def test_groups_are_padded_like_the_typed_composer(
+    stub: AlgodStub, bank: BankClient, recorder: _Recorder
+) -> None:
+    send = InstrumentedBankSend(bank, Instrumentation([recorder]))
+    entries = [(account.generate_account()[1], 5) for _ in range(16)]
+
+    send.group(bank.new_group().import_deposits((entries,)))
+
+    assert [
+        typing.cast(
+            list[bytes],
+            typing.cast(transaction.ApplicationCallTxn, stxn.transaction).app_args,
+        )[0]
+        for stxn in stub.sent
+    ] == [_selector(IMPORT), _selector(OPUP_METHOD)]
+    assert {event.method for event in recorder.events} == {"import_deposits"}
+
+
+def test_every_method_is_instrumented(
+    stub: AlgodStub, bank: BankClient, recorder: _Recorder
+) -> None:
+    send = InstrumentedBankSend(bank, Instrumentation([recorder]))
+    stub.returns[_selector("approve_successor(byte[])uint64")] = (9).to_bytes(8, "big")
+    no_simulate = algokit_utils.SendParams(populate_app_call_resources=False)
+
+    assert {name for name in dir(bank.send) if not name.startswith("_")} <= set(
+        dir(send)
+    )
+    send.set_paused((True,), send_params=no_simulate)
+    assert send.approve_successor((bytes(32),), send_params=no_simulate).abi_return == 9
+
+    methods = [event.method for event in recorder.events]
+    assert list(dict.fromkeys(methods)) == ["set_paused", "approve_successor"]
+
+
+def test_histograms_export_prometheus_text_and_json(
+    stub: AlgodStub, bank: BankClient, tmp_path: pathlib.Path
+) -> None:
+    collector = HistogramCollector(buckets=(0.001, 10.0))
+    instrumentation = Instrumentation([collector])
+    send = InstrumentedBankSend(bank, instrumentation)
+    stub.rejections.append("overspend")
+
+    with pytest.raises(Exception, match="overspend"):
+        send.withdraw((1,))
+    send.withdraw((2,))
+
+    text = collector.prometheus()
+    labels = 'method="withdraw",stage="submit"'
+    assert f'algonomists_call_stage_seconds_bucket{{{labels},le="+Inf"}} 2' in text
+    assert f"algonomists_call_stage_seconds_count{{{labels}}} 2" in text
+    assert f"algonomists_call_stage_failures_total{{{labels}}} 1" in text
+    assert "# TYPE algonomists_call_stage_seconds histogram" in text
+
+    collector.write_json(tmp_path / "stages.json")
+    collector.write_prometheus(tmp_path / "stages.prom")
+    snapshot = json.loads((tmp_path / "stages.json").read_text())
+    assert snapshot["withdraw"]["confirm"]["count"] == 1
+    assert snapshot["withdraw"]["submit"]["buckets"]["+Inf"] == 2
+    assert (tmp_path / "stages.prom").read_text() == text
+
+    # Without hooks calls go straight through and nothing is recorded
+    instrumentation.hooks.clear()
+    send.withdraw((3,))
+    assert collector.snapshot()["withdraw"]["submit"]["count"] == 2
@@ -0,0 +1,59 @@
+import dataclasses
+from pathlib import Path
+
+import algokit_utils
+
+from smart_contracts._helpers.lazy_spec import (
+    LazyAppSpec,
+    make_client_lazy,
+    parse_app_spec,
+)
+from smart_contracts.artifacts.bank import bank_client
+from smart_contracts.artifacts.bank.bank_client import BankClient
+
+APP_ID = 1234
+
+
+def test_matches_the_eager_spec() -> None:
+    spec_json = bank_client._APP_SPEC_JSON
+    eager = algokit_utils.Arc56Contract.from_json(spec_json)
+
+    assert dataclasses.asdict(parse_app_spec(spec_json)) == dataclasses.asdict(eager)
+
+
+def test_spec_is_shared_and_sources_decode_on_demand() -> None:
+    spec_json = bank_client._APP_SPEC_JSON.replace('"Bank"', '"LazyBank"', 1)
+
+    spec = LazyAppSpec(spec_json).get()
+
+    assert LazyAppSpec(spec_json).get() is spec
+    assert vars(spec)["_parsed"] == {}
+    assert spec.source is not None
+    assert spec.source is spec.source
+    assert "source_info" not in vars(spec)["_parsed"]
+
+
+def test_clients_share_the_module_spec() -> None:
+    algorand = algokit_utils.AlgorandClient.default_localnet()
+    sender = algorand.account.random().address
+
+    clients = [
+        BankClient(algorand=algorand, app_id=APP_ID, default_sender=sender)
+        for _ in range(2)
+    ]
+
+    assert clients[0].app_spec is clients[1].app_spec is bank_client.APP_SPEC
+
+
+def test_rewrite_is_idempotent(tmp_path: Path) -> None:
+    client = tmp_path / "client.py"
+    client.write_text(
+        "APP_SPEC = algokit_utils.Arc56Contract.from_json(_APP_SPEC_JSON)\n"
+        "x = f(app_spec=APP_SPEC)\n"
+    )
+
+    assert make_client_lazy(client)
+    rewritten = client.read_text()
+    assert "app_spec=_APP_SPEC.get()" in rewritten
+    assert not make_client_lazy(client)
+    assert client.read_text() == rewritten
@@ -0,0 +1,145 @@
+from collections.abc import Iterator
+
+import algokit_utils
+import pytest
+from algosdk import abi, transaction
+from algosdk.v2client.algod import AlgodClient
+
+from smart_contracts._helpers.pipeline import BulkSubmitter
+from smart_contracts.artifacts.bank.bank_client import BankClient
+from tests.algod_stub import AlgodStub
+
+APP_ID = 1234
+
+
+@pytest.fixture()
+def stub() -> Iterator[AlgodStub]:
+    with AlgodStub() as stub:
+        selector = abi.Method.from_signature("withdraw(uint64)uint64").get_selector()
+        stub.returns[selector] = (3).to_bytes(8, "big")
+        yield stub
+
+
+@pytest.fixture()
+def bank(stub: AlgodStub) -> BankClient:
+    algorand = algokit_utils.AlgorandClient.from_clients(
+        algod=AlgodClient("", stub.url)
+    )
+    return BankClient(
+        algorand=algorand,
+        app_id=APP_ID,
+        default_sender=algorand.account.random().address,
+    )
+
+
+def test_groups_are_confirmed_within_the_window(
+    stub: AlgodStub, bank: BankClient
+) -> None:
+    with BulkSubmitter(bank.algorand, window=4) as submitter:
+        futures = [
+            submitter.submit(
+                lambda composer, amount=amount: composer.add_app_call_method_call(
+                    bank.params.withdraw((amount,))
+                )
+            )
+            for amount in range(1, 21)
+        ]
+        results = [future.result(timeout=10) for future in futures]
+
+    assert [result.returns[0].value for result in results] == [3] * 20
+    assert len({result.tx_ids[0] for result in results}) == 20
+    assert all(result.attempts == 1 for result in results)
+    stats = submitter.stats
+    assert (stats.submitted, stats.confirmed, stats.failed) == (20, 20, 0)
+    assert 1 <= stats.peak_in_flight <= 4
+    assert stats.in_flight == 0
+    assert stats.latency_max >= stats.latency_p95 >= stats.latency_p50 > 0
+    assert stats.groups_per_second > 0
+    assert all(stxn.transaction.lease for stxn in stub.sent)
+
+
+def test_dropped_groups_are_rebuilt_under_the_same_lease(
+    stub: AlgodStub, bank: BankClient
+) -> None:
+    stub.dropped = 1
+
+    with BulkSubmitter(bank.algorand) as submitter:
+        first = submitter.submit(
+            lambda composer: composer.add_app_call_method_call(
+                bank.params.withdraw((5,))
+            ),
+            key="withdraw-5",
+        )
+        again = submitter.submit(lambda composer: None, key="withdraw-5")
+        result = first.result(timeout=10)
+
+    assert again is first
+    assert result.attempts == 2
+    assert submitter.stats.retries == 1
+    dropped, confirmed = stub.sent
+    assert dropped.get_txid() != confirmed.get_txid() == result.tx_ids[0]
+    assert dropped.transaction.lease == confirmed.transaction.lease
+
+
+def test_groups_fail_once_out_of_retries(stub: AlgodStub, bank: BankClient) -> None:
+    stub.dropped = 3
+
+    with BulkSubmitter(bank.algorand, retries=2) as submitter:
+        future = submitter.submit(
+            lambda composer: composer.add_app_call_method_call(
+                bank.params.withdraw((5,))
+            )
+        )
+        with pytest.raises(RuntimeError, match="after 3 attempts"):
+            future.result(timeout=10)
+
+    assert submitter.stats.failed == 1
+    assert len(stub.sent) == 3
+    assert isinstance(stub.sent[0].transaction, transaction.ApplicationCallTxn)
+
+
+def test_groups_the_pool_rejects_on_logic_are_not_retried(
+    stub: AlgodStub, bank: BankClient
+) -> None:
+    with BulkSubmitter(bank.algorand) as submitter:
+        stub.pool_errors = ["txn dead: round 3 outside of 4--1004"]
+        expired = submitter.submit(
+            lambda composer: composer.add_app_call_method_call(
+                bank.params.withdraw((5,))
+            )
+        )
+        assert expired.result(timeout=10).attempts == 2
+        stub.pool_errors = ["logic eval error: assert failed pc=84"]
+        failing = submitter.submit(
+            lambda composer: composer.add_app_call_method_call(
+                bank.params.withdraw((6,))
+            )
+        )
+        with pytest.raises(RuntimeError, match="assert failed"):
+            failing.result(timeout=10)
+
+    assert len(stub.sent) == 3
+    assert (submitter.stats.retries, submitter.stats.failed) == (1, 1)
+
+
+def test_keys_are_forgotten_once_their_group_fails_or_its_leases_lapse(
+    stub: AlgodStub, bank: BankClient
+) -> None:
+    def withdraw(composer: algokit_utils.TransactionComposer) -> None:
+        composer.add_app_call_method_call(bank.params.withdraw((5,)))
+
+    with BulkSubmitter(bank.algorand) as submitter:
+        stub.pool_errors = ["logic eval error: assert failed pc=84"]
+        failed = submitter.submit(withdraw, key="failed")
+        with pytest.raises(RuntimeError):
+            failed.result(timeout=10)
+        assert submitter.submit(withdraw, key="failed") is not failed
+
+        confirmed = submitter.submit(withdraw, key="confirmed")
+        last_valid = confirmed.result(timeout=10).confirmed_round + 1000
+        assert submitter.submit(withdraw, key="confirmed") is confirmed
+
+        # Any group the poller sweeps for after the leases lapse lets the key go
+        stub.round = last_valid + 1
+        submitter.submit(withdraw).result(timeout=10)
+        assert submitter.submit(withdraw, key="confirmed") is not confirmed
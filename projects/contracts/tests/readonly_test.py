@@ -0,0 +1,143 @@
+from collections.abc import Iterator
+from types import SimpleNamespace
+
+import algokit_utils
+import pytest
+from algokit_utils import CommonAppCallParams
+from algosdk import abi
+from algosdk.v2client.algod import AlgodClient
+
+from smart_contracts._helpers.readonly import ReadonlyCallCache
+from smart_contracts._helpers.rounds import RoundTracker
+from smart_contracts.artifacts.bank.bank_client import BankClient
+from tests.algod_stub import AlgodStub
+
+
+class FakeAlgod:
+    def __init__(self) -> None:
+        self.round = 10
+        self.status_calls = 0
+
+    def status(self) -> dict[str, int]:
+        self.status_calls += 1
+        return {"last-round": self.round}
+
+
+class FakeAppClient:
+    app_id = 1234
+
+    def __init__(self) -> None:
+        self.calls: list[tuple[str, list[object]]] = []
+        self.app_spec = SimpleNamespace(
+            get_arc56_method=lambda method: SimpleNamespace(
+                readonly=method.startswith("balance_of")
+            )
+        )
+        self.send = SimpleNamespace(call=self._call)
+
+    def _call(self, params: SimpleNamespace) -> SimpleNamespace:
+        self.calls.append((params.method, params.args))
+        return SimpleNamespace(abi_return=len(self.calls))
+
+
+@pytest.fixture()
+def algod() -> FakeAlgod:
+    return FakeAlgod()
+
+
+@pytest.fixture()
+def client() -> SimpleNamespace:
+    return SimpleNamespace(app_client=FakeAppClient())
+
+
+def test_identical_reads_in_same_round_are_served_locally(
+    algod: FakeAlgod, client: SimpleNamespace
+) -> None:
+    cache = ReadonlyCallCache(RoundTracker(algod, interval=0))  # type: ignore[arg-type]
+
+    first = cache.call(client, "balance_of(address)uint64", ("A",))
+    second = cache.call(client, "balance_of(address)uint64", ("A",))
+
+    assert first == second == 1
+    assert len(client.app_client.calls) == 1
+    assert (cache.hits, cache.misses) == (1, 1)
+
+
+def test_new_round_or_new_args_miss(algod: FakeAlgod, client: SimpleNamespace) -> None:
+    cache = ReadonlyCallCache(RoundTracker(algod, interval=0))  # type: ignore[arg-type]
+
+    cache.call(client, "balance_of(address)uint64", ("A",))
+    cache.call(client, "balance_of(address)uint64", ("B",))
+    algod.round += 1
+    cache.call(client, "balance_of(address)uint64", ("A",))
+
+    assert len(client.app_client.calls) == 3
+
+
+def test_round_is_not_refreshed_within_interval(
+    algod: FakeAlgod, client: SimpleNamespace
+) -> None:
+    cache = ReadonlyCallCache(RoundTracker(algod, interval=60))  # type: ignore[arg-type]
+
+    for _ in range(5):
+        cache.call(client, "balance_of(address)uint64", ("A",))
+
+    assert algod.status_calls == 1
+
+
+def test_rejects_non_readonly_methods(
+    algod: FakeAlgod, client: SimpleNamespace
+) -> None:
+    cache = ReadonlyCallCache(RoundTracker(algod))  # type: ignore[arg-type]
+
+    with pytest.raises(ValueError, match="not readonly"):
+        cache.call(client, "withdraw(uint64)uint64", (1,))
+
+
+def test_list_args_are_compared_by_value(
+    algod: FakeAlgod, client: SimpleNamespace
+) -> None:
+    cache = ReadonlyCallCache(RoundTracker(algod, interval=60))  # type: ignore[arg-type]
+
+    cache.call(client, "balance_of((uint64,uint64[]))uint64", ([1, [2, 3]],))
+    cache.call(client, "balance_of((uint64,uint64[]))uint64", ([1, [2, 3]],))
+    cache.call(client, "balance_of((uint64,uint64[]))uint64", ([1, [2, 4]],))
+
+    assert len(client.app_client.calls) == 2
+
+
+@pytest.fixture()
+def stub() -> Iterator[AlgodStub]:
+    with AlgodStub() as stub:
+        yield stub
+
+
+def test_typed_clients_read_through_the_installed_cache(stub: AlgodStub) -> None:
+    algod = AlgodClient("", stub.url)
+    algorand = algokit_utils.AlgorandClient.from_clients(algod)
+    sender = algorand.account.random().address
+    cache = ReadonlyCallCache(RoundTracker(algod, interval=60))
+    bank = BankClient(
+        algorand=cache.install(algorand), app_id=1234, default_sender=sender
+    )
+    stub.returns[_selector("balance_of(address)uint64")] = (3).to_bytes(8, "big")
+    stub.returns[_selector("withdraw(uint64)uint64")] = (0).to_bytes(8, "big")
+
+    assert bank.send.balance_of(args=(sender,)).abi_return == 3
+    assert bank.send.balance_of(args=(sender,)).abi_return == 3
+    assert stub.simulations == 1
+    # The sender is part of the call
+    other = algorand.account.random().address
+    bank.send.balance_of(args=(sender,), params=CommonAppCallParams(sender=other))
+    assert stub.simulations == 2
+
+    # Reads after a send see the round it was confirmed in
+    bank.send.withdraw(args=(1,))
+    simulations = stub.simulations
+    bank.send.balance_of(args=(sender,))
+    assert stub.simulations == simulations + 1
+    assert cache.hits == 1
+
+
+def _selector(signature: str) -> bytes:
+    return abi.Method.from_signature(signature).get_selector()
@@ -0,0 +1,154 @@
+import os
+import pathlib
+import threading
+import time
+from collections.abc import Iterator
+
+import algokit_utils
+import pytest
+from algosdk import account, encoding
+from algosdk.v2client.algod import AlgodClient
+
+from smart_contracts._helpers.address_table import AddressTable
+from smart_contracts.artifacts.bank.bank_client import BankClient
+from smart_contracts.bank.replica import DepositFollower, DepositReplica
+from tests.algod_stub import AlgodStub
+
+APP_ID = 1234
+
+
+@pytest.fixture()
+def stub() -> Iterator[AlgodStub]:
+    with AlgodStub() as stub:
+        yield stub
+
+
+@pytest.fixture()
+def bank(stub: AlgodStub) -> BankClient:
+    algorand = algokit_utils.AlgorandClient.from_clients(
+        algod=AlgodClient("", stub.url)
+    )
+    return BankClient(algorand=algorand, app_id=APP_ID)
+
+
+def _deposit(stub: AlgodStub, address: str, amount: int | None) -> int:
+    value = None if amount is None else amount.to_bytes(8, "big")
+    return stub.write_box(APP_ID, encoding.decode_address(address), value)
+
+
+def _addresses(count: int) -> list[str]:
+    return [account.generate_account()[1] for _ in range(count)]
+
+
+@pytest.mark.parametrize("mapped", [False, True])
+def test_follower_applies_each_round_and_resumes_from_its_checkpoint(
+    stub: AlgodStub, bank: BankClient, tmp_path: pathlib.Path, *, mapped: bool
+) -> None:
+    alice, bob, carol = _addresses(3)
+    _deposit(stub, alice, 5)
+    _deposit(stub, bob, 7)
+    path = tmp_path / "deposits"
+
+    with DepositReplica(path, mapped=mapped) as replica:
+        follower = DepositFollower(bank, replica, checkpoint_every=2)
+        assert follower.sync() == 0
+        assert (replica.round, len(replica)) == (3, 2)
+
+        _deposit(stub, alice, 15)
+        _deposit(stub, carol, 1)
+        _deposit(stub, bob, None)
+        assert follower.sync() == 3
+        assert replica.round == 6
+        assert dict(replica.items()) == {alice: 15, carol: 1}
+        assert (replica.balance_of(bob), bob in replica) == (0, False)
+
+    # Checkpointed after the first two rounds; the third is applied again
+    requests = stub.requests
+    with DepositReplica(path, mapped=mapped) as replica:
+        assert replica.round == 5
+        follower = DepositFollower(bank, replica)
+        follower.sync()
+        assert dict(replica.items()) == {alice: 15, carol: 1}
+        assert replica.round == 6
+    # No snapshot was needed to resume
+    assert stub.requests - requests <= 2
+
+
+def test_follower_reloads_when_algod_no_longer_has_a_round(
+    stub: AlgodStub, bank: BankClient
+) -> None:
+    alice, bob = _addresses(2)
+    _deposit(stub, alice, 5)
+    replica = DepositReplica()
+    follower = DepositFollower(bank, replica, sync_rounds=True)
+    follower.sync()
+    assert stub.sync_round == 3
+
+    _deposit(stub, alice, None)
+    _deposit(stub, bob, 2)
+    stub.deltas_from = stub.round
+    follower.sync()
+
+    assert (replica.round, dict(replica.items())) == (4, {bob: 2})
+
+    stop = threading.Event()
+    thread = threading.Thread(target=follower.follow, args=(stop,))
+    thread.start()
+    _deposit(stub, bob, 3)
+    deadline = time.monotonic() + 10
+    while replica.balance_of(bob) != 3 and time.monotonic() < deadline:
+        stop.wait(0.01)
+    stop.set()
+    thread.join()
+    assert replica.balance_of(bob) == 3
+    assert stub.sync_round == 6
+
+
+def test_follower_fails_if_algod_serves_no_deltas(
+    stub: AlgodStub, bank: BankClient
+) -> None:
+    alice = _addresses(1)[0]
+    _deposit(stub, alice, 5)
+    stub.serves_deltas = False
+    follower = DepositFollower(bank, DepositReplica())
+
+    with pytest.raises(RuntimeError, match="doesn't serve ledger state deltas"):
+        follower.sync()
+    assert follower.replica.round == 0
+
+    # Nor does it keep reloading if deltas stop being served later on
+    stub.serves_deltas = True
+    follower.sync()
+    stub.serves_deltas = False
+    _deposit(stub, alice, 6)
+    requests = stub.requests
+    with pytest.raises(RuntimeError, match="doesn't serve ledger state deltas"):
+        follower.sync()
+    assert stub.requests - requests == 3
+
+
+def test_address_table_grows_reuses_deleted_slots_and_reopens(
+    tmp_path: pathlib.Path,
+) -> None:
+    path = tmp_path / "table"
+    keys = [os.urandom(32) for _ in range(100)]
+    with AddressTable(path, capacity=8) as table:
+        for value, key in enumerate(keys):
+            table.set(key, value)
+        for key in keys[::2]:
+            table.delete(key)
+        table.set(keys[0], 1000)
+        table.flush(42)
+        assert len(table) == 51
+
+    with AddressTable(path) as table:
+        assert (table.round, len(table)) == (42, 51)
+        assert table.get(keys[0]) == 1000
+        assert table.get(keys[2]) is None
+        assert all(
+            table.get(key) == value for value, key in enumerate(keys) if value % 2
+        )
+        assert sorted(value for _, value in table.items()) == [
+            *range(1, 100, 2),
+            1000,
+        ]
@@ -0,0 +1,152 @@
+import dataclasses
+from collections.abc import Iterator
+
+import algokit_utils
+import pytest
+from algosdk import abi, encoding, transaction
+from algosdk.v2client.algod import AlgodClient
+
+from smart_contracts._helpers.chunking import ChunkedComposer
+from smart_contracts._helpers.resources import (
+    MAX_TXN_REFERENCES,
+    NO_RESOURCES,
+    BoxMapKeys,
+    BoxRef,
+    Resources,
+    assign_references,
+)
+from smart_contracts.artifacts.bank.bank_client import BankClient
+from smart_contracts.bank.chunked import ChunkedBankComposer
+from smart_contracts.bank.resources import BankResources
+from tests.algod_stub import AlgodStub
+
+APP_ID = 1234
+
+
+def _boxes(count: int, size: int = 40, app_id: int = APP_ID) -> frozenset[BoxRef]:
+    return frozenset(
+        BoxRef(app_id, index.to_bytes(32, "big"), size) for index in range(count)
+    )
+
+
+@pytest.fixture()
+def stub() -> Iterator[AlgodStub]:
+    with AlgodStub() as stub:
+        for signature in ("deposit(string,pay)uint64", "withdraw(uint64)uint64"):
+            selector = abi.Method.from_signature(signature).get_selector()
+            stub.returns[selector] = (1).to_bytes(8, "big")
+        yield stub
+
+
+@pytest.fixture()
+def bank(stub: AlgodStub) -> BankClient:
+    algorand = algokit_utils.AlgorandClient.from_clients(
+        algod=AlgodClient("", stub.url)
+    )
+    return BankClient(
+        algorand=algorand,
+        app_id=APP_ID,
+        default_sender=algorand.account.random().address,
+    )
+
+
+def test_box_names_come_from_the_app_spec(bank: BankClient) -> None:
+    keys = BoxMapKeys(bank.app_spec, "deposits", APP_ID)
+    address = bank.algorand.account.random().address
+
+    assert keys.ref(address) == BoxRef(APP_ID, encoding.decode_address(address), 32 + 8)
+
+
+def test_references_are_spread_over_the_group() -> None:
+    resources = Resources(
+        boxes=_boxes(10),
+        accounts=frozenset(f"account{index}" for index in range(6)),
+        apps=frozenset({APP_ID, 99}),
+    )
+
+    references = assign_references([APP_ID, APP_ID, APP_ID], resources)
+
+    assert references is not None
+    assert [len(txn.boxes) for txn in references] == [4, 3, 3]
+    assert [len(txn.accounts) for txn in references] == [2, 2, 2]
+    # The called app is available to the whole group already
+    assert [app for txn in references for app in txn.apps] == [99]
+    assert assign_references([APP_ID], Resources(boxes=_boxes(9))) is None
+    assert assign_references([7], Resources(boxes=_boxes(1))) is None
+    assert assign_references([APP_ID], Resources(accounts=frozenset("abcde"))) is None
+
+
+def test_large_boxes_get_empty_references_for_io_quota() -> None:
+    references = assign_references([APP_ID, APP_ID], Resources(boxes=_boxes(2, 2048)))
+
+    assert references is not None
+    names = [box.name for txn in references for box in txn.boxes]
+    assert len(names) == 4
+    assert names.count(b"") == 2
+
+
+def test_bank_calls_are_packed_without_simulating(
+    stub: AlgodStub, bank: BankClient
+) -> None:
+    sp = bank.algorand.get_suggested_params()
+    chunked = ChunkedBankComposer(bank)
+    depositors = [bank.algorand.account.random().address for _ in range(3)]
+    for depositor in depositors:
+        pay = transaction.PaymentTxn(depositor, sp, bank.app_address, 5)
+        chunked.deposit(("memo", pay))
+    for _ in range(MAX_TXN_REFERENCES + 2):
+        chunked.withdraw((1,))
+
+    result = chunked.send()
+
+    assert stub.simulations == 0
+    assert len(result.returns) == 3 + MAX_TXN_REFERENCES + 2
+    calls = [
+        stxn.transaction
+        for stxn in stub.sent
+        if isinstance(stxn.transaction, transaction.ApplicationCallTxn)
+    ]
+    assert {box.name for call in calls for box in call.boxes or []} == {
+        encoding.decode_address(a) for a in [*depositors, bank.params.opup().sender]
+    }
+    assert all(len(call.boxes or []) <= MAX_TXN_REFERENCES for call in calls)
+
+
+def test_bank_resources_follow_each_method(bank: BankClient) -> None:
+    resources = BankResources(bank)
+    accounts = [bank.algorand.account.random().address for _ in range(2)]
+
+    exported = resources(
+        bank.params.export_deposits(([(accounts[0], 5), (accounts[1], 6)], 99))
+    )
+    imported = resources(
+        bank.params.import_deposits(([(accounts[0], 5), (accounts[1], 6)],))
+    )
+
+    assert exported.apps == frozenset({99})
+    assert {box.name for box in exported.boxes} == {
+        encoding.decode_address(a) for a in accounts
+    }
+    assert imported.boxes == exported.boxes
+    assert resources(bank.params.opup()) == Resources()
+    with pytest.raises(ValueError, match="No resources known"):
+        resources(
+            dataclasses.replace(
+                bank.params.opup(), method=abi.Method.from_signature("nope()void")
+            )
+        )
+
+
+def test_calls_borrow_references_from_their_group(bank: BankClient) -> None:
+    resources = BankResources(bank)
+    accounts = [bank.algorand.account.random().address for _ in range(10)]
+    export = bank.params.export_deposits(([(a, 5) for a in accounts], 99))
+    chunked = ChunkedComposer(bank.algorand)
+    chunked.add_app_call_method_call(export, resources=resources(export))
+
+    with pytest.raises(ValueError, match="can't fit in its 1 calls"):
+        chunked.groups()
+
+    chunked.add_app_call_method_call(bank.params.opup(), resources=NO_RESOURCES)
+    chunked.add_app_call_method_call(bank.params.opup(), resources=NO_RESOURCES)
+    assert [len(group) for group in chunked.groups()] == [3]
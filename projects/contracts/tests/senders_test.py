@@ -0,0 +1,112 @@
+import threading
+from collections.abc import Iterator
+
+import algokit_utils
+import pytest
+from algosdk import abi
+from algosdk.v2client.algod import AlgodClient
+
+from smart_contracts._helpers.senders import SenderPool
+from smart_contracts.artifacts.bank.bank_client import BankClient
+from smart_contracts.artifacts.counter.counter_client import CounterClient
+from tests.algod_stub import AlgodStub
+
+APP_ID = 1234
+
+
+def _withdraw(bank: BankClient) -> int:
+    result = bank.send.withdraw(
+        (1,), send_params=algokit_utils.SendParams(populate_app_call_resources=False)
+    )
+    return result.abi_return or 0
+
+
+@pytest.fixture()
+def stub() -> Iterator[AlgodStub]:
+    with AlgodStub() as stub:
+        for signature in ("withdraw(uint64)uint64", "incr_counter()uint64"):
+            selector = abi.Method.from_signature(signature).get_selector()
+            stub.returns[selector] = (3).to_bytes(8, "big")
+        yield stub
+
+
+@pytest.fixture()
+def algorand(stub: AlgodStub) -> algokit_utils.AlgorandClient:
+    return algokit_utils.AlgorandClient.from_clients(algod=AlgodClient("", stub.url))
+
+
+def _accounts(count: int) -> list[algokit_utils.SigningAccount]:
+    # Signers are registered by the pool, not ahead of it
+    unregistered = algokit_utils.AlgorandClient.from_clients(
+        algod=AlgodClient("", "http://localhost:1")
+    )
+    return [unregistered.account.random() for _ in range(count)]
+
+
+def test_calls_are_spread_over_senders(
+    stub: AlgodStub, algorand: algokit_utils.AlgorandClient
+) -> None:
+    pool = SenderPool(BankClient, algorand, APP_ID, _accounts(4))
+    # Calls go four at a time, so each four hold every sender between them
+    together = threading.Barrier(4)
+
+    def withdraw(bank: BankClient) -> int:
+        together.wait(timeout=5)
+        return _withdraw(bank)
+
+    with pool.thread_executor() as executor:
+        futures = [pool.submit(executor, withdraw) for _ in range(20)]
+        assert [future.result(timeout=10) for future in futures] == [3] * 20
+
+    senders = [stxn.transaction.sender for stxn in stub.sent]
+    assert {senders.count(address) for address in pool.addresses} == {5}
+    stats = pool.stats
+    assert sum(s.calls for s in stats.values()) == 20
+    assert all(s.failures == 0 and s.in_flight == 0 for s in stats.values())
+    assert all(s.mean_latency > 0 for s in stats.values())
+
+
+def test_failures_are_counted_per_sender(
+    stub: AlgodStub, algorand: algokit_utils.AlgorandClient
+) -> None:
+    pool = SenderPool(CounterClient, algorand, APP_ID, _accounts(2))
+    stub.rejections.append("overspend")
+
+    with pytest.raises(Exception, match="overspend"):
+        pool.run(lambda counter: counter.send.incr_counter())
+    result = pool.run(lambda counter: counter.send.incr_counter())
+
+    assert result.abi_return == 3
+    first, second = pool.stats.values()
+    assert (first.calls, first.failures) == (1, 1)
+    assert (second.calls, second.failures) == (1, 0)
+
+
+def test_worker_clients_are_pinned_per_thread(
+    algorand: algokit_utils.AlgorandClient,
+) -> None:
+    pool = SenderPool(BankClient, algorand, APP_ID, _accounts(2))
+    both_started = threading.Barrier(2)
+
+    def pinned(_: int) -> BankClient:
+        both_started.wait(timeout=5)
+        return pool.worker_client()
+
+    with pool.thread_executor(2) as executor:
+        first, second = executor.map(pinned, range(2))
+
+    assert first is not second
+    assert pool.worker_client() is pool.worker_client()
+
+
+def test_process_workers_sign_for_every_sender(
+    stub: AlgodStub, algorand: algokit_utils.AlgorandClient
+) -> None:
+    pool = SenderPool(BankClient, algorand, APP_ID, _accounts(3))
+
+    with pool.process_executor(2) as executor:
+        futures = [pool.submit(executor, _withdraw) for _ in range(6)]
+        assert [future.result(timeout=60) for future in futures] == [3] * 6
+
+    assert {stxn.transaction.sender for stxn in stub.sent} == set(pool.addresses)
+    assert sum(s.calls for s in pool.stats.values()) == 6
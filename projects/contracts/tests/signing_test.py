@@ -0,0 +1,104 @@
+import base64
+from collections.abc import Iterator
+
+import algokit_utils
+import pytest
+from algosdk import abi, account, encoding, transaction
+from algosdk.atomic_transaction_composer import (
+    AccountTransactionSigner,
+    EmptySigner,
+    TransactionWithSigner,
+)
+from algosdk.v2client.algod import AlgodClient
+
+from smart_contracts._helpers.signing import SigningPool
+from smart_contracts.artifacts.bank.bank_client import BankClient
+from smart_contracts.bank.chunked import ChunkedBankComposer
+from tests.algod_stub import AlgodStub
+
+APP_ID = 1234
+
+
+@pytest.fixture()
+def stub() -> Iterator[AlgodStub]:
+    with AlgodStub() as stub:
+        selector = abi.Method.from_signature("deposit(string,pay)uint64").get_selector()
+        stub.returns[selector] = (5).to_bytes(8, "big")
+        yield stub
+
+
+@pytest.fixture()
+def bank(stub: AlgodStub) -> BankClient:
+    algorand = algokit_utils.AlgorandClient.from_clients(
+        algod=AlgodClient("", stub.url)
+    )
+    return BankClient(algorand=algorand, app_id=APP_ID)
+
+
+def _deposits(bank: BankClient, count: int) -> ChunkedBankComposer:
+    chunked = ChunkedBankComposer(bank, max_group_size=4)
+    sp = bank.algorand.get_suggested_params()
+    for _ in range(count):
+        depositor = bank.algorand.account.random().address
+        pay = transaction.PaymentTxn(depositor, sp, bank.app_address, 5)
+        chunked.deposit(
+            ("memo", pay), algokit_utils.CommonAppCallParams(sender=depositor)
+        )
+    return chunked
+
+
+def _encoded(group: list[TransactionWithSigner]) -> bytes:
+    return b"".join(
+        base64.b64decode(
+            encoding.msgpack_encode(tws.signer.sign_transactions([tws.txn], [0])[0])
+        )
+        for tws in group
+    )
+
+
+@pytest.mark.parametrize("threads", [False, True])
+def test_groups_are_signed_as_built(
+    stub: AlgodStub, bank: BankClient, *, threads: bool
+) -> None:
+    composers = _deposits(bank, 6).composer.composers()
+    built = [composer.build().transactions for composer in composers]
+
+    with SigningPool(workers=2, threads=threads) as pool:
+        signed = pool.sign(composers)
+
+    assert [group.tx_ids for group in signed] == [
+        [tws.txn.get_txid() for tws in group] for group in built
+    ]
+    assert [group.blob for group in signed] == [_encoded(group) for group in built]
+    for group in signed:
+        group.send(bank.algorand.client.algod)
+    assert len(stub.sent) == 12
+    assert stub.simulations == 0
+    for group, stxns in zip(built, [stub.sent[i : i + 4] for i in range(0, 12, 4)]):
+        assert [stxn.transaction.group for stxn in stxns] == [
+            tws.txn.group for tws in group
+        ]
+        assert all(stxn.signature for stxn in stxns)
+
+
+def test_rekeyed_senders_are_signed_for_by_their_key(bank: BankClient) -> None:
+    sp = bank.algorand.get_suggested_params()
+    sender = bank.algorand.account.random().address
+    key = account.generate_account()[0]
+    pay = transaction.PaymentTxn(sender, sp, sender, 0)
+    group = [TransactionWithSigner(pay, AccountTransactionSigner(key))]
+
+    with SigningPool(workers=1, threads=True) as pool:
+        (signed,) = pool.sign([group])
+
+    assert signed.blob == _encoded(group)
+
+
+def test_only_key_signers_can_be_pooled(bank: BankClient) -> None:
+    sp = bank.algorand.get_suggested_params()
+    sender = bank.algorand.account.random().address
+    pay = transaction.PaymentTxn(sender, sp, sender, 0)
+
+    with SigningPool(workers=1, threads=True) as pool:
+        with pytest.raises(ValueError, match="signs with a EmptySigner"):
+            pool.sign([[TransactionWithSigner(pay, EmptySigner())]])
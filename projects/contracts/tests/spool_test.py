@@ -0,0 +1,111 @@
+import pathlib
+from collections.abc import Iterator
+
+import pytest
+from algosdk import account, transaction
+from algosdk.atomic_transaction_composer import (
+    AccountTransactionSigner,
+    TransactionWithSigner,
+)
+from algosdk.v2client.algod import AlgodClient
+
+from smart_contracts._helpers.signing import SignedGroup, SigningPool
+from smart_contracts._helpers.spool import TransactionSpool
+from tests.algod_stub import AlgodStub
+
+
+class _CrashError(Exception):
+    pass
+
+
+class _CrashingAlgod(AlgodClient):
+    """Dies right after its `sends`-th group reaches algod."""
+
+    def __init__(self, address: str, sends: int):
+        super().__init__("", address)
+        self.sends = sends
+
+    def send_raw_transaction(self, txn: bytes, **kwargs: object) -> str:
+        tx_id: str = super().send_raw_transaction(txn)
+        self.sends -= 1
+        if self.sends == 0:
+            raise _CrashError
+        return tx_id
+
+
+@pytest.fixture()
+def stub() -> Iterator[AlgodStub]:
+    with AlgodStub() as stub:
+        stub.deduplicate = True
+        yield stub
+
+
+def _payments(count: int, last_valid: int = 1001) -> list[SignedGroup]:
+    key, sender = account.generate_account()
+    sp = transaction.SuggestedParams(
+        fee=1000, first=1, last=last_valid, gh=bytes(32), flat_fee=True
+    )
+    signer = AccountTransactionSigner(key)
+    groups = [
+        [TransactionWithSigner(transaction.PaymentTxn(sender, sp, sender, n), signer)]
+        for n in range(count)
+    ]
+    with SigningPool(workers=1, threads=True) as pool:
+        return pool.sign(groups)
+
+
+def test_drained_groups_are_confirmed_and_logged(
+    stub: AlgodStub, tmp_path: pathlib.Path
+) -> None:
+    groups = _payments(10)
+    with TransactionSpool(tmp_path / "payouts") as spool:
+        assert spool.append(groups[:6]) == list(range(6))
+        assert spool.append(groups[6:]) == list(range(6, 10))
+        result = spool.drain(AlgodClient("", stub.url), window=4)
+
+    assert (result.confirmed, result.unconfirmed, result.sent) == (10, 0, 10)
+    assert [stxn.get_txid() for stxn in stub.sent] == [g.tx_ids[0] for g in groups]
+    with TransactionSpool(tmp_path / "payouts") as spool:
+        assert spool.pending == []
+        assert [spool.status(r) for r in range(10)] == list(range(2, 12))
+
+
+def test_resumed_drain_finds_groups_sent_before_a_crash(
+    stub: AlgodStub, tmp_path: pathlib.Path
+) -> None:
+    with TransactionSpool(tmp_path / "payouts") as spool:
+        spool.append(_payments(5))
+        with pytest.raises(_CrashError):
+            spool.drain(_CrashingAlgod(stub.url, sends=3))
+    assert len(stub.sent) == 3
+
+    with TransactionSpool(tmp_path / "payouts") as spool:
+        assert spool.pending == list(range(5))
+        result = spool.drain(AlgodClient("", stub.url))
+        assert spool.pending == []
+
+    # The three sent before the crash were found in one sweep, not sent again
+    assert (result.confirmed, result.sent, result.rounds_swept) == (5, 2, 5)
+    assert len(stub.sent) == 5
+
+
+def test_torn_tails_are_dropped_and_expired_groups_not_sent(
+    stub: AlgodStub, tmp_path: pathlib.Path
+) -> None:
+    path = tmp_path / "payouts"
+    groups = _payments(2, last_valid=5) + _payments(1)
+    with TransactionSpool(path) as spool:
+        spool.append(groups)
+    # A crash part way through writing another group and its index entry
+    with open(path, "ab") as data, open(f"{path}.idx", "ab") as index:
+        data.write(b"\x82\xa3sig")
+        index.write(b"\x00" * 7)
+
+    stub.round = 9
+    with TransactionSpool(path) as spool:
+        assert len(spool) == 3
+        result = spool.drain(AlgodClient("", stub.url))
+        assert [spool.status(r) for r in range(3)] == [0, 0, 10]
+
+    assert (result.confirmed, result.unconfirmed, result.sent) == (1, 2, 1)
+    assert path.stat().st_size == sum(len(group.blob) for group in groups)
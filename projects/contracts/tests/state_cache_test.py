@@ -0,0 +1,224 @@
+import threading
+import time
+import typing
+from concurrent.futures import ThreadPoolExecutor
+from types import SimpleNamespace
+
+import algokit_utils
+import pytest
+from algosdk import abi, account, transaction
+from algosdk.v2client.algod import AlgodClient
+
+from smart_contracts._helpers.budget import OPUP_METHOD
+from smart_contracts._helpers.rounds import RoundTracker
+from smart_contracts._helpers.state_cache import StateCache
+from smart_contracts.artifacts.bank.bank_client import BankClient
+from smart_contracts.bank.cached_state import CachedBankClient
+from tests.algod_stub import AlgodStub
+
+
+class FakeAlgod:
+    def __init__(self) -> None:
+        self.round = 10
+        self.waits: list[int] = []
+
+    def status(self) -> dict[str, int]:
+        return {"last-round": self.round}
+
+    def status_after_block(self, round_: int) -> dict[str, int]:
+        self.waits.append(round_)
+        self.round = max(self.round, round_ + 1)
+        return {"last-round": self.round}
+
+
+class FakeAppClient:
+    app_id = 1234
+
+    def __init__(self) -> None:
+        self.reads = 0
+        self.release = threading.Event()
+        self.release.set()
+        self.state = SimpleNamespace(
+            global_state=SimpleNamespace(get_value=self._read),
+            box=SimpleNamespace(get_map_value=lambda name, key: self._read(key)),
+        )
+
+    def _read(self, name: str) -> int:
+        self.release.wait()
+        self.reads += 1
+        return self.reads
+
+
+@pytest.fixture()
+def algod() -> FakeAlgod:
+    return FakeAlgod()
+
+
+@pytest.fixture()
+def client() -> SimpleNamespace:
+    return SimpleNamespace(app_client=FakeAppClient())
+
+
+def _cache(algod: FakeAlgod, ttl: float | None = None) -> StateCache:
+    return StateCache(RoundTracker(algod, interval=0), ttl)  # type: ignore[arg-type]
+
+
+def test_reads_are_cached_until_the_next_round(
+    algod: FakeAlgod, client: SimpleNamespace
+) -> None:
+    cache = _cache(algod)
+
+    assert cache.global_value(client, "total_deposit") == 1
+    assert cache.global_value(client, "total_deposit") == 1
+    assert cache.map_value(client, "deposits", "A") == 2
+    algod.round += 1
+    assert cache.global_value(client, "total_deposit") == 3
+    assert (cache.hits, cache.misses) == (1, 3)
+
+
+def test_ttl_outlives_rounds(algod: FakeAlgod, client: SimpleNamespace) -> None:
+    cache = _cache(algod, ttl=60)
+
+    cache.global_value(client, "total_deposit")
+    algod.round += 5
+
+    assert cache.global_value(client, "total_deposit") == 1
+    assert cache.hits == 1
+
+
+def test_concurrent_misses_share_one_read(
+    algod: FakeAlgod, client: SimpleNamespace
+) -> None:
+    cache = _cache(algod)
+    client.app_client.release.clear()
+
+    with ThreadPoolExecutor(8) as pool:
+        futures = [
+            pool.submit(cache.map_value, client, "deposits", "A") for _ in range(8)
+        ]
+        deadline = time.monotonic() + 10
+        while cache.misses + cache.coalesced < 8:
+            assert time.monotonic() < deadline
+            time.sleep(0.001)
+        client.app_client.release.set()
+        results = [future.result() for future in futures]
+
+    assert results == [1] * 8
+    assert client.app_client.reads == 1
+    assert (cache.misses, cache.coalesced) == (1, 7)
+
+
+def test_reads_after_a_write_wait_for_its_round(
+    algod: FakeAlgod, client: SimpleNamespace
+) -> None:
+    cache = _cache(algod, ttl=60)
+    cache.global_value(client, "total_deposit")
+
+    cache.written(client, 12)
+
+    assert cache.global_value(client, "total_deposit") == 2
+    assert algod.waits == [10, 11]
+    assert cache.global_value(client, "total_deposit") == 2
+
+
+def test_writes_sent_through_the_cached_client_are_read_back() -> None:
+    with AlgodStub() as stub:
+        selector = abi.Method.from_signature("withdraw(uint64)uint64").get_selector()
+        stub.returns[selector] = (2).to_bytes(8, "big")
+        algorand = algokit_utils.AlgorandClient.from_clients(
+            algod=AlgodClient("", stub.url)
+        )
+        bank = BankClient(
+            algorand=algorand,
+            app_id=1234,
+            default_sender=algorand.account.random().address,
+        )
+        rounds = RoundTracker(algorand.client.algod, interval=60)
+        cached = CachedBankClient(bank, StateCache(rounds, ttl=60))
+        stub.global_state[1234] = {b"total_deposit": 5}
+        assert cached.state.global_state.total_deposit == 5
+
+        # What the withdrawal leaves behind
+        stub.global_state[1234] = {b"total_deposit": 2}
+        cached.send.withdraw(
+            (3,),
+            send_params=algokit_utils.SendParams(populate_app_call_resources=False),
+        )
+
+        assert cached.state.global_state.total_deposit == 2
+
+
+def test_groups_sent_through_the_cached_client_are_padded() -> None:
+    with AlgodStub() as stub:
+        import_deposits = abi.Method.from_signature(
+            "import_deposits((address,uint64)[])uint64"
+        )
+        stub.returns[import_deposits.get_selector()] = (0).to_bytes(8, "big")
+        algorand = algokit_utils.AlgorandClient.from_clients(
+            algod=AlgodClient("", stub.url)
+        )
+        bank = BankClient(
+            algorand=algorand,
+            app_id=1234,
+            default_sender=algorand.account.random().address,
+        )
+        cached = CachedBankClient(
+            bank, StateCache(RoundTracker(algorand.client.algod, interval=60))
+        )
+        entries = [(account.generate_account()[1], 5) for _ in range(16)]
+
+        cached.send.group(bank.new_group().import_deposits((entries,)))
+
+        assert [
+            typing.cast(
+                list[bytes],
+                typing.cast(transaction.ApplicationCallTxn, stxn.transaction).app_args,
+            )[0]
+            for stxn in stub.sent
+        ] == [
+            import_deposits.get_selector(),
+            abi.Method.from_signature(OPUP_METHOD).get_selector(),
+        ]
+
+
+def test_every_method_and_global_key_goes_through_the_cache() -> None:
+    with AlgodStub() as stub:
+        algorand = algokit_utils.AlgorandClient.from_clients(
+            algod=AlgodClient("", stub.url)
+        )
+        bank = BankClient(
+            algorand=algorand,
+            app_id=1234,
+            default_sender=algorand.account.random().address,
+        )
+        cached = CachedBankClient(
+            bank, StateCache(RoundTracker(algorand.client.algod, interval=60), ttl=60)
+        )
+        send_methods = {name for name in dir(bank.send) if not name.startswith("_")} - {
+            "app_client",
+            "budget",
+        }
+        assert send_methods <= set(dir(cached.send))
+        stub.global_state[1234] = {
+            b"total_deposit": 5,
+            b"paused": 0,
+            b"successor_hash": b"h" * 32,
+            b"successor_round": 7,
+        }
+        assert cached.state.global_state.get_all() == {
+            "total_deposit": 5,
+            "paused": 0,
+            "successor_hash": b"h" * 32,
+            "successor_round": 7,
+        }
+        assert cached.state.global_state.paused == 0
+        assert cached.state.global_state.successor_round == 7
+
+        stub.global_state[1234] = {b"paused": 1}
+        # Cached until a write is seen
+        assert cached.state.global_state.paused == 0
+        cached.send.set_paused(
+            (True,),
+            send_params=algokit_utils.SendParams(populate_app_call_resources=False),
+        )
+        assert cached.state.global_state.paused == 1
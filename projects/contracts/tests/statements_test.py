@@ -0,0 +1,99 @@
+import pathlib
+from collections.abc import Iterator
+
+import algokit_utils
+import pytest
+from algosdk import abi, transaction
+from algosdk.v2client.algod import AlgodClient
+from algosdk.v2client.indexer import IndexerClient
+
+from smart_contracts.artifacts.bank.bank_client import BankClient
+from smart_contracts.bank.statements import StatementIndex, StatementIngester
+from tests.algod_stub import AlgodStub
+
+APP_ID = 1234
+NO_SIMULATE = algokit_utils.SendParams(populate_app_call_resources=False)
+
+
+@pytest.fixture()
+def stub() -> Iterator[AlgodStub]:
+    with AlgodStub() as stub:
+        yield stub
+
+
+@pytest.fixture()
+def bank(stub: AlgodStub) -> BankClient:
+    algorand = algokit_utils.AlgorandClient.from_clients(
+        algod=AlgodClient("", stub.url)
+    )
+    return BankClient(
+        algorand=algorand,
+        app_id=APP_ID,
+        default_sender=algorand.account.random().address,
+    )
+
+
+def _returning(stub: AlgodStub, signature: str, value: int) -> None:
+    selector = abi.Method.from_signature(signature).get_selector()
+    stub.returns[selector] = value.to_bytes(8, "big")
+
+
+def _deposit(stub: AlgodStub, bank: BankClient, sender: str, amount: int) -> None:
+    _returning(stub, "deposit(string,pay)uint64", amount + 100)
+    pay = transaction.PaymentTxn(
+        sender, bank.algorand.get_suggested_params(), bank.app_address, amount
+    )
+    bank.send.deposit(
+        ("memo", pay), algokit_utils.CommonAppCallParams(sender=sender), NO_SIMULATE
+    )
+
+
+def test_statements_are_indexed_by_account_and_paged_newest_first(
+    stub: AlgodStub, bank: BankClient, tmp_path: pathlib.Path
+) -> None:
+    alice, bob = (bank.algorand.account.random().address for _ in range(2))
+    carol = bank.algorand.account.random().address
+    _deposit(stub, bank, alice, 5)
+    _deposit(stub, bank, bob, 7)
+    _returning(stub, "withdraw(uint64)uint64", 103)
+    bank.send.withdraw(
+        (2,), algokit_utils.CommonAppCallParams(sender=alice), NO_SIMULATE
+    )
+    bank.send.import_deposits(([(carol, 4)],), send_params=NO_SIMULATE)
+    bank.send.export_deposits(([(alice, 103), (carol, 4)], 99), send_params=NO_SIMULATE)
+
+    indexer = IndexerClient("", stub.url)
+    with StatementIndex(tmp_path / "statements.sqlite", APP_ID) as index:
+        added = StatementIngester(bank, index, indexer, window=2).ingest()
+        assert (added, index.round) == (6, stub.round)
+
+        page = index.statements(alice, limit=2)
+        assert [(s.kind, s.amount, s.balance) for s in page.statements] == [
+            ("export", 103, 0),
+            ("withdrawal", 2, 103),
+        ]
+        assert page.next_cursor is not None
+        rest = index.statements(alice, limit=2, cursor=page.next_cursor)
+        assert [(s.kind, s.amount, s.balance) for s in rest.statements] == [
+            ("deposit", 5, 105)
+        ]
+        assert rest.next_cursor is None
+        assert [
+            (s.kind, s.amount, s.balance) for s in index.statements(carol).statements
+        ] == [("export", 4, 0), ("import", 4, 4)]
+        assert index.statements(bob).statements[0].round == 3
+
+    # Picks up where it left off, then reads only the database
+    _deposit(stub, bank, bob, 1)
+    requests = stub.requests
+    with StatementIndex(tmp_path / "statements.sqlite", APP_ID) as index:
+        assert StatementIngester(bank, index, indexer).ingest() == 1
+        requests = stub.requests - requests
+        assert [s.amount for s in index.statements(bob).statements] == [1, 7]
+    assert requests == 3
+
+
+def test_a_database_indexes_one_app(tmp_path: pathlib.Path) -> None:
+    StatementIndex(tmp_path / "statements.sqlite", APP_ID).close()
+    with pytest.raises(ValueError, match="indexes app 1234"):
+        StatementIndex(tmp_path / "statements.sqlite", APP_ID + 1)
@@ -0,0 +1,118 @@
+import time
+from collections.abc import Callable, Iterator
+
+import algokit_utils
+import pytest
+from algosdk import abi
+from algosdk.v2client.algod import AlgodClient
+
+from smart_contracts._helpers.suggested_params import (
+    SuggestedParamsCache,
+    shared_params,
+    use_shared_params,
+)
+from smart_contracts.artifacts.bank.bank_client import BankClient
+from tests.algod_stub import AlgodStub
+
+APP_ID = 1234
+
+
+def _eventually(condition: Callable[[], bool], timeout: float = 5.0) -> bool:
+    deadline = time.monotonic() + timeout
+    while not condition():
+        if time.monotonic() > deadline:
+            return False
+        time.sleep(0.01)
+    return True
+
+
+@pytest.fixture()
+def stub() -> Iterator[AlgodStub]:
+    with AlgodStub() as stub:
+        selector = abi.Method.from_signature("withdraw(uint64)uint64").get_selector()
+        stub.returns[selector] = (3).to_bytes(8, "big")
+        yield stub
+
+
+def test_params_are_refreshed_once_per_round(stub: AlgodStub) -> None:
+    cache = SuggestedParamsCache(AlgodClient("", stub.url))
+    algorand = cache.install(
+        algokit_utils.AlgorandClient.from_clients(algod=AlgodClient("", stub.url))
+    )
+    bank = BankClient(
+        algorand=algorand,
+        app_id=APP_ID,
+        default_sender=algorand.account.random().address,
+    )
+    send_params = algokit_utils.SendParams(populate_app_call_resources=False)
+
+    try:
+        for _ in range(5):
+            bank.send.withdraw((1,), send_params=send_params)
+        assert _eventually(lambda: cache.get().first == stub.round)
+    finally:
+        cache.close()
+
+    # Each send bumps the stub's round, so the refresher fetched about once per send,
+    # and the client itself never did
+    assert cache.refreshes <= 5 + 2
+    assert stub.params_requests == cache.refreshes
+    assert all(stxn.transaction.first_valid_round > 1 for stxn in stub.sent[1:])
+
+
+def test_params_are_shared_per_node(stub: AlgodStub) -> None:
+    clients = [
+        use_shared_params(
+            algokit_utils.AlgorandClient.from_clients(algod=AlgodClient("", stub.url))
+        )
+        for _ in range(2)
+    ]
+    cache = shared_params(clients[0].client.algod)
+
+    try:
+        assert _eventually(lambda: cache.refreshes >= 2)
+        requests = stub.params_requests
+        params = [client.get_suggested_params() for client in clients for _ in range(3)]
+        # Served from what the refresher handed each client's own cache
+        assert stub.params_requests == requests
+        assert params[0] is not params[1]
+        assert {p.first for p in params} == {stub.round}
+    finally:
+        cache.close()
+
+    assert shared_params(AlgodClient("", stub.url)) is cache
+
+
+def test_clients_fetch_params_themselves_while_the_refresher_fails(
+    stub: AlgodStub,
+) -> None:
+    # The refresher's node goes away after the first fetch, the client's doesn't
+    with AlgodStub() as refresher_stub:
+        cache = SuggestedParamsCache(AlgodClient("", refresher_stub.url))
+        algorand = cache.install(
+            algokit_utils.AlgorandClient.from_clients(algod=AlgodClient("", stub.url))
+        )
+
+    def fetched() -> bool:
+        algorand.get_suggested_params()
+        return stub.params_requests > 0
+
+    try:
+        assert stub.params_requests == 0
+        assert _eventually(fetched)
+    finally:
+        cache.close()
+
+
+def test_params_can_be_refreshed_on_a_timer(stub: AlgodStub) -> None:
+    cache = SuggestedParamsCache(AlgodClient("", stub.url), ttl=0.01)
+
+    cache.get()
+    assert _eventually(lambda: cache.refreshes >= 5)
+    cache.close()
+
+    # Each get fetches for itself once closed
+    requests = stub.params_requests
+    cache.get()
+    cache.get()
+    assert stub.params_requests >= requests + 2